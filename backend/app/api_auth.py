@@ -8,8 +8,10 @@ from sqlalchemy.orm import Session
 from typing import Optional
 import hashlib
 import secrets
+from datetime import datetime
 
 from . import database, models, schemas
+from .write_queue import run_write
 
 # 创建路由
 router = APIRouter(prefix="/api/auth", tags=["用户认证"])
@@ -38,6 +40,22 @@ def generate_user_profile_id() -> str:
     return 'user_' + secrets.token_urlsafe(16)
 
 
+def _add_user(db: Session, user: models.User) -> models.User:
+    """写入新用户"""
+    db.add(user)
+    db.flush()
+    return user
+
+
+def _record_login(db: Session, user_id: int) -> models.User:
+    """更新最后登录时间，并为缺少画像ID的用户生成画像ID"""
+    user = db.get(models.User, user_id)
+    user.last_login = datetime.utcnow()
+    if not user.user_profile_id:
+        user.user_profile_id = generate_user_profile_id()
+    return user
+
+
 @router.post("/register", response_model=schemas.ResponseModel)
 def register(user_data: schemas.UserRegister, db: Session = Depends(get_db)):
     """用户注册"""
@@ -59,9 +77,7 @@ def register(user_data: schemas.UserRegister, db: Session = Depends(get_db)):
         user_profile_id=user_profile_id
     )
     
-    db.add(new_user)
-    db.commit()
-    db.refresh(new_user)
+    new_user = run_write(db, _add_user, new_user)
     
     return schemas.ResponseModel(
         data={
@@ -89,19 +105,12 @@ def login(login_data: schemas.UserLogin, db: Session = Depends(get_db)):
     if not user.is_active:
         raise HTTPException(status_code=403, detail="账号已被禁用")
     
-    # 更新最后登录时间
-    from datetime import datetime
-    user.last_login = datetime.utcnow()
-    db.commit()
+    # 更新最后登录时间，确保用户有画像ID
+    user = run_write(db, _record_login, user.id)
     
     # 生成token
     token = generate_token()
     
-    # 确保用户有画像ID
-    if not user.user_profile_id:
-        user.user_profile_id = generate_user_profile_id()
-        db.commit()
-    
     return schemas.ResponseModel(
         data={
             "token": token,
@@ -0,0 +1,61 @@
+# -*- coding: utf-8 -*-
+"""
+诊断模块 - API路由
+输出请求级查询统计（见 query_stats）、SQLite写线程统计（见 write_queue）、
+DSPy对话模式统计（见 services.chat_router）和回复缓存统计（见 services.reply_cache）
+"""
+
+from fastapi import APIRouter, Query
+
+from . import database, query_stats
+from .services.chat_router import get_chat_router
+from .services.reply_cache import get_reply_cache
+from .write_queue import write_queue_stats
+
+# 创建路由
+router = APIRouter(prefix="/api/diagnostics", tags=["诊断"])
+
+
+@router.get("/queries")
+def read_query_stats(top: int = Query(5, ge=0, le=50, description="每个路由列出的高频语句数")):
+    """按路由汇总的查询数、数据库耗时、预算超出和疑似N+1次数，以及最近的请求"""
+    return query_stats.get_query_stats(top_statements=top)
+
+
+@router.delete("/queries")
+def reset_query_stats():
+    """清空查询统计"""
+    query_stats.reset_query_stats()
+    return {"message": "查询统计已清空"}
+
+
+@router.get("/write-queue")
+def read_write_queue_stats():
+    """SQLite写线程：已执行任务数、提交批次数、平均/最大批大小和排队任务数"""
+    return {"enabled": database.WRITE_QUEUE_ENABLED, "queues": write_queue_stats()}
+
+
+@router.get("/chat-modes")
+def read_chat_mode_stats():
+    """DSPy对话模式：路由配置，以及快速模式/完整管线各自的请求数、选择原因、p50/p95 延迟和提取质量"""
+    return get_chat_router().stats()
+
+
+@router.delete("/chat-modes")
+def reset_chat_mode_stats():
+    """清空对话模式统计"""
+    get_chat_router().reset()
+    return {"message": "对话模式统计已清空"}
+
+
+@router.get("/reply-cache")
+def read_reply_cache_stats():
+    """对话回复缓存：条目数、完全相同/近似命中、未命中、命中率、过期和LRU淘汰次数"""
+    return get_reply_cache().stats()
+
+
+@router.delete("/reply-cache")
+def clear_reply_cache():
+    """清空对话回复缓存"""
+    get_reply_cache().clear()
+    return {"message": "回复缓存已清空"}
@@ -3,22 +3,22 @@
 用户画像模块 - API路由
 """
 
+import json
+import time
+
 from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
-from typing import List, Optional, Dict, Any
+from starlette.background import BackgroundTask
+from typing import List, Optional, Dict, Any, Tuple
 from pydantic import BaseModel, Field
 
 from . import database
 from . import schemas_user_profile as schemas
 from . import crud_user_profile as crud
-from .services.rag_service import get_rag_service
-# 导入新的DSPy服务（如果可用）
-try:
-    from .rag_dspy import get_dspy_rag_service
-    DSPY_AVAILABLE = True
-except ImportError:
-    DSPY_AVAILABLE = False
-    print("[API] DSPy not available, using legacy RAG service")
+from .services.registry import get_chat_service
+from .services.career_matching import match_profile, recommend_for_user
+from .write_queue import run_write
 
 # 创建路由
 router = APIRouter(prefix="/api/user-profiles", tags=["用户画像"])
@@ -89,22 +89,47 @@ def get_profile_completeness(user_id: str, db: Session = Depends(get_db)):
 
 # ==================== RAG对话接口 ====================
 
-@router.post("/{user_id}/chat", response_model=schemas.ChatMessageResponse)
-def chat_with_profile(
+def _save_chat_turn(
+    db: Session,
     user_id: str,
-    request: schemas.ChatMessageRequest,
-    db: Session = Depends(get_db)
-):
-    """
-    与用户画像进行RAG对话（DSPy增强版）
-    自动提取信息并更新画像
-    支持前端TypeChat预处理结果
-    """
-    # 获取或创建用户画像
-    profile = crud.get_or_create_user_profile(db, user_id)
+    session_id: str,
+    message: str,
+    result: Dict[str, Any],
+    update_data: Dict[str, Any]
+) -> None:
+    """写入一轮对话：用户消息、画像更新（日志引用该消息）和AI回复"""
+    intent = result.get("intent", "general_chat")
+    conversation = crud.create_conversation(
+        db=db,
+        user_id=user_id,
+        session_id=session_id,
+        message_role="user",
+        message_content=message,
+        intent_type=intent
+    )
     
-    # 将画像转换为字典
-    profile_dict = {
+    if update_data:
+        crud.update_user_profile(
+            db=db,
+            user_id=user_id,
+            profile_update=schemas.UserProfileUpdate(**update_data),
+            update_type="conversation_extract",
+            source_message_id=conversation.id
+        )
+    
+    crud.create_conversation(
+        db=db,
+        user_id=user_id,
+        session_id=session_id,
+        message_role="assistant",
+        message_content=result.get("reply", ""),
+        intent_type=intent
+    )
+
+
+def _profile_state(profile) -> Dict[str, Any]:
+    """RAG服务使用的画像字典（也作为响应中的当前画像状态）"""
+    return {
         "holland_code": profile.holland_code,
         "mbti_type": profile.mbti_type,
         "value_priorities": profile.value_priorities,
@@ -114,42 +139,21 @@ def chat_with_profile(
         "universal_skills": profile.universal_skills,
         "completeness_score": profile.completeness_score
     }
-    
-    # 处理消息 - 从context中获取history（如果是字典格式）
-    conversation_history = None
-    if request.context:
-        if isinstance(request.context, dict) and 'history' in request.context:
-            conversation_history = request.context['history']
-        else:
-            conversation_history = request.context
-    
-    # 选择RAG服务：优先使用DSPy（如果可用）
-    if DSPY_AVAILABLE:
-        rag_service = get_dspy_rag_service()
-        print(f"[API] Using DSPy RAG service for user {user_id}")
-    else:
-        rag_service = get_rag_service()
-        print(f"[API] Using legacy RAG service for user {user_id}")
-    
-    # 调用RAG服务处理消息
-    result = rag_service.process_message(
-        user_message=request.message,
-        user_profile=profile_dict,
-        conversation_history=conversation_history,
-        preprocessed=request.preprocessed  # 传递前端预处理结果
-    )
-    
-    # 创建对话记录（用户消息）
-    conversation = crud.create_conversation(
-        db=db,
-        user_id=user_id,
-        session_id=profile.rag_session_id or f"session_{user_id}",
-        message_role="user",
-        message_content=request.message,
-        intent_type=result.get("intent", "general_chat")
-    )
-    
-    # 如果有提取到信息，更新画像
+
+
+def _conversation_history(request: schemas.ChatMessageRequest):
+    """从context中获取history（如果是字典格式）"""
+    if not request.context:
+        return None
+    if isinstance(request.context, dict) and 'history' in request.context:
+        return request.context['history']
+    return request.context
+
+
+def _collect_profile_updates(
+    result: Dict[str, Any]
+) -> Tuple[Dict[str, Any], List[str], List[schemas.ExtractedInfo]]:
+    """由RAG结果构建画像更新数据，返回 (更新数据, 更新字段, 提取信息)"""
     updated_fields = []
     extracted_info_list = []
     
@@ -166,7 +170,7 @@ def chat_with_profile(
             if isinstance(item, dict):
                 field = item.get("field")
                 value = item.get("value")
-                if field and hasattr(schemas.UserProfileUpdate, field):
+                if field and field in schemas.UserProfileUpdate.model_fields:
                     update_data[field] = value
                     updated_fields.append(field)
                     extracted_info_list.append(schemas.ExtractedInfo(
@@ -178,57 +182,151 @@ def chat_with_profile(
     # 处理profile_updates（从DSPy返回的更新建议）
     if isinstance(profile_updates, dict):
         for field, value in profile_updates.items():
-            if value and hasattr(schemas.UserProfileUpdate, field):
+            if value and field in schemas.UserProfileUpdate.model_fields:
                 if field not in update_data:  # 避免重复
                     update_data[field] = value
                     updated_fields.append(field)
     
-    # 执行画像更新
-    if update_data:
-        crud.update_user_profile(
-            db=db,
-            user_id=user_id,
-            profile_update=schemas.UserProfileUpdate(**update_data),
-            update_type="conversation_extract",
-            source_message_id=conversation.id
-        )
+    extracted_info = extracted_info_list if extracted_info_list else [
+        schemas.ExtractedInfo(field=k, value=v, confidence=1.0)
+        for k, v in (profile_updates if isinstance(profile_updates, dict) else {}).items()
+    ]
+    return update_data, updated_fields, extracted_info
+
+
+@router.post("/{user_id}/chat", response_model=schemas.ChatMessageResponse)
+def chat_with_profile(
+    user_id: str,
+    request: schemas.ChatMessageRequest,
+    db: Session = Depends(get_db)
+):
+    """
+    与用户画像进行RAG对话（DSPy增强版）
+    自动提取信息并更新画像
+    支持前端TypeChat预处理结果
+    """
+    # 获取或创建用户画像
+    profile = crud.get_or_create_user_profile(db, user_id)
     
-    # 记录AI回复
-    crud.create_conversation(
-        db=db,
-        user_id=user_id,
-        session_id=profile.rag_session_id or f"session_{user_id}",
-        message_role="assistant",
-        message_content=result.get("reply", ""),
-        intent_type=result.get("intent", "general_chat")
+    # 选择RAG服务：优先使用DSPy（如果可用），首次调用时才导入LLM框架
+    rag_service = get_chat_service()
+    print(f"[API] Using {type(rag_service).__name__} for user {user_id}")
+    
+    # 调用RAG服务处理消息
+    result = rag_service.process_message(
+        user_message=request.message,
+        user_profile=_profile_state(profile),
+        conversation_history=_conversation_history(request),
+        preprocessed=request.preprocessed  # 传递前端预处理结果
     )
     
+    # 如果有提取到信息，更新画像
+    update_data, updated_fields, extracted_info = _collect_profile_updates(result)
+    
+    # 对话记录与画像更新合并为一次提交（RAG调用在事务之外，不长时间持有写锁）
+    session_id = profile.rag_session_id or f"session_{user_id}"
+    run_write(db, _save_chat_turn, user_id, session_id, request.message, result, update_data)
+    
     # 重新获取更新后的画像
     updated_profile = crud.get_user_profile(db, user_id)
     
-    # 构建当前画像状态
-    current_profile_state = {
-        "holland_code": updated_profile.holland_code,
-        "mbti_type": updated_profile.mbti_type,
-        "value_priorities": updated_profile.value_priorities,
-        "ability_assessment": updated_profile.ability_assessment,
-        "career_path_preference": updated_profile.career_path_preference,
-        "current_casve_stage": updated_profile.current_casve_stage,
-        "universal_skills": updated_profile.universal_skills,
-        "completeness_score": updated_profile.completeness_score
-    }
-    
     # 构建响应
     return schemas.ChatMessageResponse(
         reply=result.get("reply", ""),
-        extracted_info=extracted_info_list if extracted_info_list else [
-            schemas.ExtractedInfo(field=k, value=v, confidence=1.0)
-            for k, v in (profile_updates if isinstance(profile_updates, dict) else {}).items()
-        ],
+        extracted_info=extracted_info,
         updated_fields=updated_fields,
         suggested_questions=result.get("suggested_questions", []),
         current_casve_stage=updated_profile.current_casve_stage,
-        profile_updates=current_profile_state
+        profile_updates=_profile_state(updated_profile)
+    )
+
+
+def _sse(event: str, data: Dict[str, Any]) -> str:
+    """格式化一条 Server-Sent Event"""
+    return f"event: {event}\ndata: {json.dumps(data, ensure_ascii=False, default=str)}\n\n"
+
+
+@router.post("/{user_id}/chat/stream")
+def chat_with_profile_stream(
+    user_id: str,
+    request: schemas.ChatMessageRequest,
+    db: Session = Depends(get_db)
+):
+    """
+    流式RAG对话（Server-Sent Events）
+    
+    事件依次为：
+    - token: {"text": 回复片段}，随LLM生成逐段发送
+    - profile_updates: {"updates": 画像更新, "updated_fields": [...], "extracted_info": [...]}
+    - suggested_questions: {"questions": [...]}
+    - done: {"intent", "conversation_stage", "chat_mode", "ttft_ms", "total_ms"}
+    出错时发送 error: {"message": ...} 并结束。
+    
+    对话记录和画像更新在响应结束后写入；出错或客户端中途断开时不写入。
+    """
+    profile = crud.get_or_create_user_profile(db, user_id)
+    profile_state = _profile_state(profile)
+    session_id = profile.rag_session_id or f"session_{user_id}"
+    bind = db.get_bind()
+    rag_service = get_chat_service()
+    print(f"[API] Streaming with {type(rag_service).__name__} for user {user_id}")
+    
+    turn: Dict[str, Any] = {}
+    
+    async def events():
+        start = time.perf_counter()
+        ttft_ms = None
+        result = None
+        try:
+            async for kind, value in rag_service.astream_message(
+                user_message=request.message,
+                user_profile=profile_state,
+                conversation_history=_conversation_history(request),
+                preprocessed=request.preprocessed
+            ):
+                if kind == "token":
+                    if ttft_ms is None:
+                        ttft_ms = round((time.perf_counter() - start) * 1000, 1)
+                    yield _sse("token", {"text": value})
+                else:
+                    result = value
+        except Exception as e:
+            print(f"[API] Chat stream error for user {user_id}: {e}")
+            yield _sse("error", {"message": str(e)})
+            return
+        
+        update_data, updated_fields, extracted_info = _collect_profile_updates(result)
+        turn.update(result=result, update_data=update_data)
+        yield _sse("profile_updates", {
+            "updates": update_data,
+            "updated_fields": updated_fields,
+            "extracted_info": [item.model_dump() for item in extracted_info]
+        })
+        yield _sse("suggested_questions", {"questions": result.get("suggested_questions", [])})
+        
+        total_ms = round((time.perf_counter() - start) * 1000, 1)
+        print(f"[API] Chat stream for user {user_id}: first token {ttft_ms}ms, total {total_ms}ms")
+        yield _sse("done", {
+            "intent": result.get("intent", "general_chat"),
+            "conversation_stage": result.get("conversation_stage"),
+            "chat_mode": result.get("chat_mode"),
+            "ttft_ms": ttft_ms,
+            "total_ms": total_ms
+        })
+    
+    def save_turn():
+        """响应结束后写入本轮对话（使用新会话，请求的会话此时可能已关闭）"""
+        if not turn:
+            return
+        with database.SessionLocal(bind=bind) as save_db:
+            run_write(save_db, _save_chat_turn, user_id, session_id, request.message,
+                      turn["result"], turn["update_data"])
+    
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+        background=BackgroundTask(save_turn)
     )
 
 
@@ -281,7 +379,7 @@ def analyze_user_profile(user_id: str, db: Session = Depends(get_db)):
         insights.append(f"你偏好{path_names.get(profile.career_path_preference, '综合')}发展路径")
     
     # 完善建议
-    completeness = crud.get_profile_completeness_detail(db, user_id)
+    completeness = crud.build_completeness_detail(profile)
     if completeness.score < 50:
         recommendations.append("建议继续完善基础信息，完成兴趣和能力测评")
     elif completeness.score < 80:
@@ -289,23 +387,35 @@ def analyze_user_profile(user_id: str, db: Session = Depends(get_db)):
     else:
         recommendations.append("画像较为完整，可以开始制定具体的职业行动计划")
     
+    # 只计算不写入：GET 不应覆盖推荐记录（完整的前20条及其用户反馈）
+    career_paths = [
+        schemas.CareerPathRecommendation(**m._asdict())
+        for m in match_profile(db, profile, 5)
+    ]
+    
     return schemas.ProfileAnalysisResponse(
         insights=insights,
         recommendations=recommendations,
-        career_paths=[],  # TODO: 实现职业匹配算法
+        career_paths=career_paths,
         suggested_next_steps=completeness.suggestions
     )
 
 
 @router.get("/{user_id}/career-paths", response_model=List[schemas.CareerPathRecommendation])
-def get_career_path_recommendations(user_id: str, db: Session = Depends(get_db)):
-    """获取职业路径推荐"""
+def get_career_path_recommendations(
+    user_id: str,
+    limit: int = Query(20, ge=1, le=100),
+    db: Session = Depends(get_db)
+):
+    """获取职业路径推荐（基于画像特征向量匹配全部职业，结果写入推荐记录）"""
     profile = crud.get_user_profile(db, user_id)
     if not profile:
         raise HTTPException(status_code=404, detail="用户画像不存在")
     
-    # TODO: 实现基于画像的职业匹配算法
-    return []
+    return [
+        schemas.CareerPathRecommendation(**m._asdict())
+        for m in recommend_for_user(db, profile, limit=limit)
+    ]
 
 
 # ==================== CASVE接口 ====================
@@ -365,7 +475,7 @@ def get_profile_visualization(user_id: str, db: Session = Depends(get_db)):
     if not profile:
         raise HTTPException(status_code=404, detail="用户画像不存在")
     
-    completeness = crud.get_profile_completeness_detail(db, user_id)
+    completeness = crud.build_completeness_detail(profile)
     
     # 构建各层数据
     interface_data = {
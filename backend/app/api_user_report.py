@@ -6,17 +6,19 @@ FastAPI路由实现
 
 from fastapi import APIRouter, Depends, HTTPException, WebSocket, WebSocketDisconnect, Query, Request
 from fastapi.responses import FileResponse, StreamingResponse
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 from typing import Optional, List
+from datetime import datetime
 import os
 import json
 
-from .database import get_db
+from . import database
+from .database import get_async_db
 from .models_user_report import GenerationTask
 from .schemas_user_report import (
     ReportType, ReportStatus, TaskStatus, ExportFormat,
     UserReportCreate, UserReportUpdate, UserReportResponse, UserReportDetail,
-    UserReportContent, ReportChapterContent, ChapterNavigation,
+    UserReportContent, ReportChapterContent, ReportChapterResponse, ChapterNavigation,
     GenerationTaskCreate, GenerationTaskResponse, GenerationOptions,
     PrerequisitesResult, PrerequisitesValidation, PrerequisitesValidationResponse,
     ExportRequest, ExportOptions,
@@ -24,14 +26,14 @@ from .schemas_user_report import (
     GenerationHistoryParams, GenerationHistoryResponse,
     ReportCenterInit, ActiveTask, UserStats, PrerequisitesSummary
 )
-from .crud_user_report import (
-    create_user_report, get_user_report, get_user_reports, update_user_report, delete_user_report,
-    create_report_chapter, get_report_chapter, get_report_chapters,
-    get_generation_task, get_active_generation_task, update_generation_task, cancel_generation_task,
-    get_generation_history, create_export_record, update_export_download,
-    get_export_records, create_generation_log, create_report_snapshot
+# 路由均为 async def，数据访问使用 AsyncSession 版本的CRUD，查询期间不阻塞事件循环
+from .crud_user_report_async import (
+    get_user_report, get_user_reports, update_user_report, delete_user_report,
+    get_report_chapter, get_report_chapters, get_chapter_outline, get_report_snapshots,
+    get_generation_task, get_active_generation_task, update_generation_task,
+    get_generation_history, create_export_record
 )
-from .crud_user_profile import get_user_profile, get_user_profile_logs
+from .crud_user_profile_async import get_user_profile, get_user_profile_logs
 from .report_prerequisites import check_report_prerequisites, can_generate_report, ReportPrerequisitesChecker
 from .report_generation_service import ReportGenerationService
 
@@ -47,12 +49,18 @@ def get_current_user_id() -> str:
     return "test_user"  # 临时返回测试用户
 
 
+async def get_form_submission_count(db: AsyncSession, user_id: str) -> int:
+    """最近100条画像日志中表单提交的次数"""
+    logs = await get_user_profile_logs(db, user_id, limit=100)
+    return len([log for log in logs if log.update_type == "form_input"])
+
+
 # ==================== 条件检查接口 ====================
 
 @router.get("/prerequisites", response_model=PrerequisitesResult)
 async def get_prerequisites(
     report_type: ReportType = Query(..., description="报告类型"),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     user_id: str = Depends(get_current_user_id)
 ):
     """
@@ -61,13 +69,12 @@ async def get_prerequisites(
     返回指定报告类型的所有生成条件及其当前状态
     """
     # 获取用户画像
-    profile = get_user_profile(db, user_id)
+    profile = await get_user_profile(db, user_id)
     if not profile:
         raise HTTPException(status_code=404, detail="用户画像不存在")
     
     # 获取表单提交次数
-    logs = get_user_profile_logs(db, user_id, limit=100)
-    form_submission_count = len([log for log in logs if log.update_type == "form_input"])
+    form_submission_count = await get_form_submission_count(db, user_id)
     
     # 检查条件
     result = check_report_prerequisites(profile, report_type, form_submission_count)
@@ -78,7 +85,7 @@ async def get_prerequisites(
 @router.post("/prerequisites/validate", response_model=PrerequisitesValidationResponse)
 async def validate_prerequisites(
     validation: PrerequisitesValidation,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     user_id: str = Depends(get_current_user_id)
 ):
     """
@@ -87,13 +94,12 @@ async def validate_prerequisites(
     返回是否可以生成报告，以及预估时间和字数
     """
     # 获取用户画像
-    profile = get_user_profile(db, user_id)
+    profile = await get_user_profile(db, user_id)
     if not profile:
         raise HTTPException(status_code=404, detail="用户画像不存在")
     
     # 获取表单提交次数
-    logs = get_user_profile_logs(db, user_id, limit=100)
-    form_submission_count = len([log for log in logs if log.update_type == "form_input"])
+    form_submission_count = await get_form_submission_count(db, user_id)
     
     # 检查条件
     result = check_report_prerequisites(profile, validation.report_type, form_submission_count)
@@ -129,7 +135,7 @@ async def validate_prerequisites(
 
 @router.get("/center/init", response_model=ReportCenterInit)
 async def get_report_center_init(
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     user_id: str = Depends(get_current_user_id)
 ):
     """
@@ -138,10 +144,10 @@ async def get_report_center_init(
     为报告中心页面提供一站式数据加载
     """
     # 获取用户统计
-    reports, total = get_user_reports(db, user_id, limit=1)
+    reports, total = await get_user_reports(db, user_id, limit=1)
     last_generated = reports[0].created_at if reports else None
     
-    profile = get_user_profile(db, user_id)
+    profile = await get_user_profile(db, user_id)
     completeness = profile.completeness_score if profile else 0
     
     user_stats = UserStats(
@@ -151,8 +157,7 @@ async def get_report_center_init(
     )
     
     # 获取各报告类型的条件摘要
-    logs = get_user_profile_logs(db, user_id, limit=100)
-    form_submission_count = len([log for log in logs if log.update_type == "form_input"])
+    form_submission_count = await get_form_submission_count(db, user_id)
     
     prerequisites_summary = {}
     for report_type in ReportType:
@@ -166,7 +171,7 @@ async def get_report_center_init(
         )
     
     # 获取最近报告
-    recent_reports_data, _ = get_user_reports(db, user_id, limit=5)
+    recent_reports_data, _ = await get_user_reports(db, user_id, limit=5)
     recent_reports = [
         UserReportResponse(
             id=r.id,
@@ -181,7 +186,7 @@ async def get_report_center_init(
     ]
     
     # 获取进行中的任务
-    active_task_obj = get_active_generation_task(db, user_id)
+    active_task_obj = await get_active_generation_task(db, user_id)
     active_task = None
     if active_task_obj:
         active_task = ActiveTask(
@@ -204,7 +209,7 @@ async def get_report_center_init(
 async def start_generation(
     report_type: ReportType = Query(..., description="报告类型"),
     options: Optional[GenerationOptions] = None,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     user_id: str = Depends(get_current_user_id)
 ):
     """
@@ -213,7 +218,7 @@ async def start_generation(
     创建新的报告生成任务，返回任务ID和WebSocket连接URL
     """
     # 检查是否已有进行中的任务
-    active_task = get_active_generation_task(db, user_id)
+    active_task = await get_active_generation_task(db, user_id)
     if active_task:
         raise HTTPException(
             status_code=409,
@@ -226,12 +231,11 @@ async def start_generation(
         )
     
     # 检查生成条件
-    profile = get_user_profile(db, user_id)
+    profile = await get_user_profile(db, user_id)
     if not profile:
         raise HTTPException(status_code=404, detail="用户画像不存在")
     
-    logs = get_user_profile_logs(db, user_id, limit=100)
-    form_submission_count = len([log for log in logs if log.update_type == "form_input"])
+    form_submission_count = await get_form_submission_count(db, user_id)
     
     if not can_generate_report(profile, report_type, form_submission_count):
         raise HTTPException(
@@ -242,12 +246,13 @@ async def start_generation(
             }
         )
     
-    # 启动生成
-    service = ReportGenerationService(db)
+    # 启动生成：生成流程在后台任务中持续运行，使用独立的同步会话而不是本次请求的会话，
+    # 会话由服务在生成流程结束后关闭
+    service = ReportGenerationService(database.SessionLocal(), owns_session=True)
     task_id = await service.generate_report(user_id, report_type, options)
     
     # 获取任务信息
-    task = get_generation_task(db, task_id)
+    task = await get_generation_task(db, task_id)
     
     return GenerationTaskResponse(
         task_id=task.id,
@@ -271,7 +276,7 @@ async def get_generation_history_endpoint(
     page: int = Query(1, ge=1),
     page_size: int = Query(20, ge=1, le=100),
     status: Optional[str] = None,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     user_id: str = Depends(get_current_user_id)
 ):
     """
@@ -280,7 +285,7 @@ async def get_generation_history_endpoint(
     获取用户报告生成的历史记录
     """
     skip = (page - 1) * page_size
-    tasks, total = get_generation_history(
+    tasks, total = await get_generation_history(
         db, user_id,
         status=status,
         skip=skip,
@@ -319,7 +324,7 @@ async def get_generation_history_endpoint(
 @router.get("/generation/{task_id}", response_model=GenerationTaskResponse)
 async def get_generation_status(
     task_id: str,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     user_id: str = Depends(get_current_user_id)
 ):
     """
@@ -327,7 +332,7 @@ async def get_generation_status(
     
     返回任务的当前状态、进度和结果
     """
-    task = get_generation_task(db, task_id)
+    task = await get_generation_task(db, task_id)
     if not task:
         raise HTTPException(status_code=404, detail="任务不存在")
     
@@ -337,7 +342,6 @@ async def get_generation_status(
     # 计算已用时间
     elapsed_seconds = None
     if task.started_at:
-        from datetime import datetime
         elapsed_seconds = int((datetime.utcnow() - task.started_at).total_seconds())
     
     # 构建错误信息
@@ -384,7 +388,7 @@ async def get_generation_status(
 @router.post("/generation/{task_id}/cancel")
 async def cancel_generation(
     task_id: str,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     user_id: str = Depends(get_current_user_id)
 ):
     """
@@ -392,7 +396,7 @@ async def cancel_generation(
     
     取消正在进行的报告生成任务
     """
-    task = get_generation_task(db, task_id)
+    task = await get_generation_task(db, task_id)
     if not task:
         raise HTTPException(status_code=404, detail="任务不存在")
     
@@ -404,8 +408,7 @@ async def cancel_generation(
         raise HTTPException(status_code=409, detail="任务无法取消")
     
     # 更新任务状态
-    from datetime import datetime
-    update_generation_task(
+    await update_generation_task(
         db, task_id,
         status=TaskStatus.CANCELLED,
         cancelled_at=datetime.utcnow()
@@ -413,7 +416,7 @@ async def cancel_generation(
     
     # 如果有报告，也更新报告状态
     if task.report_id:
-        update_user_report(db, task.report_id, UserReportUpdate(
+        await update_user_report(db, task.report_id, UserReportUpdate(
             status=ReportStatus.CANCELLED
         ))
     
@@ -432,7 +435,7 @@ async def cancel_generation(
 async def generation_stream(
     websocket: WebSocket,
     task_id: str,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     WebSocket实时进度流
@@ -442,7 +445,7 @@ async def generation_stream(
     await websocket.accept()
     
     try:
-        task = get_generation_task(db, task_id)
+        task = await get_generation_task(db, task_id)
         if not task:
             await websocket.send_json({
                 "type": "error",
@@ -469,7 +472,7 @@ async def generation_stream(
             await asyncio.sleep(2)  # 每2秒检查一次
             
             # 刷新任务状态
-            db.refresh(task)
+            await db.refresh(task)
             
             await websocket.send_json({
                 "type": "progress_update",
@@ -510,7 +513,7 @@ async def get_reports(
     report_type: Optional[ReportType] = None,
     sort_by: str = Query("created_at", pattern="^(created_at|word_count)$"),
     sort_order: str = Query("desc", pattern="^(asc|desc)$"),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     user_id: str = Depends(get_current_user_id)
 ):
     """
@@ -519,7 +522,7 @@ async def get_reports(
     返回当前用户的所有报告列表，支持分页和筛选
     """
     skip = (page - 1) * page_size
-    reports, total = get_user_reports(
+    reports, total = await get_user_reports(
         db, user_id,
         report_type=report_type,
         skip=skip,
@@ -553,7 +556,7 @@ async def get_reports(
 @router.get("/{report_id}", response_model=UserReportDetail)
 async def get_report(
     report_id: str,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     user_id: str = Depends(get_current_user_id)
 ):
     """
@@ -561,7 +564,7 @@ async def get_report(
     
     返回指定报告的详细信息和元数据
     """
-    report = get_user_report(db, report_id)
+    report = await get_user_report(db, report_id)
     if not report:
         raise HTTPException(status_code=404, detail="报告不存在")
     
@@ -569,7 +572,7 @@ async def get_report(
         raise HTTPException(status_code=403, detail="无权访问此报告")
     
     # 获取章节列表
-    chapters = get_report_chapters(db, report_id)
+    chapters = await get_report_chapters(db, report_id)
     chapter_list = [
         ReportChapterResponse(
             id=c.id,
@@ -591,8 +594,7 @@ async def get_report(
     ]
     
     # 获取数据快照
-    from .crud_user_report import get_report_snapshots
-    snapshots = get_report_snapshots(db, report_id)
+    snapshots = await get_report_snapshots(db, report_id)
     data_snapshot = {
         s.snapshot_type: s.snapshot_data
         for s in snapshots
@@ -621,7 +623,7 @@ async def get_report_content(
     report_id: str,
     chapter_id: Optional[str] = None,
     format: str = Query("html", pattern="^(html|markdown|text)$"),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     user_id: str = Depends(get_current_user_id)
 ):
     """
@@ -629,7 +631,7 @@ async def get_report_content(
     
     返回报告的完整内容或指定章节内容
     """
-    report = get_user_report(db, report_id)
+    report = await get_user_report(db, report_id)
     if not report:
         raise HTTPException(status_code=404, detail="报告不存在")
     
@@ -638,7 +640,7 @@ async def get_report_content(
     
     if chapter_id:
         # 获取指定章节
-        chapter = get_report_chapter(db, chapter_id)
+        chapter = await get_report_chapter(db, chapter_id)
         if not chapter or chapter.report_id != report_id:
             raise HTTPException(status_code=404, detail="章节不存在")
         
@@ -659,7 +661,7 @@ async def get_report_content(
         )
     else:
         # 获取完整报告内容
-        chapters = get_report_chapters(db, report_id)
+        chapters = await get_report_chapters(db, report_id)
         
         # 组装目录
         toc = [
@@ -698,7 +700,7 @@ async def get_chapter(
     report_id: str,
     chapter_id: str,
     format: str = Query("html", pattern="^(html|markdown|text)$"),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     user_id: str = Depends(get_current_user_id)
 ):
     """
@@ -706,14 +708,14 @@ async def get_chapter(
     
     返回指定章节的详细内容，包含前后导航
     """
-    report = get_user_report(db, report_id)
+    report = await get_user_report(db, report_id)
     if not report:
         raise HTTPException(status_code=404, detail="报告不存在")
     
     if report.user_id != user_id:
         raise HTTPException(status_code=403, detail="无权访问此报告")
     
-    chapter = get_report_chapter(db, chapter_id)
+    chapter = await get_report_chapter(db, chapter_id)
     if not chapter or chapter.report_id != report_id:
         raise HTTPException(status_code=404, detail="章节不存在")
     
@@ -725,9 +727,8 @@ async def get_chapter(
     else:
         content = chapter.content_plain
     
-    # 获取导航
-    chapters = get_report_chapters(db, report_id)
-    sorted_chapters = sorted(chapters, key=lambda x: x.order_num)
+    # 获取导航（只查询章节ID和标题）
+    sorted_chapters = await get_chapter_outline(db, report_id)
     current_index = next((i for i, c in enumerate(sorted_chapters) if c.id == chapter_id), -1)
     
     navigation = ChapterNavigation()
@@ -766,7 +767,7 @@ async def get_chapter(
 async def export_pdf(
     report_id: str,
     request: ExportRequest,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     user_id: str = Depends(get_current_user_id)
 ):
     """
@@ -774,7 +775,7 @@ async def export_pdf(
     
     将报告导出为PDF格式
     """
-    report = get_user_report(db, report_id)
+    report = await get_user_report(db, report_id)
     if not report:
         raise HTTPException(status_code=404, detail="报告不存在")
     
@@ -804,7 +805,7 @@ async def export_pdf(
 async def export_word(
     report_id: str,
     request: ExportRequest,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     user_id: str = Depends(get_current_user_id)
 ):
     """
@@ -812,7 +813,7 @@ async def export_word(
     
     将报告导出为Word格式(.docx)
     """
-    report = get_user_report(db, report_id)
+    report = await get_user_report(db, report_id)
     if not report:
         raise HTTPException(status_code=404, detail="报告不存在")
     
@@ -841,7 +842,7 @@ async def export_word(
 async def export_markdown(
     report_id: str,
     include_metadata: bool = Query(True),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     user_id: str = Depends(get_current_user_id)
 ):
     """
@@ -849,7 +850,7 @@ async def export_markdown(
     
     将报告导出为Markdown格式
     """
-    report = get_user_report(db, report_id)
+    report = await get_user_report(db, report_id)
     if not report:
         raise HTTPException(status_code=404, detail="报告不存在")
     
@@ -879,7 +880,7 @@ report_type: {report.report_type}
         content = metadata + content
     
     # 创建导出记录
-    create_export_record(db, report_id, user_id, ExportFormat.MARKDOWN)
+    await create_export_record(db, report_id, user_id, ExportFormat.MARKDOWN)
     
     # 返回文件
     from fastapi.responses import PlainTextResponse
@@ -897,7 +898,7 @@ report_type: {report.report_type}
 @router.delete("/{report_id}")
 async def delete_report(
     report_id: str,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     user_id: str = Depends(get_current_user_id)
 ):
     """
@@ -905,14 +906,14 @@ async def delete_report(
     
     软删除指定的报告及其所有相关数据
     """
-    report = get_user_report(db, report_id)
+    report = await get_user_report(db, report_id)
     if not report:
         raise HTTPException(status_code=404, detail="报告不存在")
     
     if report.user_id != user_id:
         raise HTTPException(status_code=403, detail="无权删除此报告")
     
-    delete_user_report(db, report_id)
+    await delete_user_report(db, report_id)
     
     return {
         "code": 200,
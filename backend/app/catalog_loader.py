@@ -0,0 +1,213 @@
+# -*- coding: utf-8 -*-
+"""
+专业目录导入
+普通高等学校本科专业目录以数据文件的形式保存在 catalog_data/ 下（每个学科门类一个JSON文件），
+由本模块在一个事务中导入：按代码 INSERT ... ON CONFLICT DO UPDATE 批量写入学科门类、专业类和专业，
+可重复执行，并输出新增/更新/未变化的行数。目录中不存在的已有数据不会被删除。
+
+    cd backend
+    python -m app.catalog_loader [--dir DIR] [--dry-run]
+
+数据文件格式：
+    {"code": "03", "name": "法学", "description": "...",
+     "categories": [{"code": "0301", "name": "法学类", "description": "...",
+                     "majors": [{"code": "030101K", "name": "法学", "duration": 4,
+                                 "description": "...", "main_courses": ["法理学", ...]}]}]}
+"""
+
+import argparse
+import glob
+import json
+import os
+import time
+from typing import Dict, List, Optional, Tuple
+
+from sqlalchemy import or_, select
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.orm import Session
+
+from . import models
+from .catalog_snapshot import invalidate_catalog_snapshot
+from .database import APP_DIR, engine
+from .recommendation_matrix import reset_recommendation_matrix
+from .search_index import rebuild_search_index
+
+CATALOG_DIR = os.path.join(APP_DIR, "catalog_data")
+
+# 支持 ON CONFLICT 的方言
+_INSERTS = {"sqlite": sqlite.insert, "postgresql": postgresql.insert}
+
+# 表 -> 按代码比较和更新的列（外键列由上级代码解析）
+_COLUMNS = {
+    "disciplines": ("name", "description"),
+    "major_categories": ("name", "description", "discipline_id"),
+    "majors": ("name", "description", "duration", "main_courses", "category_id"),
+}
+_TABLES = {
+    "disciplines": models.Discipline.__table__,
+    "major_categories": models.MajorCategory.__table__,
+    "majors": models.Major.__table__,
+}
+
+
+# ==================== 读取数据文件 ====================
+
+def read_catalog(directory: str = CATALOG_DIR) -> Tuple[List[dict], List[dict], List[dict]]:
+    """
+    读取目录下所有JSON文件，展开为 (学科门类, 专业类, 专业) 三组行
+    专业类行带 discipline_code，专业行带 category_code；代码重复时抛出 ValueError
+    """
+    disciplines, categories, majors = [], [], []
+    seen = {"disciplines": {}, "major_categories": {}, "majors": {}}
+
+    def add(table, rows, row, source):
+        if row["code"] in seen[table]:
+            raise ValueError(f"{table} 代码重复: {row['code']}（{seen[table][row['code']]} 与 {source}）")
+        seen[table][row["code"]] = source
+        rows.append(row)
+
+    paths = sorted(glob.glob(os.path.join(directory, "*.json")))
+    if not paths:
+        raise ValueError(f"目录数据文件不存在: {directory}")
+    for path in paths:
+        source = os.path.basename(path)
+        with open(path, encoding="utf-8") as f:
+            document = json.load(f)
+        add("disciplines", disciplines, {
+            "code": document["code"],
+            "name": document["name"],
+            "description": document.get("description"),
+        }, source)
+        for category in document.get("categories", []):
+            add("major_categories", categories, {
+                "code": category["code"],
+                "name": category["name"],
+                "description": category.get("description"),
+                "discipline_code": document["code"],
+            }, source)
+            for major in category.get("majors", []):
+                add("majors", majors, {
+                    "code": major["code"],
+                    "name": major["name"],
+                    "description": major.get("description"),
+                    "duration": major.get("duration", 4),
+                    "main_courses": major.get("main_courses") or [],
+                    "category_code": category["code"],
+                }, source)
+    return disciplines, categories, majors
+
+
+# ==================== 导入 ====================
+
+def _code_map(conn, table) -> Dict[str, int]:
+    return {code: row_id for row_id, code in conn.execute(select(table.c.id, table.c.code))}
+
+
+def _upsert(conn, name: str, rows: List[dict]) -> Dict[str, int]:
+    """
+    按代码批量 upsert 一张表，返回 {"inserted", "updated", "unchanged"}
+    只有内容变化的行才会被更新（ON CONFLICT ... DO UPDATE ... WHERE）
+    """
+    table = _TABLES[name]
+    columns = _COLUMNS[name]
+    existing = {
+        row.code: row
+        for row in conn.execute(select(table.c.code, *(table.c[c] for c in columns)))
+    }
+    stats = {"inserted": 0, "updated": 0, "unchanged": 0}
+    for row in rows:
+        current = existing.get(row["code"])
+        if current is None:
+            stats["inserted"] += 1
+        elif any(getattr(current, c) != row[c] for c in columns):
+            stats["updated"] += 1
+        else:
+            stats["unchanged"] += 1
+    if stats["inserted"] or stats["updated"]:
+        insert = _INSERTS[conn.dialect.name](table)
+        stmt = insert.on_conflict_do_update(
+            index_elements=[table.c.code],
+            set_={c: insert.excluded[c] for c in columns},
+            where=or_(*(table.c[c].is_distinct_from(insert.excluded[c]) for c in columns)),
+        )
+        conn.execute(stmt, [{"code": row["code"], **{c: row[c] for c in columns}} for row in rows])
+    return stats
+
+
+def load_catalog(bind=None, directory: str = CATALOG_DIR, dry_run: bool = False) -> Dict[str, Dict[str, int]]:
+    """
+    在一个事务中导入专业目录，返回每张表的新增/更新/未变化行数
+    dry_run 时只计算差异并回滚
+    """
+    bind = bind or engine
+    if bind.dialect.name not in _INSERTS:
+        raise ValueError(f"不支持的数据库: {bind.dialect.name}")
+    disciplines, categories, majors = read_catalog(directory)
+
+    report = {}
+    conn = bind.connect()
+    trans = conn.begin()
+    try:
+        report["disciplines"] = _upsert(conn, "disciplines", disciplines)
+
+        discipline_ids = _code_map(conn, _TABLES["disciplines"])
+        for row in categories:
+            row["discipline_id"] = discipline_ids[row["discipline_code"]]
+        report["major_categories"] = _upsert(conn, "major_categories", categories)
+
+        category_ids = _code_map(conn, _TABLES["major_categories"])
+        for row in majors:
+            row["category_id"] = category_ids[row["category_code"]]
+        report["majors"] = _upsert(conn, "majors", majors)
+
+        changed = any(stats["inserted"] or stats["updated"] for stats in report.values())
+        if dry_run or not changed:
+            trans.rollback()
+        else:
+            # 同一事务内重建专业全文索引
+            with Session(bind=conn) as db:
+                rebuild_search_index(db, "majors_fts")
+            trans.commit()
+    except Exception:
+        trans.rollback()
+        raise
+    finally:
+        conn.close()
+
+    if changed and not dry_run:
+        # 本进程内的目录快照和推荐矩阵失效（其他进程的推荐矩阵按数据指纹自动重建）
+        invalidate_catalog_snapshot()
+        reset_recommendation_matrix()
+    return report
+
+
+def format_report(report: Dict[str, Dict[str, int]]) -> str:
+    """差异报告文本"""
+    lines = [f"{'table':<18}{'inserted':>10}{'updated':>10}{'unchanged':>11}"]
+    for table, stats in report.items():
+        lines.append(f"{table:<18}{stats['inserted']:>10}{stats['updated']:>10}{stats['unchanged']:>11}")
+    return "\n".join(lines)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="导入普通高等学校本科专业目录")
+    parser.add_argument("--dir", default=CATALOG_DIR, help="目录数据文件所在目录")
+    parser.add_argument("--dry-run", action="store_true", help="只输出差异，不写入数据库")
+    args = parser.parse_args(argv)
+
+    from .database import Base
+    from .migrations import run_migrations
+    from . import models_user_profile, models_user_report  # noqa: F401 注册所有表
+    Base.metadata.create_all(bind=engine)
+    run_migrations(engine)
+
+    start = time.perf_counter()
+    report = load_catalog(directory=args.dir, dry_run=args.dry_run)
+    elapsed = time.perf_counter() - start
+    print(format_report(report))
+    print(f"\n[Catalog] {'Dry run' if args.dry_run else 'Loaded'} in {elapsed:.2f}s")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
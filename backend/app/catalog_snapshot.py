@@ -0,0 +1,203 @@
+# -*- coding: utf-8 -*-
+"""
+学科专业目录 - 内存快照
+将 学科门类 → 专业类 → 专业 三级树一次性加载为不可变的版本化快照，
+/api/disciplines 系列接口直接从快照读取，无需访问数据库。
+目录写入（学科门类/专业类/专业/职业/职业路径/专业职业关联）提交后
+调用 invalidate_catalog_snapshot() 递增目录版本号并使快照失效，下次读取时重建。
+目录版本号同时作为 response_cache 中编码后响应的失效依据。
+"""
+
+import threading
+from typing import Dict, List, NamedTuple, Optional, Tuple
+
+from . import database, models
+
+
+# ==================== 快照节点 ====================
+# 使用 NamedTuple：基于tuple存储、无实例__dict__、天然不可变
+
+class MajorNode(NamedTuple):
+    """专业节点"""
+    id: int
+    name: str
+    code: str
+    category_id: int
+    description: Optional[str]
+    duration: Optional[int]
+    main_courses: Tuple[str, ...]
+    created_at: Optional[str]
+
+    def to_dict(self) -> dict:
+        return {
+            'id': self.id,
+            'name': self.name,
+            'code': self.code,
+            'categoryId': self.category_id,
+            'description': self.description,
+            'duration': self.duration,
+            'mainCourses': list(self.main_courses),
+            'createdAt': self.created_at
+        }
+
+
+class MajorCategoryNode(NamedTuple):
+    """专业类节点"""
+    id: int
+    name: str
+    code: str
+    discipline_id: int
+    description: Optional[str]
+    created_at: Optional[str]
+    majors: Tuple[MajorNode, ...]
+
+    def to_dict(self) -> dict:
+        return {
+            'id': self.id,
+            'name': self.name,
+            'code': self.code,
+            'disciplineId': self.discipline_id,
+            'description': self.description,
+            'createdAt': self.created_at,
+            'majors': [m.to_dict() for m in self.majors]
+        }
+
+
+class DisciplineNode(NamedTuple):
+    """学科门类节点"""
+    id: int
+    name: str
+    code: str
+    description: Optional[str]
+    created_at: Optional[str]
+    major_categories: Tuple[MajorCategoryNode, ...]
+
+    def to_dict(self) -> dict:
+        return {
+            'id': self.id,
+            'name': self.name,
+            'code': self.code,
+            'description': self.description,
+            'createdAt': self.created_at,
+            'majorCategories': [c.to_dict() for c in self.major_categories]
+        }
+
+
+class CatalogSnapshot:
+    """学科专业树快照（只读）"""
+
+    __slots__ = ('version', 'disciplines', '_discipline_index')
+
+    def __init__(self, version: int, disciplines: Tuple[DisciplineNode, ...]):
+        self.version = version
+        self.disciplines = disciplines
+        self._discipline_index = {d.id: d for d in disciplines}
+
+    def list_disciplines(self, skip: int = 0, limit: int = 100) -> Tuple[DisciplineNode, ...]:
+        """分页获取学科门类（与原 OFFSET/LIMIT 语义一致）"""
+        skip = max(skip, 0)
+        return self.disciplines[skip:skip + max(limit, 0)]
+
+    def get_discipline(self, discipline_id: int) -> Optional[DisciplineNode]:
+        """按ID获取学科门类"""
+        return self._discipline_index.get(discipline_id)
+
+
+# ==================== 快照构建 ====================
+
+def _isoformat(value) -> Optional[str]:
+    return value.isoformat() if value else None
+
+
+def _parse_courses(value) -> Tuple[str, ...]:
+    """主要课程转为元组（JSONText列已解码）"""
+    return tuple(value) if isinstance(value, list) else ()
+
+
+def build_catalog_snapshot(db, version: int = 0) -> CatalogSnapshot:
+    """
+    从数据库构建快照
+    使用三条平铺查询后在内存中组装，避免两级joinedload产生的笛卡尔积
+    """
+    majors_by_category: Dict[int, List[MajorNode]] = {}
+    for m in db.query(models.Major).order_by(models.Major.id):
+        majors_by_category.setdefault(m.category_id, []).append(MajorNode(
+            id=m.id,
+            name=m.name,
+            code=m.code,
+            category_id=m.category_id,
+            description=m.description,
+            duration=m.duration,
+            main_courses=_parse_courses(m.main_courses),
+            created_at=_isoformat(m.created_at)
+        ))
+
+    categories_by_discipline: Dict[int, List[MajorCategoryNode]] = {}
+    for c in db.query(models.MajorCategory).order_by(models.MajorCategory.id):
+        categories_by_discipline.setdefault(c.discipline_id, []).append(MajorCategoryNode(
+            id=c.id,
+            name=c.name,
+            code=c.code,
+            discipline_id=c.discipline_id,
+            description=c.description,
+            created_at=_isoformat(c.created_at),
+            majors=tuple(majors_by_category.get(c.id, ()))
+        ))
+
+    disciplines = tuple(
+        DisciplineNode(
+            id=d.id,
+            name=d.name,
+            code=d.code,
+            description=d.description,
+            created_at=_isoformat(d.created_at),
+            major_categories=tuple(categories_by_discipline.get(d.id, ()))
+        )
+        for d in db.query(models.Discipline).order_by(models.Discipline.id)
+    )
+
+    return CatalogSnapshot(version, disciplines)
+
+
+# ==================== 全局快照 ====================
+
+_lock = threading.Lock()
+_catalog_version = 1
+_catalog_snapshot: Optional[CatalogSnapshot] = None
+
+
+def get_catalog_version() -> int:
+    """获取当前目录版本号"""
+    return _catalog_version
+
+
+def invalidate_catalog_snapshot() -> int:
+    """目录数据变更后调用：递增版本号并丢弃当前快照"""
+    global _catalog_version, _catalog_snapshot
+    with _lock:
+        _catalog_version += 1
+        _catalog_snapshot = None
+        return _catalog_version
+
+
+def get_catalog_snapshot() -> CatalogSnapshot:
+    """
+    获取当前快照（不存在时重建）
+    仅在重建时打开数据库会话；构建期间若发生失效，不会缓存过期快照
+    """
+    global _catalog_snapshot
+    snapshot = _catalog_snapshot
+    if snapshot is not None:
+        return snapshot
+
+    version = _catalog_version
+    db = database.SessionLocal()
+    try:
+        snapshot = build_catalog_snapshot(db, version)
+    finally:
+        db.close()
+
+    with _lock:
+        if version == _catalog_version:
+            _catalog_snapshot = snapshot
+    return snapshot
@@ -0,0 +1,138 @@
+# -*- coding: utf-8 -*-
+"""
+写回式计数器（write-behind counter）
+点赞等高频自增不再逐次"读取-加一-提交"，而是先在内存中累加增量，
+由后台线程每隔 FLUSH_INTERVAL 秒用一条批量语句
+    UPDATE <表> SET <列> = <列> + :delta WHERE id = :id
+写回数据库。热门内容每秒只产生少量写事务，且数据库端自增不会丢失并发增量。
+启用 SQLITE_WRITE_QUEUE 时写回交给单写线程执行。
+
+读取时返回 数据库存储值 + 尚未写回的增量。进程退出时会执行最后一次写回。
+"""
+
+import atexit
+import threading
+from collections import Counter
+from typing import Dict, Iterable, Optional
+
+from sqlalchemy import text
+
+from . import database
+from .write_queue import get_write_queue
+
+
+FLUSH_INTERVAL = 0.25
+
+
+class WriteBehindCounter:
+    """按行ID累加增量并批量写回的计数器"""
+
+    def __init__(self, table: str, column: str, interval: float = FLUSH_INTERVAL, bind=None):
+        self.table = table
+        self.column = column
+        self.interval = interval
+        self._bind = bind
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._pending: Counter = Counter()
+        self._in_flight: Counter = Counter()
+        self._wakeup = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self.flushes = 0
+
+    # ---------- 写入 ----------
+
+    def increment(self, row_id: int, delta: int = 1) -> None:
+        """累加增量（不访问数据库）"""
+        with self._lock:
+            self._pending[row_id] += delta
+        self._ensure_thread()
+
+    # ---------- 读取 ----------
+
+    def pending(self, row_id: int) -> int:
+        """尚未写回的增量（包括正在写回的部分）"""
+        with self._lock:
+            return self._pending.get(row_id, 0) + self._in_flight.get(row_id, 0)
+
+    def current(self, row_id: int, stored: Optional[int]) -> int:
+        """当前计数 = 存储值 + 未写回增量"""
+        return (stored or 0) + self.pending(row_id)
+
+    def overlay(self, rows: Iterable[Dict], key: str = "id") -> None:
+        """为序列化后的行字典叠加未写回增量"""
+        with self._lock:
+            for row in rows:
+                row_id = row[key]
+                row[self.column] = (row.get(self.column) or 0) \
+                    + self._pending.get(row_id, 0) + self._in_flight.get(row_id, 0)
+
+    # ---------- 写回 ----------
+
+    def flush(self) -> int:
+        """将累计增量批量写回，返回写回的行数；失败时增量放回缓冲区"""
+        with self._flush_lock:
+            return self._flush()
+
+    def _flush(self) -> int:
+        with self._lock:
+            if not self._pending:
+                return 0
+            self._in_flight, self._pending = self._pending, Counter()
+            batch = [{"id": k, "delta": v} for k, v in self._in_flight.items() if v]
+        try:
+            if batch:
+                statement = text(f"UPDATE {self.table} SET {self.column} = "
+                                 f"COALESCE({self.column}, 0) + :delta WHERE id = :id")
+                bind = self._bind or database.engine
+                write_queue = get_write_queue(bind) if database.WRITE_QUEUE_ENABLED else None
+                if write_queue is not None:
+                    write_queue.submit(lambda db: db.execute(statement, batch)).result()
+                else:
+                    with bind.begin() as conn:
+                        conn.execute(statement, batch)
+        except Exception as e:
+            print(f"[Counter] Flush {self.table}.{self.column} failed, will retry: {e}")
+            with self._lock:
+                self._pending.update(self._in_flight)
+                self._in_flight = Counter()
+            return 0
+        with self._lock:
+            self._in_flight = Counter()
+            self.flushes += 1
+        return len(batch)
+
+    def _ensure_thread(self) -> None:
+        if self._thread is not None:
+            return
+        with self._lock:
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run, name=f"counter-{self.table}", daemon=True
+                )
+                self._thread.start()
+
+    def _run(self) -> None:
+        while not self._wakeup.wait(self.interval):
+            self.flush()
+
+    def close(self) -> None:
+        """停止后台线程并写回剩余增量"""
+        self._wakeup.set()
+        if self._thread is not None:
+            self._thread.join(timeout=self.interval * 4)
+        self.flush()
+
+
+# ==================== 全局实例 ====================
+
+_share_like_counter: Optional[WriteBehindCounter] = None
+
+
+def get_share_like_counter() -> WriteBehindCounter:
+    """获取经验分享点赞计数器"""
+    global _share_like_counter
+    if _share_like_counter is None:
+        _share_like_counter = WriteBehindCounter("experience_shares", "likes")
+        atexit.register(_share_like_counter.close)
+    return _share_like_counter
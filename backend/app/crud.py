@@ -1,16 +1,26 @@
+import functools
 from sqlalchemy.orm import Session, joinedload
-from sqlalchemy import or_, and_
+from sqlalchemy import or_, and_, func
 from typing import List, Optional
-import json
 from . import database, schemas
+from .database import call_after_commit, commit_or_flush
 from . import models  # 直接从models导入模型类
+from .catalog_snapshot import invalidate_catalog_snapshot
+from . import search_index
+from .counters import get_share_like_counter
+from .recommendation_matrix import get_recommendation_matrix, record_major_occupation
+from .write_queue import queued_write
+from .pagination import (
+    before_time_cursor, cached_count, decode_id_cursor, invalidate_counts, next_time_cursor
+)
 
 # 学科门类CRUD
+@queued_write
 def create_discipline(db: Session, discipline: schemas.DisciplineCreate):
     db_discipline = models.Discipline(**discipline.dict())
     db.add(db_discipline)
-    db.commit()
-    db.refresh(db_discipline)
+    call_after_commit(db, invalidate_catalog_snapshot)
+    commit_or_flush(db, db_discipline)
     return db_discipline
 
 def get_disciplines(db: Session, skip: int = 0, limit: int = 100):
@@ -26,11 +36,12 @@ def get_discipline(db: Session, discipline_id: int):
     ).filter(models.Discipline.id == discipline_id).first()
 
 # 专业类CRUD
+@queued_write
 def create_major_category(db: Session, major_category: schemas.MajorCategoryCreate):
     db_major_category = models.MajorCategory(**major_category.dict())
     db.add(db_major_category)
-    db.commit()
-    db.refresh(db_major_category)
+    call_after_commit(db, invalidate_catalog_snapshot)
+    commit_or_flush(db, db_major_category)
     return db_major_category
 
 def get_major_categories(db: Session, discipline_id: Optional[int] = None, skip: int = 0, limit: int = 100):
@@ -40,97 +51,106 @@ def get_major_categories(db: Session, discipline_id: Optional[int] = None, skip:
     return query.offset(skip).limit(limit).all()
 
 # 专业CRUD
+@queued_write
 def create_major(db: Session, major: schemas.MajorCreate):
-    major_dict = major.dict()
-    # 序列化main_courses为JSON字符串
-    if 'main_courses' in major_dict and isinstance(major_dict['main_courses'], list):
-        major_dict['main_courses'] = json.dumps(major_dict['main_courses'], ensure_ascii=False)
-    db_major = models.Major(**major_dict)
+    # main_courses 由 JSONText 列类型负责编码
+    db_major = models.Major(**major.dict())
     db.add(db_major)
-    db.commit()
-    db.refresh(db_major)
+    db.flush()
+    search_index.index_major(db, db_major)
+    call_after_commit(db, invalidate_catalog_snapshot)
+    commit_or_flush(db, db_major)
     return db_major
 
-def get_majors(db: Session, category_id: Optional[int] = None, skip: int = 0, limit: int = 100):
+def get_majors(db: Session, category_id: Optional[int] = None, skip: int = 0, limit: int = 100,
+               cursor: Optional[str] = None):
+    """获取专业列表，按id排序；传入cursor时使用键集分页（忽略skip）"""
     query = db.query(models.Major)
     if category_id:
         query = query.filter(models.Major.category_id == category_id)
-    majors = query.offset(skip).limit(limit).all()
-    # 反序列化main_courses
-    for major in majors:
-        if major.main_courses:
-            try:
-                major.main_courses = json.loads(major.main_courses)
-            except (json.JSONDecodeError, TypeError):
-                major.main_courses = []
-    return majors
+    query = query.order_by(models.Major.id)
+    if cursor:
+        return query.filter(models.Major.id > decode_id_cursor(cursor)).limit(limit).all()
+    return query.offset(skip).limit(limit).all()
 
 def get_major(db: Session, major_id: int):
-    major = db.query(models.Major).filter(models.Major.id == major_id).first()
-    if major and major.main_courses:
-        try:
-            major.main_courses = json.loads(major.main_courses)
-        except (json.JSONDecodeError, TypeError):
-            major.main_courses = []
-    return major
+    return db.query(models.Major).filter(models.Major.id == major_id).first()
 
 def search_majors(db: Session, query: str, skip: int = 0, limit: int = 100):
-    majors = db.query(models.Major).filter(
-        or_(
-            models.Major.name.contains(query),
-            models.Major.description.contains(query)
-        )
-    ).offset(skip).limit(limit).all()
-    # 反序列化main_courses
-    for major in majors:
-        if major.main_courses:
-            try:
-                major.main_courses = json.loads(major.main_courses)
-            except (json.JSONDecodeError, TypeError):
-                major.main_courses = []
-    return majors
+    """全文检索专业（FTS5 + BM25排序），返回专业及高亮摘要"""
+    hits = search_index.search_ids(db, "majors_fts", query, skip=skip, limit=limit)
+    majors = {m.id: m for m in db.query(models.Major).filter(
+        models.Major.id.in_([h.id for h in hits])
+    )}
+    results = []
+    for hit in hits:
+        major = majors.get(hit.id)
+        if not major:
+            continue
+        results.append({
+            "major": major,
+            "score": round(hit.score, 4),
+            "highlight": {
+                "name": search_index.highlight(major.name, query),
+                "snippet": search_index.snippet(query, major.description, major.main_courses)
+            }
+        })
+    return results
 
 # 职业CRUD
+@queued_write
 def create_occupation(db: Session, occupation: schemas.OccupationCreate):
-    occupation_dict = occupation.dict()
-    # 序列化requirements为JSON字符串
-    if 'requirements' in occupation_dict and isinstance(occupation_dict['requirements'], list):
-        occupation_dict['requirements'] = json.dumps(occupation_dict['requirements'], ensure_ascii=False)
-    db_occupation = models.Occupation(**occupation_dict)
+    # requirements 由 JSONText 列类型负责编码
+    db_occupation = models.Occupation(**occupation.dict())
     db.add(db_occupation)
-    db.commit()
-    db.refresh(db_occupation)
+    db.flush()
+    search_index.index_occupation(db, db_occupation)
+    call_after_commit(db, invalidate_catalog_snapshot)
+    commit_or_flush(db, db_occupation)
     return db_occupation
 
-def get_occupations(db: Session, industry: Optional[str] = None, skip: int = 0, limit: int = 100):
+def get_occupations(db: Session, industry: Optional[str] = None, skip: int = 0, limit: int = 100,
+                    cursor: Optional[str] = None):
+    """获取职业列表，按id排序；传入cursor时使用键集分页（忽略skip）"""
     query = db.query(models.Occupation)
     if industry:
         query = query.filter(models.Occupation.industry == industry)
-    occupations = query.offset(skip).limit(limit).all()
-    # 反序列化requirements
-    for occupation in occupations:
-        if occupation.requirements:
-            try:
-                occupation.requirements = json.loads(occupation.requirements)
-            except (json.JSONDecodeError, TypeError):
-                occupation.requirements = []
-    return occupations
+    query = query.order_by(models.Occupation.id)
+    if cursor:
+        return query.filter(models.Occupation.id > decode_id_cursor(cursor)).limit(limit).all()
+    return query.offset(skip).limit(limit).all()
 
 def get_occupation(db: Session, occupation_id: int):
-    occupation = db.query(models.Occupation).filter(models.Occupation.id == occupation_id).first()
-    if occupation and occupation.requirements:
-        try:
-            occupation.requirements = json.loads(occupation.requirements)
-        except (json.JSONDecodeError, TypeError):
-            occupation.requirements = []
-    return occupation
+    return db.query(models.Occupation).filter(models.Occupation.id == occupation_id).first()
+
+def search_occupations(db: Session, query: str, skip: int = 0, limit: int = 100):
+    """全文检索职业（FTS5 + BM25排序），返回职业及高亮摘要"""
+    hits = search_index.search_ids(db, "occupations_fts", query, skip=skip, limit=limit)
+    occupations = {o.id: o for o in db.query(models.Occupation).filter(
+        models.Occupation.id.in_([h.id for h in hits])
+    )}
+    results = []
+    for hit in hits:
+        occupation = occupations.get(hit.id)
+        if not occupation:
+            continue
+        results.append({
+            "occupation": occupation,
+            "score": round(hit.score, 4),
+            "highlight": {
+                "name": search_index.highlight(occupation.name, query),
+                "snippet": search_index.snippet(query, occupation.description, occupation.requirements)
+            }
+        })
+    return results
 
 # 职业路径CRUD
+@queued_write
 def create_career_path(db: Session, career_path: schemas.CareerPathCreate):
     db_career_path = models.CareerPath(**career_path.dict())
     db.add(db_career_path)
-    db.commit()
-    db.refresh(db_career_path)
+    call_after_commit(db, invalidate_catalog_snapshot)
+    commit_or_flush(db, db_career_path)
     return db_career_path
 
 def get_career_paths(db: Session, occupation_id: int):
@@ -139,6 +159,7 @@ def get_career_paths(db: Session, occupation_id: int):
     ).order_by(models.CareerPath.experience_min).all()
 
 # 专业职业关联CRUD
+@queued_write
 def create_major_occupation(db: Session, major_id: int, occupation_id: int, match_score: int = 80):
     db_major_occupation = models.MajorOccupation(
         major_id=major_id,
@@ -146,8 +167,14 @@ def create_major_occupation(db: Session, major_id: int, occupation_id: int, matc
         match_score=match_score
     )
     db.add(db_major_occupation)
-    db.commit()
-    db.refresh(db_major_occupation)
+    db.flush()
+    # 缓存和推荐矩阵在数据提交、对其他连接可见后才更新；事务回滚时不更新
+    call_after_commit(db, functools.partial(
+        record_major_occupation, db_major_occupation.major_id, db_major_occupation.occupation_id,
+        db_major_occupation.match_score, db_major_occupation.id
+    ))
+    call_after_commit(db, invalidate_catalog_snapshot)
+    commit_or_flush(db, db_major_occupation)
     return db_major_occupation
 
 def get_major_occupations(db: Session, major_id: Optional[int] = None, occupation_id: Optional[int] = None):
@@ -158,36 +185,40 @@ def get_major_occupations(db: Session, major_id: Optional[int] = None, occupatio
         query = query.filter(models.MajorOccupation.occupation_id == occupation_id)
     return query.all()
 
-# 推荐系统
+# 推荐系统（基于内存推荐矩阵，O(K)查找）
+def _load_ranked(db: Session, model, ranked):
+    """按推荐顺序加载ORM对象，返回 [{"<实体>": obj, "match_score": score}]"""
+    rows = {r.id: r for r in db.query(model).filter(model.id.in_([i for i, _ in ranked]))}
+    key = "occupation" if model is models.Occupation else "major"
+    return [{key: rows[i], "match_score": score} for i, score in ranked if i in rows]
+
 def get_recommended_occupations(db: Session, major_id: int, limit: int = 10):
-    occupations = db.query(models.Occupation).join(
-        models.MajorOccupation,
-        models.MajorOccupation.occupation_id == models.Occupation.id
-    ).filter(
-        models.MajorOccupation.major_id == major_id
-    ).order_by(
-        models.MajorOccupation.match_score.desc()
-    ).limit(limit).all()
-    # 反序列化requirements
-    for occupation in occupations:
-        if occupation.requirements:
-            try:
-                occupation.requirements = json.loads(occupation.requirements)
-            except (json.JSONDecodeError, TypeError):
-                occupation.requirements = []
-    return occupations
+    """专业的推荐职业，按匹配度降序"""
+    ranked = get_recommendation_matrix(db).occupations_for_major(major_id, limit)
+    return _load_ranked(db, models.Occupation, ranked)
+
+def get_recommended_majors(db: Session, occupation_id: int, limit: int = 10):
+    """职业的对口专业，按匹配度降序"""
+    ranked = get_recommendation_matrix(db).majors_for_occupation(occupation_id, limit)
+    return _load_ranked(db, models.Major, ranked)
 
 # 个人经历CRUD
+@queued_write
 def create_personal_experience(db: Session, experience: schemas.PersonalExperienceCreate):
     db_experience = models.PersonalExperience(**experience.dict())
     db.add(db_experience)
-    db.commit()
-    db.refresh(db_experience)
+    call_after_commit(db, functools.partial(invalidate_counts, "personal_experiences"))
+    commit_or_flush(db, db_experience)
     return db_experience
 
 def get_personal_experiences(db: Session, major_id: Optional[int] = None, 
                            school_name: Optional[str] = None,
-                           skip: int = 0, limit: int = 10):
+                           skip: int = 0, limit: int = 10,
+                           cursor: Optional[str] = None):
+    """
+    获取个人经历列表，按 (created_at, id) 降序
+    传入cursor时使用键集分页（忽略skip），total 来自计数缓存
+    """
     query = db.query(models.PersonalExperience)
     
     if major_id:
@@ -195,14 +226,24 @@ def get_personal_experiences(db: Session, major_id: Optional[int] = None,
     if school_name:
         query = query.filter(models.PersonalExperience.school_name.contains(school_name))
     
-    total = query.count()
-    items = query.order_by(models.PersonalExperience.created_at.desc()).offset(skip).limit(limit).all()
+    total = cached_count(("personal_experiences", major_id, school_name), query.count)
+    query = query.order_by(
+        models.PersonalExperience.created_at.desc(), models.PersonalExperience.id.desc()
+    )
+    if cursor:
+        query = query.filter(before_time_cursor(
+            models.PersonalExperience.created_at, models.PersonalExperience.id, cursor
+        ))
+    else:
+        query = query.offset(skip)
+    items = query.limit(limit).all()
     
     return {
         "items": items,
         "total": total,
         "page": skip // limit + 1,
-        "limit": limit
+        "limit": limit,
+        "next_cursor": next_time_cursor(items, limit)
     }
 
 def get_personal_experience(db: Session, experience_id: int):
@@ -211,36 +252,55 @@ def get_personal_experience(db: Session, experience_id: int):
     ).first()
 
 # 经验分享CRUD
+@queued_write
 def create_experience_share(db: Session, share: schemas.ExperienceShareCreate):
     db_share = models.ExperienceShare(**share.dict())
     db.add(db_share)
-    db.commit()
-    db.refresh(db_share)
+    call_after_commit(db, functools.partial(invalidate_counts, "experience_shares"))
+    commit_or_flush(db, db_share)
     return db_share
 
-def get_experience_shares(db: Session, experience_id: int, skip: int = 0, limit: int = 10):
+def get_experience_shares(db: Session, experience_id: int, skip: int = 0, limit: int = 10,
+                          cursor: Optional[str] = None):
+    """
+    获取经验分享列表，按 (created_at, id) 降序
+    传入cursor时使用键集分页（忽略skip），total 来自计数缓存
+    """
     query = db.query(models.ExperienceShare).filter(
         models.ExperienceShare.experience_id == experience_id
     )
     
-    total = query.count()
-    items = query.order_by(models.ExperienceShare.created_at.desc()).offset(skip).limit(limit).all()
+    total = cached_count(("experience_shares", experience_id), query.count)
+    query = query.order_by(
+        models.ExperienceShare.created_at.desc(), models.ExperienceShare.id.desc()
+    )
+    if cursor:
+        query = query.filter(before_time_cursor(
+            models.ExperienceShare.created_at, models.ExperienceShare.id, cursor
+        ))
+    else:
+        query = query.offset(skip)
+    items = query.limit(limit).all()
     
     return {
         "items": items,
         "total": total,
         "page": skip // limit + 1,
-        "limit": limit
+        "limit": limit,
+        "next_cursor": next_time_cursor(items, limit)
     }
 
 def like_experience_share(db: Session, share_id: int):
+    """
+    点赞经验分享
+    增量交给写回计数器批量写入数据库，返回的 share.likes 为存储值，
+    当前点赞数用 get_share_like_counter().current(share.id, share.likes) 获取
+    """
     share = db.query(models.ExperienceShare).filter(
         models.ExperienceShare.id == share_id
     ).first()
     if share:
-        share.likes += 1
-        db.commit()
-        db.refresh(share)
+        get_share_like_counter().increment(share.id)
     return share
 
 # 获取专业详情（包含相关职业）
@@ -249,13 +309,6 @@ def get_major_detail(db: Session, major_id: int):
     if not major:
         return None
     
-    # 反序列化main_courses
-    if major.main_courses:
-        try:
-            major.main_courses = json.loads(major.main_courses)
-        except (json.JSONDecodeError, TypeError):
-            major.main_courses = []
-    
     # 获取相关职业
     related_occupations = get_recommended_occupations(db, major_id)
     
@@ -264,6 +317,41 @@ def get_major_detail(db: Session, major_id: int):
         "related_occupations": related_occupations
     }
 
+# 批量获取专业详情（包含前N个相关职业）
+def get_majors_batch(db: Session, major_ids: List[int], top_n: int = 10):
+    """
+    一次查询获取多个专业及各自匹配度最高的前N个职业
+    使用 ROW_NUMBER() OVER (PARTITION BY major_id ORDER BY match_score DESC) 在数据库端截取每个专业的前N条，
+    专业左连接排名子查询，没有关联职业的专业也会返回。结果按传入ID的顺序排列，不存在的ID被忽略。
+    """
+    if not major_ids:
+        return []
+    rank = func.row_number().over(
+        partition_by=models.MajorOccupation.major_id,
+        order_by=(models.MajorOccupation.match_score.desc(), models.MajorOccupation.occupation_id)
+    ).label("rank")
+    ranked = db.query(
+        models.MajorOccupation.major_id,
+        models.MajorOccupation.occupation_id,
+        models.MajorOccupation.match_score,
+        rank
+    ).filter(models.MajorOccupation.major_id.in_(major_ids)).subquery()
+
+    rows = db.query(models.Major, models.Occupation, ranked.c.match_score).outerjoin(
+        ranked, and_(ranked.c.major_id == models.Major.id, ranked.c.rank <= top_n)
+    ).outerjoin(
+        models.Occupation, models.Occupation.id == ranked.c.occupation_id
+    ).filter(
+        models.Major.id.in_(major_ids)
+    ).order_by(models.Major.id, ranked.c.rank).all()
+
+    details = {}
+    for major, occupation, match_score in rows:
+        detail = details.setdefault(major.id, {"major": major, "related_occupations": []})
+        if occupation is not None:
+            detail["related_occupations"].append({"occupation": occupation, "match_score": match_score})
+    return [details[i] for i in dict.fromkeys(major_ids) if i in details]
+
 # 获取职业详情（包含职业路径）
 def get_occupation_detail(db: Session, occupation_id: int):
     occupation = db.query(models.Occupation).filter(
@@ -272,13 +360,6 @@ def get_occupation_detail(db: Session, occupation_id: int):
     if not occupation:
         return None
     
-    # 反序列化requirements
-    if occupation.requirements:
-        try:
-            occupation.requirements = json.loads(occupation.requirements)
-        except (json.JSONDecodeError, TypeError):
-            occupation.requirements = []
-    
     # 获取职业路径
     career_paths = get_career_paths(db, occupation_id)
     
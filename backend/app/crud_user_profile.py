@@ -1,23 +1,28 @@
 # -*- coding: utf-8 -*-
 """
 用户画像模块 - CRUD操作
+高频读取使用 lambda_stmt：语句按 lambda 的代码位置缓存，重复调用不再重建查询和计算缓存键，
+只替换绑定参数。
 """
 
 from sqlalchemy.orm import Session
-from sqlalchemy import desc
+from sqlalchemy import Row, desc, lambda_stmt, select
 from typing import List, Optional, Dict, Any
 from datetime import datetime
 import json
 
 from . import models_user_profile as models
 from . import schemas_user_profile as schemas
+from .database import commit_or_flush, unit_of_work
+from .write_queue import queued_write
 
 
 # ==================== 用户画像 CRUD ====================
 
 def get_user_profile(db: Session, user_id: str) -> Optional[models.UserProfile]:
     """获取用户画像"""
-    return db.query(models.UserProfile).filter(models.UserProfile.user_id == user_id).first()
+    stmt = lambda_stmt(lambda: select(models.UserProfile).where(models.UserProfile.user_id == user_id).limit(1))
+    return db.execute(stmt).scalars().first()
 
 
 def get_user_profile_by_id(db: Session, profile_id: int) -> Optional[models.UserProfile]:
@@ -25,9 +30,18 @@ def get_user_profile_by_id(db: Session, profile_id: int) -> Optional[models.User
     return db.query(models.UserProfile).filter(models.UserProfile.id == profile_id).first()
 
 
+@queued_write
 def create_user_profile(db: Session, profile: schemas.UserProfileCreate) -> models.UserProfile:
     """创建用户画像"""
-    db_profile = models.UserProfile(
+    db_profile = build_user_profile(profile)
+    db.add(db_profile)
+    commit_or_flush(db, db_profile)
+    return db_profile
+
+
+def build_user_profile(profile: schemas.UserProfileCreate) -> models.UserProfile:
+    """由创建请求构造画像对象（同步/异步CRUD共用）"""
+    return models.UserProfile(
         user_id=profile.user_id,
         nickname=profile.nickname,
         avatar_url=profile.avatar_url,
@@ -48,72 +62,84 @@ def create_user_profile(db: Session, profile: schemas.UserProfileCreate) -> mode
         created_at=datetime.utcnow(),
         last_updated=datetime.utcnow()
     )
-    db.add(db_profile)
-    db.commit()
-    db.refresh(db_profile)
-    return db_profile
 
 
-def update_user_profile(db: Session, user_id: str, updates: schemas.UserProfileUpdate) -> Optional[models.UserProfile]:
-    """更新用户画像"""
+@queued_write
+def update_user_profile(
+    db: Session,
+    user_id: str,
+    profile_update: schemas.UserProfileUpdate,
+    update_type: Optional[str] = None,
+    source_message_id: Optional[int] = None
+) -> Optional[models.UserProfile]:
+    """更新用户画像，指定 update_type 时为每个字段记录更新日志（与更新在同一次提交中）"""
     db_profile = get_user_profile(db, user_id)
     if not db_profile:
         return None
     
     # 更新字段
-    update_data = updates.model_dump(exclude_unset=True)
-    
-    for field, value in update_data.items():
-        if hasattr(db_profile, field):
+    update_data = profile_update.model_dump(exclude_unset=True)
+    
+    with unit_of_work(db):
+        for field, value in update_data.items():
+            if not hasattr(db_profile, field):
+                continue
+            if update_type:
+                old_value = getattr(db_profile, field, None)
+                create_profile_log(
+                    db, user_id,
+                    update_type=update_type,
+                    field_name=field,
+                    old_value=str(old_value) if old_value else None,
+                    new_value=str(value) if value else None,
+                    source_message_id=source_message_id
+                )
             setattr(db_profile, field, value)
-    
-    # 重新计算完整度
-    db_profile.completeness_score = calculate_completeness_score(db_profile)
-    db_profile.last_updated = datetime.utcnow()
-    
-    db.commit()
-    db.refresh(db_profile)
+        
+        # 重新计算完整度
+        db_profile.completeness_score = calculate_completeness_score(db_profile)
+        db_profile.last_updated = datetime.utcnow()
     return db_profile
 
 
+@queued_write
 def batch_update_profile(db: Session, user_id: str, items: List[schemas.ProfileBatchUpdateItem]) -> Optional[models.UserProfile]:
     """批量更新用户画像字段"""
     db_profile = get_user_profile(db, user_id)
     if not db_profile:
         return None
     
-    # 记录日志
-    for item in items:
-        old_value = getattr(db_profile, item.field, None)
-        create_profile_log(
-            db, user_id,
-            update_type=item.source or "batch_update",
-            field_name=item.field,
-            old_value=str(old_value) if old_value else None,
-            new_value=str(item.value) if item.value else None
-        )
-        
-        # 特殊处理JSON字段
-        if item.field in ['value_priorities', 'ability_assessment', 'preferred_disciplines', 
-                          'preferred_majors', 'practice_experiences', 'universal_skills', 
-                          'constraints', 'casve_history']:
-            if isinstance(item.value, str):
-                try:
-                    item.value = json.loads(item.value)
-                except:
-                    pass
+    # 记录日志（所有字段与日志合并为一次提交）
+    with unit_of_work(db):
+        for item in items:
+            old_value = getattr(db_profile, item.field, None)
+            create_profile_log(
+                db, user_id,
+                update_type=item.source or "batch_update",
+                field_name=item.field,
+                old_value=str(old_value) if old_value else None,
+                new_value=str(item.value) if item.value else None
+            )
+            
+            # 特殊处理JSON字段
+            if item.field in ['value_priorities', 'ability_assessment', 'preferred_disciplines', 
+                              'preferred_majors', 'practice_experiences', 'universal_skills', 
+                              'constraints', 'casve_history']:
+                if isinstance(item.value, str):
+                    try:
+                        item.value = json.loads(item.value)
+                    except:
+                        pass
+            
+            # 更新字段
+            setattr(db_profile, item.field, item.value)
         
-        # 更新字段
-        setattr(db_profile, item.field, item.value)
-    
-    db_profile.completeness_score = calculate_completeness_score(db_profile)
-    db_profile.last_updated = datetime.utcnow()
-    
-    db.commit()
-    db.refresh(db_profile)
+        db_profile.completeness_score = calculate_completeness_score(db_profile)
+        db_profile.last_updated = datetime.utcnow()
     return db_profile
 
 
+@queued_write
 def delete_user_profile(db: Session, user_id: str) -> bool:
     """删除用户画像"""
     db_profile = get_user_profile(db, user_id)
@@ -121,12 +147,13 @@ def delete_user_profile(db: Session, user_id: str) -> bool:
         return False
     
     db.delete(db_profile)
-    db.commit()
+    commit_or_flush(db)
     return True
 
 
 # ==================== 更新日志 CRUD ====================
 
+@queued_write
 def create_profile_log(
     db: Session,
     user_id: str,
@@ -147,8 +174,7 @@ def create_profile_log(
         timestamp=datetime.utcnow()
     )
     db.add(db_log)
-    db.commit()
-    db.refresh(db_log)
+    commit_or_flush(db, db_log)
     return db_log
 
 
@@ -252,7 +278,11 @@ def get_profile_completeness_detail(db: Session, user_id: str) -> Optional[schem
     profile = get_user_profile(db, user_id)
     if not profile:
         return None
-    
+    return build_completeness_detail(profile)
+
+
+def build_completeness_detail(profile: models.UserProfile) -> schemas.ProfileCompletenessResponse:
+    """由已加载的画像计算完整度详细信息（不访问数据库）"""
     # 计算各层完整度
     interface_score = 0
     if profile.holland_code: interface_score += 10
@@ -300,6 +330,7 @@ def get_profile_completeness_detail(db: Session, user_id: str) -> Optional[schem
 
 # ==================== 对话记录 CRUD ====================
 
+@queued_write
 def create_conversation(
     db: Session,
     user_id: str,
@@ -319,25 +350,35 @@ def create_conversation(
         extracted_entities=extracted_entities
     )
     db.add(db_conv)
-    db.commit()
-    db.refresh(db_conv)
+    commit_or_flush(db, db_conv)
     return db_conv
 
 
+# 对话历史只读展示，按列查询返回行元组（不建立ORM对象和标识映射）
+CONVERSATION_HISTORY_COLUMNS = (
+    models.UserConversation.id,
+    models.UserConversation.message_role,
+    models.UserConversation.message_content,
+    models.UserConversation.intent_type,
+    models.UserConversation.extracted_entities,
+    models.UserConversation.timestamp,
+)
+
+
 def get_conversation_history(
     db: Session,
     user_id: str,
     session_id: Optional[str] = None,
     limit: int = 50
-) -> List[models.UserConversation]:
-    """获取对话历史"""
-    query = db.query(models.UserConversation).filter(
+) -> List[Row]:
+    """获取对话历史（按时间倒序），返回 CONVERSATION_HISTORY_COLUMNS 的行"""
+    stmt = lambda_stmt(lambda: select(*CONVERSATION_HISTORY_COLUMNS).where(
         models.UserConversation.user_id == user_id
-    )
+    ))
     if session_id:
-        query = query.filter(models.UserConversation.session_id == session_id)
-    
-    return query.order_by(desc(models.UserConversation.timestamp)).limit(limit).all()
+        stmt += lambda s: s.where(models.UserConversation.session_id == session_id)
+    stmt += lambda s: s.order_by(desc(models.UserConversation.timestamp)).limit(limit)
+    return list(db.execute(stmt))
 
 
 def get_recent_conversation_summary(db: Session, user_id: str, limit: int = 10) -> str:
@@ -353,6 +394,7 @@ def get_recent_conversation_summary(db: Session, user_id: str, limit: int = 10)
 
 # ==================== CASVE 操作 ====================
 
+@queued_write
 def advance_casve_stage(
     db: Session,
     user_id: str,
@@ -389,8 +431,7 @@ def advance_casve_stage(
     profile.casve_history = history
     profile.last_updated = datetime.utcnow()
     
-    db.commit()
-    db.refresh(profile)
+    commit_or_flush(db, profile)
     return profile
 
 
@@ -0,0 +1,110 @@
+# -*- coding: utf-8 -*-
+"""
+用户画像模块 - 异步CRUD操作
+供 async def 路由使用的 AsyncSession 版本，查询语义与 crud_user_profile 中的同名函数一致。
+"""
+
+from sqlalchemy import Row, desc, lambda_stmt, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import List, Optional, Dict
+from datetime import datetime
+
+from . import models_user_profile as models
+from . import schemas_user_profile as schemas
+from . import crud_user_profile
+from .crud_user_profile import CONVERSATION_HISTORY_COLUMNS, build_user_profile
+from .write_queue import queued_async_write
+
+
+# ==================== 用户画像 ====================
+
+async def get_user_profile(db: AsyncSession, user_id: str) -> Optional[models.UserProfile]:
+    """获取用户画像"""
+    result = await db.execute(lambda_stmt(
+        lambda: select(models.UserProfile).where(models.UserProfile.user_id == user_id).limit(1)
+    ))
+    return result.scalars().first()
+
+
+async def get_or_create_user_profile(
+    db: AsyncSession,
+    user_id: str,
+    nickname: Optional[str] = None
+) -> models.UserProfile:
+    """获取或创建用户画像"""
+    profile = await get_user_profile(db, user_id)
+    if not profile:
+        profile = await create_user_profile(db, schemas.UserProfileCreate(
+            user_id=user_id,
+            nickname=nickname or f"用户{user_id[:8]}"
+        ))
+    return profile
+
+
+@queued_async_write(crud_user_profile.create_user_profile)
+async def create_user_profile(db: AsyncSession, profile: schemas.UserProfileCreate) -> models.UserProfile:
+    """创建用户画像"""
+    db_profile = build_user_profile(profile)
+    db.add(db_profile)
+    await db.commit()
+    await db.refresh(db_profile)
+    return db_profile
+
+
+# ==================== 更新日志 ====================
+
+async def get_user_profile_logs(
+    db: AsyncSession,
+    user_id: str,
+    update_type: Optional[str] = None,
+    limit: int = 50
+) -> List[models.UserProfileLog]:
+    """获取用户画像更新日志"""
+    stmt = select(models.UserProfileLog).where(models.UserProfileLog.user_id == user_id)
+    if update_type:
+        stmt = stmt.where(models.UserProfileLog.update_type == update_type)
+    result = await db.execute(stmt.order_by(desc(models.UserProfileLog.timestamp)).limit(limit))
+    return list(result.scalars())
+
+
+# ==================== 对话记录 ====================
+
+@queued_async_write(crud_user_profile.create_conversation)
+async def create_conversation(
+    db: AsyncSession,
+    user_id: str,
+    session_id: str,
+    message_role: str,
+    message_content: str,
+    intent_type: Optional[str] = None,
+    extracted_entities: Optional[Dict] = None
+) -> models.UserConversation:
+    """创建对话记录"""
+    db_conv = models.UserConversation(
+        user_id=user_id,
+        session_id=session_id,
+        message_role=message_role,
+        message_content=message_content,
+        intent_type=intent_type,
+        extracted_entities=extracted_entities,
+        timestamp=datetime.utcnow()
+    )
+    db.add(db_conv)
+    await db.commit()
+    return db_conv
+
+
+async def get_conversation_history(
+    db: AsyncSession,
+    user_id: str,
+    session_id: Optional[str] = None,
+    limit: int = 50
+) -> List[Row]:
+    """获取对话历史（按时间倒序），返回 CONVERSATION_HISTORY_COLUMNS 的行"""
+    stmt = lambda_stmt(lambda: select(*CONVERSATION_HISTORY_COLUMNS).where(
+        models.UserConversation.user_id == user_id
+    ))
+    if session_id:
+        stmt += lambda s: s.where(models.UserConversation.session_id == session_id)
+    stmt += lambda s: s.order_by(desc(models.UserConversation.timestamp)).limit(limit)
+    return list(await db.execute(stmt))
@@ -1,10 +1,11 @@
 # -*- coding: utf-8 -*-
 """
 用户报告模块 - CRUD操作
+按主键读取使用 Session.get（对象已在会话中时不发出查询），其余高频读取使用 lambda_stmt 缓存语句。
 """
 
 from sqlalchemy.orm import Session
-from sqlalchemy import and_, desc, asc
+from sqlalchemy import and_, desc, asc, lambda_stmt, select
 from typing import List, Optional, Dict, Any
 from datetime import datetime
 import uuid
@@ -18,10 +19,13 @@ from .schemas_user_report import (
     GenerationTaskCreate, ReportType, ReportStatus, TaskStatus,
     ChapterStatus, ExportFormat
 )
+from .database import commit_or_flush
+from .write_queue import queued_write
 
 
 # ==================== 报告CRUD ====================
 
+@queued_write
 def create_user_report(db: Session, report: UserReportCreate) -> UserReport:
     """创建报告"""
     db_report = UserReport(
@@ -37,16 +41,16 @@ def create_user_report(db: Session, report: UserReportCreate) -> UserReport:
         updated_at=datetime.utcnow()
     )
     db.add(db_report)
-    db.commit()
-    db.refresh(db_report)
+    commit_or_flush(db, db_report)
     return db_report
 
 
 def get_user_report(db: Session, report_id: str) -> Optional[UserReport]:
     """获取报告详情"""
-    return db.query(UserReport).filter(
+    stmt = lambda_stmt(lambda: select(UserReport).where(
         and_(UserReport.id == report_id, UserReport.deleted_at.is_(None))
-    ).first()
+    ).limit(1))
+    return db.execute(stmt).scalars().first()
 
 
 def get_user_reports(
@@ -78,6 +82,7 @@ def get_user_reports(
     return reports, total
 
 
+@queued_write
 def update_user_report(
     db: Session,
     report_id: str,
@@ -94,11 +99,11 @@ def update_user_report(
     for key, value in update_dict.items():
         setattr(db_report, key, value)
     
-    db.commit()
-    db.refresh(db_report)
+    commit_or_flush(db, db_report)
     return db_report
 
 
+@queued_write
 def delete_user_report(db: Session, report_id: str) -> bool:
     """软删除报告"""
     db_report = get_user_report(db, report_id)
@@ -107,10 +112,11 @@ def delete_user_report(db: Session, report_id: str) -> bool:
     
     db_report.deleted_at = datetime.utcnow()
     db_report.status = ReportStatus.ARCHIVED
-    db.commit()
+    commit_or_flush(db)
     return True
 
 
+@queued_write
 def hard_delete_user_report(db: Session, report_id: str) -> bool:
     """硬删除报告（谨慎使用）"""
     db_report = db.query(UserReport).filter(UserReport.id == report_id).first()
@@ -118,15 +124,15 @@ def hard_delete_user_report(db: Session, report_id: str) -> bool:
         return False
     
     db.delete(db_report)
-    db.commit()
+    commit_or_flush(db)
     return True
 
 
 # ==================== 章节CRUD ====================
 
-def create_report_chapter(db: Session, chapter: ReportChapterCreate) -> ReportChapter:
-    """创建章节"""
-    db_chapter = ReportChapter(
+def build_report_chapter(chapter: ReportChapterCreate) -> ReportChapter:
+    """构建章节对象（ID在本地生成，不访问数据库）"""
+    return ReportChapter(
         id=f"ch_{chapter.chapter_code.replace('.', '_')}_{uuid.uuid4().hex[:8]}",
         report_id=chapter.report_id,
         chapter_code=chapter.chapter_code,
@@ -139,15 +145,28 @@ def create_report_chapter(db: Session, chapter: ReportChapterCreate) -> ReportCh
         created_at=datetime.utcnow(),
         updated_at=datetime.utcnow()
     )
+
+
+@queued_write
+def create_report_chapter(db: Session, chapter: ReportChapterCreate) -> ReportChapter:
+    """创建章节"""
+    db_chapter = build_report_chapter(chapter)
     db.add(db_chapter)
-    db.commit()
-    db.refresh(db_chapter)
+    commit_or_flush(db, db_chapter)
     return db_chapter
 
 
+@queued_write
+def create_report_chapters(db: Session, chapters: List[ReportChapter]) -> List[ReportChapter]:
+    """批量写入 build_report_chapter 构建的章节（一次 flush/提交）"""
+    db.add_all(chapters)
+    commit_or_flush(db, *chapters)
+    return chapters
+
+
 def get_report_chapter(db: Session, chapter_id: str) -> Optional[ReportChapter]:
     """获取章节详情"""
-    return db.query(ReportChapter).filter(ReportChapter.id == chapter_id).first()
+    return db.get(ReportChapter, chapter_id)
 
 
 def get_report_chapters(
@@ -164,6 +183,7 @@ def get_report_chapters(
     return query.order_by(ReportChapter.order_num).all()
 
 
+@queued_write
 def update_chapter_content(
     db: Session,
     chapter_id: str,
@@ -205,13 +225,13 @@ def update_chapter_content(
         db_chapter.generated_at = datetime.utcnow()
     
     db_chapter.updated_at = datetime.utcnow()
-    db.commit()
-    db.refresh(db_chapter)
+    commit_or_flush(db, db_chapter)
     return db_chapter
 
 
 # ==================== 生成任务CRUD ====================
 
+@queued_write
 def create_generation_task(db: Session, task: GenerationTaskCreate) -> GenerationTask:
     """创建生成任务"""
     db_task = GenerationTask(
@@ -225,14 +245,13 @@ def create_generation_task(db: Session, task: GenerationTaskCreate) -> Generatio
         updated_at=datetime.utcnow()
     )
     db.add(db_task)
-    db.commit()
-    db.refresh(db_task)
+    commit_or_flush(db, db_task)
     return db_task
 
 
 def get_generation_task(db: Session, task_id: str) -> Optional[GenerationTask]:
     """获取生成任务"""
-    return db.query(GenerationTask).filter(GenerationTask.id == task_id).first()
+    return db.get(GenerationTask, task_id)
 
 
 def get_active_generation_task(db: Session, user_id: str) -> Optional[GenerationTask]:
@@ -252,6 +271,7 @@ def get_active_generation_task(db: Session, user_id: str) -> Optional[Generation
     ).first()
 
 
+@queued_write
 def update_generation_task(
     db: Session,
     task_id: str,
@@ -260,6 +280,7 @@ def update_generation_task(
     current_stage: Optional[str] = None,
     current_chapter_id: Optional[str] = None,
     completed_chapters: Optional[int] = None,
+    total_chapters: Optional[int] = None,
     error_code: Optional[str] = None,
     error_message: Optional[str] = None,
     started_at: Optional[datetime] = None,
@@ -281,6 +302,8 @@ def update_generation_task(
         db_task.current_chapter_id = current_chapter_id
     if completed_chapters is not None:
         db_task.completed_chapters = completed_chapters
+    if total_chapters is not None:
+        db_task.total_chapters = total_chapters
     if error_code is not None:
         db_task.error_code = error_code
     if error_message is not None:
@@ -293,11 +316,11 @@ def update_generation_task(
         db_task.cancelled_at = cancelled_at
     
     db_task.updated_at = datetime.utcnow()
-    db.commit()
-    db.refresh(db_task)
+    commit_or_flush(db, db_task)
     return db_task
 
 
+@queued_write
 def increment_task_retry(db: Session, task_id: str) -> Optional[GenerationTask]:
     """增加任务重试次数"""
     db_task = get_generation_task(db, task_id)
@@ -306,8 +329,7 @@ def increment_task_retry(db: Session, task_id: str) -> Optional[GenerationTask]:
     
     db_task.retry_count += 1
     db_task.updated_at = datetime.utcnow()
-    db.commit()
-    db.refresh(db_task)
+    commit_or_flush(db, db_task)
     return db_task
 
 
@@ -332,6 +354,7 @@ def get_generation_history(
 
 # ==================== 数据快照CRUD ====================
 
+@queued_write
 def create_report_snapshot(
     db: Session,
     report_id: str,
@@ -349,8 +372,7 @@ def create_report_snapshot(
         created_at=datetime.utcnow()
     )
     db.add(db_snapshot)
-    db.commit()
-    db.refresh(db_snapshot)
+    commit_or_flush(db, db_snapshot)
     return db_snapshot
 
 
@@ -375,6 +397,7 @@ def get_report_snapshot_by_type(
 
 # ==================== 导出记录CRUD ====================
 
+@queued_write
 def create_export_record(
     db: Session,
     report_id: str,
@@ -396,11 +419,11 @@ def create_export_record(
         created_at=datetime.utcnow()
     )
     db.add(db_export)
-    db.commit()
-    db.refresh(db_export)
+    commit_or_flush(db, db_export)
     return db_export
 
 
+@queued_write
 def update_export_download(
     db: Session,
     export_id: str,
@@ -415,8 +438,7 @@ def update_export_download(
     db_export.downloaded_at = datetime.utcnow()
     db_export.ip_address = ip_address
     db_export.user_agent = user_agent
-    db.commit()
-    db.refresh(db_export)
+    commit_or_flush(db, db_export)
     return db_export
 
 
@@ -433,6 +455,7 @@ def get_export_records(
 
 # ==================== 生成日志CRUD ====================
 
+@queued_write
 def create_generation_log(
     db: Session,
     task_id: str,
@@ -453,8 +476,7 @@ def create_generation_log(
         created_at=datetime.utcnow()
     )
     db.add(db_log)
-    db.commit()
-    db.refresh(db_log)
+    commit_or_flush(db, db_log)
     return db_log
 
 
@@ -473,6 +495,7 @@ def get_generation_logs(
     return query.order_by(desc(GenerationLog.created_at)).limit(limit).all()
 
 
+@queued_write
 def cancel_generation_task(db: Session, task_id: str) -> Optional[GenerationTask]:
     """取消生成任务"""
     db_task = get_generation_task(db, task_id)
@@ -483,16 +506,16 @@ def cancel_generation_task(db: Session, task_id: str) -> Optional[GenerationTask
     db_task.status = "cancelled"
     db_task.cancelled_at = datetime.utcnow()
     db_task.updated_at = datetime.utcnow()
-    db.commit()
-    db.refresh(db_task)
+    commit_or_flush(db, db_task)
     return db_task
 
 
 def delete_old_generation_logs(db: Session, days: int = 30) -> int:
-    """删除旧的生成日志"""
-    from datetime import timedelta
-    
-    cutoff_date = datetime.utcnow() - timedelta(days=days)
-    result = db.query(GenerationLog).filter(GenerationLog.created_at < cutoff_date).delete()
-    db.commit()
-    return result
+    """
+    删除旧的生成日志
+    按 app.retention 的策略分批删除并归档，每批在独立的短事务中提交（不加入会话的工作单元）
+    """
+    from .retention import POLICIES, purge_table
+
+    policy = POLICIES["generation_logs"]._replace(days=days)
+    return purge_table(policy, bind=db.get_bind())["deleted"]
@@ -0,0 +1,220 @@
+# -*- coding: utf-8 -*-
+"""
+用户报告模块 - 异步CRUD操作
+供 async def 路由使用的 AsyncSession 版本，查询语义与 crud_user_report 中的同名函数一致。
+"""
+
+from sqlalchemy import Row, and_, asc, desc, func, lambda_stmt, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import List, Optional, Dict
+from datetime import datetime
+import uuid
+
+from .models_user_report import (
+    UserReport, ReportChapter, GenerationTask,
+    ReportSnapshot, ReportExport
+)
+from .schemas_user_report import (
+    UserReportUpdate, ReportType, ReportStatus, TaskStatus, ExportFormat
+)
+from . import crud_user_report
+from .write_queue import queued_async_write
+
+
+# ==================== 报告CRUD ====================
+
+async def get_user_report(db: AsyncSession, report_id: str) -> Optional[UserReport]:
+    """获取报告详情"""
+    result = await db.execute(lambda_stmt(lambda: select(UserReport).where(
+        and_(UserReport.id == report_id, UserReport.deleted_at.is_(None))
+    ).limit(1)))
+    return result.scalars().first()
+
+
+async def get_user_reports(
+    db: AsyncSession,
+    user_id: str,
+    report_type: Optional[ReportType] = None,
+    skip: int = 0,
+    limit: int = 10,
+    sort_by: str = "created_at",
+    sort_order: str = "desc"
+) -> tuple[List[UserReport], int]:
+    """获取用户报告列表"""
+    stmt = select(UserReport).where(
+        and_(UserReport.user_id == user_id, UserReport.deleted_at.is_(None))
+    )
+    if report_type:
+        stmt = stmt.where(UserReport.report_type == report_type)
+
+    total = await db.scalar(select(func.count()).select_from(stmt.subquery()))
+
+    # 排序
+    sort_column = getattr(UserReport, sort_by, UserReport.created_at)
+    stmt = stmt.order_by(desc(sort_column) if sort_order == "desc" else asc(sort_column))
+    result = await db.execute(stmt.offset(skip).limit(limit))
+    return list(result.scalars()), total
+
+
+@queued_async_write(crud_user_report.update_user_report)
+async def update_user_report(
+    db: AsyncSession,
+    report_id: str,
+    update_data: UserReportUpdate
+) -> Optional[UserReport]:
+    """更新报告"""
+    db_report = await get_user_report(db, report_id)
+    if not db_report:
+        return None
+
+    update_dict = update_data.model_dump(exclude_unset=True)
+    update_dict['updated_at'] = datetime.utcnow()
+    for key, value in update_dict.items():
+        setattr(db_report, key, value)
+
+    await db.commit()
+    await db.refresh(db_report)
+    return db_report
+
+
+@queued_async_write(crud_user_report.delete_user_report)
+async def delete_user_report(db: AsyncSession, report_id: str) -> bool:
+    """软删除报告"""
+    db_report = await get_user_report(db, report_id)
+    if not db_report:
+        return False
+
+    db_report.deleted_at = datetime.utcnow()
+    db_report.status = ReportStatus.ARCHIVED
+    await db.commit()
+    return True
+
+
+# ==================== 章节CRUD ====================
+
+async def get_report_chapter(db: AsyncSession, chapter_id: str) -> Optional[ReportChapter]:
+    """获取章节"""
+    return await db.get(ReportChapter, chapter_id)
+
+
+async def get_report_chapters(
+    db: AsyncSession,
+    report_id: str,
+    parent_id: Optional[str] = None
+) -> List[ReportChapter]:
+    """获取报告章节列表"""
+    stmt = select(ReportChapter).where(ReportChapter.report_id == report_id)
+    if parent_id is not None:
+        stmt = stmt.where(ReportChapter.parent_id == parent_id)
+    result = await db.execute(stmt.order_by(ReportChapter.order_num))
+    return list(result.scalars())
+
+
+async def get_chapter_outline(db: AsyncSession, report_id: str) -> List[Row]:
+    """报告章节目录（只查询ID和标题，不加载章节内容），按序号排列"""
+    result = await db.execute(
+        select(ReportChapter.id, ReportChapter.title)
+        .where(ReportChapter.report_id == report_id)
+        .order_by(ReportChapter.order_num)
+    )
+    return list(result)
+
+
+# ==================== 生成任务CRUD ====================
+
+async def get_generation_task(db: AsyncSession, task_id: str) -> Optional[GenerationTask]:
+    """获取生成任务"""
+    return await db.get(GenerationTask, task_id)
+
+
+async def get_active_generation_task(db: AsyncSession, user_id: str) -> Optional[GenerationTask]:
+    """获取用户进行中的生成任务"""
+    active_statuses = [
+        TaskStatus.PENDING,
+        TaskStatus.VALIDATING,
+        TaskStatus.GENERATING,
+        TaskStatus.QUALITY_CHECKING,
+        TaskStatus.ASSEMBLING
+    ]
+    result = await db.execute(select(GenerationTask).where(
+        and_(
+            GenerationTask.user_id == user_id,
+            GenerationTask.status.in_(active_statuses)
+        )
+    ).limit(1))
+    return result.scalars().first()
+
+
+@queued_async_write(crud_user_report.update_generation_task)
+async def update_generation_task(
+    db: AsyncSession,
+    task_id: str,
+    **fields
+) -> Optional[GenerationTask]:
+    """更新生成任务，参数同 crud_user_report.update_generation_task（值为None的字段不更新）"""
+    db_task = await get_generation_task(db, task_id)
+    if not db_task:
+        return None
+
+    for key, value in fields.items():
+        if value is not None:
+            setattr(db_task, key, value)
+    db_task.updated_at = datetime.utcnow()
+    await db.commit()
+    await db.refresh(db_task)
+    return db_task
+
+
+async def get_generation_history(
+    db: AsyncSession,
+    user_id: str,
+    status: Optional[str] = None,
+    skip: int = 0,
+    limit: int = 20
+) -> tuple[List[GenerationTask], int]:
+    """获取生成历史"""
+    stmt = select(GenerationTask).where(GenerationTask.user_id == user_id)
+    if status:
+        stmt = stmt.where(GenerationTask.status.in_(status.split(',')))
+
+    total = await db.scalar(select(func.count()).select_from(stmt.subquery()))
+    result = await db.execute(
+        stmt.order_by(desc(GenerationTask.created_at)).offset(skip).limit(limit)
+    )
+    return list(result.scalars()), total
+
+
+# ==================== 快照CRUD ====================
+
+async def get_report_snapshots(db: AsyncSession, report_id: str) -> List[ReportSnapshot]:
+    """获取报告的所有快照"""
+    result = await db.execute(select(ReportSnapshot).where(ReportSnapshot.report_id == report_id))
+    return list(result.scalars())
+
+
+# ==================== 导出记录CRUD ====================
+
+@queued_async_write(crud_user_report.create_export_record)
+async def create_export_record(
+    db: AsyncSession,
+    report_id: str,
+    user_id: str,
+    format: ExportFormat,
+    file_size: int = 0,
+    file_path: Optional[str] = None,
+    export_options: Optional[Dict] = None
+) -> ReportExport:
+    """创建导出记录"""
+    db_export = ReportExport(
+        id=f"exp_{uuid.uuid4().hex[:16]}",
+        report_id=report_id,
+        user_id=user_id,
+        format=format,
+        file_size=file_size,
+        file_path=file_path,
+        export_options=export_options,
+        created_at=datetime.utcnow()
+    )
+    db.add(db_export)
+    await db.commit()
+    return db_export
@@ -0,0 +1,72 @@
+# -*- coding: utf-8 -*-
+"""
+自定义列类型
+JSONText: 以JSON文本存储在Text列中，加载时一次性解码为Python对象，
+替代CRUD中逐行 json.loads 并就地覆盖ORM属性的写法。
+JSONDocument: JSON列，在PostgreSQL上映射为JSONB（可建GIN索引），其他数据库为JSON。
+"""
+
+import json
+
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.types import JSON, Text, TypeDecorator
+
+# 可选的快速JSON解码器
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def json_loads(value):
+    """解码JSON（优先使用orjson）"""
+    if orjson is not None:
+        return orjson.loads(value)
+    return json.loads(value)
+
+
+def json_dumps(value) -> str:
+    """编码JSON，保留中文字符"""
+    return json.dumps(value, ensure_ascii=False)
+
+
+class JSONText(TypeDecorator):
+    """
+    JSON文本列
+
+    - 写入: 列表/字典编码为JSON字符串；字符串视为已编码的JSON，校验后原样写入（兼容旧的初始化脚本），
+      不是合法JSON时抛出 ValueError（否则读取时会被静默替换为 empty_factory()）
+    - 读取: 解码为Python对象；空值返回None，无法解码的脏数据返回 empty_factory()
+
+    注意: 未启用可变追踪，修改列表后需重新赋值属性才会被写回。
+    """
+
+    impl = Text
+    cache_ok = True
+
+    def __init__(self, empty_factory=list, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.empty_factory = empty_factory
+
+    def process_bind_param(self, value, dialect):
+        if value is None:
+            return None
+        if isinstance(value, str):
+            try:
+                json_loads(value)
+            except ValueError:
+                raise ValueError(f"JSONText expects a list/dict or a JSON-encoded string, got {value[:50]!r}")
+            return value
+        return json_dumps(value)
+
+    def process_result_value(self, value, dialect):
+        if not value:
+            return None
+        try:
+            return json_loads(value)
+        except ValueError:
+            return self.empty_factory()
+
+
+# JSON文档列：PostgreSQL 上使用 JSONB（二进制存储，支持 @> 包含查询和GIN索引）
+JSONDocument = JSON().with_variant(JSONB(), "postgresql")
@@ -0,0 +1,93 @@
+# -*- coding: utf-8 -*-
+"""
+启动导入耗时检查
+在子进程中以 python -X importtime 导入 app.main，统计累计导入耗时并列出最慢的模块；
+超过预算、或启动时导入了LLM框架（应由 services.registry 按需导入）时返回非零退出码，可用于CI。
+
+    cd backend
+    python -m app.import_budget [--budget-ms 1500] [--top 15]
+
+预算也可通过环境变量 IMPORT_BUDGET_MS 设置。
+"""
+
+import argparse
+import os
+import re
+import subprocess
+import sys
+from typing import Dict, List, Optional, Tuple
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+TARGET_MODULE = "app.main"
+DEFAULT_BUDGET_MS = float(os.getenv("IMPORT_BUDGET_MS", "1500"))
+
+# 启动时不允许导入的模块（顶层包名）
+FORBIDDEN_MODULES = ("lazyllm", "dspy", "litellm", "openai")
+
+_LINE = re.compile(r"^import time:\s+(\d+)\s+\|\s+(\d+)\s+\|(\s*)(\S+)\s*$")
+
+
+def measure_imports(module: str = TARGET_MODULE) -> Tuple[Dict[str, Tuple[int, int]], str]:
+    """
+    在新进程中导入模块，返回 ({模块名: (自身耗时us, 累计耗时us)}, 子进程标准输出)
+    """
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=BACKEND_DIR,
+        capture_output=True,
+        text=True,
+        encoding="utf-8",
+        errors="replace",
+    )
+    if proc.returncode != 0:
+        raise RuntimeError(f"导入 {module} 失败:\n{proc.stderr[-2000:]}")
+    timings = {}
+    for line in proc.stderr.splitlines():
+        match = _LINE.match(line)
+        if match:
+            timings[match.group(4)] = (int(match.group(1)), int(match.group(2)))
+    return timings, proc.stdout
+
+
+def forbidden_imports(timings: Dict[str, Tuple[int, int]]) -> List[str]:
+    """启动时被导入的禁用模块"""
+    return sorted(name for name in timings if name.split(".")[0] in FORBIDDEN_MODULES)
+
+
+def check_budget(budget_ms: float = DEFAULT_BUDGET_MS, top: int = 15, module: str = TARGET_MODULE) -> dict:
+    """执行检查，返回结果字典（ok 为是否通过）"""
+    timings, stdout = measure_imports(module)
+    total_ms = timings[module][1] / 1000
+    forbidden = forbidden_imports(timings)
+    slowest = sorted(timings.items(), key=lambda item: item[1][0], reverse=True)[:top]
+    return {
+        "module": module,
+        "total_ms": total_ms,
+        "budget_ms": budget_ms,
+        "forbidden": forbidden,
+        "slowest": [(name, self_us / 1000, cumulative_us / 1000) for name, (self_us, cumulative_us) in slowest],
+        "stdout": stdout,
+        "ok": total_ms <= budget_ms and not forbidden,
+    }
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="检查 app.main 的导入耗时")
+    parser.add_argument("--budget-ms", type=float, default=DEFAULT_BUDGET_MS, help="累计导入耗时预算（毫秒）")
+    parser.add_argument("--top", type=int, default=15, help="列出自身耗时最长的模块数")
+    args = parser.parse_args(argv)
+
+    result = check_budget(args.budget_ms, args.top)
+    print(f"{'module':<48}{'self ms':>10}{'cumul ms':>10}")
+    for name, self_ms, cumulative_ms in result["slowest"]:
+        print(f"{name:<48}{self_ms:>10.1f}{cumulative_ms:>10.1f}")
+    print(f"\n[ImportBudget] {result['module']}: {result['total_ms']:.0f}ms (budget {result['budget_ms']:.0f}ms)")
+    if result["forbidden"]:
+        print(f"[ImportBudget] Forbidden modules imported at startup: {', '.join(result['forbidden'])}")
+    print(f"[ImportBudget] {'OK' if result['ok'] else 'FAILED'}")
+    return 0 if result["ok"] else 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -1,375 +0,0 @@
-# -*- coding: utf-8 -*-
-"""
-08 学科门类：工学 - A部分
-包含：力学类、机械类、仪器类、材料类、能源动力类、电气类、电子信息类、自动化类、计算机类
-"""
-
-import sys
-import os
-import json
-
-backend_path = 'D:/github.com/carrotmet/zyplusv2/backend'
-if backend_path not in sys.path:
-    sys.path.insert(0, backend_path)
-os.chdir(backend_path)
-
-from app.database import SessionLocal
-from app import models
-
-def get_or_create_discipline(db, name, code, description):
-    discipline = db.query(models.Discipline).filter(models.Discipline.code == code).first()
-    if not discipline:
-        discipline = models.Discipline(name=name, code=code, description=description)
-        db.add(discipline)
-        db.commit()
-        db.refresh(discipline)
-        print(f"  创建学科门类: {name} (ID: {discipline.id})")
-    else:
-        print(f"  学科门类已存在: {name} (ID: {discipline.id})")
-    return discipline
-
-def get_or_create_category(db, name, code, discipline_id, description):
-    category = db.query(models.MajorCategory).filter(
-        models.MajorCategory.code == code,
-        models.MajorCategory.discipline_id == discipline_id
-    ).first()
-    if not category:
-        category = models.MajorCategory(
-            name=name, code=code, discipline_id=discipline_id, description=description
-        )
-        db.add(category)
-        db.commit()
-        db.refresh(category)
-        print(f"    创建专业类: {name} (ID: {category.id})")
-    else:
-        print(f"    专业类已存在: {name} (ID: {category.id})")
-    return category
-
-def create_major_if_not_exists(db, name, code, category_id, description, duration, courses):
-    existing = db.query(models.Major).filter(models.Major.code == code).first()
-    if existing:
-        print(f"      跳过: {name} (已存在)")
-        return None
-    
-    major = models.Major(
-        name=name,
-        code=code,
-        category_id=category_id,
-        description=description,
-        duration=duration,
-        main_courses=json.dumps(courses, ensure_ascii=False)
-    )
-    db.add(major)
-    db.commit()
-    db.refresh(major)
-    print(f"      创建专业: {name} (ID: {major.id})")
-    return major
-
-def init_engineering_a_data():
-    print("=== 初始化 08 工学类数据（A：机械电子信息自动化计算机）===\n")
-    db = SessionLocal()
-    
-    try:
-        discipline = get_or_create_discipline(
-            db, "工学", "08",
-            "工学学科门类，包含力学、机械、仪器、材料、能源、电气、电子信息、自动化、计算机、土木、水利、测绘、化工、地质、矿业、纺织、轻工、交通运输、海洋工程、航空航天、兵器、核工程、农业工程、林业工程、环境、生物医学、食品、建筑、安全、生物工程、公安技术、交叉工程等专业类"
-        )
-        
-        # 0801 力学类
-        category = get_or_create_category(db, "力学类", "0801", discipline.id, "研究力与运动规律的学科")
-        majors_data = [
-            ("理论与应用力学", "080101", "培养从事力学研究和应用的专业人才",
-             ["理论力学", "材料力学", "流体力学", "弹性力学", "振动力学", "计算力学", "实验力学"]),
-            ("工程力学", "080102", "培养从事工程力学研究和应用的专业人才",
-             ["理论力学", "材料力学", "结构力学", "弹性力学", "有限元法", "实验应力分析", "工程结构"]),
-        ]
-        for name, code, desc, courses in majors_data:
-            create_major_if_not_exists(db, name, code, category.id, desc, 4, courses)
-        
-        # 0802 机械类
-        category2 = get_or_create_category(db, "机械类", "0802", discipline.id, "研究机械设计、制造和控制的学科")
-        majors_data2 = [
-            ("机械工程", "080201", "培养从事机械工程研究和设计的专业人才",
-             ["机械制图", "理论力学", "材料力学", "机械原理", "机械设计", "机械制造技术", "控制工程基础"]),
-            ("机械设计制造及其自动化", "080202", "培养从事机械设计制造及自动化的专业人才",
-             ["机械制图", "理论力学", "材料力学", "机械原理", "机械设计", "数控技术", "机电一体化"]),
-            ("材料成型及控制工程", "080203", "培养从事材料成型及控制工程的专业人才",
-             ["材料科学基础", "金属学与热处理", "铸造原理", "焊接原理", "塑性成形原理", "模具设计", "成型设备"]),
-            ("机械电子工程", "080204", "培养从事机械电子工程的专业人才",
-             ["机械设计", "电子技术", "控制理论", "传感器技术", "机电系统设计", "机器人技术", "PLC技术"]),
-            ("工业设计", "080205", "培养从事工业设计的专业人才",
-             ["设计素描", "设计色彩", "工业设计史", "人机工程学", "产品设计", "交互设计", "设计表达"]),
-            ("过程装备与控制工程", "080206", "培养从事过程装备与控制工程的专业人才",
-             ["化工原理", "工程力学", "机械设计", "过程设备设计", "过程流体机械", "过程控制工程", "压力容器"]),
-            ("车辆工程", "080207", "培养从事车辆工程的专业人才",
-             ["汽车构造", "汽车理论", "汽车设计", "发动机原理", "汽车电子", "新能源汽车", "智能网联汽车"]),
-            ("汽车服务工程", "080208", "培养从事汽车服务工程的专业人才",
-             ["汽车构造", "汽车运用工程", "汽车维修工程", "汽车营销", "汽车保险", "汽车评估", "汽车服务企业管理"]),
-            ("机械工艺技术", "080209T", "培养从事机械工艺技术的专业人才",
-             ["机械制造工艺学", "机床夹具设计", "特种加工", "数控技术", "先进制造技术", "质量控制", "生产管理"]),
-            ("微机电系统工程", "080210T", "培养从事微机电系统工程的专业人才",
-             ["微机械原理", "MEMS设计", "微电子工艺", "传感器技术", "微执行器", "封装技术", "测试技术"]),
-            ("机电技术教育", "080211T", "培养从事机电技术教育的专业人才",
-             ["机械设计", "电子技术", "控制技术", "教育学", "教学法", "技能训练", "职业教育"]),
-            ("汽车维修工程教育", "080212T", "培养从事汽车维修工程教育的专业人才",
-             ["汽车构造", "汽车维修", "汽车检测", "故障诊断", "教育学", "教学法", "技能训练"]),
-            ("智能制造工程", "080213T", "培养从事智能制造工程的专业人才",
-             ["机械设计", "控制理论", "人工智能", "工业互联网", "智能生产线", "数字孪生", "智能决策"]),
-            ("智能车辆工程", "080214T", "培养从事智能车辆工程的专业人才",
-             ["车辆构造", "自动驾驶", "车联网", "人工智能", "传感器融合", "路径规划", "智能座舱"]),
-            ("仿生科学与工程", "080215T", "培养从事仿生科学与工程的专业人才",
-             ["仿生学", "生物力学", "生物材料", "机器人学", "神经工程", "感知系统", "运动控制"]),
-            ("新能源汽车工程", "080216T", "培养从事新能源汽车工程的专业人才",
-             ["电驱动系统", "动力电池", "新能源汽车构造", "电机控制", "充电技术", "整车控制", "热管理"]),
-            ("增材制造工程", "080217T", "培养从事增材制造工程的专业人才",
-             ["增材制造原理", "3D打印技术", "材料成型", "数字化设计", "后处理技术", "质量控制", "应用开发"]),
-            ("智能交互设计", "080218T", "培养从事智能交互设计的专业人才",
-             ["交互设计", "人工智能", "人机交互", "用户体验", "服务设计", "原型设计", "设计评估"]),
-            ("应急装备技术与工程", "080219T", "培养从事应急装备技术与工程的专业人才",
-             ["应急装备", "救援技术", "应急管理", "装备设计", "检测技术", "防护技术", "现场指挥"]),
-            ("农林智能装备工程", "080220T", "培养从事农林智能装备工程的专业人才",
-             ["农业机械", "林业机械", "智能控制", "机器视觉", "精准农业", "农业机器人", "智慧农业"]),
-        ]
-        for name, code, desc, courses in majors_data2:
-            create_major_if_not_exists(db, name, code, category2.id, desc, 4, courses)
-        
-        # 0803 仪器类
-        category3 = get_or_create_category(db, "仪器类", "0803", discipline.id, "研究仪器科学与技术")
-        majors_data3 = [
-            ("测控技术与仪器", "080301", "培养从事测控技术与仪器的专业人才",
-             ["传感器技术", "测试技术", "自动控制", "精密机械", "信号处理", "仪器设计", "计量技术"]),
-            ("精密仪器", "080302T", "培养从事精密仪器的专业人才",
-             ["精密机械设计", "精密测量", "光学精密仪器", "微纳技术", "误差理论", "质量控制", "仪器校准"]),
-            ("智能感知工程", "080303T", "培养从事智能感知工程的专业人才",
-             ["传感器技术", "信号处理", "人工智能", "模式识别", "多传感器融合", "智能系统", "边缘计算"]),
-        ]
-        for name, code, desc, courses in majors_data3:
-            create_major_if_not_exists(db, name, code, category3.id, desc, 4, courses)
-        
-        # 0804 材料类
-        category4 = get_or_create_category(db, "材料类", "0804", discipline.id, "研究材料组成、结构、性能与应用的学科")
-        majors_data4 = [
-            ("材料科学与工程", "080401", "培养从事材料科学与工程研究的专业人才",
-             ["材料科学基础", "材料物理", "材料化学", "材料力学", "材料加工", "材料表征", "材料设计"]),
-            ("材料物理", "080402", "培养从事材料物理研究的专业人才",
-             ["固体物理", "量子力学", "材料物理", "半导体物理", "磁性材料", "光学材料", "电子材料"]),
-            ("材料化学", "080403", "培养从事材料化学研究的专业人才",
-             ["材料化学", "固体化学", "高分子化学", "无机合成", "有机合成", "催化化学", "电化学"]),
-            ("冶金工程", "080404", "培养从事冶金工程的专业人才",
-             ["冶金物理化学", "钢铁冶金", "有色金属冶金", "冶金设备", "冶金能源", "环境保护", "冶金自动化"]),
-            ("金属材料工程", "080405", "培养从事金属材料工程的专业人才",
-             ["金属学", "热处理", "金属材料", "材料成形", "材料性能", "材料检测", "失效分析"]),
-            ("无机非金属材料工程", "080406", "培养从事无机非金属材料工程的专业人才",
-             ["无机化学", "硅酸盐物理化学", "陶瓷材料", "玻璃材料", "水泥材料", "耐火材料", "材料工艺"]),
-            ("高分子材料与工程", "080407", "培养从事高分子材料与工程的专业人才",
-             ["高分子化学", "高分子物理", "聚合物加工", "橡胶工程", "塑料工程", "纤维材料", "涂料材料"]),
-            ("复合材料与工程", "080408", "培养从事复合材料与工程的专业人才",
-             ["复合材料原理", "复合材料工艺", "树脂基复合材料", "金属基复合材料", "陶瓷基复合材料", "界面工程", "性能测试"]),
-            ("粉体材料科学与工程", "080409T", "培养从事粉体材料科学与工程的专业人才",
-             ["粉体工程", "粉末冶金", "颗粒学", "粉碎工程", "粉体成型", "粉体改性", "粉体检测"]),
-            ("宝石及材料工艺学", "080410T", "培养从事宝石及材料工艺学的专业人才",
-             ["宝石学", "钻石分级", "有色宝石", "玉石学", "首饰设计", "材料工艺", "鉴定评估"]),
-            ("焊接技术与工程", "080411T", "培养从事焊接技术与工程的专业人才",
-             ["焊接原理", "焊接材料", "焊接工艺", "焊接设备", "焊接结构", "焊接检测", "特种焊接"]),
-            ("功能材料", "080412T", "培养从事功能材料研究的专业人才",
-             ["功能材料", "半导体材料", "磁性材料", "光学材料", "生物材料", "能源材料", "智能材料"]),
-            ("纳米材料与技术", "080413T", "培养从事纳米材料与技术的专业人才",
-             ["纳米材料", "纳米制备", "纳米表征", "纳米器件", "纳米生物", "纳米能源", "纳米环境"]),
-            ("新能源材料与器件", "080414T", "培养从事新能源材料与器件的专业人才",
-             ["新能源材料", "太阳能电池", "锂电池", "燃料电池", "超级电容器", "储能技术", "器件设计"]),
-            ("材料设计科学与工程", "080415T", "培养从事材料设计科学与工程的专业人才",
-             ["材料设计", "计算材料学", "材料基因组", "人工智能", "数据挖掘", "材料模拟", "优化设计"]),
-            ("复合材料成型工程", "080416T", "培养从事复合材料成型工程的专业人才",
-             ["复合材料", "成型工艺", "模具设计", "工艺装备", "质量控制", "性能测试", "工艺优化"]),
-            ("智能材料与结构", "080417T", "培养从事智能材料与结构的专业人才",
-             ["智能材料", "传感材料", "驱动材料", "智能结构", "振动控制", "健康监测", "自适应系统"]),
-            ("光电信息材料与器件", "080418T", "培养从事光电信息材料与器件的专业人才",
-             ["光电材料", "半导体器件", "光电子器件", "显示技术", "光通信", "光电检测", "器件设计"]),
-            ("生物材料", "080419T", "培养从事生物材料研究的专业人才",
-             ["生物材料", "生物相容性", "组织工程", "生物降解", "药物载体", "生物传感", "临床应用"]),
-            ("材料智能技术", "080420T", "培养从事材料智能技术的专业人才",
-             ["材料信息学", "机器学习", "材料数据库", "智能设计", "高通量计算", "数据挖掘", "知识图谱"]),
-            ("电子信息材料", "080421T", "培养从事电子信息材料的专业人才",
-             ["电子材料", "半导体材料", "介电材料", "磁性材料", "光电材料", "封装材料", "测试表征"]),
-            ("软物质科学与工程", "080422T", "培养从事软物质科学与工程的专业人才",
-             ["软物质物理", "胶体化学", "高分子物理", "生物物理", "界面科学", "自组装", "微流控"]),
-            ("稀土材料科学与工程", "080423T", "培养从事稀土材料科学与工程的专业人才",
-             ["稀土化学", "稀土物理", "稀土分离", "稀土磁性材料", "稀土发光材料", "稀土催化", "稀土应用"]),
-        ]
-        for name, code, desc, courses in majors_data4:
-            create_major_if_not_exists(db, name, code, category4.id, desc, 4, courses)
-        
-        # 0805 能源动力类
-        category5 = get_or_create_category(db, "能源动力类", "0805", discipline.id, "研究能源转换与利用的学科")
-        majors_data5 = [
-            ("能源与动力工程", "080501", "培养从事能源与动力工程的专业人才",
-             ["工程热力学", "流体力学", "传热学", "燃烧学", "锅炉原理", "汽轮机原理", "内燃机原理"]),
-            ("能源与环境系统工程", "080502T", "培养从事能源与环境系统工程的专业人才",
-             ["能源工程", "环境工程", "热力学", "污染控制", "节能减排", "清洁生产", "循环经济"]),
-            ("新能源科学与工程", "080503T", "培养从事新能源科学与工程的专业人才",
-             ["新能源技术", "太阳能", "风能", "生物质能", "储能技术", "并网技术", "能源管理"]),
-            ("储能科学与工程", "080504T", "培养从事储能科学与工程的专业人才",
-             ["储能原理", "电池技术", "超级电容", "储热技术", "储氢技术", "储能系统", "安全管理"]),
-            ("能源服务工程", "080505T", "培养从事能源服务工程的专业人才",
-             ["能源管理", "节能技术", "能源审计", "合同能源管理", "能源经济", "碳管理", "智慧能源"]),
-            ("氢能科学与工程", "080506TK", "培养从事氢能科学与工程的专业人才",
-             ["氢能技术", "制氢技术", "储氢技术", "燃料电池", "氢安全", "氢经济", "氢能政策"]),
-            ("可持续能源", "080507TK", "培养从事可持续能源的专业人才",
-             ["可再生能源", "能源系统", "能源政策", "气候变化", "碳中和", "能源转型", "可持续发展"]),
-        ]
-        for name, code, desc, courses in majors_data5:
-            create_major_if_not_exists(db, name, code, category5.id, desc, 4, courses)
-        
-        # 0806 电气类
-        category6 = get_or_create_category(db, "电气类", "0806", discipline.id, "研究电能生产、传输和应用的学科")
-        majors_data6 = [
-            ("电气工程及其自动化", "080601", "培养从事电气工程及其自动化的专业人才",
-             ["电路原理", "电机学", "电力电子技术", "电力系统分析", "自动控制", "继电保护", "高电压技术"]),
-            ("智能电网信息工程", "080602T", "培养从事智能电网信息工程的专业人才",
-             ["电力系统", "通信技术", "信息技术", "智能电网", "物联网", "数据分析", "网络安全"]),
-            ("光源与照明", "080603T", "培养从事光源与照明的专业人才",
-             ["光学", "光源原理", "照明设计", "LED技术", "智能照明", "光环境", "照明控制"]),
-            ("电气工程与智能控制", "080604T", "培养从事电气工程与智能控制的专业人才",
-             ["电气工程", "智能控制", "人工智能", "机器人", "运动控制", "过程控制", "智能制造"]),
-            ("电机电器智能化", "080605T", "培养从事电机电器智能化的专业人才",
-             ["电机学", "电器学", "智能控制", "电力电子", "驱动技术", "状态监测", "故障诊断"]),
-            ("电缆工程", "080606T", "培养从事电缆工程的专业人才",
-             ["电缆材料", "电缆设计", "电缆制造", "电缆敷设", "电缆检测", "电缆附件", "电缆运维"]),
-            ("能源互联网工程", "080607T", "培养从事能源互联网工程的专业人才",
-             ["能源系统", "互联网技术", "物联网", "大数据", "人工智能", "能源市场", "能源金融"]),
-            ("智慧能源工程", "080608TK", "培养从事智慧能源工程的专业人才",
-             ["能源工程", "信息技术", "人工智能", "数字孪生", "能源管理", "优化调度", "智慧平台"]),
-            ("电动载运工程", "080609T", "培养从事电动载运工程的专业人才",
-             ["电驱动", "载运工具", "动力电池", "电机控制", "车载电网", "充电技术", "能量管理"]),
-            ("大功率半导体科学与工程", "080610TK", "培养从事大功率半导体科学与工程的专业人才",
-             ["半导体物理", "功率器件", "封装技术", "驱动技术", "可靠性", "热管理", "应用技术"]),
-        ]
-        for name, code, desc, courses in majors_data6:
-            create_major_if_not_exists(db, name, code, category6.id, desc, 4, courses)
-        
-        # 0807 电子信息类
-        category7 = get_or_create_category(db, "电子信息类", "0807", discipline.id, "研究信息获取、传输、处理和应用的学科")
-        majors_data7 = [
-            ("电子信息工程", "080701", "培养从事电子信息工程的专业人才",
-             ["电路分析", "模拟电子", "数字电子", "信号与系统", "通信原理", "嵌入式系统", "电子设计"]),
-            ("电子科学与技术", "080702", "培养从事电子科学与技术研究的专业人才",
-             ["固体物理", "半导体物理", "集成电路", "光电子技术", "显示技术", "传感器", "纳米电子"]),
-            ("通信工程", "080703", "培养从事通信工程的专业人才",
-             ["信号与系统", "通信原理", "数字信号处理", "移动通信", "光纤通信", "无线通信", "网络通信"]),
-            ("微电子科学与工程", "080704", "培养从事微电子科学与工程的专业人才",
-             ["半导体物理", "集成电路设计", "微电子工艺", "器件物理", "EDA技术", "封装测试", "可靠性"]),
-            ("光电信息科学与工程", "080705", "培养从事光电信息科学与工程的专业人才",
-             ["光学", "光电子学", "激光技术", "光纤通信", "光电检测", "光学设计", "光通信器件"]),
-            ("信息工程", "080706", "培养从事信息工程的专业人才",
-             ["信息论", "信号处理", "通信系统", "信息系统", "网络安全", "数据压缩", "多媒体技术"]),
-            ("广播电视工程", "080707T", "培养从事广播电视工程的专业人才",
-             ["电视原理", "广播技术", "数字电视", "节目制作", "传输技术", "新媒体", "融媒体"]),
-            ("水声工程", "080708T", "培养从事水声工程的专业人才",
-             ["水声学", "声学基础", "信号处理", "声纳技术", "水下通信", "换能器", "水声探测"]),
-            ("电子封装技术", "080709T", "培养从事电子封装技术的专业人才",
-             ["封装原理", "封装材料", "封装工艺", "封装设计", "封装测试", "可靠性", "先进封装"]),
-            ("集成电路设计与集成系统", "080710T", "培养从事集成电路设计与集成系统的专业人才",
-             ["集成电路设计", "EDA工具", "版图设计", "系统设计", "验证测试", "低功耗设计", "SOC设计"]),
-            ("医学信息工程", "080711T", "培养从事医学信息工程的专业人才",
-             ["医学信息学", "生物医学工程", "医院信息系统", "医学图像处理", "健康大数据", "医疗AI", "远程医疗"]),
-            ("电磁场与无线技术", "080712T", "培养从事电磁场与无线技术的专业人才",
-             ["电磁场理论", "微波技术", "天线设计", "无线通信", "射频电路", "电磁兼容", "电波传播"]),
-            ("电波传播与天线", "080713T", "培养从事电波传播与天线的专业人才",
-             ["电波传播", "天线理论", "电磁场", "微波技术", "天线设计", "测量技术", "通信应用"]),
-            ("电子信息科学与技术", "080714T", "培养从事电子信息科学与技术研究的专业人才",
-             ["电子学", "信息技术", "计算机技术", "信号处理", "通信技术", "嵌入式系统", "人工智能"]),
-            ("电信工程及管理", "080715T", "培养从事电信工程及管理的专业人才",
-             ["电信技术", "网络技术", "通信工程", "项目管理", "运营管理", "市场营销", "电信法规"]),
-            ("应用电子技术教育", "080716T", "培养从事应用电子技术教育的专业人才",
-             ["电子技术", "教育学", "教学法", "技能训练", "课程开发", "实训指导", "职业教育"]),
-            ("人工智能", "080717T", "培养从事人工智能研究和应用的专业人才",
-             ["机器学习", "深度学习", "计算机视觉", "自然语言处理", "语音识别", "强化学习", "AI系统"]),
-            ("海洋信息工程", "080718T", "培养从事海洋信息工程的专业人才",
-             ["海洋学", "信息工程", "水声技术", "海洋遥感", "海洋观测", "数据处理", "海洋信息应用"]),
-            ("柔性电子学", "080719T", "培养从事柔性电子学研究的专业人才",
-             ["柔性电子", "有机电子", "可拉伸电子", "可穿戴设备", "生物电子", "柔性显示", "柔性传感"]),
-            ("智能测控工程", "080720T", "培养从事智能测控工程的专业人才",
-             ["传感器技术", "智能控制", "人工智能", "信号处理", "测控系统", "数据处理", "物联网"]),
-            ("智能视觉工程", "080721T", "培养从事智能视觉工程的专业人才",
-             ["计算机视觉", "图像处理", "模式识别", "深度学习", "三维视觉", "视觉检测", "视觉导航"]),
-            ("智能视听工程", "080722T", "培养从事智能视听工程的专业人才",
-             ["音视频技术", "信号处理", "人工智能", "编解码", "智能处理", "沉浸式技术", "交互技术"]),
-        ]
-        for name, code, desc, courses in majors_data7:
-            create_major_if_not_exists(db, name, code, category7.id, desc, 4, courses)
-        
-        # 0808 自动化类
-        category8 = get_or_create_category(db, "自动化类", "0808", discipline.id, "研究自动控制系统与技术的学科")
-        majors_data8 = [
-            ("自动化", "080801", "培养从事自动化系统的专业人才",
-             ["自动控制原理", "现代控制理论", "传感器技术", "执行机构", "PLC技术", "运动控制", "过程控制"]),
-            ("轨道交通信号与控制", "080802T", "培养从事轨道交通信号与控制的专业人才",
-             ["信号基础", "车站信号", "区间信号", "列车运行控制", "调度集中", "故障诊断", "安全技术"]),
-            ("机器人工程", "080803T", "培养从事机器人工程的专业人才",
-             ["机器人学", "机械设计", "控制理论", "传感器", "人工智能", "机器视觉", "运动规划"]),
-            ("邮政工程", "080804T", "培养从事邮政工程的专业人才",
-             ["邮政概论", "物流技术", "分拣系统", "信息系统", "供应链管理", "电子商务", "智能配送"]),
-            ("核电技术与控制工程", "080805T", "培养从事核电技术与控制工程的专业人才",
-             ["核工程", "控制工程", "反应堆物理", "热工水力", "仪控系统", "核安全", "辐射防护"]),
-            ("智能装备与系统", "080806T", "培养从事智能装备与系统的专业人才",
-             ["智能装备", "系统集成", "人工智能", "机器视觉", "传感技术", "控制系统", "数字孪生"]),
-            ("工业智能", "080807T", "培养从事工业智能的专业人才",
-             ["工业人工智能", "智能工厂", "工业互联网", "大数据分析", "智能优化", "预测维护", "质量控制"]),
-            ("智能工程与创意设计", "080808T", "培养从事智能工程与创意设计的专业人才",
-             ["智能技术", "创意设计", "交互设计", "智能制造", "人工智能", "数字媒体", "创新方法"]),
-        ]
-        for name, code, desc, courses in majors_data8:
-            create_major_if_not_exists(db, name, code, category8.id, desc, 4, courses)
-        
-        # 0809 计算机类
-        category9 = get_or_create_category(db, "计算机类", "0809", discipline.id, "研究计算机科学与技术")
-        majors_data9 = [
-            ("计算机科学与技术", "080901", "培养从事计算机科学与技术研究的专业人才",
-             ["数据结构", "计算机组成原理", "操作系统", "计算机网络", "数据库原理", "算法设计", "软件工程"]),
-            ("软件工程", "080902", "培养从事软件工程的专业人才",
-             ["软件工程", "程序设计", "数据结构", "操作系统", "数据库", "软件测试", "项目管理"]),
-            ("网络工程", "080903", "培养从事网络工程的专业人才",
-             ["计算机网络", "网络协议", "网络安全", "网络管理", "路由交换", "云计算", "网络编程"]),
-            ("信息安全", "080904K", "培养从事信息安全的专业人才",
-             ["密码学", "网络安全", "系统安全", "应用安全", "安全管理", "渗透测试", "安全审计"]),
-            ("物联网工程", "080905", "培养从事物联网工程的专业人才",
-             ["物联网技术", "传感器", "嵌入式系统", "无线通信", "数据处理", "云计算", "智能应用"]),
-            ("数字媒体技术", "080906", "培养从事数字媒体技术的专业人才",
-             ["计算机图形学", "多媒体技术", "游戏开发", "动画技术", "虚拟现实", "交互设计", "数字影像"]),
-            ("智能科学与技术", "080907T", "培养从事智能科学与技术的专业人才",
-             ["人工智能", "机器学习", "模式识别", "智能系统", "认知科学", "神经计算", "智能决策"]),
-            ("空间信息与数字技术", "080908T", "培养从事空间信息与数字技术的专业人才",
-             ["遥感技术", "GIS", "卫星导航", "空间数据库", "数字地球", "空间分析", "位置服务"]),
-            ("电子与计算机工程", "080909T", "培养从事电子与计算机工程的专业人才",
-             ["电子工程", "计算机工程", "嵌入式系统", "硬件设计", "软件开发", "系统集成", "芯片设计"]),
-            ("数据科学与大数据技术", "080910T", "培养从事数据科学与大数据技术的专业人才",
-             ["数据科学", "大数据技术", "数据挖掘", "机器学习", "分布式计算", "数据可视化", "数据治理"]),
-            ("网络空间安全", "080911TK", "培养从事网络空间安全的专业人才",
-             ["网络安全", "密码学", "系统安全", "应用安全", "内容安全", "安全管理", "攻防技术"]),
-            ("新媒体技术", "080912T", "培养从事新媒体技术的专业人才",
-             ["新媒体技术", "数字媒体", "交互设计", "数据 journalism", "社交媒体", "内容生产", "平台运营"]),
-            ("电影制作", "080913T", "培养从事电影制作的专业人才",
-             ["电影摄影", "剪辑", "声音设计", "视觉特效", "制片", "导演", "编剧"]),
-            ("保密技术", "080914TK", "培养从事保密技术的专业人才",
-             ["保密管理", "密码技术", "信息安全", "保密检查", "保密技术防护", "保密法规", "保密审计"]),
-            ("服务科学与工程", "080915T", "培养从事服务科学与工程的专业人才",
-             ["服务科学", "服务设计", "服务运营", "服务创新", "IT服务", "金融服务", "物流服务"]),
-            ("虚拟现实技术", "080916T", "培养从事虚拟现实技术的专业人才",
-             ["虚拟现实", "三维建模", "图形学", "人机交互", "传感器", "实时渲染", "应用开发"]),
-            ("区块链工程", "080917T", "培养从事区块链工程的专业人才",
-             ["区块链原理", "密码学", "共识机制", "智能合约", "分布式系统", "区块链应用", "数字金融"]),
-            ("密码科学与技术", "080918TK", "培养从事密码科学与技术的专业人才",
-             ["密码学", "信息安全", "量子密码", "密码分析", "密码工程", "密码管理", "密码应用"]),
-            ("工业软件", "080919T", "培养从事工业软件的专业人才",
-             ["CAD/CAM", "CAE", "PDM", "数字孪生", "工业APP", "低代码开发", "工业智能"]),
-        ]
-        for name, code, desc, courses in majors_data9:
-            create_major_if_not_exists(db, name, code, category9.id, desc, 4, courses)
-        
-        print("\n=== 工学类数据（A部分）初始化完成 ===")
-        
-    finally:
-        db.close()
-
-if __name__ == "__main__":
-    init_engineering_a_data()
@@ -1,8 +1,9 @@
-from fastapi import FastAPI, HTTPException, Depends, Query
+from fastapi import FastAPI, HTTPException, Depends, Query, Request
 from fastapi.middleware.cors import CORSMiddleware
 from sqlalchemy.orm import Session
 from typing import List, Optional
 from datetime import datetime
+from contextlib import asynccontextmanager
 import uvicorn
 import json
 import sys
@@ -12,7 +13,16 @@ import os
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
 from . import crud, schemas, database, models
-from .database import get_db, create_tables, init_database, get_database_file, check_database_exists
+from .catalog_snapshot import get_catalog_snapshot
+from .response_cache import cached_catalog_response
+from .pagination import next_id_cursor
+from .recommendation_matrix import TOP_K
+from .counters import get_share_like_counter
+from .database import get_db, create_tables, get_database_file, check_database_exists
+from .retention import start_retention_scheduler, stop_retention_scheduler
+from .query_stats import QUERY_STATS_ENABLED, QueryStatsMiddleware
+from .write_queue import close_write_queues
+from .services.skill_index import get_skill_index
 
 # 导入用户画像模块
 from . import models_user_profile, schemas_user_profile, crud_user_profile
@@ -22,73 +32,89 @@ from .api_auth import router as auth_router
 # 导入用户报告模块
 from .api_user_report import router as user_report_router
 
+# 导入诊断模块
+from .api_diagnostics import router as diagnostics_router
 
-def _discipline_to_tree(discipline):
-    """将Discipline ORM对象转换为树形结构字典"""
-    if discipline is None:
-        return None
-    
-    result = {
-        'id': discipline.id,
-        'name': discipline.name,
-        'code': discipline.code,
-        'description': discipline.description,
-        'createdAt': discipline.created_at.isoformat() if discipline.created_at else None,
-        'majorCategories': []
+
+def _json_list(value):
+    """JSONText列已解码，空值或非列表统一为空列表"""
+    return value if isinstance(value, list) else []
+
+
+def _major_to_dict(major):
+    """将Major ORM对象转换为可直接编码的字典"""
+    return {
+        'id': major.id,
+        'name': major.name,
+        'code': major.code,
+        'category_id': major.category_id,
+        'description': major.description,
+        'duration': major.duration,
+        'main_courses': _json_list(major.main_courses),
+        'created_at': major.created_at.isoformat() if major.created_at else None
+    }
+
+
+def _occupation_to_dict(occupation):
+    """将Occupation ORM对象转换为可直接编码的字典"""
+    return {
+        'id': occupation.id,
+        'name': occupation.name,
+        'industry': occupation.industry,
+        'description': occupation.description,
+        'requirements': _json_list(occupation.requirements),
+        'salary_min': occupation.salary_min,
+        'salary_max': occupation.salary_max,
+        'created_at': occupation.created_at.isoformat() if occupation.created_at else None
+    }
+
+
+def _career_path_to_dict(career_path):
+    """将CareerPath ORM对象转换为可直接编码的字典"""
+    return {
+        'id': career_path.id,
+        'occupation_id': career_path.occupation_id,
+        'level': career_path.level,
+        'title': career_path.title,
+        'experience_min': career_path.experience_min,
+        'experience_max': career_path.experience_max,
+        'avg_salary': career_path.avg_salary
+    }
+
+
+def _share_to_dict(share):
+    """将ExperienceShare ORM对象转换为可直接编码的字典（likes 为存储值）"""
+    return {
+        'id': share.id,
+        'experience_id': share.experience_id,
+        'title': share.title,
+        'content': share.content,
+        'tags': _json_list(share.tags),
+        'likes': share.likes or 0,
+        'created_at': share.created_at.isoformat() if share.created_at else None
     }
-    
-    # 处理专业类
-    if hasattr(discipline, 'major_categories') and discipline.major_categories:
-        for category in discipline.major_categories:
-            category_dict = {
-                'id': category.id,
-                'name': category.name,
-                'code': category.code,
-                'disciplineId': category.discipline_id,
-                'description': category.description,
-                'createdAt': category.created_at.isoformat() if category.created_at else None,
-                'majors': []
-            }
-            
-            # 处理专业
-            if hasattr(category, 'majors') and category.majors:
-                for major in category.majors:
-                    major_dict = {
-                        'id': major.id,
-                        'name': major.name,
-                        'code': major.code,
-                        'categoryId': major.category_id,
-                        'description': major.description,
-                        'duration': major.duration,
-                        'mainCourses': [],
-                        'createdAt': major.created_at.isoformat() if major.created_at else None
-                    }
-                    # 处理main_courses
-                    if major.main_courses:
-                        try:
-                            if isinstance(major.main_courses, str):
-                                major_dict['mainCourses'] = json.loads(major.main_courses)
-                            else:
-                                major_dict['mainCourses'] = major.main_courses
-                        except (json.JSONDecodeError, TypeError):
-                            major_dict['mainCourses'] = []
-                    category_dict['majors'].append(major_dict)
-            
-            result['majorCategories'].append(category_dict)
-    
-    return result
 
 
-# 初始化数据库
-db_status = init_database()
-print(f"[API] Database initialized: {db_status['database_file']}")
-print(f"[API] Database exists: {db_status['database_exists']}")
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """应用启动时初始化数据库并加载知识库检索索引（导入本模块时不访问数据库）"""
+    # 本模块的 init_database 是示例数据接口，这里使用 database.init_database
+    db_status = database.init_database()
+    print(f"[API] Database initialized: {db_status['database_file']}")
+    print(f"[API] Database exists: {db_status['database_exists']}")
+    get_skill_index()
+    start_retention_scheduler()
+    yield
+    stop_retention_scheduler()
+    close_write_queues()
+
 
 # 创建FastAPI应用
 app = FastAPI(
     title="职业规划导航API",
     description="为高中生和大学生提供专业选择与职业发展的API服务",
-    version="1.0.0"
+    version="1.0.0",
+    lifespan=lifespan
 )
 
 # 配置CORS - 必须在路由之前
@@ -102,6 +128,10 @@ app.add_middleware(
     max_age=3600,  # 预检请求缓存1小时
 )
 
+# 请求级查询统计（查询数、数据库耗时、N+1、路由预算）
+if QUERY_STATS_ENABLED:
+    app.add_middleware(QueryStatsMiddleware)
+
 # 注册用户画像路由
 app.include_router(user_profile_router)
 
@@ -111,6 +141,9 @@ app.include_router(auth_router)
 # 注册用户报告路由
 app.include_router(user_report_router)
 
+# 注册诊断路由
+app.include_router(diagnostics_router)
+
 # 根路径
 @app.get("/")
 def read_root():
@@ -118,12 +151,13 @@ def read_root():
 
 # 学科门类相关接口
 @app.get("/api/disciplines")
-def read_disciplines(skip: int = 0, limit: int = 100, db: Session = Depends(get_db)):
-    """获取学科门类列表，包含专业类和专业信息（树形结构）"""
-    disciplines = crud.get_disciplines(db, skip=skip, limit=limit)
-    # 使用自定义函数将ORM对象转换为字典，处理嵌套关系
-    discipline_trees = [_discipline_to_tree(d) for d in disciplines]
-    return {"code": 200, "message": "success", "data": {"disciplines": discipline_trees}}
+def read_disciplines(request: Request, skip: int = 0, limit: int = 100):
+    """获取学科门类列表，包含专业类和专业信息（树形结构，从内存快照读取）"""
+    def build():
+        disciplines = get_catalog_snapshot().list_disciplines(skip=skip, limit=limit)
+        discipline_trees = [d.to_dict() for d in disciplines]
+        return {"code": 200, "message": "success", "data": {"disciplines": discipline_trees}}
+    return cached_catalog_response(request, build)
 
 @app.post("/api/disciplines", response_model=schemas.ResponseModel)
 def create_discipline(discipline: schemas.DisciplineCreate, db: Session = Depends(get_db)):
@@ -131,56 +165,125 @@ def create_discipline(discipline: schemas.DisciplineCreate, db: Session = Depend
     return schemas.ResponseModel(data={"discipline": db_discipline})
 
 @app.get("/api/disciplines/{discipline_id}")
-def read_discipline(discipline_id: int, db: Session = Depends(get_db)):
-    discipline = crud.get_discipline(db, discipline_id)
+def read_discipline(request: Request, discipline_id: int):
+    discipline = get_catalog_snapshot().get_discipline(discipline_id)
     if not discipline:
         raise HTTPException(status_code=404, detail="学科门类不存在")
-    return {"code": 200, "message": "success", "data": {"discipline": _discipline_to_tree(discipline)}}
+    return cached_catalog_response(request, lambda: {
+        "code": 200, "message": "success", "data": {"discipline": discipline.to_dict()}
+    })
 
 # 专业相关接口
 @app.get("/api/majors", response_model=schemas.ResponseModel)
 def read_majors(
+    request: Request,
     category_id: Optional[int] = None,
     skip: int = 0,
     limit: int = 100,
-    db: Session = Depends(get_db)
+    cursor: Optional[str] = None
 ):
-    majors = crud.get_majors(db, category_id=category_id, skip=skip, limit=limit)
-    return schemas.ResponseModel(data={"majors": majors})
+    """获取专业列表；传入上一页返回的 next_cursor 继续翻页"""
+    def build():
+        with database.SessionLocal() as db:
+            try:
+                majors = crud.get_majors(db, category_id=category_id, skip=skip, limit=limit, cursor=cursor)
+            except ValueError as e:
+                raise HTTPException(status_code=400, detail=str(e))
+            return {"code": 200, "message": "success",
+                    "data": {"majors": [_major_to_dict(m) for m in majors],
+                             "next_cursor": next_id_cursor(majors, limit)}}
+    return cached_catalog_response(request, build)
 
 @app.post("/api/majors", response_model=schemas.ResponseModel)
 def create_major(major: schemas.MajorCreate, db: Session = Depends(get_db)):
     db_major = crud.create_major(db, major)
     return schemas.ResponseModel(data={"major": db_major})
 
+# 注意：静态路由 /search、/batch 必须在动态路由 /{major_id} 之前定义
+@app.get("/api/majors/search", response_model=schemas.ResponseModel)
+def search_majors(q: str, skip: int = 0, limit: int = Query(100, ge=1, le=100), db: Session = Depends(get_db)):
+    """全文检索专业，按相关度排序并返回高亮摘要"""
+    results = crud.search_majors(db, q, skip=skip, limit=limit)
+    majors = [
+        dict(_major_to_dict(r["major"]), score=r["score"], highlight=r["highlight"])
+        for r in results
+    ]
+    return {"code": 200, "message": "success", "data": {"majors": majors}}
+
+@app.get("/api/majors/batch", response_model=schemas.ResponseModel)
+def read_majors_batch(
+    ids: str = Query(..., description="逗号分隔的专业ID，如 1,2,3"),
+    top_n: int = Query(10, ge=1, le=50),
+    db: Session = Depends(get_db)
+):
+    """批量获取专业详情及各自前N个相关职业（单次查询），用于专业对比和意向专业列表"""
+    try:
+        major_ids = [int(i) for i in ids.split(",") if i.strip()]
+    except ValueError:
+        raise HTTPException(status_code=400, detail="ids 必须为逗号分隔的整数")
+    if not major_ids or len(major_ids) > 100:
+        raise HTTPException(status_code=400, detail="ids 数量需在1到100之间")
+
+    details = crud.get_majors_batch(db, major_ids, top_n=top_n)
+    majors = [
+        dict(_major_to_dict(d["major"]), related_occupations=[
+            dict(_occupation_to_dict(r["occupation"]), match_score=r["match_score"])
+            for r in d["related_occupations"]
+        ])
+        for d in details
+    ]
+    return {"code": 200, "message": "success", "data": {"majors": majors}}
+
 @app.get("/api/majors/{major_id}", response_model=schemas.ResponseModel)
 def read_major(major_id: int, db: Session = Depends(get_db)):
-    major_detail = crud.get_major_detail(db, major_id)
-    if not major_detail:
+    details = crud.get_majors_batch(db, [major_id])
+    if not details:
         raise HTTPException(status_code=404, detail="专业不存在")
-    return schemas.ResponseModel(data=major_detail)
-
-@app.get("/api/majors/search", response_model=schemas.ResponseModel)
-def search_majors(q: str, skip: int = 0, limit: int = 100, db: Session = Depends(get_db)):
-    majors = crud.search_majors(db, q, skip=skip, limit=limit)
-    return schemas.ResponseModel(data={"majors": majors})
+    detail = details[0]
+    return {"code": 200, "message": "success", "data": {
+        "major": _major_to_dict(detail["major"]),
+        "related_occupations": [
+            dict(_occupation_to_dict(r["occupation"]), match_score=r["match_score"])
+            for r in detail["related_occupations"]
+        ]
+    }}
 
 # 职业相关接口
 @app.get("/api/occupations", response_model=schemas.ResponseModel)
 def read_occupations(
+    request: Request,
     industry: Optional[str] = None,
     skip: int = 0,
     limit: int = 100,
-    db: Session = Depends(get_db)
+    cursor: Optional[str] = None
 ):
-    occupations = crud.get_occupations(db, industry=industry, skip=skip, limit=limit)
-    return schemas.ResponseModel(data={"occupations": occupations})
+    """获取职业列表；传入上一页返回的 next_cursor 继续翻页"""
+    def build():
+        with database.SessionLocal() as db:
+            try:
+                occupations = crud.get_occupations(db, industry=industry, skip=skip, limit=limit, cursor=cursor)
+            except ValueError as e:
+                raise HTTPException(status_code=400, detail=str(e))
+            return {"code": 200, "message": "success",
+                    "data": {"occupations": [_occupation_to_dict(o) for o in occupations],
+                             "next_cursor": next_id_cursor(occupations, limit)}}
+    return cached_catalog_response(request, build)
 
 @app.post("/api/occupations", response_model=schemas.ResponseModel)
 def create_occupation(occupation: schemas.OccupationCreate, db: Session = Depends(get_db)):
     db_occupation = crud.create_occupation(db, occupation)
     return schemas.ResponseModel(data={"occupation": db_occupation})
 
+@app.get("/api/occupations/search", response_model=schemas.ResponseModel)
+def search_occupations(q: str, skip: int = 0, limit: int = Query(100, ge=1, le=100), db: Session = Depends(get_db)):
+    """全文检索职业，按相关度排序并返回高亮摘要"""
+    results = crud.search_occupations(db, q, skip=skip, limit=limit)
+    occupations = [
+        dict(_occupation_to_dict(r["occupation"]), score=r["score"], highlight=r["highlight"])
+        for r in results
+    ]
+    return {"code": 200, "message": "success", "data": {"occupations": occupations}}
+
 @app.get("/api/occupations/{occupation_id}", response_model=schemas.ResponseModel)
 def read_occupation(occupation_id: int, db: Session = Depends(get_db)):
     occupation_detail = crud.get_occupation_detail(db, occupation_id)
@@ -190,9 +293,13 @@ def read_occupation(occupation_id: int, db: Session = Depends(get_db)):
 
 # 职业路径接口
 @app.get("/api/career-paths/{occupation_id}", response_model=schemas.ResponseModel)
-def read_career_paths(occupation_id: int, db: Session = Depends(get_db)):
-    career_paths = crud.get_career_paths(db, occupation_id)
-    return schemas.ResponseModel(data={"career_paths": career_paths})
+def read_career_paths(request: Request, occupation_id: int):
+    def build():
+        with database.SessionLocal() as db:
+            career_paths = crud.get_career_paths(db, occupation_id)
+            return {"code": 200, "message": "success",
+                    "data": {"career_paths": [_career_path_to_dict(p) for p in career_paths]}}
+    return cached_catalog_response(request, build)
 
 @app.post("/api/career-paths", response_model=schemas.ResponseModel)
 def create_career_path(career_path: schemas.CareerPathCreate, db: Session = Depends(get_db)):
@@ -201,9 +308,17 @@ def create_career_path(career_path: schemas.CareerPathCreate, db: Session = Depe
 
 # 推荐系统接口
 @app.get("/api/recommendations/majors/{major_id}/occupations", response_model=schemas.ResponseModel)
-def get_major_recommendations(major_id: int, limit: int = 10, db: Session = Depends(get_db)):
-    occupations = crud.get_recommended_occupations(db, major_id, limit)
-    return schemas.ResponseModel(data={"occupations": occupations})
+def get_major_recommendations(major_id: int, limit: int = Query(10, ge=1, le=TOP_K), db: Session = Depends(get_db)):
+    results = crud.get_recommended_occupations(db, major_id, limit)
+    occupations = [dict(_occupation_to_dict(r["occupation"]), match_score=r["match_score"]) for r in results]
+    return {"code": 200, "message": "success", "data": {"occupations": occupations}}
+
+@app.get("/api/recommendations/occupations/{occupation_id}/majors", response_model=schemas.ResponseModel)
+def get_occupation_recommendations(occupation_id: int, limit: int = Query(10, ge=1, le=TOP_K), db: Session = Depends(get_db)):
+    """职业的对口专业（按匹配度降序）"""
+    results = crud.get_recommended_majors(db, occupation_id, limit)
+    majors = [dict(_major_to_dict(r["major"]), match_score=r["match_score"]) for r in results]
+    return {"code": 200, "message": "success", "data": {"majors": majors}}
 
 # 个人经历接口
 @app.get("/api/experiences", response_model=schemas.ResponseModel)
@@ -212,12 +327,17 @@ def read_personal_experiences(
     school_name: Optional[str] = None,
     page: int = 1,
     limit: int = 10,
+    cursor: Optional[str] = None,
     db: Session = Depends(get_db)
 ):
+    """获取个人经历列表；传入 cursor 时按游标翻页（忽略page）"""
     skip = (page - 1) * limit
-    result = crud.get_personal_experiences(
-        db, major_id=major_id, school_name=school_name, skip=skip, limit=limit
-    )
+    try:
+        result = crud.get_personal_experiences(
+            db, major_id=major_id, school_name=school_name, skip=skip, limit=limit, cursor=cursor
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     return schemas.ResponseModel(data=result)
 
 @app.post("/api/experiences", response_model=schemas.ResponseModel)
@@ -243,10 +363,17 @@ def read_experience_shares(
     experience_id: int,
     page: int = 1,
     limit: int = 10,
+    cursor: Optional[str] = None,
     db: Session = Depends(get_db)
 ):
+    """获取经验分享列表；传入 cursor 时按游标翻页（忽略page）"""
     skip = (page - 1) * limit
-    result = crud.get_experience_shares(db, experience_id, skip=skip, limit=limit)
+    try:
+        result = crud.get_experience_shares(db, experience_id, skip=skip, limit=limit, cursor=cursor)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    result["items"] = [_share_to_dict(s) for s in result["items"]]
+    get_share_like_counter().overlay(result["items"])
     return schemas.ResponseModel(data=result)
 
 @app.post("/api/experiences/{experience_id}/shares", response_model=schemas.ResponseModel)
@@ -261,14 +388,16 @@ def create_experience_share(
         raise HTTPException(status_code=404, detail="个人经历不存在")
     
     db_share = crud.create_experience_share(db, share)
-    return schemas.ResponseModel(data={"share": db_share})
+    return schemas.ResponseModel(data={"share": _share_to_dict(db_share)})
 
 @app.post("/api/experiences/shares/{share_id}/like", response_model=schemas.ResponseModel)
 def like_experience_share(share_id: int, db: Session = Depends(get_db)):
     share = crud.like_experience_share(db, share_id)
     if not share:
         raise HTTPException(status_code=404, detail="经验分享不存在")
-    return schemas.ResponseModel(data={"share": share})
+    data = _share_to_dict(share)
+    get_share_like_counter().overlay([data])
+    return schemas.ResponseModel(data={"share": data})
 
 # 初始化数据接口
 @app.post("/api/init-data", response_model=schemas.ResponseModel)
@@ -0,0 +1,199 @@
+# -*- coding: utf-8 -*-
+"""
+数据库迁移
+按注册顺序执行的幂等迁移，执行记录保存在 schema_migrations 表中。
+init_database() 启动时自动执行尚未应用的迁移，也可手动运行：
+
+    cd backend
+    python -m app.migrations
+"""
+
+import json
+import re
+from datetime import datetime
+from typing import Callable, List, Tuple
+
+from sqlalchemy import text
+
+from .database import engine
+
+
+# (迁移ID, 说明, 执行函数)
+MIGRATIONS: List[Tuple[str, str, Callable]] = []
+
+
+def migration(migration_id: str, description: str):
+    """注册迁移函数，函数接收一个处于事务中的Connection"""
+    def decorator(func):
+        MIGRATIONS.append((migration_id, description, func))
+        return func
+    return decorator
+
+
+# ==================== 迁移定义 ====================
+
+@migration("0001_normalize_json_text_columns", "规范化目录JSON文本列（main_courses/requirements/tags）")
+def _normalize_json_text_columns(conn):
+    """
+    JSONText 列类型要求存储合法JSON数组。
+    历史数据中存在空字符串、顿号/逗号分隔的纯文本等，这里统一转换为JSON数组。
+    """
+    columns = [
+        ("majors", "main_courses"),
+        ("occupations", "requirements"),
+        ("experience_shares", "tags"),
+    ]
+    for table, column in columns:
+        rows = conn.execute(text(f"SELECT id, {column} FROM {table} WHERE {column} IS NOT NULL")).fetchall()
+        updates = []
+        for row_id, raw in rows:
+            normalized = _normalize_json_list(raw)
+            if normalized != raw:
+                updates.append({"id": row_id, "value": normalized})
+        if updates:
+            conn.execute(text(f"UPDATE {table} SET {column} = :value WHERE id = :id"), updates)
+            print(f"[Migration] {table}.{column}: normalized {len(updates)} rows")
+
+
+def _normalize_json_list(raw):
+    """将任意历史值转换为JSON数组文本，空值返回None"""
+    if raw is None or not str(raw).strip():
+        return None
+    try:
+        value = json.loads(raw)
+    except (json.JSONDecodeError, TypeError):
+        value = [part.strip() for part in re.split(r"[、,，;；\n]", str(raw)) if part.strip()]
+    else:
+        # 已是合法数组时保留原文，避免无意义的写入
+        if isinstance(value, list):
+            return raw
+    if isinstance(value, str):
+        value = [value]
+    elif not isinstance(value, list):
+        value = []
+    return json.dumps(value, ensure_ascii=False)
+
+
+@migration("0002_keyset_pagination_indexes", "为列表接口的键集分页创建复合索引")
+def _keyset_pagination_indexes(conn):
+    """与 models 中 __table_args__ 定义的索引保持一致"""
+    indexes = [
+        ("ix_majors_category_id_id", "majors", "category_id, id"),
+        ("ix_occupations_industry_id", "occupations", "industry, id"),
+        ("ix_personal_experiences_created_at_id", "personal_experiences", "created_at, id"),
+        ("ix_personal_experiences_major_created_at_id", "personal_experiences", "major_id, created_at, id"),
+        ("ix_experience_shares_experience_created_at_id", "experience_shares", "experience_id, created_at, id"),
+    ]
+    for name, table, columns in indexes:
+        conn.execute(text(f"CREATE INDEX IF NOT EXISTS {name} ON {table} ({columns})"))
+
+
+@migration("0003_hot_path_composite_indexes", "为高频查询路径创建复合索引（见 app.query_audit）")
+def _hot_path_composite_indexes(conn):
+    """与 models / models_user_profile / models_user_report 中 __table_args__ 定义的索引保持一致"""
+    indexes = [
+        ("ix_major_occupations_major_score", "major_occupations", "major_id, match_score, occupation_id"),
+        ("ix_major_occupations_occupation_score", "major_occupations", "occupation_id, match_score"),
+        ("ix_career_paths_occupation_experience", "career_paths", "occupation_id, experience_min"),
+        ("ix_user_conversations_user_timestamp", "user_conversations", "user_id, timestamp"),
+        ("ix_user_profile_logs_user_timestamp", "user_profile_logs", "user_id, timestamp"),
+        ("ix_user_reports_user_created_at", "user_reports", "user_id, created_at"),
+        ("ix_report_chapters_report_order", "report_chapters", "report_id, order_num"),
+        ("ix_report_chapters_parent_id", "report_chapters", "parent_id"),
+        ("ix_generation_tasks_user_status", "generation_tasks", "user_id, status"),
+        ("ix_generation_tasks_user_created_at", "generation_tasks", "user_id, created_at"),
+        ("ix_report_exports_report_created_at", "report_exports", "report_id, created_at"),
+        ("ix_generation_logs_task_created_at", "generation_logs", "task_id, created_at"),
+        ("ix_generation_logs_chapter_id", "generation_logs", "chapter_id"),
+        ("ix_generation_logs_created_at", "generation_logs", "created_at"),
+    ]
+    for name, table, columns in indexes:
+        conn.execute(text(f"CREATE INDEX IF NOT EXISTS {name} ON {table} ({columns})"))
+    # 更新统计信息，使查询规划器优先选择新的复合索引
+    conn.execute(text("ANALYZE"))
+
+
+@migration("0004_postgres_jsonb_columns", "PostgreSQL: JSON列转换为JSONB并创建GIN索引")
+def _postgres_jsonb_columns(conn):
+    """
+    与 db_types.JSONDocument 及 UserProfile 的GIN索引保持一致。
+    新建的PostgreSQL库由 create_all 直接创建JSONB列；这里处理更早以 json 类型创建的库。SQLite 无需处理。
+    """
+    if conn.dialect.name != "postgresql":
+        return
+    rows = conn.execute(text(
+        "SELECT table_name, column_name FROM information_schema.columns "
+        "WHERE table_schema = current_schema() AND data_type = 'json'"
+    )).fetchall()
+    for table, column in rows:
+        conn.execute(text(f'ALTER TABLE {table} ALTER COLUMN "{column}" TYPE JSONB USING "{column}"::jsonb'))
+        print(f"[Migration] {table}.{column}: json -> jsonb")
+    for column in ("preferred_majors", "preferred_disciplines"):
+        conn.execute(text(
+            f"CREATE INDEX IF NOT EXISTS ix_user_profiles_{column}_gin "
+            f"ON user_profiles USING gin ({column} jsonb_path_ops)"
+        ))
+
+
+@migration("0005_unique_major_category_code", "专业类代码唯一索引（目录导入按代码 upsert）")
+def _unique_major_category_code(conn):
+    """与 models.MajorCategory 的 ux_major_categories_code 保持一致；重复的专业类合并到最早创建的一条"""
+    duplicates = conn.execute(text(
+        "SELECT code, MIN(id) FROM major_categories GROUP BY code HAVING COUNT(*) > 1"
+    )).fetchall()
+    for code, keep_id in duplicates:
+        conn.execute(text(
+            "UPDATE majors SET category_id = :keep WHERE category_id IN "
+            "(SELECT id FROM major_categories WHERE code = :code AND id != :keep)"
+        ), {"keep": keep_id, "code": code})
+        conn.execute(text("DELETE FROM major_categories WHERE code = :code AND id != :keep"),
+                     {"keep": keep_id, "code": code})
+        print(f"[Migration] major_categories: merged duplicates of {code} into id={keep_id}")
+    conn.execute(text("CREATE UNIQUE INDEX IF NOT EXISTS ux_major_categories_code ON major_categories (code)"))
+
+
+@migration("0006_retention_timestamp_indexes", "日志保留：按时间分批清理和置空对话引用的索引（见 app.retention）")
+def _retention_timestamp_indexes(conn):
+    """与 models_user_profile 中 __table_args__ 定义的索引保持一致"""
+    indexes = [
+        ("ix_user_conversations_timestamp", "user_conversations", "timestamp"),
+        ("ix_user_profile_logs_timestamp", "user_profile_logs", "timestamp"),
+        ("ix_user_profile_logs_source_message_id", "user_profile_logs", "source_message_id"),
+    ]
+    for name, table, columns in indexes:
+        conn.execute(text(f"CREATE INDEX IF NOT EXISTS {name} ON {table} ({columns})"))
+
+
+# ==================== 执行 ====================
+
+def _applied_migrations(conn) -> set:
+    conn.execute(text(
+        "CREATE TABLE IF NOT EXISTS schema_migrations ("
+        "id VARCHAR(100) PRIMARY KEY, description TEXT, applied_at TIMESTAMP)"
+    ))
+    return {row[0] for row in conn.execute(text("SELECT id FROM schema_migrations"))}
+
+
+def run_migrations(bind=None) -> List[str]:
+    """执行所有未应用的迁移，返回本次执行的迁移ID"""
+    bind = bind or engine
+    executed = []
+    with bind.begin() as conn:
+        applied = _applied_migrations(conn)
+    for migration_id, description, func in MIGRATIONS:
+        if migration_id in applied:
+            continue
+        with bind.begin() as conn:
+            func(conn)
+            conn.execute(
+                text("INSERT INTO schema_migrations (id, description, applied_at) VALUES (:id, :d, :t)"),
+                {"id": migration_id, "d": description, "t": datetime.utcnow()}
+            )
+        print(f"[Migration] Applied {migration_id}: {description}")
+        executed.append(migration_id)
+    return executed
+
+
+if __name__ == "__main__":
+    applied = run_migrations()
+    print(f"[Migration] {len(applied)} migration(s) applied")
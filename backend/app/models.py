@@ -1,7 +1,8 @@
-from sqlalchemy import Column, Integer, String, Text, Boolean, DateTime, ForeignKey
+from sqlalchemy import Column, Integer, String, Text, Boolean, DateTime, ForeignKey, Index
 from sqlalchemy.orm import relationship
 from datetime import datetime
 from .database import Base
+from .db_types import JSONText
 
 # 学科门类表
 class Discipline(Base):
@@ -30,6 +31,11 @@ class MajorCategory(Base):
     # 关系
     discipline = relationship("Discipline", back_populates="major_categories")
     majors = relationship("Major", back_populates="category")
+    
+    # 专业类代码唯一（目录导入按代码 upsert）
+    __table_args__ = (
+        Index("ux_major_categories_code", "code", unique=True),
+    )
 
 # 专业表
 class Major(Base):
@@ -41,13 +47,18 @@ class Major(Base):
     category_id = Column(Integer, ForeignKey("major_categories.id"), nullable=False)
     description = Column(Text)
     duration = Column(Integer)  # 学制年限
-    main_courses = Column(Text)  # 主要课程（JSON格式）
+    main_courses = Column(JSONText)  # 主要课程（JSON数组）
     created_at = Column(DateTime, default=datetime.utcnow)
     
     # 关系
     category = relationship("MajorCategory", back_populates="majors")
     occupations = relationship("Occupation", secondary="major_occupations", back_populates="majors")
     experiences = relationship("PersonalExperience", back_populates="major")
+    
+    # 按专业类键集分页
+    __table_args__ = (
+        Index("ix_majors_category_id_id", "category_id", "id"),
+    )
 
 # 职业表
 class Occupation(Base):
@@ -57,7 +68,7 @@ class Occupation(Base):
     name = Column(String(100), nullable=False)
     industry = Column(String(100))
     description = Column(Text)
-    requirements = Column(Text)  # 要求（JSON格式）
+    requirements = Column(JSONText)  # 要求（JSON数组）
     salary_min = Column(Integer)
     salary_max = Column(Integer)
     created_at = Column(DateTime, default=datetime.utcnow)
@@ -65,6 +76,11 @@ class Occupation(Base):
     # 关系
     majors = relationship("Major", secondary="major_occupations", back_populates="occupations")
     career_paths = relationship("CareerPath", back_populates="occupation")
+    
+    # 按行业键集分页
+    __table_args__ = (
+        Index("ix_occupations_industry_id", "industry", "id"),
+    )
 
 # 专业职业关联表
 class MajorOccupation(Base):
@@ -74,6 +90,12 @@ class MajorOccupation(Base):
     major_id = Column(Integer, ForeignKey("majors.id"), nullable=False)
     occupation_id = Column(Integer, ForeignKey("occupations.id"), nullable=False)
     match_score = Column(Integer, default=80)  # 匹配度
+    
+    # 按专业/职业取匹配度排名前N
+    __table_args__ = (
+        Index("ix_major_occupations_major_score", "major_id", "match_score", "occupation_id"),
+        Index("ix_major_occupations_occupation_score", "occupation_id", "match_score"),
+    )
 
 # 职业路径表
 class CareerPath(Base):
@@ -89,6 +111,11 @@ class CareerPath(Base):
     
     # 关系
     occupation = relationship("Occupation", back_populates="career_paths")
+    
+    # 按职业取晋升路径（按经验排序）
+    __table_args__ = (
+        Index("ix_career_paths_occupation_experience", "occupation_id", "experience_min"),
+    )
 
 # 个人经历表
 class PersonalExperience(Base):
@@ -108,6 +135,12 @@ class PersonalExperience(Base):
     # 关系
     major = relationship("Major", back_populates="experiences")
     shares = relationship("ExperienceShare", back_populates="experience")
+    
+    # 按 (created_at, id) 键集分页
+    __table_args__ = (
+        Index("ix_personal_experiences_created_at_id", "created_at", "id"),
+        Index("ix_personal_experiences_major_created_at_id", "major_id", "created_at", "id"),
+    )
 
 # 经验分享表
 class ExperienceShare(Base):
@@ -117,12 +150,17 @@ class ExperienceShare(Base):
     experience_id = Column(Integer, ForeignKey("personal_experiences.id"), nullable=False)
     title = Column(String(200), nullable=False)
     content = Column(Text, nullable=False)
-    tags = Column(Text)  # 标签（JSON格式）
+    tags = Column(JSONText)  # 标签（JSON数组）
     likes = Column(Integer, default=0)
     created_at = Column(DateTime, default=datetime.utcnow)
     
     # 关系
     experience = relationship("PersonalExperience", back_populates="shares")
+    
+    # 按 (created_at, id) 键集分页
+    __table_args__ = (
+        Index("ix_experience_shares_experience_created_at_id", "experience_id", "created_at", "id"),
+    )
 
 # 用户表
 class User(Base):
@@ -4,10 +4,11 @@
 基于 Career-Planning SKILL 三层模型架构设计
 """
 
-from sqlalchemy import Column, Integer, String, Text, DateTime, ForeignKey, JSON
+from sqlalchemy import Column, Integer, String, Text, DateTime, ForeignKey, Index
 from sqlalchemy.orm import relationship
 from datetime import datetime
 from .database import Base
+from .db_types import JSONDocument
 
 
 class UserProfile(Base):
@@ -26,32 +27,32 @@ class UserProfile(Base):
     # 兴趣与价值观
     holland_code = Column(String(10))  # 如: RIA, SEC
     mbti_type = Column(String(10))     # 如: INTJ, ENFP
-    value_priorities = Column(JSON)    # ["成就感", "工作稳定", "创新空间"]
+    value_priorities = Column(JSONDocument)    # ["成就感", "工作稳定", "创新空间"]
     
     # 能力评估
-    ability_assessment = Column(JSON)  # {"逻辑推理": 8, "创造力": 7, ...}
+    ability_assessment = Column(JSONDocument)  # {"逻辑推理": 8, "创造力": 7, ...}
     
     # 约束条件
-    constraints = Column(JSON)         # {"family_bg": "...", "location_pref": "..."}
+    constraints = Column(JSONDocument)         # {"family_bg": "...", "location_pref": "..."}
     
     # ==================== 可变层 (Variable Layer) ====================
     # 专业偏好
-    preferred_disciplines = Column(JSON)  # [1, 2, 8] 学科ID列表
-    preferred_majors = Column(JSON)       # [101, 102, 801] 专业ID列表
+    preferred_disciplines = Column(JSONDocument)  # [1, 2, 8] 学科ID列表
+    preferred_majors = Column(JSONDocument)       # [101, 102, 801] 专业ID列表
     
     # 路径偏好
     career_path_preference = Column(String(50))  # technical/management/professional/public
     
     # 实践经历
-    practice_experiences = Column(JSON)  # [{"type": "internship", "desc": "..."}, ...]
+    practice_experiences = Column(JSONDocument)  # [{"type": "internship", "desc": "..."}, ...]
     
     # ==================== 核心层 (Core Layer) ====================
     # CASVE决策状态
     current_casve_stage = Column(String(20), default='communication')  # C/A/S/V/E
-    casve_history = Column(JSON)         # [{"stage": "C", "timestamp": "...", "notes": "..."}]
+    casve_history = Column(JSONDocument)         # [{"stage": "C", "timestamp": "...", "notes": "..."}]
     
     # 通用技能
-    universal_skills = Column(JSON)      # {"communication": 7, "teamwork": 8, ...}
+    universal_skills = Column(JSONDocument)      # {"communication": 7, "teamwork": 8, ...}
     resilience_score = Column(Integer)   # 1-10
     
     # RAG对话上下文
@@ -67,6 +68,14 @@ class UserProfile(Base):
     conversations = relationship("UserConversation", back_populates="user_profile", cascade="all, delete-orphan")
     update_logs = relationship("UserProfileLog", back_populates="user_profile", cascade="all, delete-orphan")
 
+    # PostgreSQL: 意向学科/专业ID列表的包含查询（@>）使用GIN索引，SQLite 上不创建
+    __table_args__ = (
+        Index("ix_user_profiles_preferred_majors_gin", "preferred_majors", postgresql_using="gin",
+              postgresql_ops={"preferred_majors": "jsonb_path_ops"}).ddl_if(dialect="postgresql"),
+        Index("ix_user_profiles_preferred_disciplines_gin", "preferred_disciplines", postgresql_using="gin",
+              postgresql_ops={"preferred_disciplines": "jsonb_path_ops"}).ddl_if(dialect="postgresql"),
+    )
+
 
 class UserConversation(Base):
     """
@@ -81,11 +90,17 @@ class UserConversation(Base):
     message_role = Column(String(20))  # user/assistant/system
     message_content = Column(Text)
     intent_type = Column(String(50))   # interest_explore/ability_assess/value_clarify/career_advice/...
-    extracted_entities = Column(JSON)  # 提取的实体信息
+    extracted_entities = Column(JSONDocument)  # 提取的实体信息
     timestamp = Column(DateTime, default=datetime.utcnow)
     
     # 关系
     user_profile = relationship("UserProfile", back_populates="conversations")
+    
+    # 按用户取最近对话；按时间清理
+    __table_args__ = (
+        Index("ix_user_conversations_user_timestamp", "user_id", "timestamp"),
+        Index("ix_user_conversations_timestamp", "timestamp"),
+    )
 
 
 class UserProfileLog(Base):
@@ -106,6 +121,13 @@ class UserProfileLog(Base):
     
     # 关系
     user_profile = relationship("UserProfile", back_populates="update_logs")
+    
+    # 按用户取最近更新日志；按时间清理；清理对话时置空引用
+    __table_args__ = (
+        Index("ix_user_profile_logs_user_timestamp", "user_id", "timestamp"),
+        Index("ix_user_profile_logs_timestamp", "timestamp"),
+        Index("ix_user_profile_logs_source_message_id", "source_message_id"),
+    )
 
 
 class UserCareerPathRecommendation(Base):
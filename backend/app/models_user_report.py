@@ -4,10 +4,11 @@
 基于 Career-Planning SKILL 三层模型架构设计
 """
 
-from sqlalchemy import Column, Integer, String, Text, DateTime, ForeignKey, JSON, Boolean
+from sqlalchemy import Column, Integer, String, Text, DateTime, ForeignKey, Boolean, Index
 from sqlalchemy.orm import relationship
 from datetime import datetime
 from .database import Base
+from .db_types import JSONDocument
 
 
 class UserReport(Base):
@@ -50,6 +51,11 @@ class UserReport(Base):
     snapshots = relationship("ReportSnapshot", back_populates="report", cascade="all, delete-orphan")
     exports = relationship("ReportExport", back_populates="report", cascade="all, delete-orphan")
     generation_task = relationship("GenerationTask", back_populates="report", uselist=False)
+    
+    # 按用户取报告列表（按创建时间排序）
+    __table_args__ = (
+        Index("ix_user_reports_user_created_at", "user_id", "created_at"),
+    )
 
 
 class ReportChapter(Base):
@@ -93,6 +99,12 @@ class ReportChapter(Base):
     report = relationship("UserReport", back_populates="chapters")
     parent = relationship("ReportChapter", remote_side="ReportChapter.id", backref="children")
     generation_logs = relationship("GenerationLog", back_populates="chapter")
+    
+    # 按报告取有序章节；父章节级联删除
+    __table_args__ = (
+        Index("ix_report_chapters_report_order", "report_id", "order_num"),
+        Index("ix_report_chapters_parent_id", "parent_id"),
+    )
 
 
 class GenerationTask(Base):
@@ -126,7 +138,7 @@ class GenerationTask(Base):
     retry_count = Column(Integer, default=0)
     
     # 生成选项
-    options = Column(JSON, nullable=True)
+    options = Column(JSONDocument, nullable=True)
     
     # 时间戳
     started_at = Column(DateTime, nullable=True)
@@ -139,6 +151,12 @@ class GenerationTask(Base):
     report = relationship("UserReport", back_populates="generation_task")
     logs = relationship("GenerationLog", back_populates="task", cascade="all, delete-orphan")
     current_chapter = relationship("ReportChapter")
+    
+    # 进行中任务查询与生成历史
+    __table_args__ = (
+        Index("ix_generation_tasks_user_status", "user_id", "status"),
+        Index("ix_generation_tasks_user_created_at", "user_id", "created_at"),
+    )
 
 
 class ReportSnapshot(Base):
@@ -154,7 +172,7 @@ class ReportSnapshot(Base):
     
     # 快照类型: user_profile/interface_layer/variable_layer/core_layer/form_history/major_preferences
     snapshot_type = Column(String(30), nullable=False, index=True)
-    snapshot_data = Column(JSON, nullable=False)
+    snapshot_data = Column(JSONDocument, nullable=False)
     
     created_at = Column(DateTime, default=datetime.utcnow)
     
@@ -177,7 +195,7 @@ class ReportExport(Base):
     format = Column(String(20), nullable=False, index=True)
     file_size = Column(Integer, default=0)  # 文件大小(字节)
     file_path = Column(String(500), nullable=True)
-    export_options = Column(JSON, nullable=True)
+    export_options = Column(JSONDocument, nullable=True)
     
     # 下载记录
     downloaded_at = Column(DateTime, nullable=True)
@@ -188,6 +206,11 @@ class ReportExport(Base):
     
     # 关系
     report = relationship("UserReport", back_populates="exports")
+    
+    # 按报告取导出记录
+    __table_args__ = (
+        Index("ix_report_exports_report_created_at", "report_id", "created_at"),
+    )
 
 
 class GenerationLog(Base):
@@ -206,13 +229,20 @@ class GenerationLog(Base):
     stage = Column(String(30), nullable=True)  # 生成阶段
     chapter_id = Column(String(64), ForeignKey("report_chapters.id"), nullable=True)
     message = Column(Text, nullable=False)
-    details = Column(JSON, nullable=True)
+    details = Column(JSONDocument, nullable=True)
     
     created_at = Column(DateTime, default=datetime.utcnow)
     
     # 关系
     task = relationship("GenerationTask", back_populates="logs")
     chapter = relationship("ReportChapter", back_populates="generation_logs")
+    
+    # 按任务取日志；章节级联删除；按时间清理
+    __table_args__ = (
+        Index("ix_generation_logs_task_created_at", "task_id", "created_at"),
+        Index("ix_generation_logs_chapter_id", "chapter_id"),
+        Index("ix_generation_logs_created_at", "created_at"),
+    )
 
 
 # 导出所有模型
@@ -0,0 +1,126 @@
+# -*- coding: utf-8 -*-
+"""
+游标分页
+列表接口使用基于排序键的键集分页（keyset pagination）替代 OFFSET：
+下一页条件为 (created_at, id) < 上一页最后一条，配合复合索引可直接定位，
+翻页深度不再影响耗时。游标对客户端不透明（URL安全的base64编码JSON）。
+
+总数使用带TTL的计数缓存，写入路径调用 invalidate_counts() 使对应计数失效，
+避免每次翻页都执行一次 COUNT(*)。缓存键含查询参数（如学校名），按 LRU 限制条目数。
+"""
+
+import base64
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+from datetime import datetime
+from typing import Callable, Dict, Optional, Tuple
+
+from sqlalchemy import and_, or_
+
+
+# ==================== 游标编解码 ====================
+
+def encode_cursor(*values) -> str:
+    """将排序键编码为游标，datetime 以ISO格式保存"""
+    payload = [v.isoformat() if isinstance(v, datetime) else v for v in values]
+    raw = json.dumps(payload, separators=(",", ":")).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def decode_cursor(token: str, size: int) -> tuple:
+    """解码游标，格式不合法时抛出 ValueError"""
+    try:
+        raw = base64.urlsafe_b64decode(token + "=" * (-len(token) % 4))
+        values = json.loads(raw)
+    except (ValueError, TypeError):
+        raise ValueError("无效的分页游标")
+    if not isinstance(values, list) or len(values) != size:
+        raise ValueError("无效的分页游标")
+    return tuple(values)
+
+
+def decode_time_cursor(token: str) -> Tuple[datetime, int]:
+    """解码 (created_at, id) 游标"""
+    created_at, row_id = decode_cursor(token, 2)
+    try:
+        return datetime.fromisoformat(created_at), int(row_id)
+    except (ValueError, TypeError):
+        raise ValueError("无效的分页游标")
+
+
+def decode_id_cursor(token: str) -> int:
+    """解码 id 游标"""
+    (row_id,) = decode_cursor(token, 1)
+    try:
+        return int(row_id)
+    except (ValueError, TypeError):
+        raise ValueError("无效的分页游标")
+
+
+def before_time_cursor(created_at_column, id_column, token: str):
+    """(created_at, id) 降序排列时，位于游标之后的行的过滤条件"""
+    created_at, row_id = decode_time_cursor(token)
+    return or_(
+        created_at_column < created_at,
+        and_(created_at_column == created_at, id_column < row_id)
+    )
+
+
+def next_time_cursor(items, limit: int) -> Optional[str]:
+    """按 (created_at, id) 生成下一页游标，不足一页时返回None"""
+    if not items or len(items) < limit:
+        return None
+    last = items[-1]
+    return encode_cursor(last.created_at, last.id)
+
+
+def next_id_cursor(items, limit: int) -> Optional[str]:
+    """按 id 生成下一页游标，不足一页时返回None"""
+    if not items or len(items) < limit:
+        return None
+    return encode_cursor(items[-1].id)
+
+
+# ==================== 计数缓存 ====================
+
+COUNT_TTL_SECONDS = 60
+COUNT_CACHE_MAX_ENTRIES = int(os.environ.get("COUNT_CACHE_MAX_ENTRIES", "1024"))
+
+_count_lock = threading.Lock()
+_counts: "OrderedDict[tuple, Tuple[float, int]]" = OrderedDict()
+
+
+def cached_count(key: tuple, counter: Callable[[], int], ttl: float = COUNT_TTL_SECONDS) -> int:
+    """
+    获取缓存的总数，过期或不存在时调用 counter() 重新计算
+    key 的第一个元素为表名，供 invalidate_counts 按表失效；
+    条目数超过 COUNT_CACHE_MAX_ENTRIES 时淘汰最久未使用的条目
+    """
+    now = time.monotonic()
+    with _count_lock:
+        entry = _counts.get(key)
+        if entry:
+            if entry[0] > now:
+                _counts.move_to_end(key)
+                return entry[1]
+            del _counts[key]
+    total = counter()
+    with _count_lock:
+        _counts[key] = (now + ttl, total)
+        _counts.move_to_end(key)
+        while len(_counts) > COUNT_CACHE_MAX_ENTRIES:
+            _counts.popitem(last=False)
+    return total
+
+
+def invalidate_counts(table: Optional[str] = None) -> None:
+    """使指定表（或全部）的计数缓存失效"""
+    with _count_lock:
+        if table is None:
+            _counts.clear()
+            return
+        for key in [k for k in _counts if k[0] == table]:
+            del _counts[key]
@@ -0,0 +1,376 @@
+# -*- coding: utf-8 -*-
+"""
+查询计划审计工具
+在临时数据库上逐个调用 crud.py / crud_user_profile.py / crud_user_report.py 中的函数，
+捕获其发出的 SELECT/UPDATE/DELETE 语句，用 EXPLAIN QUERY PLAN 检查：
+- 全表扫描（SCAN <表> 且未使用索引）
+- 临时B树排序（USE TEMP B-TREE FOR ORDER BY / GROUP BY / DISTINCT）
+
+临时数据库默认复制 data/career_guidance.db 并执行建表和迁移（与线上启动后的结构一致），
+原数据库不会被修改。已确认可接受的计划列在 EXPECTED_FINDINGS 中，
+出现其他问题时以非零状态退出，可用于在本地发现索引回退：
+
+    cd backend
+    python -m app.query_audit            # 审计并输出问题
+    python -m app.query_audit --verbose  # 同时输出每条语句的完整计划
+    python -m app.query_audit --fresh    # 使用空的内存数据库
+"""
+
+import argparse
+import inspect
+import os
+import re
+import shutil
+import sys
+import tempfile
+from datetime import datetime
+from typing import Callable, Dict, List, NamedTuple, Optional, Tuple
+
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from . import crud, crud_user_profile, crud_user_report, database
+from . import models, models_user_profile, models_user_report
+from . import schemas_user_profile, schemas_user_report
+
+
+AUDITED_MODULES = (crud, crud_user_profile, crud_user_report)
+
+# 只做 INSERT + 主键回读的创建函数，以及不访问数据库的纯计算函数
+SKIPPED_FUNCTIONS = {
+    "build_completeness_detail",
+    "build_report_chapter",
+    "build_user_profile",
+    "calculate_completeness_score",
+    "calculate_completeness_score_from_data",
+}
+SKIPPED_PREFIXES = ("create_",)
+
+# 已确认可接受的问题: (函数名, 计划片段) -> 原因
+EXPECTED_FINDINGS = {
+    ("crud.get_disciplines", "SCAN disciplines"): "全量目录列表（已由内存快照替代）",
+    ("crud.get_major_categories", "SCAN major_categories"): "全量目录列表（行数很少）",
+    ("crud.get_personal_experiences", "SCAN personal_experiences"): "school_name 使用 LIKE '%x%' 子串匹配",
+    ("crud.get_majors_batch", "USE TEMP B-TREE FOR RIGHT PART OF ORDER BY"): "每个专业内按排名排序，最多N行",
+    ("crud.get_major_detail", "SCAN major_occupations"): "首次访问时全量构建推荐矩阵（每进程一次）",
+    ("crud.get_recommended_occupations", "SCAN major_occupations"): "首次访问时全量构建推荐矩阵（每进程一次）",
+    ("crud.get_recommended_majors", "SCAN major_occupations"): "首次访问时全量构建推荐矩阵（每进程一次）",
+    ("crud.search_majors", "SCAN majors"): "检索索引一致性检查（每进程一次）",
+    ("crud.search_majors", "USE TEMP B-TREE FOR ORDER BY"): "FTS5 bm25 排序只作用于命中行",
+    ("crud.search_occupations", "SCAN occupations"): "检索索引一致性检查（每进程一次）",
+    ("crud.search_occupations", "USE TEMP B-TREE FOR ORDER BY"): "FTS5 bm25 排序只作用于命中行",
+}
+
+_SCAN_RE = re.compile(r"^SCAN (\w+)")
+
+
+class Finding(NamedTuple):
+    """一条计划问题"""
+    function: str
+    statement: str
+    detail: str
+    expected: Optional[str]
+
+
+# ==================== 场景 ====================
+
+def _seed(db) -> Dict[str, object]:
+    """写入每张表至少一行数据，使函数走完完整的查询路径"""
+    suffix = datetime.utcnow().strftime("%H%M%S%f")
+    user_id = f"audit_user_{suffix}"
+    discipline = models.Discipline(name="审计学科", code=f"A{suffix}")
+    db.add(discipline)
+    db.flush()
+    category = models.MajorCategory(name="审计专业类", code=f"AC{suffix}", discipline_id=discipline.id)
+    db.add(category)
+    db.flush()
+    major = models.Major(name="审计专业", code=f"AM{suffix}", category_id=category.id, main_courses=["课程"])
+    occupation = models.Occupation(name="审计职业", industry="审计行业", requirements=["能力"])
+    db.add_all([major, occupation])
+    db.flush()
+    experience = models.PersonalExperience(
+        nickname="审计", major_id=major.id, education="本科", school_name="审计大学", experience="经历"
+    )
+    db.add_all([
+        experience,
+        models.MajorOccupation(major_id=major.id, occupation_id=occupation.id, match_score=80),
+        models.CareerPath(occupation_id=occupation.id, level="初级", title="助理", experience_min=0),
+        models_user_profile.UserProfile(user_id=user_id, nickname="审计用户"),
+    ])
+    db.flush()
+    share = models.ExperienceShare(experience_id=experience.id, title="分享", content="内容", tags=["标签"])
+    report = models_user_report.UserReport(
+        id=f"report_audit_{suffix}", user_id=user_id, title="报告", report_type="FULL_REPORT"
+    )
+    db.add_all([share, report])
+    db.flush()
+    chapter = models_user_report.ReportChapter(
+        id=f"ch_audit_{suffix}", report_id=report.id, chapter_code="1", title="章节"
+    )
+    task = models_user_report.GenerationTask(
+        id=f"task_audit_{suffix}", user_id=user_id, report_id=report.id, report_type="FULL_REPORT"
+    )
+    export = models_user_report.ReportExport(
+        id=f"export_audit_{suffix}", report_id=report.id, user_id=user_id, format="pdf"
+    )
+    db.add_all([chapter, task, export])
+    db.flush()
+    db.add_all([
+        models_user_report.GenerationLog(task_id=task.id, message="日志"),
+        models_user_report.ReportSnapshot(
+            id=f"snap_audit_{suffix}", report_id=report.id, user_id=user_id,
+            snapshot_type="profile", snapshot_data={}
+        ),
+        models_user_profile.UserConversation(
+            user_id=user_id, session_id="s", message_role="user", message_content="你好"
+        ),
+    ])
+    db.commit()
+    return {
+        "discipline": discipline.id, "category": category.id, "major": major.id,
+        "occupation": occupation.id, "experience": experience.id, "share": share.id,
+        "user": user_id, "report": report.id, "chapter": chapter.id, "task": task.id,
+        "export": export.id,
+    }
+
+
+def _scenarios(ids: Dict[str, object]) -> Dict[str, Callable]:
+    """函数名 -> 以代表性参数调用该函数"""
+    user, report, task = ids["user"], ids["report"], ids["task"]
+    return {
+        # crud.py
+        "crud.get_disciplines": lambda db: crud.get_disciplines(db),
+        "crud.get_discipline": lambda db: crud.get_discipline(db, ids["discipline"]),
+        "crud.get_major_categories": lambda db: crud.get_major_categories(db, discipline_id=ids["discipline"]),
+        "crud.get_majors": lambda db: crud.get_majors(db, category_id=ids["category"]),
+        "crud.get_major": lambda db: crud.get_major(db, ids["major"]),
+        "crud.get_majors_batch": lambda db: crud.get_majors_batch(db, [ids["major"]]),
+        "crud.get_major_detail": lambda db: crud.get_major_detail(db, ids["major"]),
+        "crud.search_majors": lambda db: crud.search_majors(db, "审计"),
+        "crud.get_occupations": lambda db: crud.get_occupations(db, industry="审计行业"),
+        "crud.get_occupation": lambda db: crud.get_occupation(db, ids["occupation"]),
+        "crud.get_occupation_detail": lambda db: crud.get_occupation_detail(db, ids["occupation"]),
+        "crud.search_occupations": lambda db: crud.search_occupations(db, "审计"),
+        "crud.get_career_paths": lambda db: crud.get_career_paths(db, ids["occupation"]),
+        "crud.get_major_occupations": lambda db: crud.get_major_occupations(db, major_id=ids["major"]),
+        "crud.get_recommended_occupations": lambda db: crud.get_recommended_occupations(db, ids["major"]),
+        "crud.get_recommended_majors": lambda db: crud.get_recommended_majors(db, ids["occupation"]),
+        "crud.get_personal_experiences": lambda db: (
+            crud.get_personal_experiences(db, major_id=ids["major"]),
+            crud.get_personal_experiences(db, school_name="审计"),
+        ),
+        "crud.get_personal_experience": lambda db: crud.get_personal_experience(db, ids["experience"]),
+        "crud.get_experience_shares": lambda db: crud.get_experience_shares(db, ids["experience"]),
+        "crud.like_experience_share": lambda db: crud.like_experience_share(db, ids["share"]),
+        # crud_user_profile.py
+        "crud_user_profile.get_user_profile": lambda db: crud_user_profile.get_user_profile(db, user),
+        "crud_user_profile.get_user_profile_by_id": lambda db: crud_user_profile.get_user_profile_by_id(db, 1),
+        "crud_user_profile.get_or_create_user_profile":
+            lambda db: crud_user_profile.get_or_create_user_profile(db, user),
+        "crud_user_profile.update_user_profile": lambda db: crud_user_profile.update_user_profile(
+            db, user, schemas_user_profile.UserProfileUpdate(holland_code="RIA")
+        ),
+        "crud_user_profile.batch_update_profile": lambda db: crud_user_profile.batch_update_profile(
+            db, user, [schemas_user_profile.ProfileBatchUpdateItem(field="mbti_type", value="INTJ")]
+        ),
+        "crud_user_profile.get_user_profile_logs": lambda db: crud_user_profile.get_user_profile_logs(db, user),
+        "crud_user_profile.get_profile_completeness_detail":
+            lambda db: crud_user_profile.get_profile_completeness_detail(db, user),
+        "crud_user_profile.get_conversation_history":
+            lambda db: crud_user_profile.get_conversation_history(db, user),
+        "crud_user_profile.get_recent_conversation_summary":
+            lambda db: crud_user_profile.get_recent_conversation_summary(db, user),
+        "crud_user_profile.advance_casve_stage": lambda db: crud_user_profile.advance_casve_stage(db, user),
+        "crud_user_profile.get_profile_summary_for_rag":
+            lambda db: crud_user_profile.get_profile_summary_for_rag(db, user),
+        # crud_user_report.py
+        "crud_user_report.get_user_report": lambda db: crud_user_report.get_user_report(db, report),
+        "crud_user_report.get_user_reports": lambda db: crud_user_report.get_user_reports(db, user),
+        "crud_user_report.update_user_report": lambda db: crud_user_report.update_user_report(
+            db, report, schemas_user_report.UserReportUpdate(title="新标题")
+        ),
+        "crud_user_report.get_report_chapter": lambda db: crud_user_report.get_report_chapter(db, ids["chapter"]),
+        "crud_user_report.get_report_chapters": lambda db: crud_user_report.get_report_chapters(db, report),
+        "crud_user_report.update_chapter_content":
+            lambda db: crud_user_report.update_chapter_content(db, ids["chapter"], word_count=10),
+        "crud_user_report.get_generation_task": lambda db: crud_user_report.get_generation_task(db, task),
+        "crud_user_report.get_active_generation_task":
+            lambda db: crud_user_report.get_active_generation_task(db, user),
+        "crud_user_report.update_generation_task":
+            lambda db: crud_user_report.update_generation_task(db, task, progress=50),
+        "crud_user_report.increment_task_retry": lambda db: crud_user_report.increment_task_retry(db, task),
+        "crud_user_report.get_generation_history": lambda db: (
+            crud_user_report.get_generation_history(db, user),
+            crud_user_report.get_generation_history(db, user, status="completed,failed"),
+        ),
+        "crud_user_report.get_report_snapshots": lambda db: crud_user_report.get_report_snapshots(db, report),
+        "crud_user_report.get_report_snapshot_by_type":
+            lambda db: crud_user_report.get_report_snapshot_by_type(db, report, "profile"),
+        "crud_user_report.update_export_download":
+            lambda db: crud_user_report.update_export_download(db, ids["export"]),
+        "crud_user_report.get_export_records": lambda db: crud_user_report.get_export_records(db, report),
+        "crud_user_report.get_generation_logs": lambda db: crud_user_report.get_generation_logs(db, task),
+        "crud_user_report.cancel_generation_task": lambda db: crud_user_report.cancel_generation_task(db, task),
+        "crud_user_report.delete_old_generation_logs":
+            lambda db: crud_user_report.delete_old_generation_logs(db, days=30),
+        "crud_user_report.delete_user_report": lambda db: crud_user_report.delete_user_report(db, report),
+        "crud_user_report.hard_delete_user_report":
+            lambda db: crud_user_report.hard_delete_user_report(db, report),
+        "crud_user_profile.delete_user_profile": lambda db: crud_user_profile.delete_user_profile(db, user),
+    }
+
+
+def uncovered_functions(scenarios: Dict[str, Callable]) -> List[str]:
+    """审计模块中既未跳过也没有场景的公开函数"""
+    missing = []
+    for module in AUDITED_MODULES:
+        prefix = module.__name__.rsplit(".", 1)[-1]
+        for name, func in inspect.getmembers(module, inspect.isfunction):
+            if func.__module__ != module.__name__ or name.startswith("_"):
+                continue
+            if name in SKIPPED_FUNCTIONS or name.startswith(SKIPPED_PREFIXES):
+                continue
+            if f"{prefix}.{name}" not in scenarios:
+                missing.append(f"{prefix}.{name}")
+    return missing
+
+
+# ==================== 计划分析 ====================
+
+def _plan_findings(plan: List[Tuple], tables: set) -> List[str]:
+    findings = []
+    for row in plan:
+        detail = row[-1]
+        if "USE TEMP B-TREE" in detail:
+            findings.append(detail)
+            continue
+        match = _SCAN_RE.match(detail)
+        if match and match.group(1) in tables and "USING" not in detail:
+            findings.append(detail)
+    return findings
+
+
+def _make_engine(source: Optional[str]):
+    """创建临时数据库引擎：复制源数据库文件，或使用空的内存数据库"""
+    if source:
+        workdir = tempfile.mkdtemp(prefix="query_audit_")
+        path = os.path.join(workdir, "audit.db")
+        shutil.copyfile(source, path)
+        engine = create_engine(f"sqlite:///{path}", connect_args={"check_same_thread": False})
+    else:
+        workdir = None
+        engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+    database.Base.metadata.create_all(bind=engine)
+    from .migrations import run_migrations
+    run_migrations(engine)
+    # 清除统计信息：小表在统计信息下会被判定为"扫描更快"，审计关注的是索引是否可用
+    with engine.begin() as conn:
+        if conn.exec_driver_sql("SELECT 1 FROM sqlite_master WHERE name = 'sqlite_stat1'").first():
+            conn.exec_driver_sql("DELETE FROM sqlite_stat1")
+    if source:
+        engine.dispose()  # 已打开的连接缓存了旧的统计信息
+    return engine, workdir
+
+
+def run_audit(source: Optional[str] = None, verbose: bool = False) -> Tuple[List[Finding], List[str]]:
+    """执行审计，返回 (问题列表, 未覆盖函数列表)"""
+    from . import counters, recommendation_matrix, search_index
+
+    engine, workdir = _make_engine(source)
+    tables = set(database.Base.metadata.tables)
+    captured: List[Tuple[str, str, tuple]] = []
+    current = {"function": None}
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def _capture(conn, cursor, statement, parameters, context, executemany):
+        head = statement.lstrip().split(None, 1)[0].upper()
+        if current["function"] and not executemany and head in ("SELECT", "UPDATE", "DELETE", "WITH"):
+            captured.append((current["function"], statement, tuple(parameters or ())))
+
+    # 隔离全局状态：推荐矩阵写入临时文件，点赞计数写回临时数据库，检索索引在临时数据库上重建
+    search_ready = dict(search_index._ready)
+    search_index._ready.clear()
+    matrix_file = recommendation_matrix.MATRIX_FILE
+    like_counter = counters._share_like_counter
+    recommendation_matrix.MATRIX_FILE = os.path.join(workdir or tempfile.mkdtemp(), "matrix.bin")
+    recommendation_matrix.reset_recommendation_matrix()
+    counters._share_like_counter = counters.WriteBehindCounter("experience_shares", "likes", interval=3600, bind=engine)
+    try:
+        db = sessionmaker(bind=engine)()
+        ids = _seed(db)
+        scenarios = _scenarios(ids)
+        for name, call in scenarios.items():
+            current["function"] = name
+            # 每个场景都从冷启动的推荐矩阵开始，使结果与执行顺序无关
+            recommendation_matrix.reset_recommendation_matrix()
+            try:
+                call(db)
+                db.commit()
+            except Exception as e:
+                db.rollback()
+                print(f"[Audit] {name} raised {type(e).__name__}: {e}")
+            finally:
+                current["function"] = None
+        counters._share_like_counter.close()
+        db.close()
+
+        findings = []
+        seen = set()
+        with engine.connect() as conn:
+            for function, statement, parameters in captured:
+                if (function, statement) in seen:
+                    continue
+                seen.add((function, statement))
+                plan = conn.exec_driver_sql("EXPLAIN QUERY PLAN " + statement, parameters).fetchall()
+                if verbose:
+                    print(f"\n[{function}] {' '.join(statement.split())[:160]}")
+                    for row in plan:
+                        print(f"    {row[-1]}")
+                for detail in _plan_findings(plan, tables):
+                    expected = next(
+                        (reason for (func, fragment), reason in EXPECTED_FINDINGS.items()
+                         if func == function and fragment in detail), None
+                    )
+                    findings.append(Finding(function, " ".join(statement.split()), detail, expected))
+        return findings, uncovered_functions(scenarios)
+    finally:
+        search_index._ready.clear()
+        search_index._ready.update(search_ready)
+        recommendation_matrix.MATRIX_FILE = matrix_file
+        recommendation_matrix.reset_recommendation_matrix()
+        counters._share_like_counter = like_counter
+        engine.dispose()
+        if workdir:
+            shutil.rmtree(workdir, ignore_errors=True)
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="CRUD查询计划审计")
+    parser.add_argument("--db", default=database.DATABASE_FILE, help="作为模板复制的数据库文件")
+    parser.add_argument("--fresh", action="store_true", help="使用空的内存数据库")
+    parser.add_argument("--verbose", action="store_true", help="输出每条语句的完整计划")
+    args = parser.parse_args(argv)
+
+    source = None if args.fresh or not os.path.exists(args.db) else args.db
+    findings, uncovered = run_audit(source, verbose=args.verbose)
+
+    unexpected = [f for f in findings if not f.expected]
+    print("\n" + "=" * 60)
+    print("查询计划审计结果")
+    print("=" * 60)
+    for f in findings:
+        mark = "  (已确认)" if f.expected else "❌"
+        print(f"{mark} {f.function}: {f.detail}")
+        if f.expected:
+            print(f"      原因: {f.expected}")
+        else:
+            print(f"      SQL: {f.statement[:200]}")
+    for name in uncovered:
+        print(f"⚠️ 未覆盖: {name}")
+    print(f"\n问题: {len(unexpected)}  已确认: {len(findings) - len(unexpected)}  未覆盖函数: {len(uncovered)}")
+    return 1 if unexpected or uncovered else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
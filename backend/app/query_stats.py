@@ -0,0 +1,316 @@
+# -*- coding: utf-8 -*-
+"""
+请求级查询统计
+通过 SQLAlchemy 的 before_cursor_execute / after_cursor_execute 事件，记录每个HTTP请求发出的
+查询条数、数据库耗时和规范化后的SQL（参数占位、IN列表折叠），并：
+
+- 同一请求中相同语句执行 QUERY_N_PLUS_ONE_THRESHOLD 次及以上时标记为疑似 N+1；
+- 按路由检查查询数预算（ROUTE_BUDGETS，未配置的路由使用 QUERY_BUDGET_DEFAULT），
+  QUERY_BUDGET_MODE=log 时超出只记录日志，raise 时超出预算的那条查询抛出 QueryBudgetExceeded（用于测试/CI）；
+- 按路由汇总访问了数据库的请求，并保留最近的请求明细，由 GET /api/diagnostics/queries 输出。
+
+响应头 X-DB-Queries / X-DB-Time-Ms 给出本请求在响应开始前的查询数和耗时。
+
+统计通过上下文变量传递：
+- 请求结束后统计关闭，之后复制了请求上下文的任务（如 asyncio.create_task 启动的后台流程）不再计入；
+  从请求中启动的后台任务应使用 run_detached()，在不带请求统计的上下文中启动；
+- 写线程（app.write_queue）在提交方的上下文中执行任务，任务内的查询计入提交它的请求，
+  写线程自身的 BEGIN IMMEDIATE / SAVEPOINT / COMMIT 不计入。
+
+QUERY_STATS_ENABLED=0 时不注册事件和中间件。
+"""
+
+import os
+import re
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from contextvars import ContextVar, copy_context
+from functools import lru_cache
+from typing import Dict, List, Optional
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+QUERY_STATS_ENABLED = os.environ.get("QUERY_STATS_ENABLED", "1") != "0"
+N_PLUS_ONE_THRESHOLD = int(os.environ.get("QUERY_N_PLUS_ONE_THRESHOLD", "5"))
+DEFAULT_QUERY_BUDGET = int(os.environ.get("QUERY_BUDGET_DEFAULT", "30"))
+QUERY_BUDGET_MODE = os.environ.get("QUERY_BUDGET_MODE", "log")   # log | raise
+RECENT_REQUESTS = 100
+
+# 路由查询数预算："<方法> <路由模板>" -> 每请求最多查询条数
+# 可用 QUERY_BUDGETS="GET /api/majors/{major_id}=3;POST /api/user-profiles/{user_id}/chat=12" 覆盖
+ROUTE_BUDGETS: Dict[str, int] = {
+    "GET /api/majors/{major_id}": 4,
+    "GET /api/user-profiles/{user_id}": 2,
+    "GET /api/user-profiles/{user_id}/visualization": 1,
+    "POST /api/user-profiles/{user_id}/chat": 15,
+    "GET /user-reports/{report_id}": 3,
+    "GET /user-reports/{report_id}/chapters/{chapter_id}": 3,
+}
+
+
+def _parse_budgets(value: str) -> Dict[str, int]:
+    budgets = {}
+    for item in value.split(";"):
+        route, sep, limit = item.rpartition("=")
+        if sep and route.strip():
+            budgets[route.strip()] = int(limit)
+    return budgets
+
+
+ROUTE_BUDGETS.update(_parse_budgets(os.environ.get("QUERY_BUDGETS", "")))
+
+
+class QueryBudgetExceeded(RuntimeError):
+    """请求的查询数超出路由预算（QUERY_BUDGET_MODE=raise）"""
+
+
+# ==================== SQL 规范化 ====================
+
+_WHITESPACE = re.compile(r"\s+")
+_STRING_LITERAL = re.compile(r"'(?:[^']|'')*'")
+_NUMBER_LITERAL = re.compile(r"(?<![\w.])-?\d+(?:\.\d+)?\b")
+_PARAM_LIST = re.compile(r"\(\s*(?:\?|%\(\w+\)s|%s|\$\d+)(?:\s*,\s*(?:\?|%\(\w+\)s|%s|\$\d+))*\s*\)")
+
+
+@lru_cache(maxsize=2048)
+def normalize_sql(statement: str) -> str:
+    """规范化SQL：字面量替换为 ?，IN 参数列表折叠为 (...)，合并空白"""
+    sql = _STRING_LITERAL.sub("?", statement)
+    sql = _NUMBER_LITERAL.sub("?", sql)
+    sql = _PARAM_LIST.sub("(...)", sql)
+    return _WHITESPACE.sub(" ", sql).strip()
+
+
+# ==================== 请求统计 ====================
+
+_route_paths: Dict[object, str] = {}
+
+
+def _route_path(scope) -> str:
+    """由路由匹配后写入 scope 的 endpoint 找到路由模板"""
+    endpoint = scope.get("endpoint")
+    if endpoint is None:
+        return "<unmatched>"
+    if endpoint not in _route_paths:
+        for route in getattr(scope.get("app"), "routes", ()):
+            if getattr(route, "endpoint", None) is not None:
+                _route_paths.setdefault(route.endpoint, route.path)
+    return _route_paths.get(endpoint, scope.get("path", "<unmatched>"))
+
+
+class RequestQueryStats:
+    """一个请求（或 track_queries 块）内的查询统计"""
+
+    def __init__(self, method: str, path: str, scope: Optional[dict] = None, route: Optional[str] = None):
+        self.method = method
+        self.path = path
+        self.scope = scope
+        self._route = route
+        self.count = 0
+        self.db_time = 0.0
+        # 请求结束后关闭，复制了请求上下文的后台任务的查询不再计入
+        self.closed = False
+        # 规范化SQL -> [执行次数, 总耗时]
+        self.statements: Dict[str, List[float]] = {}
+
+    @property
+    def route(self) -> str:
+        if self._route is None:
+            if self.scope is None:
+                return self.path
+            # 路由匹配前（如中间件中）不缓存
+            if self.scope.get("endpoint") is None:
+                return f"{self.method} <unmatched>"
+            self._route = f"{self.method} {_route_path(self.scope)}"
+        return self._route
+
+    @property
+    def budget(self) -> int:
+        return ROUTE_BUDGETS.get(self.route, DEFAULT_QUERY_BUDGET)
+
+    def record(self, statement: str, elapsed: float) -> None:
+        self.count += 1
+        self.db_time += elapsed
+        entry = self.statements.setdefault(normalize_sql(statement), [0, 0.0])
+        entry[0] += 1
+        entry[1] += elapsed
+
+    def n_plus_one(self) -> List[Dict[str, object]]:
+        """疑似 N+1 的语句（执行次数达到阈值）"""
+        return [
+            {"sql": sql, "count": count, "db_ms": round(total * 1000, 2)}
+            for sql, (count, total) in self.statements.items()
+            if count >= N_PLUS_ONE_THRESHOLD
+        ]
+
+    def to_dict(self) -> Dict[str, object]:
+        return {
+            "route": self.route,
+            "path": self.path,
+            "queries": self.count,
+            "db_ms": round(self.db_time * 1000, 2),
+            "budget": self.budget,
+            "n_plus_one": self.n_plus_one(),
+        }
+
+
+_current: ContextVar[Optional[RequestQueryStats]] = ContextVar("query_stats", default=None)
+
+
+def current_query_stats() -> Optional[RequestQueryStats]:
+    """当前请求的查询统计（不在请求中时为None）"""
+    return _current.get()
+
+
+def run_detached(func, *args, **kwargs):
+    """
+    在不带查询统计的上下文中调用 func（其余上下文变量保留）
+    用于从请求中启动后台任务：run_detached(asyncio.create_task, coro)
+    """
+    context = copy_context()
+    context.run(_current.set, None)
+    return context.run(func, *args, **kwargs)
+
+
+# ==================== SQLAlchemy 事件 ====================
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    stats = _current.get()
+    if stats is None or stats.closed:
+        return
+    if QUERY_BUDGET_MODE == "raise" and stats.count >= stats.budget:
+        raise QueryBudgetExceeded(
+            f"{stats.route}: query #{stats.count + 1} exceeds budget {stats.budget}: {normalize_sql(statement)[:200]}"
+        )
+    if context is not None:
+        context._query_stats_start = time.perf_counter()
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    stats = _current.get()
+    if stats is None or stats.closed:
+        return
+    start = getattr(context, "_query_stats_start", None)
+    stats.record(statement, time.perf_counter() - start if start is not None else 0.0)
+
+
+def install_query_hooks() -> None:
+    """为所有引擎注册查询事件（幂等）"""
+    if not event.contains(Engine, "before_cursor_execute", _before_cursor_execute):
+        event.listen(Engine, "before_cursor_execute", _before_cursor_execute)
+        event.listen(Engine, "after_cursor_execute", _after_cursor_execute)
+
+
+@contextmanager
+def track_queries(label: str = "<block>"):
+    """在请求之外统计一段代码的查询（脚本、测试、后台任务），不计入汇总"""
+    install_query_hooks()
+    stats = RequestQueryStats("", label, route=label)
+    token = _current.set(stats)
+    try:
+        yield stats
+    finally:
+        stats.closed = True
+        _current.reset(token)
+
+
+# ==================== 汇总 ====================
+
+_lock = threading.Lock()
+_routes: Dict[str, Dict[str, object]] = {}
+_recent: deque = deque(maxlen=RECENT_REQUESTS)
+
+
+def record_request(stats: RequestQueryStats) -> None:
+    """请求结束：检查预算和 N+1，计入汇总（只汇总访问了数据库的请求）"""
+    if not stats.count:
+        return
+    summary = stats.to_dict()
+    if stats.count > summary["budget"]:
+        print(f"[QueryStats] {stats.route}: {stats.count} queries exceeds budget {summary['budget']}")
+    for item in summary["n_plus_one"]:
+        print(f"[QueryStats] N+1 suspected on {stats.route}: {item['count']}x {item['sql'][:160]}")
+
+    with _lock:
+        route = _routes.setdefault(stats.route, {
+            "requests": 0, "queries_total": 0, "queries_max": 0, "db_ms_total": 0.0, "db_ms_max": 0.0,
+            "budget": summary["budget"], "over_budget": 0, "n_plus_one": 0, "statements": {},
+        })
+        route["requests"] += 1
+        route["queries_total"] += stats.count
+        route["queries_max"] = max(route["queries_max"], stats.count)
+        route["db_ms_total"] += summary["db_ms"]
+        route["db_ms_max"] = max(route["db_ms_max"], summary["db_ms"])
+        route["over_budget"] += stats.count > summary["budget"]
+        route["n_plus_one"] += bool(summary["n_plus_one"])
+        for sql, (count, _) in stats.statements.items():
+            route["statements"][sql] = route["statements"].get(sql, 0) + count
+        _recent.append(summary)
+
+
+def get_query_stats(top_statements: int = 5) -> Dict[str, object]:
+    """诊断数据：按路由汇总（按总查询数降序）与最近的请求"""
+    with _lock:
+        routes = []
+        for name, route in _routes.items():
+            statements = sorted(route["statements"].items(), key=lambda item: item[1], reverse=True)
+            routes.append({
+                "route": name,
+                **{k: v for k, v in route.items() if k != "statements"},
+                "queries_avg": round(route["queries_total"] / route["requests"], 2),
+                "db_ms_total": round(route["db_ms_total"], 2),
+                "top_statements": [{"sql": sql, "count": count} for sql, count in statements[:top_statements]],
+            })
+        recent = list(_recent)
+    routes.sort(key=lambda item: item["queries_total"], reverse=True)
+    return {
+        "enabled": QUERY_STATS_ENABLED,
+        "budget_mode": QUERY_BUDGET_MODE,
+        "default_budget": DEFAULT_QUERY_BUDGET,
+        "n_plus_one_threshold": N_PLUS_ONE_THRESHOLD,
+        "routes": routes,
+        "recent": recent,
+    }
+
+
+def reset_query_stats() -> None:
+    """清空汇总数据"""
+    with _lock:
+        _routes.clear()
+        _recent.clear()
+
+
+# ==================== ASGI 中间件 ====================
+
+class QueryStatsMiddleware:
+    """为每个HTTP请求建立查询统计"""
+
+    def __init__(self, app):
+        self.app = app
+        install_query_hooks()
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        stats = RequestQueryStats(scope["method"], scope["path"], scope)
+        token = _current.set(stats)
+
+        async def send_with_headers(message):
+            if message["type"] == "http.response.start":
+                headers = list(message.get("headers", []))
+                headers.append((b"x-db-queries", str(stats.count).encode()))
+                headers.append((b"x-db-time-ms", f"{stats.db_time * 1000:.1f}".encode()))
+                message = {**message, "headers": headers}
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_headers)
+        finally:
+            stats.closed = True
+            _current.reset(token)
+            record_request(stats)
@@ -2,16 +2,40 @@
 """
 基于DSPy的职业规划RAG服务主入口
 整合所有模块，提供统一的对话处理接口
+
+对话管线声明为阶段依赖图（见 services.pipeline），互不依赖的阶段并发执行：
+
+    intent -> merged_intent -> extracted_info -> prompt_config -> raw_response -> optimization
+    context_analysis（只依赖消息和历史）
+    suggested_questions（依赖 extracted_info、prompt_config，与主LLM调用并发）
+
+各阶段超时见 STAGE_TIMEOUTS，可用 DSPY_STAGE_TIMEOUTS="raw_response=30,intent=8" 覆盖；
+主LLM调用（raw_response）之外的阶段超时或出错时使用降级结果继续。
+
+短消息走快速模式（FastChatResponder 一次调用输出意图、提取信息、回复和追问），
+由 services.chat_router 按消息长度、对话阶段和延迟预算选择模式并记录各模式的延迟和提取质量。
+
+回复缓存（services.reply_cache）位于管线之前，只用于开场白（对话历史为空）：
+同一画像摘要和对话阶段下的相似开场白直接复用回复和追问，各阶段都成功的结果才写入缓存。
+对话中途的"是的"、"好的"依赖上文，不读写缓存。
+
+完整管线和流式输出的提示词包含从职业规划知识库（services.skill_index）检索到的参考资料；
+快速模式为控制延迟不注入。
+
+astream_message 流式输出回复：快速模式立即开始输出，意图、提取和追问由一次 FastChatResponder 调用与之并发产生；
+完整管线先执行到 prompt_config 再输出，context_analysis 和追问与之并发。
 """
 
 import os
 import json
-from typing import Dict, Any, List, Optional
+import time
+import asyncio
+from typing import Dict, Any, List, Optional, AsyncIterator, Tuple
 from datetime import datetime
 
 # 加载环境变量
-from dotenv import load_dotenv
-load_dotenv()
+from ..services.registry import load_env
+load_env()
 
 # 尝试导入dspy
 try:
@@ -25,6 +49,41 @@ from .modules.intent_classifier import IntentClassifier, IntentMerger
 from .modules.info_extractor import StructuredInfoExtractor, ContextAnalyzer
 from .modules.prompt_generator import ContextualPromptGenerator
 from .modules.response_optimizer import ResponseOptimizer, QuestionGenerator
+from .modules.fast_responder import FastChatResponder
+from ..services.chat_router import RouteDecision, get_chat_router
+from ..services.reply_cache import REPLY_CACHE_ENABLED, get_reply_cache
+from ..services.skill_index import retrieve_context
+from ..services.pipeline import (
+    Stage, StageTiming, parse_timeouts, run_stages, run_stages_sync, split_stages, summarize_timings
+)
+
+# 各阶段超时（秒）
+STAGE_TIMEOUTS = {
+    'intent': 15,
+    'merged_intent': 10,
+    'context_analysis': 15,
+    'extracted_info': 20,
+    'prompt_config': 15,
+    'raw_response': 60,
+    'optimization': 20,
+    'suggested_questions': 15,
+    'fast': 60,
+}
+STAGE_TIMEOUTS.update(parse_timeouts(os.environ.get('DSPY_STAGE_TIMEOUTS', '')))
+
+# 流式快速模式的系统提示（不等待意图和提取结果，追问单独生成）
+STREAM_SYSTEM_PROMPT = (
+    "你是一位亲切的职业规划顾问，正在与用户自然对话。针对用户说的具体内容回应，"
+    "语气像朋友聊天，不要提及霍兰德代码、MBTI等术语，回复控制在150字以内，不要在回复中列出追问。"
+)
+
+DEFAULT_INTENT = {
+    'intent_type': 'general_chat',
+    'confidence': 0.0,
+    'reasoning': '',
+    'sub_intents': [],
+    'emotional_state': 'neutral'
+}
 
 
 class DSPyCareerRAGService:
@@ -37,6 +96,8 @@ class DSPyCareerRAGService:
         self.dspy_available = DSPY_AVAILABLE
         self.llm = None
         self.modules = {}
+        self.router = get_chat_router()
+        self.reply_cache = get_reply_cache()
         
         if self.dspy_available:
             self._init_dspy()
@@ -84,7 +145,8 @@ class DSPyCareerRAGService:
                 'context_analyzer': ContextAnalyzer(),
                 'prompt_generator': ContextualPromptGenerator(),
                 'response_optimizer': ResponseOptimizer(),
-                'question_generator': QuestionGenerator()
+                'question_generator': QuestionGenerator(),
+                'fast_responder': FastChatResponder()
             }
             
             # 加载优化后的提示词（如果有）
@@ -132,106 +194,377 @@ class DSPyCareerRAGService:
             print(f"[DSPyRAG] Process error: {e}")
             return self._fallback_process(user_message, user_profile, conversation_history)
     
+    async def aprocess_message(self,
+                               user_message: str,
+                               user_profile: Dict[str, Any],
+                               conversation_history: List[Dict] = None,
+                               preprocessed: Dict = None) -> Dict[str, Any]:
+        """process_message 的异步版本（在事件循环中等待各阶段，不占用请求线程）"""
+        if not self.dspy_available:
+            return self._fallback_process(user_message, user_profile, conversation_history)
+        
+        try:
+            inputs = self._pipeline_inputs(user_message, user_profile, conversation_history, preprocessed)
+            cached = self._cached_result(inputs)
+            if cached is not None:
+                return cached
+            decision = self.router.choose(user_message, inputs['conversation_stage'])
+            results, timings = await run_stages(self._stages_for(decision), inputs, STAGE_TIMEOUTS)
+            return self._cache_result(inputs, self._finish(decision, results, timings))
+        except Exception as e:
+            print(f"[DSPyRAG] Process error: {e}")
+            return self._fallback_process(user_message, user_profile, conversation_history)
+    
+    async def astream_message(self,
+                              user_message: str,
+                              user_profile: Dict[str, Any],
+                              conversation_history: List[Dict] = None,
+                              preprocessed: Dict = None) -> AsyncIterator[Tuple[str, Any]]:
+        """
+        流式处理用户消息
+        
+        依次产生 ('token', 回复片段)，最后产生 ('result', 与 process_message 格式相同的结果)。
+        已发送的回复无法再修改，因此流式输出时不执行回复优化。
+        第一个片段发送前出错时改用 fallback 服务；之后出错则抛出异常。
+        """
+        if not self.dspy_available:
+            async for event in self._astream_fallback(user_message, user_profile, conversation_history):
+                yield event
+            return
+        
+        origin = time.perf_counter()
+        inputs = self._pipeline_inputs(user_message, user_profile, conversation_history, preprocessed)
+        cached = self._cached_result(inputs)
+        if cached is not None:
+            yield 'token', cached['reply']
+            yield 'result', cached
+            return
+        decision = self.router.choose(user_message, inputs['conversation_stage'])
+        chunks = []
+        background = None
+        try:
+            if decision.mode == 'fast':
+                # 立即输出回复；意图、提取和追问由一次快速模式调用与之并发产生
+                pre_results, pre_timings, rest = inputs, [], self._fast_stages(streaming=True)
+                prompt = self._stream_prompt(inputs)
+            else:
+                stages = [s for s in self._chat_stages() if s.name not in ('raw_response', 'optimization')]
+                pre_stages, rest = split_stages(stages, ('prompt_config',))
+                pre_results, pre_timings = await run_stages(pre_stages, inputs, STAGE_TIMEOUTS, origin)
+                prompt = self.modules['prompt_generator'].build_final_prompt(
+                    pre_results['prompt_config'], user_message
+                )
+            background = asyncio.ensure_future(run_stages(rest, pre_results, STAGE_TIMEOUTS, origin))
+            
+            stream_start = time.perf_counter() - origin
+            first_token = None
+            async for text in self._astream_llm(prompt):
+                if first_token is None:
+                    first_token = time.perf_counter() - origin
+                chunks.append(text)
+                yield 'token', text
+            if not chunks:
+                raise ValueError("LLM stream returned an empty reply")
+            stream_end = time.perf_counter() - origin
+            results, post_timings = await background
+        except Exception as e:
+            if chunks:
+                raise
+            print(f"[DSPyRAG] Stream error: {e}")
+            async for event in self._astream_fallback(user_message, user_profile, conversation_history):
+                yield event
+            return
+        finally:
+            if background is not None and not background.done():
+                background.cancel()
+        
+        raw_response = ''.join(chunks)
+        timings = pre_timings + post_timings + [StageTiming('raw_response', 'ok', stream_start, stream_end)]
+        if decision.mode == 'fast':
+            results = dict(results, fast=dict(results['fast'], reply=raw_response))
+            result = self._build_fast_result(results, timings)
+        else:
+            results = dict(results, raw_response=raw_response,
+                           optimization={'optimized_response': raw_response, 'changes': 'streamed'})
+            result = self._build_result(results, timings)
+        result['pipeline']['ttft_ms'] = round(first_token * 1000, 1)
+        yield 'result', self._cache_result(inputs, self._record(decision, result))
+    
+    async def _astream_fallback(self,
+                                user_message: str,
+                                user_profile: Dict[str, Any],
+                                conversation_history: Optional[List[Dict]]) -> AsyncIterator[Tuple[str, Any]]:
+        """fallback 服务不支持逐段输出：整段回复作为一个片段"""
+        result = await asyncio.to_thread(self._fallback_process, user_message, user_profile, conversation_history)
+        yield 'token', result['reply']
+        yield 'result', result
+    
+    async def _astream_llm(self, prompt: str) -> AsyncIterator[str]:
+        """流式调用LLM（经 litellm，模型和参数与 self.llm 相同），逐段产生回复文本"""
+        import litellm
+        
+        response = await litellm.acompletion(
+            model=self.llm.model,
+            messages=[{'role': 'user', 'content': prompt}],
+            stream=True,
+            timeout=STAGE_TIMEOUTS['raw_response'],
+            **self.llm.kwargs
+        )
+        async for chunk in response:
+            text = chunk.choices[0].delta.content
+            if text:
+                yield text
+    
+    def _stream_prompt(self, inputs: Dict[str, Any]) -> str:
+        """流式快速模式的提示词：由画像摘要、最近对话和知识库参考资料直接构建"""
+        recent = "\n".join(
+            f"{'用户' if h.get('role') == 'user' else '助手'}: {h.get('content', '')[:100]}"
+            for h in inputs['history'][-3:]
+        )
+        config = {
+            'system_prompt': STREAM_SYSTEM_PROMPT,
+            'user_context': f"{inputs['profile_summary']}\n{recent or '（新对话）'}",
+            'references': inputs['references']
+        }
+        return self.modules['prompt_generator'].build_final_prompt(config, inputs['message'])
+    
     def _dspy_process(self,
                      user_message: str,
                      user_profile: Dict[str, Any],
                      conversation_history: List[Dict],
                      preprocessed: Optional[Dict]) -> Dict[str, Any]:
-        """使用DSPy的处理流程"""
+        """使用DSPy的处理流程（按路由选择快速模式或完整管线）"""
+        inputs = self._pipeline_inputs(user_message, user_profile, conversation_history, preprocessed)
+        cached = self._cached_result(inputs)
+        if cached is not None:
+            return cached
+        decision = self.router.choose(user_message, inputs['conversation_stage'])
+        results, timings = run_stages_sync(self._stages_for(decision), inputs, STAGE_TIMEOUTS)
+        return self._cache_result(inputs, self._finish(decision, results, timings))
+    
+    def _cacheable(self, inputs: Dict[str, Any]) -> bool:
+        """只缓存开场白：有对话历史时回复依赖上文，不能跨对话复用"""
+        return REPLY_CACHE_ENABLED and not inputs['history']
+    
+    def _cached_result(self, inputs: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """回复缓存命中时返回结果（不执行管线）"""
+        if not self._cacheable(inputs):
+            return None
+        hit = self.reply_cache.get(inputs['message'], inputs['profile_summary'], inputs['conversation_stage'])
+        if hit is None:
+            return None
+        print(f"[DSPyRAG] Reply cache hit (similarity {hit.similarity}, exact={hit.exact})")
+        result = hit.result
+        result.update({
+            'conversation_stage': inputs['conversation_stage'],
+            'context_analysis': {},
+            'optimization_notes': 'reply_cache',
+            'chat_mode': 'cache',
+            'cache': {'similarity': hit.similarity, 'exact': hit.exact}
+        })
+        return result
+    
+    def _cache_result(self, inputs: Dict[str, Any], result: Dict[str, Any]) -> Dict[str, Any]:
+        """开场白且各阶段都成功时写入回复缓存（含降级结果的不缓存），返回 result"""
+        stages = result['pipeline']['stages'].values()
+        if self._cacheable(inputs) and all(stage['status'] == 'ok' for stage in stages):
+            self.reply_cache.put(inputs['message'], inputs['profile_summary'], inputs['conversation_stage'], result)
+        return result
+    
+    def _stages_for(self, decision: RouteDecision) -> List[Stage]:
+        """路由结果对应的阶段图"""
+        return self._fast_stages() if decision.mode == 'fast' else self._chat_stages()
+    
+    def _finish(self, decision: RouteDecision, results: Dict[str, Any], timings) -> Dict[str, Any]:
+        """构建返回结果（快速模式或完整管线）并记录"""
+        if decision.mode == 'fast':
+            result = self._build_fast_result(results, timings)
+        else:
+            result = self._build_result(results, timings)
+        return self._record(decision, result)
+    
+    def _record(self, decision: RouteDecision, result: Dict[str, Any]) -> Dict[str, Any]:
+        """标注对话模式，并按模式记录延迟和提取质量"""
+        result['chat_mode'] = decision.mode
+        pipeline = result['pipeline']
+        print(f"[DSPyRAG] Pipeline {pipeline['wall_ms']}ms (stages total {pipeline['stages_ms']}ms)")
+        self.router.record(decision, pipeline['wall_ms'], result)
+        return result
+    
+    def _pipeline_inputs(self,
+                         user_message: str,
+                         user_profile: Dict[str, Any],
+                         conversation_history: Optional[List[Dict]],
+                         preprocessed: Optional[Dict]) -> Dict[str, Any]:
+        """管线输入：消息、画像、历史，以及不需要LLM的画像摘要、对话阶段、最近AI回复和知识库参考资料"""
+        history = conversation_history or []
+        return {
+            'message': user_message,
+            'profile': user_profile,
+            'history': history,
+            'preprocessed': preprocessed or {},
+            'profile_summary': self._format_profile_summary(user_profile),
+            'conversation_stage': self._determine_stage(history, user_profile.get('completeness_score', 0)),
+            'previous_responses': [
+                h.get('content', '') for h in history if h.get('role') == 'assistant'
+            ][-3:],  # 最近3条AI回复
+            'references': retrieve_context(user_message),
+        }
+    
+    def _chat_stages(self) -> List[Stage]:
+        """对话管线的阶段依赖图"""
+        modules = self.modules
         
-        # Stage 1: 意图分类
-        intent_result = self.modules['intent_classifier'](
-            user_message=user_message,
-            conversation_history=conversation_history or [],
-            current_profile=user_profile
-        )
+        def classify_intent(ctx):
+            return modules['intent_classifier'](
+                user_message=ctx['message'],
+                conversation_history=ctx['history'],
+                current_profile=ctx['profile']
+            )
         
-        # 如果有前端预处理结果，进行融合
-        if preprocessed and preprocessed.get('intent'):
-            intent_result = self.modules['intent_merger'](
-                user_message=user_message,
-                frontend_intent=preprocessed.get('intent'),
-                backend_intent=intent_result
+        def merge_intent(ctx):
+            # 有前端预处理结果时进行融合
+            if not ctx['preprocessed'].get('intent'):
+                return ctx['intent']
+            return modules['intent_merger'](
+                user_message=ctx['message'],
+                frontend_intent=ctx['preprocessed'].get('intent'),
+                backend_intent=ctx['intent']
             )
         
-        # Stage 2: 上下文分析
-        context_analysis = self.modules['context_analyzer'](
-            current_message=user_message,
-            previous_messages=conversation_history or []
-        )
+        def analyze_context(ctx):
+            return modules['context_analyzer'](
+                current_message=ctx['message'],
+                previous_messages=ctx['history']
+            )
         
-        # Stage 3: 结构化信息提取
-        extracted_info = self.modules['info_extractor'](
-            user_message=user_message,
-            intent_type=intent_result['intent_type'],
-            profile_context=user_profile,
-            conversation_context=conversation_history or []
-        )
+        def extract_info(ctx):
+            return modules['info_extractor'](
+                user_message=ctx['message'],
+                intent_type=ctx['merged_intent']['intent_type'],
+                profile_context=ctx['profile'],
+                conversation_context=ctx['history']
+            )
         
-        # Stage 4: 确定对话阶段
-        conversation_stage = self._determine_stage(
-            conversation_history,
-            user_profile.get('completeness_score', 0)
-        )
+        def generate_prompt(ctx):
+            return modules['prompt_generator'](
+                user_message=ctx['message'],
+                intent_info=ctx['merged_intent'],
+                extracted_info=ctx['extracted_info'],
+                profile_summary=ctx['profile_summary'],
+                conversation_stage=ctx['conversation_stage'],
+                previous_responses=ctx['previous_responses'],
+                references=ctx['references']
+            )
         
-        # Stage 5: 生成动态提示词
-        previous_ai_responses = [
-            h.get('content', '') for h in (conversation_history or [])
-            if h.get('role') == 'assistant'
-        ][-3:]  # 最近3条AI回复
+        def call_llm(ctx):
+            final_prompt = modules['prompt_generator'].build_final_prompt(ctx['prompt_config'], ctx['message'])
+            # DSPy 3.x: LM返回列表
+            llm_response = self.llm(final_prompt)
+            return llm_response[0] if isinstance(llm_response, list) else str(llm_response)
         
-        prompt_config = self.modules['prompt_generator'](
-            user_message=user_message,
-            intent_info=intent_result,
-            extracted_info=extracted_info,
-            profile_summary=self._format_profile_summary(user_profile),
-            conversation_stage=conversation_stage,
-            previous_responses=previous_ai_responses
-        )
+        def optimize_response(ctx):
+            return modules['response_optimizer'](
+                raw_response=ctx['raw_response'],
+                user_message=ctx['message'],
+                conversation_history=ctx['history'],
+                extracted_info=ctx['extracted_info']
+            )
         
-        # Stage 6: 调用LLM
-        final_prompt = self.modules['prompt_generator'].build_final_prompt(
-            prompt_config,
-            user_message
-        )
+        def generate_questions(ctx):
+            # 提示词配置中已有追问时直接使用
+            if ctx['prompt_config'].get('suggested_questions'):
+                return ctx['prompt_config']['suggested_questions']
+            return modules['question_generator'](
+                user_message=ctx['message'],
+                extracted_info=ctx['extracted_info'],
+                conversation_stage=ctx['conversation_stage'],
+                asked_questions=self._extract_previous_questions(ctx['history'])
+            )
         
-        # DSPy 3.x: LM返回列表
-        llm_response = self.llm(final_prompt)
-        raw_response = llm_response[0] if isinstance(llm_response, list) else str(llm_response)
+        return [
+            Stage('intent', classify_intent, fallback=lambda ctx: dict(DEFAULT_INTENT)),
+            Stage('merged_intent', merge_intent, ('intent',), fallback=lambda ctx: ctx['intent']),
+            Stage('context_analysis', analyze_context, fallback=lambda ctx: {}),
+            Stage('extracted_info', extract_info, ('merged_intent',), fallback=lambda ctx: {}),
+            Stage('prompt_config', generate_prompt, ('merged_intent', 'extracted_info'),
+                  fallback=lambda ctx: {'references': ctx['references']}),
+            # 主LLM调用没有降级结果：失败时整个请求改用 fallback 服务
+            Stage('raw_response', call_llm, ('prompt_config',)),
+            Stage('optimization', optimize_response, ('raw_response', 'extracted_info'),
+                  fallback=lambda ctx: {'optimized_response': ctx['raw_response'], 'changes': 'skipped'}),
+            Stage('suggested_questions', generate_questions, ('extracted_info', 'prompt_config'),
+                  fallback=lambda ctx: ctx['prompt_config'].get('suggested_questions') or []),
+        ]
+    
+    def _fast_stages(self, streaming: bool = False) -> List[Stage]:
+        """
+        快速模式：单个阶段，一次调用输出全部结果
+        streaming=True 时回复已由流式调用输出，只使用意图、提取信息和追问，失败时降级为空结果
+        """
+        def respond(ctx):
+            result = self.modules['fast_responder'](
+                user_message=ctx['message'],
+                conversation_history=ctx['history'],
+                profile_summary=ctx['profile_summary'],
+                conversation_stage=ctx['conversation_stage']
+            )
+            if not streaming and not result['reply']:
+                raise ValueError("Fast mode returned an empty reply")
+            return result
         
-        # Stage 7: 优化回复
-        optimization = self.modules['response_optimizer'](
-            raw_response=raw_response,
-            user_message=user_message,
-            conversation_history=conversation_history or [],
-            extracted_info=extracted_info
-        )
+        if streaming:
+            return [Stage('fast', respond, fallback=lambda ctx: {
+                'intent': dict(DEFAULT_INTENT),
+                'extracted_info': {'profile_updates': {}},
+                'reply': '',
+                'suggested_questions': []
+            })]
+        # 没有降级结果：失败时整个请求改用 fallback 服务
+        return [Stage('fast', respond)]
+    
+    def _build_fast_result(self, results: Dict[str, Any], timings) -> Dict[str, Any]:
+        """由快速模式结果构建返回结果（字段与完整管线一致）"""
+        fast = results['fast']
+        intent_result = fast['intent']
+        extracted_info = fast['extracted_info']
         
-        # Stage 8: 生成追问（如果配置中没有）
-        if not prompt_config.get('suggested_questions'):
-            suggested_questions = self.modules['question_generator'](
-                user_message=user_message,
-                extracted_info=extracted_info,
-                conversation_stage=conversation_stage,
-                asked_questions=self._extract_previous_questions(conversation_history)
-            )
-        else:
-            suggested_questions = prompt_config['suggested_questions']
+        return {
+            'reply': fast['reply'],
+            'extracted_info': self._convert_to_api_format(extracted_info),
+            'intent': intent_result['intent_type'],
+            'sub_intents': [],
+            'suggested_questions': fast['suggested_questions'],
+            'reasoning': '',
+            'conversation_stage': results['conversation_stage'],
+            'confidence': intent_result['confidence'],
+            'emotional_state': intent_result['emotional_state'],
+            'profile_updates': extracted_info['profile_updates'],
+            'context_analysis': {},
+            'optimization_notes': 'fast_mode',
+            'pipeline': summarize_timings(timings)
+        }
+    
+    def _build_result(self, results: Dict[str, Any], timings) -> Dict[str, Any]:
+        """由各阶段结果构建返回结果"""
+        intent_result = results['merged_intent']
+        extracted_info = results['extracted_info']
+        optimization = results['optimization']
         
-        # 构建返回结果
         return {
             'reply': optimization['optimized_response'],
             'extracted_info': self._convert_to_api_format(extracted_info),
             'intent': intent_result['intent_type'],
             'sub_intents': intent_result.get('sub_intents', []),
-            'suggested_questions': suggested_questions,
+            'suggested_questions': results['suggested_questions'],
             'reasoning': intent_result.get('reasoning', ''),
-            'conversation_stage': conversation_stage,
+            'conversation_stage': results['conversation_stage'],
             'confidence': intent_result.get('confidence', 0.5),
             'emotional_state': intent_result.get('emotional_state', 'neutral'),
             'profile_updates': extracted_info.get('profile_updates', {}),
-            'context_analysis': context_analysis,
-            'optimization_notes': optimization.get('changes', '')
+            'context_analysis': results['context_analysis'],
+            'optimization_notes': optimization.get('changes', ''),
+            'pipeline': summarize_timings(timings)
         }
     
     def _fallback_process(self,
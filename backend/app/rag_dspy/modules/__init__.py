@@ -5,6 +5,7 @@ from .intent_classifier import IntentClassifier, IntentMerger
 from .info_extractor import StructuredInfoExtractor, ContextAnalyzer
 from .prompt_generator import ContextualPromptGenerator
 from .response_optimizer import ResponseOptimizer, QuestionGenerator
+from .fast_responder import FastChatResponder
 
 __all__ = [
     'IntentClassifier',
@@ -13,5 +14,6 @@ __all__ = [
     'ContextAnalyzer',
     'ContextualPromptGenerator',
     'ResponseOptimizer',
-    'QuestionGenerator'
+    'QuestionGenerator',
+    'FastChatResponder'
 ]
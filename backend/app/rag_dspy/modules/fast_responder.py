@@ -0,0 +1,100 @@
+# -*- coding: utf-8 -*-
+"""快速模式模块：一次LLM调用完成意图识别、信息提取、回复和追问"""
+
+import json
+from typing import Dict, Any
+import dspy
+
+from ..signatures.fast_signature import FastChatTurn
+
+
+class FastChatResponder(dspy.Module):
+    """
+    单次调用对话模块
+    用于短消息：以一次结构化调用代替完整管线的多次往返，输出格式与各阶段模块一致
+    """
+
+    def __init__(self):
+        super().__init__()
+        # 不使用ChainOfThought，省去推理字段的输出耗时
+        self.respond = dspy.Predict(FastChatTurn)
+
+    def forward(self,
+                user_message: str,
+                conversation_history: list,
+                profile_summary: str,
+                conversation_stage: str) -> Dict[str, Any]:
+        """
+        执行单次调用
+
+        Args:
+            user_message: 用户消息
+            conversation_history: 对话历史
+            profile_summary: 画像摘要
+            conversation_stage: 对话阶段
+
+        Returns:
+            {'intent': 意图字典, 'extracted_info': 提取信息字典, 'reply': 回复, 'suggested_questions': 追问列表}
+        """
+        result = self.respond(
+            user_message=user_message,
+            conversation_history=self._format_history(conversation_history),
+            profile_summary=profile_summary,
+            conversation_stage=conversation_stage
+        )
+
+        values = []
+        if result.value_keywords:
+            values = [v.strip() for v in result.value_keywords.split(',') if v.strip()]
+
+        questions = []
+        if result.suggested_questions:
+            questions = [q.strip() for q in result.suggested_questions.split('\n') if q.strip()][:3]
+
+        return {
+            'intent': {
+                'intent_type': result.intent_type or 'general_chat',
+                'confidence': self._parse_float(result.confidence),
+                'reasoning': '',
+                'sub_intents': [],
+                'emotional_state': result.emotional_state or 'neutral'
+            },
+            'extracted_info': {
+                'interests': self._parse_json(result.interests, []),
+                'abilities': self._parse_json(result.abilities, []),
+                'values': values,
+                'constraints': [],
+                'career_hints': {},
+                'profile_updates': self._parse_json(result.profile_updates, {}),
+                'confidence': self._parse_float(result.extraction_confidence)
+            },
+            'reply': result.reply or '',
+            'suggested_questions': questions
+        }
+
+    def _format_history(self, history: list) -> str:
+        """格式化对话历史（最近3轮）"""
+        if not history:
+            return "（新对话）"
+        return "\n".join([f"{'用户' if h.get('role') == 'user' else 'AI'}: {h.get('content', '')[:80]}"
+                         for h in history[-3:]])
+
+    def _parse_float(self, text: str) -> float:
+        """解析置信度"""
+        try:
+            return float(text)
+        except (TypeError, ValueError):
+            return 0.5
+
+    def _parse_json(self, text: str, default: Any) -> Any:
+        """安全解析JSON"""
+        if not text:
+            return default
+        try:
+            return json.loads(text)
+        except ValueError:
+            try:
+                # 单引号改双引号
+                return json.loads(text.replace("'", '"'))
+            except ValueError:
+                return default
@@ -23,7 +23,8 @@ class ContextualPromptGenerator(dspy.Module):
                 extracted_info: dict,
                 profile_summary: str,
                 conversation_stage: str,
-                previous_responses: list = None) -> Dict[str, Any]:
+                previous_responses: list = None,
+                references: str = "") -> Dict[str, Any]:
         """
         生成动态提示词
         
@@ -34,9 +35,10 @@ class ContextualPromptGenerator(dspy.Module):
             profile_summary: 画像摘要
             conversation_stage: 对话阶段
             previous_responses: 之前的AI回复（用于避免重复）
+            references: 从职业规划知识库检索到的参考资料（见 services.skill_index）
             
         Returns:
-            包含system_prompt, user_context, strategy, key_points, suggested_questions
+            包含system_prompt, user_context, strategy, key_points, suggested_questions, references
         """
         # 格式化输入
         intent_str = self._format_intent(intent_info)
@@ -50,7 +52,8 @@ class ContextualPromptGenerator(dspy.Module):
             extracted_info=extract_str,
             profile_summary=profile_summary,
             conversation_stage=conversation_stage,
-            previous_responses=prev_str
+            previous_responses=prev_str,
+            reference_passages=references or "（无）"
         )
         
         # 解析建议问题
@@ -69,7 +72,8 @@ class ContextualPromptGenerator(dspy.Module):
             'response_strategy': result.response_strategy,
             'key_points': key_points,
             'suggested_questions': questions,
-            'anti_repetition': result.anti_repetition_guidelines
+            'anti_repetition': result.anti_repetition_guidelines,
+            'references': references
         }
     
     def _format_intent(self, intent_info: dict) -> str:
@@ -149,6 +153,10 @@ class ContextualPromptGenerator(dspy.Module):
         if config.get('response_strategy'):
             parts.append(f"\n【回复策略】\n{config['response_strategy']}")
         
+        # 知识库参考资料
+        if config.get('references'):
+            parts.append(f"\n【参考资料】（可自然借鉴，不要照搬）\n{config['references']}")
+        
         # 关键点
         if config.get('key_points'):
             points = "\n".join([f"- {p}" for p in config['key_points']])
@@ -4,10 +4,12 @@
 from .intent_signature import IntentClassification
 from .extract_signature import StructuredInfoExtraction
 from .generate_signature import DynamicPromptGeneration, ResponseOptimization
+from .fast_signature import FastChatTurn
 
 __all__ = [
     'IntentClassification',
     'StructuredInfoExtraction', 
     'DynamicPromptGeneration',
-    'ResponseOptimization'
+    'ResponseOptimization',
+    'FastChatTurn'
 ]
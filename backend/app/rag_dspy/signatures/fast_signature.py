@@ -0,0 +1,43 @@
+# -*- coding: utf-8 -*-
+"""快速模式签名定义：一次调用同时输出意图、提取信息、回复和追问"""
+
+import dspy
+
+
+class FastChatTurn(dspy.Signature):
+    """
+    作为职业规划顾问回复用户，并在同一次输出中给出意图判断、从本轮消息提取的结构化信息和追问。
+    回复需要针对用户的具体内容，避免重复之前的回复和模板化表达。
+    """
+
+    user_message = dspy.InputField(desc="用户的原始输入文本")
+    conversation_history = dspy.InputField(desc="最近几轮对话")
+    profile_summary = dspy.InputField(desc="用户画像摘要")
+    conversation_stage = dspy.InputField(
+        desc="对话阶段: initial(初始), exploring(探索中), deepening(深入), concluding(收尾)"
+    )
+
+    # 意图
+    intent_type = dspy.OutputField(
+        desc="意图类型: greeting, share_interest, share_experience, ask_advice, "
+             "express_confusion, provide_info, general_chat"
+    )
+    confidence = dspy.OutputField(desc="意图判断置信度，0-1之间")
+    emotional_state = dspy.OutputField(desc="情绪状态: positive, neutral, negative, confused, anxious")
+
+    # 提取信息（与 StructuredInfoExtraction 的对应字段格式相同）
+    interests = dspy.OutputField(
+        desc="兴趣列表，JSON格式。每个兴趣包含: domain, specific, sentiment, constraints；没有则为[]"
+    )
+    abilities = dspy.OutputField(
+        desc="能力列表，JSON格式。每个能力包含: skill, level, evidence；没有则为[]"
+    )
+    value_keywords = dspy.OutputField(desc="价值观关键词，用逗号分隔；没有则留空")
+    profile_updates = dspy.OutputField(
+        desc="建议更新的画像字段，JSON格式，如{'holland_code': 'RIA'}；没有则为{}"
+    )
+    extraction_confidence = dspy.OutputField(desc="信息提取的整体置信度，0-1之间")
+
+    # 回复
+    reply = dspy.OutputField(desc="给用户的最终回复")
+    suggested_questions = dspy.OutputField(desc="2-3个建议追问，用换行分隔")
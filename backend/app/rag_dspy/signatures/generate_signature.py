@@ -18,6 +18,7 @@ class DynamicPromptGeneration(dspy.Signature):
         desc="对话阶段: initial(初始), exploring(探索中), deepening(深入), concluding(收尾)"
     )
     previous_responses = dspy.InputField(desc="之前几轮的AI回复，用于避免重复")
+    reference_passages = dspy.InputField(desc="从职业规划知识库检索到的相关段落，作为回复的依据")
     
     system_prompt = dspy.OutputField(
         desc="系统级提示词，定义AI角色和基本行为准则"
@@ -0,0 +1,301 @@
+# -*- coding: utf-8 -*-
+"""
+专业↔职业推荐矩阵
+将 major_occupations 的匹配度加载为内存中的稀疏矩阵：
+- CSR（按专业压缩）: 专业 → 职业，行内按匹配度降序
+- CSC（按职业压缩）: 职业 → 专业，列内按匹配度降序
+并为每个专业、每个职业预计算前K名列表，两个方向的推荐查询都是 O(K) 的字典查找。
+
+create_major_occupation 的事务提交后调用 record_major_occupation() 增量更新受影响的两个前K列表，
+新增条目先进入待合并缓冲区，累计到阈值后再压缩进CSR/CSC数组并写回文件。
+矩阵以紧凑二进制文件持久化（data/recommendation_matrix.bin），启动时若文件中的
+指纹（major_occupations 行数、最大ID和内容校验和）与数据库一致则直接加载，否则从数据库重建。
+校验和是每行 (id, major_id, occupation_id, match_score) 的散列之和，由数据库聚合计算，
+原地修改匹配度或删除后再插入都会改变指纹。各进程先写各自的临时文件再原子替换。
+"""
+
+import os
+import struct
+import sys
+import tempfile
+import threading
+from array import array
+from bisect import bisect_left
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from sqlalchemy import BigInteger, cast, func
+from sqlalchemy.orm import Session
+
+from . import database, models
+
+
+TOP_K = 50
+COMPACT_THRESHOLD = 256
+MATRIX_FILE = os.path.join(database.DATABASE_DIR, "recommendation_matrix.bin")
+
+# 文件头: 魔数, 前K, 行数指纹, 最大ID指纹, 校验和指纹, 行数, 非零元数
+_MAGIC = b"RMX2"
+_HEADER = struct.Struct("<4siiiqii")
+
+# 行散列: (id * A + major_id * B + occupation_id * C + match_score) % P，Python与SQL计算结果一致
+_HASH_FACTORS = (1000003, 7919, 104729)
+_HASH_MODULUS = 2147483647
+
+Ranked = Tuple[Tuple[int, int], ...]  # ((目标ID, 匹配度), ...)
+Fingerprint = Tuple[int, int, int]    # (行数, 最大ID, 校验和)
+
+
+def row_hash(row_id: int, major_id: int, occupation_id: int, score: Optional[int]) -> int:
+    """单行的散列（与 _db_fingerprint 中的SQL表达式一致）"""
+    a, b, c = _HASH_FACTORS
+    return (row_id * a + major_id * b + occupation_id * c + (score or 0)) % _HASH_MODULUS
+
+
+class CompressedScores:
+    """
+    压缩稀疏行存储
+    keys[i] 行的非零元素位于 cols/scores[indptr[i]:indptr[i+1]]，行内按得分降序、ID升序
+    """
+
+    __slots__ = ("keys", "indptr", "cols", "scores")
+
+    def __init__(self, keys: array, indptr: array, cols: array, scores: array):
+        self.keys = keys
+        self.indptr = indptr
+        self.cols = cols
+        self.scores = scores
+
+    @classmethod
+    def from_triples(cls, triples: Iterable[Tuple[int, int, int]]) -> "CompressedScores":
+        """由 (行, 列, 得分) 三元组构建"""
+        keys, indptr, cols, scores = array("i"), array("i", [0]), array("i"), array("i")
+        for row, col, score in sorted(triples, key=lambda t: (t[0], -t[2], t[1])):
+            if not keys or keys[-1] != row:
+                if keys:
+                    indptr.append(len(cols))
+                keys.append(row)
+            cols.append(col)
+            scores.append(score)
+        if keys:
+            indptr.append(len(cols))
+        return cls(keys, indptr, cols, scores)
+
+    @property
+    def nnz(self) -> int:
+        return len(self.cols)
+
+    def row(self, key: int) -> List[Tuple[int, int]]:
+        """返回一行的 (列, 得分) 列表，按得分降序"""
+        i = bisect_left(self.keys, key)
+        if i == len(self.keys) or self.keys[i] != key:
+            return []
+        start, end = self.indptr[i], self.indptr[i + 1]
+        return list(zip(self.cols[start:end], self.scores[start:end]))
+
+    def triples(self):
+        """遍历 (行, 列, 得分)"""
+        for i, key in enumerate(self.keys):
+            for j in range(self.indptr[i], self.indptr[i + 1]):
+                yield key, self.cols[j], self.scores[j]
+
+
+def _rank(entries: Iterable[Tuple[int, int]], k: int) -> Ranked:
+    return tuple(sorted(entries, key=lambda e: (-e[1], e[0]))[:k])
+
+
+class RecommendationMatrix:
+    """专业↔职业匹配度稀疏矩阵及前K推荐列表"""
+
+    def __init__(self, csr: CompressedScores, top_k: int = TOP_K, fingerprint: Fingerprint = (0, 0, 0)):
+        self.top_k = top_k
+        self.fingerprint = fingerprint
+        self._csr = csr
+        self._csc = CompressedScores.from_triples((o, m, s) for m, o, s in csr.triples())
+        self._pending: Dict[Tuple[int, int], int] = {}
+        self._occupations_by_major = self._precompute(self._csr)
+        self._majors_by_occupation = self._precompute(self._csc)
+
+    @classmethod
+    def from_rows(cls, rows: Iterable[Tuple[int, int, int]], top_k: int = TOP_K,
+                  fingerprint: Fingerprint = (0, 0, 0)) -> "RecommendationMatrix":
+        """由 (major_id, occupation_id, match_score) 构建，同一专业-职业对以最后一条为准"""
+        scores = {}
+        for major_id, occupation_id, score in rows:
+            scores[(major_id, occupation_id)] = score if score is not None else 0
+        csr = CompressedScores.from_triples((m, o, s) for (m, o), s in scores.items())
+        return cls(csr, top_k=top_k, fingerprint=fingerprint)
+
+    def _precompute(self, matrix: CompressedScores) -> Dict[int, Ranked]:
+        result = {}
+        for i, key in enumerate(matrix.keys):
+            start = matrix.indptr[i]
+            end = min(matrix.indptr[i + 1], start + self.top_k)
+            result[key] = tuple(zip(matrix.cols[start:end], matrix.scores[start:end]))
+        return result
+
+    # ---------- 查询 ----------
+
+    def occupations_for_major(self, major_id: int, limit: int = 10) -> Ranked:
+        """专业的推荐职业 ((occupation_id, match_score), ...)"""
+        return self._occupations_by_major.get(major_id, ())[:limit]
+
+    def majors_for_occupation(self, occupation_id: int, limit: int = 10) -> Ranked:
+        """职业的对口专业 ((major_id, match_score), ...)"""
+        return self._majors_by_occupation.get(occupation_id, ())[:limit]
+
+    @property
+    def nnz(self) -> int:
+        return self._csr.nnz + len(self._pending)
+
+    # ---------- 增量更新 ----------
+
+    def update(self, major_id: int, occupation_id: int, score: int, row_id: int = 0) -> None:
+        """写入一条匹配度，只重算受影响的专业行和职业列的前K列表"""
+        score = score if score is not None else 0
+        self._pending[(major_id, occupation_id)] = score
+        count, max_id, checksum = self.fingerprint
+        self.fingerprint = (count + 1, max(max_id, row_id),
+                            checksum + row_hash(row_id, major_id, occupation_id, score))
+
+        major_row = dict(self._csr.row(major_id))
+        major_row.update({o: s for (m, o), s in self._pending.items() if m == major_id})
+        self._occupations_by_major[major_id] = _rank(major_row.items(), self.top_k)
+
+        occupation_col = dict(self._csc.row(occupation_id))
+        occupation_col.update({m: s for (m, o), s in self._pending.items() if o == occupation_id})
+        self._majors_by_occupation[occupation_id] = _rank(occupation_col.items(), self.top_k)
+
+    @property
+    def needs_compaction(self) -> bool:
+        return len(self._pending) >= COMPACT_THRESHOLD
+
+    def compact(self) -> None:
+        """将待合并条目压缩进CSR/CSC数组"""
+        if not self._pending:
+            return
+        scores = {(m, o): s for m, o, s in self._csr.triples()}
+        scores.update(self._pending)
+        self._csr = CompressedScores.from_triples((m, o, s) for (m, o), s in scores.items())
+        self._csc = CompressedScores.from_triples((o, m, s) for (m, o), s in scores.items())
+        self._pending = {}
+
+    # ---------- 持久化 ----------
+
+    def save(self, path: Optional[str] = None) -> None:
+        """压缩后写入二进制文件（先写本进程的临时文件再原子替换）"""
+        path = path or MATRIX_FILE
+        self.compact()
+        csr = self._csr
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path) or ".",
+                                        prefix=os.path.basename(path) + ".", suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(_HEADER.pack(_MAGIC, self.top_k, *self.fingerprint, len(csr.keys), csr.nnz))
+                for values in (csr.keys, csr.indptr, csr.cols, csr.scores):
+                    _write_array(f, values)
+            os.replace(tmp_path, path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+
+    @classmethod
+    def load(cls, path: Optional[str] = None) -> Optional["RecommendationMatrix"]:
+        """从文件加载，文件不存在或格式不符时返回None"""
+        try:
+            with open(path or MATRIX_FILE, "rb") as f:
+                magic, top_k, count, max_id, checksum, rows, nnz = _HEADER.unpack(f.read(_HEADER.size))
+                if magic != _MAGIC:
+                    return None
+                keys = _read_array(f, rows)
+                indptr = _read_array(f, rows + 1)
+                cols = _read_array(f, nnz)
+                scores = _read_array(f, nnz)
+        except (OSError, struct.error, EOFError, ValueError):
+            return None
+        return cls(CompressedScores(keys, indptr, cols, scores), top_k=top_k,
+                   fingerprint=(count, max_id, checksum))
+
+
+def _write_array(f, values: array) -> None:
+    if sys.byteorder == "big":
+        values = array(values.typecode, values)
+        values.byteswap()
+    values.tofile(f)
+
+
+def _read_array(f, size: int) -> array:
+    values = array("i")
+    values.fromfile(f, size)
+    if sys.byteorder == "big":
+        values.byteswap()
+    return values
+
+
+# ==================== 全局实例 ====================
+
+_lock = threading.Lock()
+_matrix: Optional[RecommendationMatrix] = None
+
+
+def _db_fingerprint(db: Session) -> Fingerprint:
+    """(行数, 最大ID, 各行散列之和)，散列见 row_hash"""
+    table = models.MajorOccupation
+    a, b, c = _HASH_FACTORS
+    row_hash_sql = (
+        cast(table.id, BigInteger) * a + cast(table.major_id, BigInteger) * b
+        + cast(table.occupation_id, BigInteger) * c + func.coalesce(table.match_score, 0)
+    ) % _HASH_MODULUS
+    count, max_id, checksum = db.query(
+        func.count(table.id), func.max(table.id), func.sum(row_hash_sql)
+    ).one()
+    return count or 0, max_id or 0, int(checksum or 0)
+
+
+def build_recommendation_matrix(db: Session) -> RecommendationMatrix:
+    """从数据库全量构建"""
+    rows = db.query(
+        models.MajorOccupation.major_id,
+        models.MajorOccupation.occupation_id,
+        models.MajorOccupation.match_score
+    ).order_by(models.MajorOccupation.id)
+    return RecommendationMatrix.from_rows(rows, fingerprint=_db_fingerprint(db))
+
+
+def get_recommendation_matrix(db: Session) -> RecommendationMatrix:
+    """获取推荐矩阵，首次调用时优先从文件热启动"""
+    global _matrix
+    if _matrix is not None:
+        return _matrix
+    with _lock:
+        if _matrix is None:
+            fingerprint = _db_fingerprint(db)
+            matrix = RecommendationMatrix.load()
+            if matrix is None or matrix.fingerprint != fingerprint or matrix.top_k != TOP_K:
+                print("[Recommendation] Building recommendation matrix from database ...")
+                matrix = build_recommendation_matrix(db)
+                try:
+                    matrix.save()
+                except OSError as e:
+                    print(f"[Recommendation] Warning: could not save matrix: {e}")
+            _matrix = matrix
+    return _matrix
+
+
+def record_major_occupation(major_id: int, occupation_id: int, match_score: Optional[int], row_id: int) -> None:
+    """create_major_occupation 的事务提交后调用（见 database.call_after_commit），增量更新已加载的矩阵"""
+    with _lock:
+        if _matrix is None:
+            return
+        _matrix.update(major_id, occupation_id, match_score, row_id=row_id)
+        if _matrix.needs_compaction:
+            try:
+                _matrix.save()
+            except OSError as e:
+                print(f"[Recommendation] Warning: could not save matrix: {e}")
+
+
+def reset_recommendation_matrix() -> None:
+    """丢弃内存中的矩阵（批量导入数据后调用），下次访问时重新加载"""
+    global _matrix
+    with _lock:
+        _matrix = None
@@ -20,15 +20,20 @@ from .models_user_report import (
     UserReport, ReportChapter, GenerationTask, ReportSnapshot, GenerationLog
 )
 from .schemas_user_report import (
-    ReportType, TaskStatus, ChapterStatus, GenerationOptions,
-    WebSocketMessage, GenerationProgressUpdate
+    ReportType, ReportStatus, TaskStatus, ChapterStatus, GenerationOptions,
+    WebSocketMessage, GenerationProgressUpdate,
+    UserReportCreate, UserReportUpdate, GenerationTaskCreate, ReportChapterCreate
 )
 from .crud_user_report import (
-    create_user_report, update_user_report, create_report_chapter,
+    create_user_report, update_user_report, build_report_chapter, create_report_chapters,
+    create_generation_task,
     update_chapter_content, update_generation_task, create_generation_log,
     increment_task_retry, create_report_snapshot
 )
 from .report_prerequisites import ReportPrerequisitesChecker
+from .database import immediate_commits
+from .query_stats import run_detached
+from .write_queue import run_write
 
 
 # ==================== 章节配置定义 ====================
@@ -754,8 +759,13 @@ class ReportGenerationService:
     使用LazyLLM实现并行章节生成
     """
     
-    def __init__(self, db: Session):
+    def __init__(self, db: Session, owns_session: bool = False):
+        """owns_session=True 时会话由本服务关闭：生成流程结束后，或创建记录失败时"""
         self.db = db
+        self.owns_session = owns_session
+        if owns_session:
+            # 章节等对象的属性在事件循环上读取：提交后不过期，避免读取时在事件循环上重新查询
+            db.expire_on_commit = False
         # TODO: 初始化LazyLLM模块
         # self.llm = OnlineChatModule(model="kimi", stream=True)
     
@@ -771,9 +781,31 @@ class ReportGenerationService:
         Returns:
             task_id: 生成任务ID
         """
+        # 报告、任务和章节记录合并为一次提交
+        try:
+            task_id, report_id = await asyncio.to_thread(
+                run_write, self.db, self._create_report_records, user_id, report_type, options
+            )
+        except Exception:
+            await self._close_session()
+            raise
+        
+        # 4. 启动异步生成流程（不计入本请求的查询统计和预算）
+        run_detached(asyncio.create_task, self._run_generation_workflow(task_id, report_id, user_id))
+        
+        return task_id
+    
+    def _create_report_records(
+        self,
+        db: Session,
+        user_id: str,
+        report_type: ReportType,
+        options: Optional[GenerationOptions]
+    ) -> tuple:
+        """创建报告、生成任务和章节记录（在一个工作单元中执行），返回 (task_id, report_id)"""
         # 1. 创建报告记录
         report_title = self._get_report_title(report_type)
-        report = create_user_report(self.db, UserReportCreate(
+        report = create_user_report(db, UserReportCreate(
             user_id=user_id,
             title=report_title,
             report_type=report_type,
@@ -783,30 +815,29 @@ class ReportGenerationService:
         ))
         
         # 2. 创建生成任务
-        task = create_generation_task(self.db, GenerationTaskCreate(
+        task = create_generation_task(db, GenerationTaskCreate(
             user_id=user_id,
             report_type=report_type,
             report_id=report.id,
             options=options
         ))
         
-        # 3. 创建章节记录
+        # 3. 创建章节记录：章节ID在本地生成，父章节按代码在已构建的章节中查找，一次写入
         chapter_configs = self._get_chapter_configs(report_type)
+        chapters = {}
         for config in chapter_configs:
-            create_report_chapter(self.db, ReportChapterCreate(
+            parent = chapters.get(config.parent_code)
+            chapters[config.code] = build_report_chapter(ReportChapterCreate(
                 report_id=report.id,
                 chapter_code=config.code,
                 title=config.title,
-                parent_id=self._get_parent_chapter_id(report.id, config.parent_code),
+                parent_id=parent.id if parent else None,
                 order_num=self._get_order_num(config.code),
                 level=config.level,
                 status=ChapterStatus.PENDING
             ))
-        
-        # 4. 启动异步生成流程
-        asyncio.create_task(self._run_generation_workflow(task.id, report.id, user_id))
-        
-        return task.id
+        create_report_chapters(db, list(chapters.values()))
+        return task.id, report.id
     
     async def _run_generation_workflow(
         self,
@@ -815,26 +846,52 @@ class ReportGenerationService:
         user_id: str
     ):
         """运行生成工作流"""
+        # 长时间运行：逐次提交，使进度及时对轮询/WebSocket可见
+        try:
+            with immediate_commits(self.db):
+                await self._run_generation_steps(task_id, report_id, user_id)
+        finally:
+            await self._close_session()
+    
+    async def _run_db(self, func: Callable, *args, **kwargs) -> Any:
+        """
+        在线程池中执行同步CRUD函数 func(self.db, ...)
+        每次提交都是一次磁盘同步，放在事件循环上会阻塞WebSocket进度推送和其他请求；
+        工作流中的数据库操作依次执行，同一时刻只有一个线程使用会话
+        """
+        return await asyncio.to_thread(func, self.db, *args, **kwargs)
+    
+    async def _close_session(self) -> None:
+        """关闭本服务持有的会话（会话由调用方传入时不关闭）"""
+        if self.owns_session:
+            await asyncio.to_thread(self.db.close)
+    
+    async def _run_generation_steps(
+        self,
+        task_id: str,
+        report_id: str,
+        user_id: str
+    ):
         try:
             # 更新任务状态
-            update_generation_task(
-                self.db, task_id,
+            await self._run_db(
+                update_generation_task, task_id,
                 status=TaskStatus.GENERATING,
                 started_at=datetime.utcnow()
             )
             
             # 获取用户数据
-            user_data = self._fetch_user_data(user_id)
+            user_data = await asyncio.to_thread(self._fetch_user_data, user_id)
             
             # 创建数据快照
-            self._create_data_snapshots(report_id, user_id, user_data)
+            await asyncio.to_thread(self._create_data_snapshots, report_id, user_id, user_data)
             
             # 获取章节列表
-            chapters = self._get_pending_chapters(report_id)
+            chapters = await asyncio.to_thread(self._get_pending_chapters, report_id)
             
             # 更新总章节数
-            update_generation_task(
-                self.db, task_id,
+            await self._run_db(
+                update_generation_task, task_id,
                 total_chapters=len(chapters)
             )
             
@@ -844,18 +901,18 @@ class ReportGenerationService:
                 await self._generate_chapter(task_id, chapter, user_data, i, len(chapters))
             
             # 组装报告
-            update_generation_task(
-                self.db, task_id,
+            await self._run_db(
+                update_generation_task, task_id,
                 status=TaskStatus.ASSEMBLING,
                 current_stage="content_assembly"
             )
             await self._assemble_report(report_id)
             
             # 更新报告状态
-            total_word_count = self._calculate_total_word_count(report_id)
+            total_word_count = await asyncio.to_thread(self._calculate_total_word_count, report_id)
             chapter_count = len(chapters)
             
-            update_user_report(self.db, report_id, UserReportUpdate(
+            await self._run_db(update_user_report, report_id, UserReportUpdate(
                 status=ReportStatus.COMPLETED,
                 word_count=total_word_count,
                 chapter_count=chapter_count,
@@ -863,8 +920,8 @@ class ReportGenerationService:
             ))
             
             # 完成任务
-            update_generation_task(
-                self.db, task_id,
+            await self._run_db(
+                update_generation_task, task_id,
                 status=TaskStatus.COMPLETED,
                 progress=100,
                 completed_at=datetime.utcnow()
@@ -872,22 +929,22 @@ class ReportGenerationService:
             
         except Exception as e:
             # 记录错误
-            create_generation_log(
-                self.db, task_id,
+            await self._run_db(
+                create_generation_log, task_id,
                 message=f"Generation failed: {str(e)}",
                 log_level="error"
             )
             
             # 更新任务状态为失败
-            update_generation_task(
-                self.db, task_id,
+            await self._run_db(
+                update_generation_task, task_id,
                 status=TaskStatus.FAILED,
                 error_code="GENERATION_ERROR",
                 error_message=str(e)
             )
             
             # 更新报告状态
-            update_user_report(self.db, report_id, UserReportUpdate(
+            await self._run_db(update_user_report, report_id, UserReportUpdate(
                 status=ReportStatus.FAILED
             ))
     
@@ -903,15 +960,15 @@ class ReportGenerationService:
         start_time = datetime.utcnow()
         
         # 更新当前章节
-        update_generation_task(
-            self.db, task_id,
+        await self._run_db(
+            update_generation_task, task_id,
             current_chapter_id=chapter.id,
             current_stage="chapter_generation"
         )
         
         # 更新章节状态
-        update_chapter_content(
-            self.db, chapter.id,
+        await self._run_db(
+            update_chapter_content, chapter.id,
             status=ChapterStatus.GENERATING
         )
         
@@ -930,8 +987,8 @@ class ReportGenerationService:
             end_time = datetime.utcnow()
             generation_time = int((end_time - start_time).total_seconds())
             
-            update_chapter_content(
-                self.db, chapter.id,
+            await self._run_db(
+                update_chapter_content, chapter.id,
                 content_html=f"<div class='chapter'>{content}</div>",
                 content_markdown=content,
                 content_plain=content,
@@ -943,15 +1000,15 @@ class ReportGenerationService:
             
             # 更新进度
             progress = int((index + 1) / total * 80)  # 生成占80%进度
-            update_generation_task(
-                self.db, task_id,
+            await self._run_db(
+                update_generation_task, task_id,
                 progress=progress,
                 completed_chapters=index + 1
             )
             
             # 记录日志
-            create_generation_log(
-                self.db, task_id,
+            await self._run_db(
+                create_generation_log, task_id,
                 message=f"Chapter {chapter.chapter_code} generated successfully",
                 stage="chapter_generation",
                 chapter_id=chapter.id,
@@ -960,14 +1017,14 @@ class ReportGenerationService:
             
         except Exception as e:
             # 更新章节状态为失败
-            update_chapter_content(
-                self.db, chapter.id,
+            await self._run_db(
+                update_chapter_content, chapter.id,
                 status=ChapterStatus.FAILED
             )
             
             # 记录错误日志
-            create_generation_log(
-                self.db, task_id,
+            await self._run_db(
+                create_generation_log, task_id,
                 message=f"Chapter {chapter.chapter_code} generation failed: {str(e)}",
                 log_level="error",
                 stage="chapter_generation",
@@ -1039,7 +1096,7 @@ class ReportGenerationService:
     async def _assemble_report(self, report_id: str):
         """组装报告"""
         # 获取所有章节
-        chapters = self._get_chapters_by_report(report_id)
+        chapters = await asyncio.to_thread(self._get_chapters_by_report, report_id)
         
         # 按顺序组装内容
         assembled_content = []
@@ -1068,18 +1125,6 @@ class ReportGenerationService:
             if report_type in config.report_types
         ]
     
-    def _get_parent_chapter_id(self, report_id: str, parent_code: Optional[str]) -> Optional[str]:
-        """获取父章节ID"""
-        if not parent_code:
-            return None
-        
-        chapter = self.db.query(ReportChapter).filter(
-            ReportChapter.report_id == report_id,
-            ReportChapter.chapter_code == parent_code
-        ).first()
-        
-        return chapter.id if chapter else None
-    
     def _get_order_num(self, code: str) -> int:
         """获取排序序号"""
         # 简单的排序逻辑：基于章节代码
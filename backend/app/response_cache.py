@@ -0,0 +1,211 @@
+# -*- coding: utf-8 -*-
+"""
+目录接口响应缓存
+缓存目录类只读接口的最终JSON字节（以及gzip/brotli压缩版本），按目录版本号失效。
+响应携带强ETag，每种编码各不相同（"<散列>"、"<散列>-gz"、"<散列>-br"）；
+按 Accept-Encoding 的 q 值选择编码后，条件请求（If-None-Match）与所选编码的ETag匹配时直接返回304，
+不访问SQLAlchemy或Pydantic。
+"""
+
+import gzip
+import hashlib
+import json
+import threading
+from collections import OrderedDict
+from typing import Callable, Dict, NamedTuple, Optional
+
+from fastapi import Request
+from fastapi.responses import Response
+
+from .catalog_snapshot import get_catalog_version
+
+# 可选的快速JSON编码器
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# 可选的brotli压缩
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+
+# 小于该字节数的响应不压缩
+COMPRESS_MIN_SIZE = 1024
+# 缓存条目上限（按 路径+查询参数 计）
+MAX_ENTRIES = 512
+
+
+# 编码 -> ETag后缀
+ETAG_SUFFIXES = {"gzip": "-gz", "br": "-br"}
+
+
+class CachedResponse(NamedTuple):
+    """已编码的响应（etag 为未压缩版本的ETag）"""
+    version: int
+    etag: str
+    body: bytes
+    gzip_body: Optional[bytes]
+    br_body: Optional[bytes]
+
+
+def encode_json(payload) -> bytes:
+    """编码为紧凑的UTF-8 JSON字节（与FastAPI JSONResponse输出一致）"""
+    if orjson is not None:
+        return orjson.dumps(payload)
+    return json.dumps(payload, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def _build_entry(version: int, payload) -> CachedResponse:
+    body = encode_json(payload)
+    etag = '"%s"' % hashlib.blake2b(body, digest_size=16).hexdigest()
+    gzip_body = br_body = None
+    if len(body) >= COMPRESS_MIN_SIZE:
+        gzip_body = gzip.compress(body, compresslevel=6)
+        if brotli is not None:
+            br_body = brotli.compress(body)
+    return CachedResponse(version, etag, body, gzip_body, br_body)
+
+
+class ResponseCache:
+    """按请求键缓存编码后响应的LRU缓存"""
+
+    def __init__(self, max_entries: int = MAX_ENTRIES):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, CachedResponse]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: str, version: int) -> Optional[CachedResponse]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry.version != version:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry
+
+    def put(self, key: str, entry: CachedResponse) -> None:
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> dict:
+        return {"entries": len(self._entries), "hits": self.hits, "misses": self.misses}
+
+
+_catalog_cache = ResponseCache()
+
+
+def get_catalog_response_cache() -> ResponseCache:
+    """获取目录响应缓存单例"""
+    return _catalog_cache
+
+
+def _request_key(request: Request) -> str:
+    """缓存键：路径 + 排序后的查询参数"""
+    query = "&".join(f"{k}={v}" for k, v in sorted(request.query_params.multi_items()))
+    return f"{request.url.path}?{query}"
+
+
+def representation_etag(etag: str, encoding: Optional[str]) -> str:
+    """某种编码版本的强ETag：未压缩版本的ETag加编码后缀"""
+    if encoding is None:
+        return etag
+    return etag[:-1] + ETAG_SUFFIXES[encoding] + '"'
+
+
+def parse_accept_encoding(accept_encoding: str) -> Dict[str, float]:
+    """解析 Accept-Encoding 为 {编码: q值}（编码名小写，无效的q值按0处理）"""
+    accepted = {}
+    for item in accept_encoding.split(","):
+        coding, *params = [part.strip() for part in item.split(";")]
+        if not coding:
+            continue
+        q = 1.0
+        for param in params:
+            name, _, value = param.partition("=")
+            if name.strip().lower() == "q":
+                try:
+                    q = float(value)
+                except ValueError:
+                    q = 0.0
+        accepted[coding.lower()] = q
+    return accepted
+
+
+def _choose_encoding(accept_encoding: str, entry: CachedResponse) -> Optional[str]:
+    """按q值选择压缩编码（q=0 表示不接受，未列出的编码取 * 的q值），同q值时优先br；None 表示不压缩"""
+    accepted = parse_accept_encoding(accept_encoding)
+    candidates = []
+    for encoding, body in (("br", entry.br_body), ("gzip", entry.gzip_body)):
+        q = accepted.get(encoding, accepted.get("*", 0.0))
+        if body is not None and q > 0:
+            candidates.append((q, encoding))
+    if not candidates:
+        return None
+    return max(candidates, key=lambda item: item[0])[1]
+
+
+def _etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """If-None-Match 弱比较（RFC 9110）"""
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate.startswith("W/"):
+            candidate = candidate[2:]
+        if candidate == etag:
+            return True
+    return False
+
+
+def cached_catalog_response(request: Request, builder: Callable[[], dict]) -> Response:
+    """
+    返回目录接口的缓存响应
+
+    Args:
+        request: 当前请求
+        builder: 缓存未命中时调用，返回待编码的响应字典（自行打开数据库会话）
+    """
+    version = get_catalog_version()
+    key = _request_key(request)
+    entry = _catalog_cache.get(key, version)
+    if entry is None:
+        entry = _build_entry(version, builder())
+        # 构建期间目录发生变更时不缓存
+        if version == get_catalog_version():
+            _catalog_cache.put(key, entry)
+
+    encoding = _choose_encoding(request.headers.get("accept-encoding", ""), entry)
+    etag = representation_etag(entry.etag, encoding)
+    headers = {
+        "ETag": etag,
+        "Cache-Control": "no-cache",
+        "Vary": "Accept-Encoding",
+    }
+
+    if _etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=304, headers=headers)
+
+    body = entry.body
+    if encoding == "br":
+        body = entry.br_body
+        headers["Content-Encoding"] = "br"
+    elif encoding == "gzip":
+        body = entry.gzip_body
+        headers["Content-Encoding"] = "gzip"
+
+    return Response(content=body, media_type="application/json", headers=headers)
@@ -0,0 +1,320 @@
+# -*- coding: utf-8 -*-
+"""
+日志数据保留
+generation_logs、user_conversations、user_profile_logs 会随使用无限增长。本模块按表配置保留天数，
+由后台线程定期清理过期行：
+
+- 分批删除：每批最多 RETENTION_BATCH_SIZE 行、各自一个短事务，批次之间让出写锁；
+  启用写队列（SQLITE_WRITE_QUEUE=1）时每批经 run_write 交给写线程执行，不与写线程争用写锁；
+- 删除前归档：被删除的行（DELETE ... RETURNING）写入 data/archive/<表>/<表>-<时间>-<进程ID>.jsonl.gz，
+  归档写入成功后才提交删除；多个工作进程同时清理时，每行只会被实际删除它的进程归档；
+- 清理后 PRAGMA incremental_vacuum 归还空闲页（SQLite，需 auto_vacuum=INCREMENTAL）。
+
+    cd backend
+    python -m app.retention                             # 执行一次清理
+    python -m app.retention --dry-run                   # 只统计过期行数
+    python -m app.retention --enable-incremental-vacuum # 已有数据库一次性切换为增量 VACUUM
+
+保留天数：RETENTION_<表名大写>_DAYS（0 表示不清理），清理间隔：RETENTION_INTERVAL（秒，0 表示不启动后台线程）。
+"""
+
+import argparse
+import gzip
+import json
+import os
+import threading
+import time
+from datetime import date, datetime, timedelta
+from typing import Dict, List, NamedTuple, Optional, Tuple
+
+from sqlalchemy import func, select
+from sqlalchemy.orm import Session
+
+from . import database, models_user_profile, models_user_report  # noqa: F401 注册表
+from .write_queue import run_write
+
+
+class RetentionPolicy(NamedTuple):
+    """单张表的保留策略"""
+    table: str
+    timestamp_column: str
+    days: int
+    archive: bool = True
+    # 删除前置空的引用列 (表, 列)，避免保留的行指向已删除的行
+    references: Tuple[Tuple[str, str], ...] = ()
+
+
+def _days(table: str, default: int) -> int:
+    return int(os.environ.get(f"RETENTION_{table.upper()}_DAYS", str(default)))
+
+
+POLICIES: Dict[str, RetentionPolicy] = {
+    policy.table: policy for policy in (
+        RetentionPolicy("generation_logs", "created_at", _days("generation_logs", 30)),
+        RetentionPolicy("user_profile_logs", "timestamp", _days("user_profile_logs", 365)),
+        RetentionPolicy("user_conversations", "timestamp", _days("user_conversations", 180),
+                        references=(("user_profile_logs", "source_message_id"),)),
+    )
+}
+
+# 默认放在SQLite数据库文件旁（PostgreSQL 时为 data/archive）
+ARCHIVE_DIR = os.environ.get("RETENTION_ARCHIVE_DIR") or os.path.join(os.path.dirname(database.DATABASE_FILE), "archive")
+BATCH_SIZE = int(os.environ.get("RETENTION_BATCH_SIZE", "500"))
+BATCH_PAUSE = float(os.environ.get("RETENTION_BATCH_PAUSE", "0.05"))   # 批次间隔（秒）
+VACUUM_PAGES = int(os.environ.get("RETENTION_VACUUM_PAGES", "2000"))   # 每步释放的页数
+RETENTION_INTERVAL = float(os.environ.get("RETENTION_INTERVAL", "21600"))
+INITIAL_DELAY = float(os.environ.get("RETENTION_INITIAL_DELAY", "60"))
+
+
+def _table(name: str):
+    return database.Base.metadata.tables[name]
+
+
+def _json_default(value):
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    return str(value)
+
+
+class _ArchiveWriter:
+    """按需创建的 gzip JSONL 归档文件（没有过期行时不创建文件）"""
+
+    def __init__(self, archive_dir: str, table: str):
+        self.directory = os.path.join(archive_dir, table)
+        self.table = table
+        self.path: Optional[str] = None
+        self._file = None
+
+    def write(self, rows: List[dict]) -> None:
+        if self._file is None:
+            os.makedirs(self.directory, exist_ok=True)
+            stamp = datetime.utcnow().strftime("%Y%m%dT%H%M%S")
+            self.path = os.path.join(self.directory, f"{self.table}-{stamp}-{os.getpid()}.jsonl.gz")
+            self._file = gzip.open(self.path, "at", encoding="utf-8")
+        for row in rows:
+            self._file.write(json.dumps(row, ensure_ascii=False, default=_json_default) + "\n")
+        # 同步刷新压缩流，删除提交前数据已写入文件
+        self._file.flush()
+
+    def close(self) -> None:
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+
+# ==================== 清理 ====================
+
+def count_expired(policy: RetentionPolicy, bind=None, now: Optional[datetime] = None) -> int:
+    """过期行数"""
+    table = _table(policy.table)
+    cutoff = (now or datetime.utcnow()) - timedelta(days=policy.days)
+    with (bind or database.engine).connect() as conn:
+        return conn.execute(
+            select(func.count()).select_from(table).where(table.c[policy.timestamp_column] < cutoff)
+        ).scalar()
+
+
+def _delete_batch(db: Session, policy: RetentionPolicy, cutoff: datetime, batch_size: int,
+                  writer: Optional[_ArchiveWriter]) -> Tuple[int, int]:
+    """删除一批过期行并写入归档（在调用方的事务中执行），返回 (选出行数, 删除行数)"""
+    table = _table(policy.table)
+    conn = db.connection()
+    ids = conn.execute(
+        select(table.c.id).where(table.c[policy.timestamp_column] < cutoff).limit(batch_size)
+    ).scalars().all()
+    if not ids:
+        return 0, 0
+    for ref_table, ref_column in policy.references:
+        ref = _table(ref_table)
+        conn.execute(ref.update().where(ref.c[ref_column].in_(ids)).values({ref_column: None}))
+    # 只返回本事务实际删除的行，并发清理时不会重复归档
+    deleted = conn.execute(
+        table.delete().where(table.c.id.in_(ids)).returning(*table.c)
+    ).mappings().all()
+    if writer is not None and deleted:
+        writer.write(sorted((dict(row) for row in deleted), key=lambda row: row["id"]))
+    return len(ids), len(deleted)
+
+
+def purge_table(policy: RetentionPolicy, bind=None, now: Optional[datetime] = None,
+                batch_size: int = BATCH_SIZE, pause: float = BATCH_PAUSE,
+                archive_dir: str = ARCHIVE_DIR) -> Dict[str, object]:
+    """
+    分批删除一张表的过期行，返回 {"deleted", "batches", "archive"}
+    每批一个事务：选出过期行ID -> 置空引用 -> DELETE ... RETURNING -> 写入归档 -> 提交；
+    归档写入失败时该批回滚。进程在归档后、提交前退出时，下次清理会再次归档这些行。
+    启用写队列时每批是写线程批次事务中的一个保存点，随该批次提交。
+    """
+    bind = bind or database.engine
+    cutoff = (now or datetime.utcnow()) - timedelta(days=policy.days)
+    writer = _ArchiveWriter(archive_dir, policy.table) if policy.archive else None
+    stats = {"deleted": 0, "batches": 0, "archive": None}
+    try:
+        with Session(bind=bind) as db:
+            while True:
+                selected, deleted = run_write(db, _delete_batch, policy, cutoff, batch_size, writer)
+                if not selected:
+                    break
+                stats["deleted"] += deleted
+                stats["batches"] += 1
+                if selected < batch_size:
+                    break
+                if pause > 0:
+                    time.sleep(pause)
+    finally:
+        if writer is not None:
+            writer.close()
+            stats["archive"] = writer.path
+    return stats
+
+
+# ==================== 空间回收 ====================
+
+def auto_vacuum_mode(bind=None) -> Optional[int]:
+    """SQLite auto_vacuum 模式：0=NONE 1=FULL 2=INCREMENTAL；非SQLite返回None"""
+    bind = bind or database.engine
+    if bind.dialect.name != "sqlite":
+        return None
+    with bind.connect() as conn:
+        return conn.exec_driver_sql("PRAGMA auto_vacuum").scalar()
+
+
+def incremental_vacuum(bind=None, step_pages: int = VACUUM_PAGES) -> int:
+    """
+    分步释放SQLite空闲页，返回释放的页数
+    PostgreSQL 由 autovacuum 回收空间；auto_vacuum 不是 INCREMENTAL 的SQLite库不做处理
+    """
+    bind = bind or database.engine
+    if auto_vacuum_mode(bind) != 2:
+        return 0
+    freed = 0
+    with bind.connect() as conn:
+        driver_conn = conn.connection.driver_connection
+        while True:
+            free = driver_conn.execute("PRAGMA freelist_count").fetchone()[0]
+            if not free:
+                break
+            # sqlite3 的 execute 只执行一步（释放一页），executescript 执行到完成
+            driver_conn.executescript(f"PRAGMA incremental_vacuum({min(free, step_pages)})")
+            remaining = driver_conn.execute("PRAGMA freelist_count").fetchone()[0]
+            if remaining >= free:
+                break
+            freed += free - remaining
+    return freed
+
+
+def enable_incremental_vacuum(bind=None) -> bool:
+    """将已有SQLite数据库切换为 auto_vacuum=INCREMENTAL（执行一次完整 VACUUM，期间独占数据库）"""
+    bind = bind or database.engine
+    mode = auto_vacuum_mode(bind)
+    if mode is None or mode == 2:
+        return False
+    with bind.connect() as conn:
+        driver_conn = conn.connection.driver_connection
+        driver_conn.executescript("PRAGMA auto_vacuum = INCREMENTAL; VACUUM;")
+    return True
+
+
+# ==================== 执行 ====================
+
+def run_retention(bind=None, policies: Optional[List[RetentionPolicy]] = None, dry_run: bool = False,
+                  now: Optional[datetime] = None, vacuum: bool = True, **options) -> Dict[str, object]:
+    """
+    按策略清理所有表，返回 {"tables": {表: 统计}, "vacuumed_pages": n}
+    dry_run 时统计中只有 expired（过期行数）
+    """
+    bind = bind or database.engine
+    policies = list(POLICIES.values()) if policies is None else policies
+    report = {"tables": {}, "vacuumed_pages": 0}
+    for policy in policies:
+        if policy.days <= 0:
+            continue
+        if dry_run:
+            report["tables"][policy.table] = {"expired": count_expired(policy, bind, now)}
+        else:
+            report["tables"][policy.table] = purge_table(policy, bind, now, **options)
+    deleted = sum(stats.get("deleted", 0) for stats in report["tables"].values())
+    if vacuum and deleted:
+        report["vacuumed_pages"] = incremental_vacuum(bind)
+    return report
+
+
+_scheduler_thread: Optional[threading.Thread] = None
+_scheduler_stop = threading.Event()
+
+
+def start_retention_scheduler(interval: float = None, initial_delay: float = None) -> Optional[threading.Thread]:
+    """启动后台清理线程（每个进程一个）"""
+    global _scheduler_thread
+    interval = RETENTION_INTERVAL if interval is None else interval
+    initial_delay = min(INITIAL_DELAY, interval) if initial_delay is None else initial_delay
+    if interval <= 0 or _scheduler_thread is not None:
+        return _scheduler_thread
+    _scheduler_stop.clear()
+
+    def _run():
+        delay = initial_delay
+        while not _scheduler_stop.wait(delay):
+            delay = interval
+            try:
+                report = run_retention()
+            except Exception as e:
+                print(f"[Retention] Run failed: {e}")
+                continue
+            for table, stats in report["tables"].items():
+                if stats["deleted"]:
+                    print(f"[Retention] {table}: deleted {stats['deleted']} rows, archive {stats['archive']}")
+
+    _scheduler_thread = threading.Thread(target=_run, name="retention", daemon=True)
+    _scheduler_thread.start()
+    return _scheduler_thread
+
+
+def stop_retention_scheduler(timeout: float = 5) -> None:
+    """停止后台清理线程（正在执行的批次会完成）"""
+    global _scheduler_thread
+    _scheduler_stop.set()
+    if _scheduler_thread is not None:
+        _scheduler_thread.join(timeout=timeout)
+        _scheduler_thread = None
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="清理过期的日志和对话记录")
+    parser.add_argument("--dry-run", action="store_true", help="只统计过期行数，不删除")
+    parser.add_argument("--table", action="append", choices=sorted(POLICIES), help="只清理指定的表（可重复）")
+    parser.add_argument("--no-vacuum", action="store_true", help="清理后不执行 incremental_vacuum")
+    parser.add_argument("--enable-incremental-vacuum", action="store_true",
+                        help="将数据库切换为 auto_vacuum=INCREMENTAL（执行一次完整 VACUUM）")
+    args = parser.parse_args(argv)
+
+    if args.enable_incremental_vacuum:
+        changed = enable_incremental_vacuum()
+        print(f"[Retention] auto_vacuum=INCREMENTAL {'enabled' if changed else 'already enabled or not SQLite'}")
+        return 0
+
+    size_before = database.get_database_size()
+    policies = [POLICIES[name] for name in args.table] if args.table else None
+    start = time.perf_counter()
+    report = run_retention(policies=policies, dry_run=args.dry_run, vacuum=not args.no_vacuum)
+    elapsed = time.perf_counter() - start
+
+    for table, stats in report["tables"].items():
+        policy = POLICIES[table]
+        if args.dry_run:
+            print(f"{table:<22}{policy.days:>5}d  expired {stats['expired']}")
+        else:
+            print(f"{table:<22}{policy.days:>5}d  deleted {stats['deleted']} in {stats['batches']} batch(es)"
+                  + (f" -> {stats['archive']}" if stats["archive"] else ""))
+    if not args.dry_run:
+        if auto_vacuum_mode() == 0:
+            print("[Retention] auto_vacuum is NONE, free pages are reused but the file does not shrink; "
+                  "run with --enable-incremental-vacuum once")
+        print(f"[Retention] Vacuumed {report['vacuumed_pages']} page(s), "
+              f"database {size_before / 1048576:.1f}MB -> {database.get_database_size() / 1048576:.1f}MB")
+    print(f"[Retention] Done in {elapsed:.2f}s")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -84,8 +84,8 @@ class UserProfileCore(BaseModel):
 
 # ==================== CRUD模型 ====================
 
-class UserProfileCreate(UserProfileBase):
-    """创建用户画像"""
+class UserProfileCreate(UserProfileBase, UserProfileVariable, UserProfileCore):
+    """创建用户画像（可同时提供接口层、可变层和核心层字段）"""
     user_id: str = Field(..., description="用户唯一标识")
 
 
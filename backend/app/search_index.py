@@ -0,0 +1,263 @@
+# -*- coding: utf-8 -*-
+"""
+专业/职业全文检索
+基于SQLite FTS5的倒排索引，替代 LIKE '%q%' 全表扫描。
+
+中文分词：FTS5没有内置的二元（bigram）分词器，因此在写入和查询时由Python
+将连续汉字切分为重叠二元组（"计算机" → "计算 算机"），英文/数字按单词切分，
+再交给 unicode61 分词器按空格建立索引。查询结果按BM25排序，并基于原文生成高亮摘要。
+
+索引在 crud 的创建路径中同步写入；首次检索时自动建表并在数量不一致时全量重建。
+非SQLite或未编译FTS5时回退到LIKE查询。
+"""
+
+import html
+import re
+import threading
+from typing import Dict, List, NamedTuple, Optional
+
+from sqlalchemy import or_, text
+from sqlalchemy.orm import Session
+
+from . import models
+from .write_queue import run_write
+
+
+# ==================== 分词 ====================
+
+_TOKEN_RE = re.compile(r'[\u3400-\u4dbf\u4e00-\u9fff\uf900-\ufaff]+|[A-Za-z0-9]+')
+_CJK_RE = re.compile(r'[\u3400-\u4dbf\u4e00-\u9fff\uf900-\ufaff]')
+
+
+def bigram_tokens(value: Optional[str]) -> List[str]:
+    """将文本切分为索引词元：汉字串取重叠二元组，英文数字取小写单词"""
+    if not value:
+        return []
+    tokens = []
+    for run in _TOKEN_RE.findall(value):
+        if _CJK_RE.match(run):
+            if len(run) == 1:
+                tokens.append(run)
+            else:
+                tokens.extend(run[i:i + 2] for i in range(len(run) - 1))
+        else:
+            tokens.append(run.lower())
+    return tokens
+
+
+def _index_text(value) -> str:
+    """将字段值（字符串或已解码的列表）转换为索引文本"""
+    if not value:
+        return ""
+    if isinstance(value, list):
+        value = " ".join(str(v) for v in value)
+    return " ".join(bigram_tokens(str(value)))
+
+
+def _match_expression(query: str) -> Optional[str]:
+    """
+    构造FTS5 MATCH表达式
+    所有词元需同时命中；最后一个英文单词或单个汉字按前缀匹配以支持边输入边搜索
+    """
+    tokens = bigram_tokens(query)
+    if not tokens:
+        return None
+    parts = [f'"{t}"' for t in tokens]
+    last = tokens[-1]
+    if not _CJK_RE.match(last) or len(last) == 1:
+        parts[-1] = f'"{last}"*'
+    return " ".join(parts)
+
+
+# ==================== 高亮 ====================
+
+def highlight(value: Optional[str], query: str, width: int = 48) -> str:
+    """在原文中定位查询词并生成带<mark>标记的摘要（已做HTML转义）"""
+    if not value:
+        return ""
+    pos, length = value.find(query), len(query)
+    if pos < 0:
+        for token in bigram_tokens(query):
+            pos = value.lower().find(token)
+            if pos >= 0:
+                length = len(token)
+                break
+    if pos < 0:
+        clipped = value[:width]
+        return html.escape(clipped) + ("…" if len(value) > width else "")
+
+    start = max(0, pos - width // 3)
+    end = min(len(value), pos + length + width)
+    return (
+        ("…" if start > 0 else "")
+        + html.escape(value[start:pos])
+        + "<mark>" + html.escape(value[pos:pos + length]) + "</mark>"
+        + html.escape(value[pos + length:end])
+        + ("…" if end < len(value) else "")
+    )
+
+
+def _display_text(value) -> str:
+    """将列表字段转换为可读文本"""
+    if isinstance(value, list):
+        return "、".join(str(v) for v in value)
+    return str(value) if value else ""
+
+
+def snippet(query: str, *values) -> str:
+    """从多个候选字段中选取首个命中查询词的字段生成摘要"""
+    texts = [_display_text(v) for v in values]
+    tokens = bigram_tokens(query)
+    for value in texts:
+        lowered = value.lower()
+        if query in value or any(t in lowered for t in tokens):
+            return highlight(value, query)
+    return highlight(texts[0] if texts else "", query)
+
+
+# ==================== 索引定义 ====================
+
+class SearchHit(NamedTuple):
+    """检索命中"""
+    id: int
+    score: float
+
+
+# 表名 -> (源表模型, 列名列表, bm25列权重)
+_INDEXES = {
+    "majors_fts": (models.Major, ("name", "description", "main_courses"), (10.0, 2.0, 1.0)),
+    "occupations_fts": (models.Occupation, ("name", "description", "requirements"), (10.0, 2.0, 1.0)),
+}
+
+_lock = threading.Lock()
+_ready: Dict[str, bool] = {}
+_fts5_supported: Optional[bool] = None
+
+
+def is_fts_available(db: Session) -> bool:
+    """当前数据库是否支持FTS5"""
+    global _fts5_supported
+    if db.get_bind().dialect.name != "sqlite":
+        return False
+    if _fts5_supported is None:
+        try:
+            options = [row[0] for row in db.execute(text("PRAGMA compile_options"))]
+            _fts5_supported = "ENABLE_FTS5" in options
+        except Exception:
+            _fts5_supported = False
+    return _fts5_supported
+
+
+def _create_table(db: Session, table: str) -> None:
+    _, columns, _ = _INDEXES[table]
+    db.execute(text(
+        f"CREATE VIRTUAL TABLE IF NOT EXISTS {table} "
+        f"USING fts5({', '.join(columns)}, tokenize='unicode61')"
+    ))
+
+
+def _row_params(table: str, row) -> dict:
+    _, columns, _ = _INDEXES[table]
+    params = {c: _index_text(getattr(row, c)) for c in columns}
+    params["rowid"] = row.id
+    return params
+
+
+def _insert_sql(table: str):
+    _, columns, _ = _INDEXES[table]
+    return text(
+        f"INSERT INTO {table}(rowid, {', '.join(columns)}) "
+        f"VALUES (:rowid, {', '.join(':' + c for c in columns)})"
+    )
+
+
+def _upsert(db: Session, table: str, row) -> None:
+    db.execute(text(f"DELETE FROM {table} WHERE rowid = :rowid"), {"rowid": row.id})
+    db.execute(_insert_sql(table), _row_params(table, row))
+
+
+def rebuild_search_index(db: Session, table: Optional[str] = None) -> int:
+    """全量重建索引，返回写入的行数（调用方负责提交）"""
+    if not is_fts_available(db):
+        return 0
+    count = 0
+    for name in ([table] if table else list(_INDEXES)):
+        model, _, _ = _INDEXES[name]
+        _create_table(db, name)
+        db.execute(text(f"DELETE FROM {name}"))
+        params = [_row_params(name, row) for row in db.query(model)]
+        if params:
+            db.execute(_insert_sql(name), params)
+        count += len(params)
+        _ready[name] = True
+    return count
+
+
+def _sync_search_index(db: Session, table: str) -> None:
+    """建表并在数量不一致时重建（在写操作的工作单元中执行）"""
+    with _lock:
+        if _ready.get(table):
+            return
+        model, _, _ = _INDEXES[table]
+        _create_table(db, table)
+        indexed = db.execute(text(f"SELECT count(*) FROM {table}")).scalar()
+        if indexed != db.query(model).count():
+            print(f"[Search] Rebuilding {table} ...")
+            rebuild_search_index(db, table)
+
+
+def ensure_search_index(db: Session, table: str) -> bool:
+    """确保索引存在且与源表数量一致，必要时重建"""
+    if _ready.get(table):
+        return True
+    if not is_fts_available(db):
+        return False
+    run_write(db, _sync_search_index, table)
+    _ready[table] = True
+    return True
+
+
+def index_major(db: Session, major: models.Major) -> None:
+    """写入/更新单个专业的索引（在调用方事务内）"""
+    if ensure_search_index(db, "majors_fts"):
+        _upsert(db, "majors_fts", major)
+
+
+def index_occupation(db: Session, occupation: models.Occupation) -> None:
+    """写入/更新单个职业的索引（在调用方事务内）"""
+    if ensure_search_index(db, "occupations_fts"):
+        _upsert(db, "occupations_fts", occupation)
+
+
+# ==================== 检索 ====================
+
+def _search(db: Session, table: str, query: str, skip: int, limit: int) -> List[SearchHit]:
+    expression = _match_expression(query)
+    if not expression:
+        return []
+    _, _, weights = _INDEXES[table]
+    rows = db.execute(
+        text(f"SELECT rowid, bm25({table}, {', '.join(str(w) for w in weights)}) AS rank "
+             f"FROM {table} WHERE {table} MATCH :q ORDER BY rank LIMIT :limit OFFSET :skip"),
+        {"q": expression, "limit": limit, "skip": skip}
+    )
+    # bm25 越小越相关，这里取反作为得分
+    return [SearchHit(row[0], -row[1]) for row in rows]
+
+
+def _like_search(db: Session, model, columns, query: str, skip: int, limit: int) -> List[SearchHit]:
+    """不支持FTS5时的回退查询"""
+    conditions = [getattr(model, c).contains(query) for c in columns[:2]]
+    rows = db.query(model.id).filter(or_(*conditions)).order_by(model.id).offset(skip).limit(limit)
+    return [SearchHit(row[0], 0.0) for row in rows]
+
+
+def search_ids(db: Session, table: str, query: str, skip: int = 0, limit: int = 20) -> List[SearchHit]:
+    """检索并返回按相关度排序的命中ID"""
+    query = (query or "").strip()
+    if not query:
+        return []
+    model, columns, _ = _INDEXES[table]
+    if ensure_search_index(db, table):
+        return _search(db, table, query, skip, limit)
+    return _like_search(db, model, columns, query, skip, limit)
@@ -1,8 +1,14 @@
 # -*- coding: utf-8 -*-
 """
 服务模块
+RAG服务依赖的LLM框架导入较慢，按需导入（见 registry）
 """
 
-from .rag_service import CareerPlanningRAGService, get_rag_service
-
 __all__ = ['CareerPlanningRAGService', 'get_rag_service']
+
+
+def __getattr__(name):
+    if name in __all__:
+        from . import rag_service
+        return getattr(rag_service, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
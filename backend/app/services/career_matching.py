@@ -0,0 +1,417 @@
+# -*- coding: utf-8 -*-
+"""
+用户画像模块 - 职业匹配引擎
+将用户画像和职业编码到同一特征空间，用一次矩阵运算为全部职业打分。
+
+特征分块（每块单独L2归一化，按块权重加权）：
+- 兴趣: 霍兰德六维（RIASEC），MBTI按倾向折算到六维作为补充
+- 能力: 分析推理/创造创新/沟通表达/组织协作/动手实践/学习研究
+- 价值观: 成就感/稳定/创新/收入/社会价值/平衡
+- 路径: technical/management/professional/public_welfare
+职业侧特征由名称、行业、描述和要求中的关键词推断；
+此外意向专业通过推荐矩阵（recommendation_matrix）为对口职业加分。
+
+职业特征矩阵按目录版本缓存，目录变化后自动重建；
+rescore_all_users() 分批对全部用户重新打分，用于目录批量更新后刷新推荐结果：
+
+    cd backend
+    python -m app.services.career_matching
+"""
+
+import threading
+from typing import Dict, List, NamedTuple, Optional, Sequence
+
+import numpy as np
+from sqlalchemy.orm import Session
+
+from .. import database, models
+from .. import models_user_profile
+from ..catalog_snapshot import get_catalog_version
+from ..database import commit_or_flush
+from ..recommendation_matrix import get_recommendation_matrix
+from ..write_queue import queued_write
+
+
+# ==================== 特征定义 ====================
+
+RIASEC = "RIASEC"
+
+RIASEC_KEYWORDS = {
+    "R": ["工程", "机械", "制造", "施工", "操作", "维修", "电气", "土木", "建筑", "农业"],
+    "I": ["研究", "分析", "数据", "科学", "算法", "实验", "统计", "医学", "编程", "开发"],
+    "A": ["设计", "艺术", "创意", "文学", "写作", "音乐", "美术", "影视", "传媒", "编辑"],
+    "S": ["教育", "教师", "医疗", "护理", "咨询", "服务", "社会", "心理", "培训", "沟通"],
+    "E": ["管理", "销售", "市场", "创业", "领导", "商务", "运营", "营销", "谈判", "经理"],
+    "C": ["财务", "会计", "行政", "审计", "文秘", "档案", "规范", "核算", "金融", "银行"],
+}
+
+# MBTI单个字母对霍兰德维度的倾向
+MBTI_RIASEC = {
+    "E": "ES", "I": "I", "S": "RC", "N": "IA",
+    "T": "IR", "F": "SA", "J": "CE", "P": "A",
+}
+
+SKILL_KEYWORDS = {
+    "分析推理": ["逻辑", "推理", "分析", "算法", "数理", "数学", "统计", "编程", "计算"],
+    "创造创新": ["创造", "创新", "创意", "设计", "艺术", "想象"],
+    "沟通表达": ["沟通", "表达", "语言", "写作", "演讲", "外语", "英语"],
+    "组织协作": ["组织", "协作", "团队", "领导", "管理", "协调"],
+    "动手实践": ["动手", "实践", "操作", "实验", "工程", "技术"],
+    "学习研究": ["学习", "研究", "探索", "钻研"],
+}
+
+# 前端能力自评（profile-form.js 的 ability_assessment 滑块）使用英文键；
+# 对话提取的中文能力名（如"逻辑思维"）仍按 SKILL_KEYWORDS 关键词匹配
+ABILITY_KEYS = {
+    "logic": "分析推理",
+    "analysis": "分析推理",
+    "creativity": "创造创新",
+    "communication": "沟通表达",
+    "teamwork": "组织协作",
+    "leadership": "组织协作",
+}
+
+VALUE_KEYWORDS = {
+    "成就感": ["成就", "挑战", "成长", "晋升"],
+    "稳定": ["稳定", "安稳", "保障", "体制", "公务"],
+    "创新": ["创新", "创造", "前沿", "探索", "互联网"],
+    "收入": ["收入", "薪资", "薪酬", "待遇", "财富"],
+    "社会价值": ["社会", "帮助", "影响", "贡献", "公益", "意义", "医疗", "教育"],
+    "平衡": ["平衡", "自由", "弹性", "生活"],
+}
+
+PATH_KEYWORDS = {
+    "technical": ["工程师", "开发", "技术", "程序", "架构", "算法"],
+    "management": ["经理", "管理", "主管", "总监", "运营"],
+    "professional": ["律师", "医生", "会计", "分析师", "咨询", "教师", "设计师"],
+    "public_welfare": ["公益", "社会工作", "志愿", "社区", "公务", "教育"],
+}
+
+# (块名, 维度名列表, 权重)
+_BLOCKS = [
+    ("interest", list(RIASEC), 0.30),
+    ("ability", list(SKILL_KEYWORDS), 0.25),
+    ("value", list(VALUE_KEYWORDS), 0.15),
+    ("path", list(PATH_KEYWORDS), 0.10),
+]
+MAJOR_WEIGHT = 0.20
+
+_SLICES = {}
+_offset = 0
+for _name, _dims, _ in _BLOCKS:
+    _SLICES[_name] = slice(_offset, _offset + len(_dims))
+    _offset += len(_dims)
+FEATURE_DIM = _offset
+_WEIGHTS = {name: weight for name, _, weight in _BLOCKS}
+
+_REASON_LABELS = {
+    "interest": "与你的兴趣类型契合",
+    "ability": "能发挥你的能力优势",
+    "value": "符合你看重的职业价值",
+    "path": "符合你偏好的发展路径",
+    "major": "与你的意向专业对口",
+}
+
+
+def _keyword_vector(text: str, keywords: Dict[str, List[str]]) -> np.ndarray:
+    """统计每个维度关键词在文本中的命中数"""
+    return np.array(
+        [sum(1 for k in words if k in text) for words in keywords.values()],
+        dtype=np.float32
+    )
+
+
+def _normalize_rows(matrix: np.ndarray) -> np.ndarray:
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    return np.divide(matrix, norms, out=np.zeros_like(matrix), where=norms > 0)
+
+
+def _normalize_blocks(matrix: np.ndarray) -> np.ndarray:
+    """对每个特征块分别做行归一化"""
+    for block in _SLICES.values():
+        matrix[:, block] = _normalize_rows(matrix[:, block])
+    return matrix
+
+
+# ==================== 职业编码 ====================
+
+def _occupation_text(occupation) -> str:
+    requirements = occupation.requirements if isinstance(occupation.requirements, list) else []
+    return " ".join(filter(None, [
+        occupation.name, occupation.industry, occupation.description, " ".join(map(str, requirements))
+    ]))
+
+
+def encode_occupations(occupations: Sequence) -> np.ndarray:
+    """将职业编码为特征矩阵 (职业数 × FEATURE_DIM)，每块已归一化"""
+    matrix = np.zeros((len(occupations), FEATURE_DIM), dtype=np.float32)
+    salaries = np.array([o.salary_max or 0 for o in occupations], dtype=np.float32)
+    max_salary = salaries.max() if len(salaries) else 0
+    income = list(VALUE_KEYWORDS).index("收入")
+    for i, occupation in enumerate(occupations):
+        text = _occupation_text(occupation)
+        matrix[i, _SLICES["interest"]] = _keyword_vector(text, RIASEC_KEYWORDS)
+        matrix[i, _SLICES["ability"]] = _keyword_vector(text, SKILL_KEYWORDS)
+        values = _keyword_vector(text, VALUE_KEYWORDS)
+        if max_salary > 0:
+            values[income] += salaries[i] / max_salary
+        matrix[i, _SLICES["value"]] = values
+        matrix[i, _SLICES["path"]] = _keyword_vector(text, PATH_KEYWORDS)
+    return _normalize_blocks(matrix)
+
+
+class OccupationIndex(NamedTuple):
+    """职业特征索引"""
+    version: int
+    ids: np.ndarray              # 职业ID
+    features: np.ndarray         # 特征矩阵
+    position: Dict[int, int]     # 职业ID -> 行号
+    occupations: Dict[int, dict]  # 职业ID -> 展示字段
+
+
+_index_lock = threading.Lock()
+_index: Optional[OccupationIndex] = None
+
+
+def build_occupation_index(db: Session, version: int = 0) -> OccupationIndex:
+    """从数据库构建职业特征索引"""
+    occupations = db.query(models.Occupation).order_by(models.Occupation.id).all()
+    ids = np.array([o.id for o in occupations], dtype=np.int64)
+    return OccupationIndex(
+        version=version,
+        ids=ids,
+        features=encode_occupations(occupations),
+        position={int(i): n for n, i in enumerate(ids)},
+        occupations={o.id: {
+            "name": o.name,
+            "requirements": o.requirements if isinstance(o.requirements, list) else [],
+            "salary_min": o.salary_min,
+            "salary_max": o.salary_max,
+        } for o in occupations}
+    )
+
+
+def get_occupation_index(db: Session) -> OccupationIndex:
+    """获取职业特征索引，目录版本变化后重建"""
+    global _index
+    version = get_catalog_version()
+    index = _index
+    if index is not None and index.version == version:
+        return index
+    with _index_lock:
+        if _index is None or _index.version != version:
+            _index = build_occupation_index(db, version)
+        return _index
+
+
+# ==================== 画像编码 ====================
+
+def _holland_vector(holland_code: Optional[str], mbti_type: Optional[str]) -> np.ndarray:
+    vector = np.zeros(len(RIASEC), dtype=np.float32)
+    code = (holland_code or "").upper()
+    for rank, letter in enumerate(c for c in code if c in RIASEC):
+        vector[RIASEC.index(letter)] += max(3 - rank, 1)
+    for letter in (mbti_type or "").upper():
+        for target in MBTI_RIASEC.get(letter, ""):
+            vector[RIASEC.index(target)] += 0.5
+    return vector
+
+
+def _ability_vector(abilities) -> np.ndarray:
+    vector = np.zeros(len(SKILL_KEYWORDS), dtype=np.float32)
+    if not isinstance(abilities, dict):
+        return vector
+    for name, score in abilities.items():
+        try:
+            score = float(score)
+        except (TypeError, ValueError):
+            continue
+        score = score / 100 if score > 10 else score / 10
+        dimension = ABILITY_KEYS.get(str(name).strip().lower())
+        for d, (dim, words) in enumerate(SKILL_KEYWORDS.items()):
+            if dim == dimension or any(k in str(name) for k in words):
+                vector[d] = max(vector[d], score)
+    return vector
+
+
+def _value_vector(priorities) -> np.ndarray:
+    vector = np.zeros(len(VALUE_KEYWORDS), dtype=np.float32)
+    if not isinstance(priorities, list):
+        return vector
+    for rank, value in enumerate(priorities):
+        weight = max(1.0 - 0.15 * rank, 0.25)
+        vector += weight * np.minimum(_keyword_vector(str(value), VALUE_KEYWORDS), 1)
+    return vector
+
+
+def _path_vector(preference: Optional[str]) -> np.ndarray:
+    vector = np.zeros(len(PATH_KEYWORDS), dtype=np.float32)
+    if preference in PATH_KEYWORDS:
+        vector[list(PATH_KEYWORDS).index(preference)] = 1
+    return vector
+
+
+def encode_profile(profile) -> np.ndarray:
+    """将用户画像编码为加权特征向量 (FEATURE_DIM,)，每块归一化后乘以块权重"""
+    vector = np.zeros((1, FEATURE_DIM), dtype=np.float32)
+    vector[0, _SLICES["interest"]] = _holland_vector(profile.holland_code, profile.mbti_type)
+    vector[0, _SLICES["ability"]] = _ability_vector(profile.ability_assessment)
+    vector[0, _SLICES["value"]] = _value_vector(profile.value_priorities)
+    vector[0, _SLICES["path"]] = _path_vector(profile.career_path_preference)
+    vector = _normalize_blocks(vector)[0]
+    for name, block in _SLICES.items():
+        vector[block] *= _WEIGHTS[name]
+    return vector
+
+
+def _major_affinity(db: Session, profile, index: OccupationIndex) -> np.ndarray:
+    """意向专业对口职业的匹配度（0-1），取各意向专业中的最大值"""
+    affinity = np.zeros(len(index.ids), dtype=np.float32)
+    majors = profile.preferred_majors if isinstance(profile.preferred_majors, list) else []
+    if not majors or not len(index.ids):
+        return affinity
+    matrix = get_recommendation_matrix(db)
+    for major_id in majors:
+        try:
+            ranked = matrix.occupations_for_major(int(major_id), matrix.top_k)
+        except (TypeError, ValueError):
+            continue
+        for occupation_id, score in ranked:
+            row = index.position.get(occupation_id)
+            if row is not None:
+                affinity[row] = max(affinity[row], (score or 0) / 100)
+    return affinity
+
+
+def _present_weight(vector: np.ndarray, has_majors: bool) -> float:
+    """画像中已填写的特征块权重之和，用于把得分换算到0-100"""
+    weight = sum(_WEIGHTS[name] for name, block in _SLICES.items() if vector[block].any())
+    return weight + (MAJOR_WEIGHT if has_majors else 0)
+
+
+# ==================== 打分 ====================
+
+class CareerMatch(NamedTuple):
+    """单个职业匹配结果"""
+    occupation_id: int
+    occupation_name: str
+    match_score: int
+    match_reason: str
+    key_requirements: List[str]
+    salary_range: Optional[str]
+
+
+def _top_k(scores: np.ndarray, k: int) -> np.ndarray:
+    """得分最高的k个下标（降序）"""
+    k = min(k, len(scores))
+    if k <= 0:
+        return np.array([], dtype=np.int64)
+    top = np.argpartition(-scores, k - 1)[:k]
+    return top[np.argsort(-scores[top], kind="stable")]
+
+
+def _reason(index: OccupationIndex, row: int, vector: np.ndarray, affinity: float) -> str:
+    contributions = {name: float(index.features[row, block] @ vector[block]) for name, block in _SLICES.items()}
+    contributions["major"] = MAJOR_WEIGHT * affinity
+    reasons = [_REASON_LABELS[name] for name, value in sorted(contributions.items(), key=lambda x: -x[1]) if value > 0.02]
+    return "；".join(reasons[:3]) if reasons else "综合画像匹配"
+
+
+def _build_matches(index: OccupationIndex, rows, scores, vector, affinity, denominator) -> List[CareerMatch]:
+    matches = []
+    for row in rows:
+        occupation_id = int(index.ids[row])
+        info = index.occupations[occupation_id]
+        salary_range = None
+        if info["salary_min"] or info["salary_max"]:
+            salary_range = f"{info['salary_min'] or ''}-{info['salary_max'] or ''}"
+        matches.append(CareerMatch(
+            occupation_id=occupation_id,
+            occupation_name=info["name"],
+            match_score=int(round(min(max(scores[row] / denominator, 0), 1) * 100)),
+            match_reason=_reason(index, row, vector, float(affinity[row])),
+            key_requirements=[str(r) for r in info["requirements"][:5]],
+            salary_range=salary_range
+        ))
+    return matches
+
+
+def match_profile(db: Session, profile, limit: int = 20) -> List[CareerMatch]:
+    """为单个用户计算前limit个匹配职业"""
+    index = get_occupation_index(db)
+    if not len(index.ids):
+        return []
+    vector = encode_profile(profile)
+    affinity = _major_affinity(db, profile, index)
+    denominator = _present_weight(vector, bool(affinity.any()))
+    if denominator == 0:
+        return []
+    scores = index.features @ vector + MAJOR_WEIGHT * affinity
+    return _build_matches(index, _top_k(scores, limit), scores, vector, affinity, denominator)
+
+
+# ==================== 推荐记录 ====================
+
+@queued_write
+def save_recommendations(db: Session, user_id: str, matches: List[CareerMatch], commit: bool = True) -> None:
+    """覆盖写入用户的推荐记录，保留已有的用户反馈"""
+    Recommendation = models_user_profile.UserCareerPathRecommendation
+    existing = db.query(Recommendation).filter(Recommendation.user_id == user_id)
+    feedback = {r.occupation_id: r.user_feedback for r in existing if r.user_feedback}
+    existing.delete()
+    db.add_all([
+        Recommendation(
+            user_id=user_id,
+            occupation_id=m.occupation_id,
+            match_score=m.match_score,
+            match_reason=m.match_reason,
+            recommendation_rank=rank,
+            user_feedback=feedback.get(m.occupation_id)
+        )
+        for rank, m in enumerate(matches, start=1)
+    ])
+    if commit:
+        commit_or_flush(db)
+
+
+def recommend_for_user(db: Session, profile, limit: int = 20) -> List[CareerMatch]:
+    """计算并保存用户的职业推荐"""
+    matches = match_profile(db, profile, limit)
+    save_recommendations(db, profile.user_id, matches)
+    return matches
+
+
+def rescore_all_users(db: Session, limit: int = 20, batch_size: int = 256) -> int:
+    """
+    批量重新打分（目录变化后调用）
+    每批用户编码为矩阵后与职业特征矩阵做一次矩阵乘法，返回处理的用户数
+    """
+    index = get_occupation_index(db)
+    total = 0
+    last_id = 0
+    while True:
+        profiles = db.query(models_user_profile.UserProfile).filter(
+            models_user_profile.UserProfile.id > last_id
+        ).order_by(models_user_profile.UserProfile.id).limit(batch_size).all()
+        if not profiles:
+            break
+        last_id = profiles[-1].id
+        vectors = np.stack([encode_profile(p) for p in profiles])
+        affinities = np.stack([_major_affinity(db, p, index) for p in profiles])
+        scores = vectors @ index.features.T + MAJOR_WEIGHT * affinities
+        with database.unit_of_work(db):
+            for i, profile in enumerate(profiles):
+                denominator = _present_weight(vectors[i], bool(affinities[i].any()))
+                matches = [] if denominator == 0 or not len(index.ids) else _build_matches(
+                    index, _top_k(scores[i], limit), scores[i], vectors[i], affinities[i], denominator
+                )
+                save_recommendations(db, profile.user_id, matches, commit=False)
+        total += len(profiles)
+    print(f"[Matching] Rescored {total} user profiles against {len(index.ids)} occupations")
+    return total
+
+
+if __name__ == "__main__":
+    # 批处理直接使用可写引擎（不经过写线程）
+    with Session(bind=database.engine) as session:
+        rescore_all_users(session)
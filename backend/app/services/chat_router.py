@@ -0,0 +1,159 @@
+# -*- coding: utf-8 -*-
+"""
+对话模式路由
+DSPy对话有两种模式：完整管线（full，意图/提取/提示词/回复/优化等多阶段，多次LLM往返）
+和快速模式（fast，一次结构化调用同时输出意图、提取信息、回复和追问）。
+
+路由规则（DSPY_CHAT_MODE=auto 时）：
+- 短消息（不超过 DSPY_FAST_MAX_CHARS 字）且对话不在 deepening/concluding 阶段 -> fast；
+- 近期（DSPY_LATENCY_WINDOW_SECONDS 秒内）完整管线的 p50 延迟超出 DSPY_LATENCY_BUDGET_MS -> fast，
+  其中每 DSPY_BUDGET_PROBE_EVERY 次改走 full 作为探测，使完整管线恢复后能重新采样；
+  时间窗口内样本不足时不按预算路由（样本过期后自动恢复 full）；
+- 其余 -> full。
+DSPY_CHAT_MODE=fast / full 时固定使用该模式。
+
+每次对话按模式记录延迟和提取质量（提取字段数、平均置信度）并输出日志，
+GET /api/diagnostics/chat-modes 给出汇总，用于调整路由阈值。
+"""
+
+import os
+import threading
+import time
+from collections import deque
+from typing import Any, Dict, NamedTuple, Optional
+
+CHAT_MODE = os.environ.get("DSPY_CHAT_MODE", "auto")   # auto | fast | full
+FAST_MAX_CHARS = int(os.environ.get("DSPY_FAST_MAX_CHARS", "40"))
+LATENCY_BUDGET_MS = float(os.environ.get("DSPY_LATENCY_BUDGET_MS", "15000"))
+LATENCY_WINDOW_SECONDS = float(os.environ.get("DSPY_LATENCY_WINDOW_SECONDS", "600"))
+BUDGET_PROBE_EVERY = int(os.environ.get("DSPY_BUDGET_PROBE_EVERY", "10"))
+LATENCY_WINDOW = 50          # 每种模式保留的最近延迟样本数
+MIN_BUDGET_SAMPLES = 5       # 时间窗口内完整管线样本数达到后才按预算路由
+FULL_STAGES = ("deepening", "concluding")   # 需要完整提取的对话阶段
+
+MODES = ("fast", "full")
+
+
+class RouteDecision(NamedTuple):
+    """路由结果：mode 为 fast | full，reason 为选择原因"""
+    mode: str
+    reason: str
+
+
+def _percentile(values, q: float) -> float:
+    ordered = sorted(values)
+    if not ordered:
+        return 0.0
+    return ordered[min(len(ordered) - 1, int(len(ordered) * q))]
+
+
+def extraction_quality(result: Dict[str, Any]) -> Dict[str, float]:
+    """对话结果的提取质量：提取字段数（含画像更新建议）和平均置信度"""
+    items = [i for i in result.get("extracted_info") or [] if isinstance(i, dict)]
+    updates = result.get("profile_updates") or {}
+    confidences = [float(i.get("confidence", 0.0)) for i in items]
+    return {
+        "fields": len(items) + (len(updates) if isinstance(updates, dict) else 0),
+        "confidence": sum(confidences) / len(confidences) if confidences else 0.0,
+    }
+
+
+class ChatModeRouter:
+    """按消息长度、对话阶段和延迟预算选择对话模式，并按模式统计延迟和提取质量"""
+
+    def __init__(self,
+                 mode: str = CHAT_MODE,
+                 fast_max_chars: int = FAST_MAX_CHARS,
+                 latency_budget_ms: float = LATENCY_BUDGET_MS,
+                 window_seconds: float = LATENCY_WINDOW_SECONDS,
+                 probe_every: int = BUDGET_PROBE_EVERY,
+                 clock=time.monotonic):
+        self.mode = mode
+        self.fast_max_chars = fast_max_chars
+        self.latency_budget_ms = latency_budget_ms
+        self.window_seconds = window_seconds
+        self.probe_every = probe_every
+        self._clock = clock
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self) -> None:
+        """清空统计"""
+        with self._lock:
+            self._latencies = {m: deque(maxlen=LATENCY_WINDOW) for m in MODES}   # (时间, 延迟)
+            self._over_budget = 0
+            self._totals = {m: {"requests": 0, "fields": 0, "confidence": 0.0, "reasons": {}} for m in MODES}
+
+    def choose(self, message: str, conversation_stage: str) -> RouteDecision:
+        """选择本次对话的模式"""
+        if self.mode in MODES:
+            return RouteDecision(self.mode, "forced")
+        if len(message.strip()) <= self.fast_max_chars and conversation_stage not in FULL_STAGES:
+            return RouteDecision("fast", "short_message")
+        full_p50 = self.estimate_ms("full")
+        if full_p50 is not None and full_p50 > self.latency_budget_ms:
+            with self._lock:
+                self._over_budget += 1
+                probe = self.probe_every > 0 and self._over_budget % self.probe_every == 0
+            if probe:
+                return RouteDecision("full", "budget_probe")
+            return RouteDecision("fast", "over_budget")
+        return RouteDecision("full", "detailed")
+
+    def estimate_ms(self, mode: str) -> Optional[float]:
+        """模式在时间窗口内的 p50 延迟；样本不足时返回 None"""
+        cutoff = self._clock() - self.window_seconds
+        with self._lock:
+            samples = [latency for at, latency in self._latencies[mode] if at >= cutoff]
+        if len(samples) < MIN_BUDGET_SAMPLES:
+            return None
+        return _percentile(samples, 0.5)
+
+    def record(self, decision: RouteDecision, latency_ms: float, result: Dict[str, Any]) -> None:
+        """记录一次对话的延迟和提取质量"""
+        quality = extraction_quality(result)
+        with self._lock:
+            self._latencies[decision.mode].append((self._clock(), latency_ms))
+            totals = self._totals[decision.mode]
+            totals["requests"] += 1
+            totals["fields"] += quality["fields"]
+            totals["confidence"] += quality["confidence"]
+            totals["reasons"][decision.reason] = totals["reasons"].get(decision.reason, 0) + 1
+        print(f"[ChatRouter] mode={decision.mode} reason={decision.reason} {latency_ms:.0f}ms "
+              f"fields={quality['fields']} confidence={quality['confidence']:.2f}")
+
+    def stats(self) -> Dict[str, Any]:
+        """按模式汇总：请求数、选择原因、p50/p95 延迟、平均提取字段数和置信度"""
+        with self._lock:
+            modes = {}
+            for mode in MODES:
+                totals = self._totals[mode]
+                samples = [latency for _, latency in self._latencies[mode]]
+                requests = totals["requests"]
+                modes[mode] = {
+                    "requests": requests,
+                    "reasons": dict(totals["reasons"]),
+                    "p50_ms": round(_percentile(samples, 0.5), 1),
+                    "p95_ms": round(_percentile(samples, 0.95), 1),
+                    "avg_fields": round(totals["fields"] / requests, 2) if requests else 0.0,
+                    "avg_confidence": round(totals["confidence"] / requests, 3) if requests else 0.0,
+                }
+        return {
+            "mode": self.mode,
+            "fast_max_chars": self.fast_max_chars,
+            "latency_budget_ms": self.latency_budget_ms,
+            "window_seconds": self.window_seconds,
+            "probe_every": self.probe_every,
+            "modes": modes,
+        }
+
+
+_router: Optional[ChatModeRouter] = None
+
+
+def get_chat_router() -> ChatModeRouter:
+    """获取对话模式路由单例"""
+    global _router
+    if _router is None:
+        _router = ChatModeRouter()
+    return _router
@@ -0,0 +1,175 @@
+# -*- coding: utf-8 -*-
+"""
+阶段图执行器
+多阶段处理流程（如DSPy对话管线）声明为依赖图：每个阶段列出依赖的阶段，依赖完成后立即开始，
+互不依赖的阶段并发执行（同步的阶段函数在共享线程池中运行），总耗时接近关键路径长度而不是各阶段耗时之和。
+
+每个阶段有独立超时。超时或出错时使用阶段的 fallback 结果继续，
+没有 fallback 的阶段失败时整个流程抛出 PipelineError。超时的线程无法中断，其结果被丢弃。
+
+流程需要在中途插入其他步骤（如流式输出LLM回复）时，用 split_stages 把阶段图拆成前后两段分别执行，
+两段共用同一个计时起点（origin）。
+"""
+
+import asyncio
+import contextvars
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Sequence, Tuple
+
+PIPELINE_WORKERS = int(os.environ.get("PIPELINE_WORKERS", "16"))
+
+
+class Stage(NamedTuple):
+    """流程阶段：func 和 fallback 的参数为输入与已完成阶段结果组成的字典"""
+    name: str
+    func: Callable[[Dict[str, Any]], Any]
+    deps: Tuple[str, ...] = ()
+    timeout: Optional[float] = None
+    fallback: Optional[Callable[[Dict[str, Any]], Any]] = None
+
+
+class StageTiming(NamedTuple):
+    """阶段执行记录，start/end 为相对流程开始的秒数，status 为 ok | timeout | error"""
+    name: str
+    status: str
+    start: float
+    end: float
+
+
+class PipelineError(RuntimeError):
+    """没有 fallback 的阶段超时或出错"""
+
+
+def parse_timeouts(value: str) -> Dict[str, float]:
+    """解析 "stage=秒,stage=秒" 格式的超时配置"""
+    timeouts = {}
+    for item in value.split(","):
+        name, sep, seconds = item.partition("=")
+        if sep and name.strip():
+            timeouts[name.strip()] = float(seconds)
+    return timeouts
+
+
+def _check_graph(stages: Sequence[Stage], inputs: Dict[str, Any]) -> None:
+    """检查阶段名唯一、依赖存在且无环"""
+    names = [stage.name for stage in stages]
+    if len(set(names)) != len(names):
+        raise ValueError(f"Duplicate stage names: {names}")
+    deps = {stage.name: stage.deps for stage in stages}
+    for name, stage_deps in deps.items():
+        missing = [d for d in stage_deps if d not in deps and d not in inputs]
+        if missing:
+            raise ValueError(f"Stage '{name}' depends on unknown {missing}")
+
+    state: Dict[str, int] = {}   # 1 = 访问中, 2 = 已完成
+
+    def visit(name, path):
+        if state.get(name) == 2 or name not in deps:
+            return
+        if state.get(name) == 1:
+            raise ValueError(f"Stage dependency cycle: {' -> '.join(path + [name])}")
+        state[name] = 1
+        for dep in deps[name]:
+            visit(dep, path + [name])
+        state[name] = 2
+
+    for name in names:
+        visit(name, [])
+
+
+def split_stages(stages: Sequence[Stage], targets: Sequence[str]) -> Tuple[List[Stage], List[Stage]]:
+    """拆分阶段图：返回 (targets 及其全部上游阶段, 其余阶段)，两部分都保持原顺序"""
+    by_name = {stage.name: stage for stage in stages}
+    needed = set()
+    pending = [name for name in targets if name in by_name]
+    while pending:
+        name = pending.pop()
+        if name not in needed:
+            needed.add(name)
+            pending.extend(dep for dep in by_name[name].deps if dep in by_name)
+    return ([stage for stage in stages if stage.name in needed],
+            [stage for stage in stages if stage.name not in needed])
+
+
+_executor: Optional[ThreadPoolExecutor] = None
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    """阶段函数共享的线程池（超时的阶段不会阻塞事件循环的关闭）"""
+    global _executor
+    if _executor is None:
+        _executor = ThreadPoolExecutor(max_workers=PIPELINE_WORKERS, thread_name_prefix="pipeline")
+    return _executor
+
+
+async def run_stages(
+    stages: Sequence[Stage],
+    inputs: Dict[str, Any],
+    timeouts: Optional[Dict[str, float]] = None,
+    origin: Optional[float] = None
+) -> Tuple[Dict[str, Any], List[StageTiming]]:
+    """按依赖图并发执行各阶段，返回 (输入与各阶段结果, 执行记录)；origin 为计时起点（perf_counter，默认为调用时刻）"""
+    _check_graph(stages, inputs)
+    timeouts = timeouts or {}
+    loop = asyncio.get_running_loop()
+    results: Dict[str, Any] = dict(inputs)
+    timings: List[StageTiming] = []
+    tasks: Dict[str, asyncio.Task] = {}
+    origin = time.perf_counter() if origin is None else origin
+
+    async def run(stage: Stage):
+        await asyncio.gather(*(tasks[dep] for dep in stage.deps if dep in tasks))
+        start = time.perf_counter() - origin
+        # 阶段函数看到的是开始时的结果快照（包含全部依赖）
+        snapshot = dict(results)
+        call = contextvars.copy_context().run
+        try:
+            value = await asyncio.wait_for(
+                loop.run_in_executor(_get_executor(), call, stage.func, snapshot),
+                timeouts.get(stage.name, stage.timeout)
+            )
+            status = "ok"
+        except Exception as e:
+            status = "timeout" if isinstance(e, asyncio.TimeoutError) else "error"
+            if stage.fallback is None:
+                raise PipelineError(f"Stage '{stage.name}' {status}: {e!r}") from e
+            print(f"[Pipeline] Stage {stage.name} {status}, using fallback: {e!r}")
+            value = stage.fallback(snapshot)
+        results[stage.name] = value
+        timings.append(StageTiming(stage.name, status, start, time.perf_counter() - origin))
+
+    for stage in stages:
+        tasks[stage.name] = asyncio.ensure_future(run(stage))
+    try:
+        await asyncio.gather(*tasks.values())
+    except BaseException:
+        for task in tasks.values():
+            task.cancel()
+        await asyncio.gather(*tasks.values(), return_exceptions=True)
+        raise
+    return results, timings
+
+
+def run_stages_sync(
+    stages: Sequence[Stage],
+    inputs: Dict[str, Any],
+    timeouts: Optional[Dict[str, float]] = None
+) -> Tuple[Dict[str, Any], List[StageTiming]]:
+    """同步调用 run_stages；当前线程已有运行中的事件循环时在另一线程中执行"""
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(run_stages(stages, inputs, timeouts))
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        return executor.submit(asyncio.run, run_stages(stages, inputs, timeouts)).result()
+
+
+def summarize_timings(timings: List[StageTiming]) -> Dict[str, Any]:
+    """执行摘要：总耗时（墙钟）、各阶段耗时之和与每个阶段的状态和耗时"""
+    return {
+        "wall_ms": round(max((t.end for t in timings), default=0.0) * 1000, 1),
+        "stages_ms": round(sum(t.end - t.start for t in timings) * 1000, 1),
+        "stages": {t.name: {"status": t.status, "ms": round((t.end - t.start) * 1000, 1)} for t in timings},
+    }
@@ -7,25 +7,15 @@
 import os
 import json
 import re
-from typing import List, Dict, Any, Optional
+import asyncio
+from typing import List, Dict, Any, Optional, AsyncIterator, Tuple
 from datetime import datetime
 
-# 加载 .env 文件中的环境变量
-try:
-    from dotenv import load_dotenv
-    # 尝试从多个位置加载 .env
-    env_paths = [
-        os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(__file__))), '.env'),
-        os.path.join(os.path.dirname(os.path.dirname(__file__)), '.env'),
-        '.env',
-    ]
-    for env_path in env_paths:
-        if os.path.exists(env_path):
-            load_dotenv(env_path, override=True)
-            print(f"[RAG] Loaded .env from: {env_path}")
-            break
-except ImportError:
-    print("[RAG] python-dotenv not installed, .env file will not be loaded")
+from .registry import load_env
+from .skill_index import SKILL_FILES, retrieve_context
+
+# 加载 .env 文件中的环境变量（LLM API Key）
+load_env()
 
 # LazyLLM导入
 try:
@@ -81,20 +71,10 @@ class CareerPlanningRAGService:
     def _load_skill_documents(self) -> Dict[str, str]:
         """加载SKILL文档作为知识库"""
         docs = {}
-        files = [
-            ("SKILL.md", "核心架构"),
-            ("references/01-theoretical-foundations.md", "理论基础"),
-            ("references/02-lifelong-learning.md", "终身学习"),
-            ("references/03-career-path-selection.md", "道路选择"),
-            ("references/04-career-progression.md", "路径进阶"),
-            ("references/05-action-plan.md", "行动计划"),
-            ("references/06-industry-trends.md", "行业趋势")
-        ]
-        
         project_root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
         base_path = os.path.join(project_root, self.knowledge_base_path)
         
-        for filename, category in files:
+        for filename, category in SKILL_FILES:
             filepath = os.path.join(base_path, filename)
             if os.path.exists(filepath):
                 try:
@@ -145,6 +125,24 @@ class CareerPlanningRAGService:
             "profile_updates": extracted_info  # 提取的信息直接用于更新画像
         }
 
+    async def astream_message(
+        self,
+        user_message: str,
+        user_profile: Dict[str, Any],
+        conversation_history: List[Dict] = None,
+        preprocessed: Dict[str, Any] = None
+    ) -> AsyncIterator[Tuple[str, Any]]:
+        """
+        流式接口（与DSPy版一致）：产生 ('token', 回复片段)，最后产生 ('result', process_message 的结果)
+        
+        注意: 回复需要从LLM输出中解析出追问，无法逐字转发，整段回复作为一个片段
+        """
+        result = await asyncio.to_thread(
+            self.process_message, user_message, user_profile, conversation_history, preprocessed
+        )
+        yield "token", result["reply"]
+        yield "result", result
+
     def _recognize_intent(self, message: str) -> str:
         """识别用户意图"""
         message_lower = message.lower()
@@ -290,12 +288,16 @@ class CareerPlanningRAGService:
                     for item in recent:
                         role = "用户" if item.get("role") == "user" else "助手"
                         history_text += f"{role}: {item.get('content', '')}\n"
+
+                # 从职业规划知识库检索相关段落
+                references = retrieve_context(message)
+                reference_text = f"\n参考资料（职业规划知识库，可自然借鉴，不要照搬）:\n{references}\n" if references else ""
                 
                 prompt = f"""你是一位亲切的职业规划顾问，正在与用户进行自然对话。
 
 对话历史:
 {history_text if history_text else "（新对话）"}
-
+{reference_text}
 用户说: {message}
 
 请用自然、亲切的语气回复，就像朋友聊天一样。不要提及任何结构化信息（如霍兰德代码、MBTI、CASVE阶段等）。回复控制在100字以内。
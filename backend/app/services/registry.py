@@ -0,0 +1,121 @@
+# -*- coding: utf-8 -*-
+"""
+服务注册表
+LLM框架（lazyllm、dspy）的导入树很重，不在应用启动时导入：
+服务以工厂函数登记在注册表中，首次使用时才导入对应模块并创建实例（每个进程一个）。
+.env 中的LLM配置也在第一个服务创建前统一加载一次。
+"""
+
+import os
+import threading
+from typing import Any, Callable, Dict, List, Optional
+
+APP_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# .env 查找顺序：backend/、backend/app/、当前目录
+ENV_PATHS = [
+    os.path.join(os.path.dirname(APP_DIR), '.env'),
+    os.path.join(APP_DIR, '.env'),
+    '.env',
+]
+
+_factories: Dict[str, Callable[[], Any]] = {}
+_instances: Dict[str, Any] = {}
+_unavailable: Dict[str, str] = {}
+_lock = threading.RLock()
+_env_path: Optional[str] = None
+_env_loaded = False
+
+
+def load_env() -> Optional[str]:
+    """加载第一个存在的 .env 文件（只执行一次），返回其路径"""
+    global _env_loaded, _env_path
+    if _env_loaded:
+        return _env_path
+    with _lock:
+        if _env_loaded:
+            return _env_path
+        try:
+            from dotenv import load_dotenv
+        except ImportError:
+            print("[Services] python-dotenv not installed, .env file will not be loaded")
+        else:
+            for env_path in ENV_PATHS:
+                if os.path.exists(env_path):
+                    load_dotenv(env_path, override=True)
+                    _env_path = env_path
+                    print(f"[Services] Loaded .env from: {env_path}")
+                    break
+        _env_loaded = True
+    return _env_path
+
+
+def register_service(name: str, factory: Callable[[], Any]) -> None:
+    """登记服务工厂；已创建的同名实例会被丢弃"""
+    with _lock:
+        _factories[name] = factory
+        _instances.pop(name, None)
+        _unavailable.pop(name, None)
+
+
+def get_service(name: str) -> Any:
+    """获取服务实例，首次调用时导入并创建；依赖缺失时抛出 ImportError"""
+    instance = _instances.get(name)
+    if instance is not None:
+        return instance
+    with _lock:
+        if name in _instances:
+            return _instances[name]
+        if name in _unavailable:
+            raise ImportError(_unavailable[name])
+        load_env()
+        try:
+            instance = _factories[name]()
+        except ImportError as e:
+            _unavailable[name] = f"{name}: {e}"
+            print(f"[Services] {name} not available: {e}")
+            raise
+        _instances[name] = instance
+        print(f"[Services] {name} initialized")
+        return instance
+
+
+def try_get_service(name: str) -> Optional[Any]:
+    """获取服务实例，依赖缺失时返回None"""
+    try:
+        return get_service(name)
+    except ImportError:
+        return None
+
+
+def loaded_services() -> List[str]:
+    """已创建的服务名称"""
+    return sorted(_instances)
+
+
+def reset_services() -> None:
+    """丢弃所有已创建的实例和不可用记录（测试用）"""
+    with _lock:
+        _instances.clear()
+        _unavailable.clear()
+
+
+# ==================== 服务登记 ====================
+
+def _legacy_rag_service():
+    from .rag_service import get_rag_service
+    return get_rag_service()
+
+
+def _dspy_rag_service():
+    from ..rag_dspy import get_dspy_rag_service
+    return get_dspy_rag_service()
+
+
+register_service("rag", _legacy_rag_service)
+register_service("dspy_rag", _dspy_rag_service)
+
+
+def get_chat_service():
+    """对话使用的RAG服务：优先DSPy版，dspy 未安装时使用LazyLLM版"""
+    return try_get_service("dspy_rag") or get_service("rag")
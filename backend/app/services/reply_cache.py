@@ -0,0 +1,214 @@
+# -*- coding: utf-8 -*-
+"""
+对话回复缓存
+很多学生的开场白几乎相同（"我不知道想做什么"、"我喜欢打篮球"），缓存命中时直接复用之前的回复，
+不再执行DSPy管线。只用于开场白（对话历史为空，由调用方判断）：对话中途的"是的"、"好的"依赖上文，
+在同一分区内也不能复用其他对话的回复。
+
+- 消息规范化：NFKC、小写、去掉标点空白和句末语气词；
+- 缓存分区：画像摘要（_format_profile_summary 的输出）+ 对话阶段，只在同一分区内查找；
+- 近似匹配：分区内按字符 1~3-gram 的TF向量（L2归一化）计算余弦相似度，
+  通过 (分区, 2/3-gram) 倒排表找候选（单字太常见，只参与打分），相似度不低于 REPLY_CACHE_THRESHOLD 且否定词相同时命中
+  （"我知道想做什么"与"我不知道想做什么"相似度达 0.82，但含义相反）；
+- 命中时复用回复、追问和意图；提取信息和画像更新只在规范化后完全相同时复用
+  （近似消息的提取结果可能不同，如"篮球"与"排球"）；
+- LRU + TTL 淘汰，命中率等指标由 GET /api/diagnostics/reply-cache 输出。
+全部在本地内存中完成，不访问网络。REPLY_CACHE_ENABLED=0 时关闭。
+"""
+
+import copy
+import math
+import os
+import re
+import threading
+import time
+import unicodedata
+from collections import Counter, OrderedDict
+from typing import Any, Dict, NamedTuple, Optional, Set, Tuple
+
+REPLY_CACHE_ENABLED = os.environ.get("REPLY_CACHE_ENABLED", "1") != "0"
+REPLY_CACHE_MAX_ENTRIES = int(os.environ.get("REPLY_CACHE_MAX_ENTRIES", "1000"))
+REPLY_CACHE_TTL = float(os.environ.get("REPLY_CACHE_TTL", "3600"))      # 秒
+REPLY_CACHE_THRESHOLD = float(os.environ.get("REPLY_CACHE_THRESHOLD", "0.8"))
+NGRAM_SIZES = (1, 2, 3)
+
+# 缓存的结果字段；EXACT_ONLY_FIELDS 只在规范化消息完全相同时复用
+CACHED_FIELDS = ('reply', 'suggested_questions', 'intent', 'sub_intents', 'reasoning',
+                 'confidence', 'emotional_state', 'extracted_info', 'profile_updates')
+EXACT_ONLY_FIELDS = {'extracted_info': [], 'profile_updates': {}}
+
+_STRIP_RE = re.compile(r'[\W_]+')
+_PARTICLE_RE = re.compile(r'[啊呀呢吧嘛哦啦呗哈噢]+$')
+_NEGATION_RE = re.compile(r'[不没别无非未]')
+
+
+def normalize_message(message: str) -> str:
+    """规范化消息：全半角统一、小写、去掉标点空白和句末语气词"""
+    text = _STRIP_RE.sub('', unicodedata.normalize('NFKC', message or '').lower())
+    stripped = _PARTICLE_RE.sub('', text)
+    return stripped or text
+
+
+def ngram_vector(text: str) -> Dict[str, float]:
+    """字符 n-gram 的TF向量（L2归一化）"""
+    counts = Counter(
+        text[i:i + n] for n in NGRAM_SIZES for i in range(len(text) - n + 1)
+    )
+    norm = math.sqrt(sum(c * c for c in counts.values()))
+    return {gram: c / norm for gram, c in counts.items()} if norm else {}
+
+
+def cosine(a: Dict[str, float], b: Dict[str, float]) -> float:
+    """归一化向量的余弦相似度"""
+    if len(a) > len(b):
+        a, b = b, a
+    return sum(w * b.get(gram, 0.0) for gram, w in a.items())
+
+
+def _index_grams(vector: Dict[str, float]):
+    """倒排表使用的 n-gram：单字太常见，只在消息只有一个字时使用"""
+    return [gram for gram in vector if len(gram) > 1] or list(vector)
+
+
+class _Entry(NamedTuple):
+    partition: str
+    normalized: str
+    negations: str
+    vector: Dict[str, float]
+    payload: Dict[str, Any]
+    created: float
+
+
+class CacheHit(NamedTuple):
+    """缓存命中：result 为可直接返回的结果字段，exact 表示规范化后完全相同"""
+    result: Dict[str, Any]
+    similarity: float
+    exact: bool
+
+
+class ReplyCache:
+    """按 画像摘要+对话阶段 分区、分区内按字符 n-gram 近似匹配的回复缓存（LRU + TTL）"""
+
+    def __init__(self,
+                 max_entries: int = REPLY_CACHE_MAX_ENTRIES,
+                 ttl: float = REPLY_CACHE_TTL,
+                 threshold: float = REPLY_CACHE_THRESHOLD):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.threshold = threshold
+        self._lock = threading.Lock()
+        self.clear()
+
+    def clear(self) -> None:
+        """清空缓存和指标"""
+        with self._lock:
+            self._entries: "OrderedDict[Tuple[str, str], _Entry]" = OrderedDict()
+            self._postings: Dict[Tuple[str, str], Set[Tuple[str, str]]] = {}
+            self._counters = Counter()
+
+    def get(self, message: str, profile_summary: str, stage: str) -> Optional[CacheHit]:
+        """查找相似消息的缓存回复"""
+        partition = f"{stage}|{profile_summary}"
+        normalized = normalize_message(message)
+        negations = ''.join(_NEGATION_RE.findall(normalized))
+        vector = ngram_vector(normalized)
+        now = time.monotonic()
+        with self._lock:
+            candidates = set()
+            for gram in _index_grams(vector):
+                candidates.update(self._postings.get((partition, gram), ()))
+            best, best_score = None, 0.0
+            for key in candidates:
+                entry = self._entries[key]
+                if now - entry.created > self.ttl:
+                    self._remove(key)
+                    self._counters['expired'] += 1
+                    continue
+                if entry.negations != negations:
+                    continue
+                score = 1.0 if entry.normalized == normalized else cosine(vector, entry.vector)
+                if score > best_score:
+                    best, best_score = entry, score
+            if best is None or best_score < self.threshold:
+                self._counters['misses'] += 1
+                return None
+            self._entries.move_to_end((best.partition, best.normalized))
+            exact = best.normalized == normalized
+            self._counters['exact_hits' if exact else 'near_hits'] += 1
+
+        result = copy.deepcopy(best.payload)
+        if not exact:
+            result.update(EXACT_ONLY_FIELDS)
+        return CacheHit(result, round(best_score, 3), exact)
+
+    def put(self, message: str, profile_summary: str, stage: str, result: Dict[str, Any]) -> None:
+        """缓存一次对话结果（同一分区内规范化相同的消息覆盖旧条目）"""
+        normalized = normalize_message(message)
+        vector = ngram_vector(normalized)
+        if not vector:
+            return
+        partition = f"{stage}|{profile_summary}"
+        key = (partition, normalized)
+        payload = copy.deepcopy({field: result[field] for field in CACHED_FIELDS if field in result})
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            elif len(self._entries) >= self.max_entries:
+                self._evict()
+            negations = ''.join(_NEGATION_RE.findall(normalized))
+            self._entries[key] = _Entry(partition, normalized, negations, vector, payload, time.monotonic())
+            for gram in _index_grams(vector):
+                self._postings.setdefault((partition, gram), set()).add(key)
+            self._counters['puts'] += 1
+
+    def _evict(self) -> None:
+        """先清理过期条目，仍然已满时淘汰最久未使用的条目"""
+        now = time.monotonic()
+        for key in [k for k, e in self._entries.items() if now - e.created > self.ttl]:
+            self._remove(key)
+            self._counters['expired'] += 1
+        while len(self._entries) >= self.max_entries:
+            self._remove(next(iter(self._entries)))
+            self._counters['evicted'] += 1
+
+    def _remove(self, key: Tuple[str, str]) -> None:
+        entry = self._entries.pop(key)
+        for gram in _index_grams(entry.vector):
+            posting = self._postings.get((entry.partition, gram))
+            if posting is not None:
+                posting.discard(key)
+                if not posting:
+                    del self._postings[(entry.partition, gram)]
+
+    def stats(self) -> Dict[str, Any]:
+        """条目数、命中（完全相同/近似）、未命中、命中率、写入、过期和LRU淘汰次数"""
+        with self._lock:
+            counters = dict(self._counters)
+            entries = len(self._entries)
+        hits = counters.get('exact_hits', 0) + counters.get('near_hits', 0)
+        lookups = hits + counters.get('misses', 0)
+        return {
+            "enabled": REPLY_CACHE_ENABLED,
+            "entries": entries,
+            "max_entries": self.max_entries,
+            "ttl": self.ttl,
+            "threshold": self.threshold,
+            "exact_hits": counters.get('exact_hits', 0),
+            "near_hits": counters.get('near_hits', 0),
+            "misses": counters.get('misses', 0),
+            "hit_rate": round(hits / lookups, 3) if lookups else 0.0,
+            "puts": counters.get('puts', 0),
+            "expired": counters.get('expired', 0),
+            "evicted": counters.get('evicted', 0),
+        }
+
+
+_reply_cache: Optional[ReplyCache] = None
+
+
+def get_reply_cache() -> ReplyCache:
+    """获取回复缓存单例"""
+    global _reply_cache
+    if _reply_cache is None:
+        _reply_cache = ReplyCache()
+    return _reply_cache
@@ -0,0 +1,312 @@
+# -*- coding: utf-8 -*-
+"""
+职业规划知识库检索
+将 .agents/skills/Career-Planning 下的 SKILL.md 和参考文档（安装 pypdf 时还包括PDF）切分为段落块，
+建立中文二元组（与 search_index.bigram_tokens 相同的分词）BM25 倒排索引，检索前K个相关段落注入提示词。
+
+- 切块：Markdown 按标题分节，节内按段落合并到不超过 SKILL_CHUNK_CHARS 字，块标题为标题路径；
+  PDF 按页切分后同样合并；
+- 索引：每个词元的倒排表中直接保存预先计算好的 BM25 权重，检索时只需累加和取前K；
+- 持久化：索引写入 data/skill_index.json，启动时若文件中的指纹（源文件大小和修改时间、切块参数）
+  与当前一致则直接加载，否则重新构建并写回。
+"""
+
+import heapq
+import json
+import math
+import os
+import re
+import tempfile
+import threading
+from collections import Counter
+from typing import Dict, List, NamedTuple, Optional, Sequence, Tuple
+
+from .. import database
+from ..search_index import bigram_tokens
+
+# 可选的PDF文本提取
+try:
+    import pypdf
+except ImportError:
+    pypdf = None
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+SKILL_DIR = os.path.join(PROJECT_ROOT, ".agents", "skills", "Career-Planning")
+SKILL_INDEX_FILE = os.path.join(database.DATABASE_DIR, "skill_index.json")
+SKILL_INDEX_PDF = os.environ.get("SKILL_INDEX_PDF", "1") != "0"
+SKILL_CHUNK_CHARS = int(os.environ.get("SKILL_CHUNK_CHARS", "400"))
+SKILL_TOP_K = int(os.environ.get("SKILL_TOP_K", "3"))
+SKILL_CONTEXT_CHARS = int(os.environ.get("SKILL_CONTEXT_CHARS", "900"))   # 注入提示词的参考资料总字数上限
+BM25_K1 = 1.5
+BM25_B = 0.75
+INDEX_VERSION = 1
+
+# (相对 SKILL_DIR 的路径, 分类)
+SKILL_FILES = [
+    ("SKILL.md", "核心架构"),
+    ("references/01-theoretical-foundations.md", "理论基础"),
+    ("references/02-lifelong-learning.md", "终身学习"),
+    ("references/03-career-path-selection.md", "道路选择"),
+    ("references/04-career-progression.md", "路径进阶"),
+    ("references/05-action-plan.md", "行动计划"),
+    ("references/06-industry-trends.md", "行业趋势")
+]
+SKILL_PDF = ("references/职业生涯规划.pdf", "职业生涯规划")
+
+
+class Chunk(NamedTuple):
+    """段落块：source 为文档分类，title 为标题路径（PDF为页码）"""
+    source: str
+    title: str
+    text: str
+
+
+class Passage(NamedTuple):
+    """检索结果"""
+    source: str
+    title: str
+    text: str
+    score: float
+
+
+# ==================== 切块 ====================
+
+_HEADING_RE = re.compile(r'^(#{1,6})\s+(.+?)\s*#*$')
+_TABLE_RULE_RE = re.compile(r'^\|?[\s:|-]+\|?$')
+_FRONT_MATTER_RE = re.compile(r'\A---\n.*?\n---\n', re.S)
+# 代词、助词等口语常用字：含这些字的二元组（"我想"、"什么"、"的职"）不参与索引和检索
+_STOP_CHARS = set("我你他她它们的地得了着过吗呢吧啊呀么这那哪个些很也都就还又和与及或在是")
+
+
+def _clean_line(line: str) -> str:
+    """去掉Markdown强调和表格竖线"""
+    line = line.replace('**', '').replace('`', '').strip()
+    if line.startswith('|'):
+        cells = [cell.strip() for cell in line.strip('|').split('|')]
+        line = ' | '.join(cell for cell in cells if cell)
+    return line
+
+
+def _pack(paragraphs: Sequence[str], max_chars: int) -> List[str]:
+    """按顺序把段落合并为不超过 max_chars 的块，超长段落按字数切开"""
+    pieces = []
+    for paragraph in paragraphs:
+        while len(paragraph) > max_chars:
+            pieces.append(paragraph[:max_chars])
+            paragraph = paragraph[max_chars:]
+        if paragraph:
+            pieces.append(paragraph)
+    chunks, current = [], ""
+    for piece in pieces:
+        if current and len(current) + 1 + len(piece) > max_chars:
+            chunks.append(current)
+            current = piece
+        else:
+            current = f"{current}\n{piece}" if current else piece
+    if current:
+        chunks.append(current)
+    return chunks
+
+
+def chunk_markdown(text: str, source: str, max_chars: int = SKILL_CHUNK_CHARS) -> List[Chunk]:
+    """Markdown 按标题分节，节内按段落合并"""
+    chunks: List[Chunk] = []
+    headings: List[Tuple[int, str]] = []
+    paragraphs: List[str] = []
+    lines: List[str] = []
+
+    def end_paragraph():
+        if lines:
+            paragraphs.append("\n".join(lines))
+            lines.clear()
+
+    def end_section():
+        end_paragraph()
+        title = " > ".join(h for _, h in headings) or source
+        chunks.extend(Chunk(source, title, body) for body in _pack(paragraphs, max_chars))
+        paragraphs.clear()
+
+    for raw in _FRONT_MATTER_RE.sub('', text).splitlines():
+        match = _HEADING_RE.match(raw)
+        if match:
+            end_section()
+            level = len(match.group(1))
+            headings[:] = [h for h in headings if h[0] < level] + [(level, _clean_line(match.group(2)))]
+        elif not raw.strip():
+            end_paragraph()
+        elif not _TABLE_RULE_RE.match(raw.strip()):
+            line = _clean_line(raw)
+            if line:
+                lines.append(line)
+    end_section()
+    return chunks
+
+
+def chunk_pdf(path: str, source: str, max_chars: int = SKILL_CHUNK_CHARS) -> List[Chunk]:
+    """PDF 按页提取文本后合并（需要 pypdf）"""
+    chunks = []
+    reader = pypdf.PdfReader(path)
+    for number, page in enumerate(reader.pages, 1):
+        paragraphs = [p.strip() for p in re.split(r'\n\s*\n', page.extract_text() or '') if p.strip()]
+        chunks.extend(Chunk(source, f"第{number}页", body) for body in _pack(paragraphs, max_chars))
+    return chunks
+
+
+def _source_files(skill_dir: str) -> List[Tuple[str, str]]:
+    """参与索引的 (路径, 分类)；PDF只在安装了 pypdf 且 SKILL_INDEX_PDF 未关闭时包含"""
+    files = [(os.path.join(skill_dir, name), category) for name, category in SKILL_FILES]
+    if SKILL_INDEX_PDF and pypdf is not None:
+        files.append((os.path.join(skill_dir, SKILL_PDF[0]), SKILL_PDF[1]))
+    return [(path, category) for path, category in files if os.path.exists(path)]
+
+
+def load_chunks(skill_dir: str = SKILL_DIR) -> List[Chunk]:
+    """读取并切分全部源文件"""
+    chunks = []
+    for path, category in _source_files(skill_dir):
+        try:
+            if path.endswith(".pdf"):
+                chunks.extend(chunk_pdf(path, category))
+            else:
+                with open(path, "r", encoding="utf-8") as f:
+                    chunks.extend(chunk_markdown(f.read(), category))
+        except Exception as e:
+            print(f"[SkillIndex] Error loading {path}: {e}")
+    return chunks
+
+
+def source_fingerprint(skill_dir: str = SKILL_DIR) -> List:
+    """源文件和切块参数的指纹"""
+    files = []
+    for path, _ in _source_files(skill_dir):
+        stat = os.stat(path)
+        files.append([os.path.relpath(path, skill_dir), stat.st_size, stat.st_mtime_ns])
+    return [INDEX_VERSION, SKILL_CHUNK_CHARS, BM25_K1, BM25_B, files]
+
+
+# ==================== 索引 ====================
+
+def index_tokens(text: str) -> List[str]:
+    """检索词元：search_index 的二元组分词，去掉含口语常用字的二元组"""
+    return [token for token in bigram_tokens(text) if not _STOP_CHARS.intersection(token)]
+
+
+def _chunk_tokens(chunk: Chunk) -> List[str]:
+    """块的索引词元：标题路径 + 正文"""
+    return index_tokens(chunk.title) + index_tokens(chunk.text)
+
+
+class SkillIndex:
+    """BM25 倒排索引：postings[词元] = [(块序号, BM25权重), ...]"""
+
+    def __init__(self, chunks: List[Chunk], postings: Dict[str, List[Tuple[int, float]]], fingerprint: List):
+        self.chunks = chunks
+        self.postings = postings
+        self.fingerprint = fingerprint
+
+    @classmethod
+    def build(cls, chunks: List[Chunk], fingerprint: List) -> "SkillIndex":
+        """由段落块构建，预先计算每个 (词元, 块) 的 BM25 权重"""
+        counts = [Counter(_chunk_tokens(chunk)) for chunk in chunks]
+        lengths = [sum(c.values()) for c in counts]
+        avg_length = sum(lengths) / len(lengths) if lengths else 0.0
+        doc_freq = Counter(token for c in counts for token in c)
+        total = len(chunks)
+
+        postings: Dict[str, List[Tuple[int, float]]] = {}
+        for index, (tf_counts, length) in enumerate(zip(counts, lengths)):
+            norm = BM25_K1 * (1 - BM25_B + BM25_B * length / avg_length)
+            for token, tf in tf_counts.items():
+                idf = math.log(1 + (total - doc_freq[token] + 0.5) / (doc_freq[token] + 0.5))
+                postings.setdefault(token, []).append((index, idf * tf * (BM25_K1 + 1) / (tf + norm)))
+        return cls(chunks, postings, fingerprint)
+
+    def search(self, query: str, k: int = SKILL_TOP_K) -> List[Passage]:
+        """返回与查询最相关的前K个段落"""
+        scores: Dict[int, float] = {}
+        for token in set(index_tokens(query)):
+            for index, weight in self.postings.get(token, ()):
+                scores[index] = scores.get(index, 0.0) + weight
+        best = heapq.nlargest(k, scores.items(), key=lambda item: item[1])
+        return [Passage(*self.chunks[index], round(score, 3)) for index, score in best]
+
+    def save(self, path: Optional[str] = None) -> None:
+        """写入JSON文件（先写本进程的临时文件再原子替换，多个工作进程同时启动时互不覆盖）"""
+        path = path or SKILL_INDEX_FILE
+        payload = {
+            "fingerprint": self.fingerprint,
+            "chunks": [list(chunk) for chunk in self.chunks],
+            "postings": {token: [[i, round(w, 5)] for i, w in entries] for token, entries in self.postings.items()},
+        }
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path) or ".",
+                                        prefix=os.path.basename(path) + ".", suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(payload, f, ensure_ascii=False, separators=(",", ":"))
+            os.replace(tmp_path, path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+
+    @classmethod
+    def load(cls, path: Optional[str] = None) -> Optional["SkillIndex"]:
+        """从文件加载，文件不存在或格式不符时返回None"""
+        try:
+            with open(path or SKILL_INDEX_FILE, "r", encoding="utf-8") as f:
+                payload = json.load(f)
+            chunks = [Chunk(*chunk) for chunk in payload["chunks"]]
+            postings = {token: [(i, w) for i, w in entries] for token, entries in payload["postings"].items()}
+            return cls(chunks, postings, payload["fingerprint"])
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+
+
+def format_passages(passages: Sequence[Passage], max_chars: int = SKILL_CONTEXT_CHARS) -> str:
+    """格式化为提示词中的参考资料，总字数不超过 max_chars"""
+    parts, used = [], 0
+    for number, passage in enumerate(passages, 1):
+        text = passage.text[:max(0, max_chars - used)]
+        if not text:
+            break
+        parts.append(f"[{number}] {passage.source}：{passage.title}\n{text}")
+        used += len(text)
+    return "\n\n".join(parts)
+
+
+# ==================== 全局实例 ====================
+
+_lock = threading.Lock()
+_index: Optional[SkillIndex] = None
+
+
+def get_skill_index() -> SkillIndex:
+    """获取知识库索引，首次调用时优先从文件加载，指纹不一致时重建并写回"""
+    global _index
+    if _index is not None:
+        return _index
+    with _lock:
+        if _index is None:
+            fingerprint = source_fingerprint()
+            index = SkillIndex.load()
+            if index is None or index.fingerprint != fingerprint:
+                print("[SkillIndex] Building skill document index ...")
+                index = SkillIndex.build(load_chunks(), fingerprint)
+                try:
+                    index.save()
+                except OSError as e:
+                    print(f"[SkillIndex] Warning: could not save index: {e}")
+            print(f"[SkillIndex] {len(index.chunks)} chunks, {len(index.postings)} terms")
+            _index = index
+    return _index
+
+
+def retrieve_context(query: str, k: int = SKILL_TOP_K) -> str:
+    """检索并格式化参考资料（无相关段落时返回空字符串）"""
+    return format_passages(get_skill_index().search(query, k))
+
+
+def reset_skill_index() -> None:
+    """丢弃内存中的索引（文档更新后调用），下次访问时重新加载"""
+    global _index
+    with _lock:
+        _index = None
@@ -0,0 +1,246 @@
+# -*- coding: utf-8 -*-
+"""
+SQLite 单写线程
+多个请求/后台任务各自用独立会话写同一个SQLite文件时，写锁竞争会导致等待和 "database is locked"。
+设置 SQLITE_WRITE_QUEUE=1 后：
+
+- CRUD写函数（@queued_write）和多步写操作（run_write）提交给每个数据库文件一个的写线程执行，
+  调用方通过 Future 等待结果；
+- 写线程每次取出队列中已有的全部任务（最多 WRITE_QUEUE_MAX_BATCH 个），在一个 BEGIN IMMEDIATE 事务中
+  依次执行，每个任务一个保存点（失败只回滚该任务），整批一次提交——负载越高每次提交包含的任务越多；
+- 请求会话使用只读连接（PRAGMA query_only），写操作只能经由写线程。
+
+写线程返回的ORM对象已与写线程的会话分离（列属性已加载，关系属性需重新查询）；
+调用方会话中已加载的对象会被过期（同步会话）或移出会话（AsyncSession），之后的查询读取最新数据。
+任务中通过 database.call_after_commit 登记的缓存失效等回调在整批提交后执行，任务的保存点或整批回滚时丢弃。
+PostgreSQL 和内存数据库不使用写线程。
+"""
+
+import asyncio
+import contextvars
+import functools
+import os
+import queue
+import threading
+from concurrent.futures import Future
+from typing import Any, Callable, Dict, Optional
+
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import Session
+
+from . import database
+from .database import UNIT_OF_WORK_KEY, in_unit_of_work, unit_of_work
+
+WRITE_QUEUE_MAX_BATCH = int(os.environ.get("WRITE_QUEUE_MAX_BATCH", "64"))
+WRITER_THREAD_PREFIX = "sqlite-writer"
+
+
+class WriteQueue:
+    """一个SQLite数据库文件的写线程"""
+
+    def __init__(self, url, max_batch: int = WRITE_QUEUE_MAX_BATCH):
+        self.url = url
+        self.max_batch = max_batch
+        self.engine = create_engine(url, pool_size=1, max_overflow=0,
+                                    connect_args={"check_same_thread": False})
+        database.apply_sqlite_pragmas(self.engine, database.get_sqlite_pragmas())
+
+        # 由 SQLAlchemy 控制事务边界（pysqlite 默认不为 SAVEPOINT 开启事务），并在事务开始时取得写锁
+        @event.listens_for(self.engine, "connect")
+        def _autocommit_driver(dbapi_connection, connection_record):
+            dbapi_connection.isolation_level = None
+
+        @event.listens_for(self.engine, "begin")
+        def _begin_immediate(conn):
+            conn.exec_driver_sql("BEGIN IMMEDIATE")
+
+        self._queue: "queue.Queue" = queue.Queue()
+        self.jobs = 0
+        self.batches = 0
+        self.failed_batches = 0
+        self.max_batch_seen = 0
+        self._thread = threading.Thread(
+            target=self._run, name=f"{WRITER_THREAD_PREFIX}-{url.database}", daemon=True
+        )
+        self._thread.start()
+
+    # ---------- 提交 ----------
+
+    def submit(self, func: Callable, *args, **kwargs) -> Future:
+        """提交写任务 func(写线程会话, *args, **kwargs)，返回 Future"""
+        future: Future = Future()
+        # 在调用方的上下文中执行（查询统计等上下文变量）
+        context = contextvars.copy_context()
+        self._queue.put((future, context, func, args, kwargs))
+        return future
+
+    def stats(self) -> Dict[str, object]:
+        return {
+            "database": self.url.database,
+            "jobs": self.jobs,
+            "batches": self.batches,
+            "failed_batches": self.failed_batches,
+            "avg_batch": round(self.jobs / self.batches, 2) if self.batches else 0,
+            "max_batch": self.max_batch_seen,
+            "pending": self._queue.qsize(),
+        }
+
+    # ---------- 写线程 ----------
+
+    def _run(self) -> None:
+        db = Session(bind=self.engine, autoflush=False, expire_on_commit=False)
+        # CRUD写函数在写线程中只 flush，由批次统一提交
+        db.info[UNIT_OF_WORK_KEY] = True
+        while True:
+            job = self._queue.get()
+            if job is None:
+                break
+            jobs = [job]
+            while len(jobs) < self.max_batch:
+                try:
+                    job = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+                if job is None:
+                    self._queue.put(None)
+                    break
+                jobs.append(job)
+            self._execute(db, jobs)
+        db.close()
+        self.engine.dispose()
+
+    def _execute(self, db: Session, jobs) -> None:
+        outcomes = []
+        for future, context, func, args, kwargs in jobs:
+            if not future.set_running_or_notify_cancel():
+                continue
+            savepoint = db.begin_nested()
+            # 在调用方上下文之外开始事务和保存点，不计入请求的查询统计
+            db.connection()
+            try:
+                result = context.run(func, db, *args, **kwargs)
+                savepoint.commit()
+                outcomes.append((future, result, None))
+            except BaseException as e:
+                savepoint.rollback()
+                outcomes.append((future, None, e))
+        try:
+            db.commit()
+        except Exception as e:
+            db.rollback()
+            self.failed_batches += 1
+            print(f"[WriteQueue] Batch of {len(outcomes)} failed: {e}")
+            outcomes = [(future, None, error or e) for future, _, error in outcomes]
+        finally:
+            db.expunge_all()
+        self.jobs += len(outcomes)
+        self.batches += 1
+        self.max_batch_seen = max(self.max_batch_seen, len(outcomes))
+        for future, result, error in outcomes:
+            if error is not None:
+                future.set_exception(error)
+            else:
+                future.set_result(result)
+
+    def close(self, timeout: float = 5) -> None:
+        """处理完已提交的任务后停止写线程"""
+        self._queue.put(None)
+        self._thread.join(timeout=timeout)
+
+
+# ==================== 全局实例 ====================
+
+_queues: Dict[str, WriteQueue] = {}
+_lock = threading.Lock()
+
+
+def get_write_queue(bind=None) -> Optional[WriteQueue]:
+    """获取数据库文件对应的写线程；非SQLite文件数据库返回None"""
+    bind = bind or database.engine
+    url = bind.url
+    if url.get_backend_name() != "sqlite" or url.database in (None, "", ":memory:"):
+        return None
+    key = os.path.abspath(url.database)
+    write_queue = _queues.get(key)
+    if write_queue is None:
+        with _lock:
+            write_queue = _queues.get(key)
+            if write_queue is None:
+                # 异步会话的URL使用 aiosqlite，写线程使用同步驱动
+                write_queue = _queues[key] = WriteQueue(url.set(drivername="sqlite"))
+    return write_queue
+
+
+def write_queue_stats() -> list:
+    """所有写线程的统计"""
+    return [write_queue.stats() for write_queue in list(_queues.values())]
+
+
+def close_write_queues() -> None:
+    """停止所有写线程"""
+    with _lock:
+        for write_queue in _queues.values():
+            write_queue.close()
+        _queues.clear()
+
+
+def _on_writer_thread() -> bool:
+    return threading.current_thread().name.startswith(WRITER_THREAD_PREFIX)
+
+
+def _queue_for(db: Session) -> Optional[WriteQueue]:
+    """会话的写操作是否交给写线程：启用写队列、不在调用方的工作单元中、且不在写线程上"""
+    if not database.WRITE_QUEUE_ENABLED or in_unit_of_work(db) or _on_writer_thread():
+        return None
+    return get_write_queue(db.get_bind())
+
+
+# ==================== 写操作入口 ====================
+
+def queued_write(func: Callable) -> Callable:
+    """
+    CRUD写函数装饰器（第一个参数为会话）
+    启用写队列时在写线程中以写线程的会话执行，否则直接执行
+    """
+    @functools.wraps(func)
+    def wrapper(db, *args, **kwargs):
+        write_queue = _queue_for(db)
+        if write_queue is None:
+            return func(db, *args, **kwargs)
+        result = write_queue.submit(func, *args, **kwargs).result()
+        db.expire_all()
+        return result
+    return wrapper
+
+
+def queued_async_write(sync_func: Callable) -> Callable:
+    """
+    异步CRUD写函数装饰器：启用写队列时改为在写线程中执行同名的同步CRUD函数，
+    事件循环通过 asyncio.wrap_future 等待，不阻塞
+    """
+    def decorator(func: Callable) -> Callable:
+        @functools.wraps(func)
+        async def wrapper(db, *args, **kwargs):
+            write_queue = _queue_for(db.sync_session)
+            if write_queue is None:
+                return await func(db, *args, **kwargs)
+            result = await asyncio.wrap_future(write_queue.submit(sync_func, *args, **kwargs))
+            # AsyncSession 不能隐式刷新过期属性，改为移出会话
+            db.expunge_all()
+            return result
+        return wrapper
+    return decorator
+
+
+def run_write(db: Session, func: Callable, *args, **kwargs) -> Any:
+    """
+    在一个工作单元中执行多步写操作 func(db, *args, **kwargs)
+    启用写队列时整体提交给写线程（批次事务中的一个保存点），否则在 db 的 unit_of_work 中执行
+    """
+    write_queue = _queue_for(db)
+    if write_queue is None:
+        with unit_of_work(db):
+            return func(db, *args, **kwargs)
+    result = write_queue.submit(func, *args, **kwargs).result()
+    db.expire_all()
+    return result
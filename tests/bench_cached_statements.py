@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+缓存语句微基准
+对比高频读取函数改写前（每次构建 ORM Query）与改写后（lambda_stmt / Session.get / 行元组）
+的单次调用耗时。每次调用前清空会话的标识映射，模拟每个请求使用新会话。
+使用 data/career_guidance.db 的副本，原数据库不会被修改。
+
+    python tests/bench_cached_statements.py [每个函数的调用次数=3000]
+"""
+
+import sys
+import os
+import shutil
+import tempfile
+import time
+
+# 添加 backend 目录到 Python 路径
+backend_path = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'backend')
+sys.path.insert(0, backend_path)
+
+from sqlalchemy import and_, create_engine, desc
+from sqlalchemy.orm import sessionmaker
+
+from bench_unit_of_work import _prepare_database
+
+
+# ==================== 改写前的实现 ====================
+
+def _legacy_get_user_profile(db, user_id):
+    from app.models_user_profile import UserProfile
+    return db.query(UserProfile).filter(UserProfile.user_id == user_id).first()
+
+
+def _legacy_get_user_report(db, report_id):
+    from app.models_user_report import UserReport
+    return db.query(UserReport).filter(
+        and_(UserReport.id == report_id, UserReport.deleted_at.is_(None))
+    ).first()
+
+
+def _legacy_get_report_chapter(db, chapter_id):
+    from app.models_user_report import ReportChapter
+    return db.query(ReportChapter).filter(ReportChapter.id == chapter_id).first()
+
+
+def _legacy_get_generation_task(db, task_id):
+    from app.models_user_report import GenerationTask
+    return db.query(GenerationTask).filter(GenerationTask.id == task_id).first()
+
+
+def _legacy_get_conversation_history(db, user_id, limit=20):
+    from app.models_user_profile import UserConversation
+    return db.query(UserConversation).filter(
+        UserConversation.user_id == user_id
+    ).order_by(desc(UserConversation.timestamp)).limit(limit).all()
+
+
+def _seed(db):
+    """写入基准数据，返回各函数的参数"""
+    from app import crud_user_profile, crud_user_report
+    from app.database import unit_of_work
+    from app.schemas_user_report import (
+        ChapterStatus, GenerationTaskCreate, ReportChapterCreate, ReportType, UserReportCreate
+    )
+
+    user_id = "bench_cached"
+    with unit_of_work(db):
+        crud_user_profile.get_or_create_user_profile(db, user_id)
+        for i in range(40):
+            crud_user_profile.create_conversation(db, user_id, "bench", "user", f"消息{i}" * 20)
+        report = crud_user_report.create_user_report(db, UserReportCreate(
+            user_id=user_id, title="基准报告", report_type=ReportType.FULL_REPORT
+        ))
+        task = crud_user_report.create_generation_task(db, GenerationTaskCreate(
+            user_id=user_id, report_type=ReportType.FULL_REPORT, report_id=report.id
+        ))
+        chapter = crud_user_report.create_report_chapter(db, ReportChapterCreate(
+            report_id=report.id, chapter_code="1", title="章节", order_num=1, level=1,
+            status=ChapterStatus.PENDING
+        ))
+    return user_id, report.id, task.id, chapter.id
+
+
+def _time(db, func, args, calls):
+    """返回每次调用的平均微秒数"""
+    for _ in range(50):
+        db.expunge_all()
+        func(db, *args)
+    start = time.perf_counter()
+    for _ in range(calls):
+        db.expunge_all()
+        func(db, *args)
+    return (time.perf_counter() - start) / calls * 1e6
+
+
+def main():
+    """主函数"""
+    from app import crud_user_profile, crud_user_report
+
+    calls = int(sys.argv[1]) if len(sys.argv) > 1 else 3000
+
+    workdir = tempfile.mkdtemp(prefix="bench_cached_")
+    results = []
+    try:
+        path = os.path.join(workdir, "bench.db")
+        _prepare_database(path)
+        engine = create_engine(f"sqlite:///{path}", connect_args={"check_same_thread": False})
+        Session = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+        with Session() as db:
+            user_id, report_id, task_id, chapter_id = _seed(db)
+            cases = [
+                ("get_user_profile", _legacy_get_user_profile, crud_user_profile.get_user_profile, (user_id,)),
+                ("get_user_report", _legacy_get_user_report, crud_user_report.get_user_report, (report_id,)),
+                ("get_report_chapter", _legacy_get_report_chapter, crud_user_report.get_report_chapter, (chapter_id,)),
+                ("get_generation_task", _legacy_get_generation_task, crud_user_report.get_generation_task, (task_id,)),
+                ("get_conversation_history", _legacy_get_conversation_history,
+                 crud_user_profile.get_conversation_history, (user_id, None, 20)),
+            ]
+            for name, before, after, args in cases:
+                print(f"[Bench] {name} x {calls} ...")
+                legacy_args = args if name != "get_conversation_history" else (user_id, 20)
+                results.append((name, _time(db, before, legacy_args, calls), _time(db, after, args, calls)))
+        engine.dispose()
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+
+    print("\n" + "=" * 64)
+    print(f"{'function':<28}{'before us':>11}{'after us':>11}{'speedup':>10}")
+    for name, before, after in results:
+        print(f"{name:<28}{before:>11.1f}{after:>11.1f}{before / after:>9.2f}x")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
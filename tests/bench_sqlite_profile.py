@@ -0,0 +1,190 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+SQLite连接配置基准测试
+对比 default（回滚日志）与 production（WAL）两种连接配置：
+在 /chat（写入用户/助手对话并更新画像）和报告生成（写入章节内容、生成日志、任务进度）
+持续写入的同时，测量目录读取（专业列表/专业详情）的吞吐量和延迟。
+
+两个写线程按固定速率写入（默认各 20 次/秒），两种配置承担相同的写负载，
+读取指标的差异即为写锁对读取的阻塞。写入速率设为 0 时写线程全速运行，用于比较写吞吐量。
+每种配置使用 data/career_guidance.db 的独立副本，原数据库不会被修改。
+
+    python tests/bench_sqlite_profile.py [持续秒数=5] [读线程数=4] [每个写线程的写入速率=20]
+"""
+
+import sys
+import os
+import random
+import shutil
+import sqlite3
+import tempfile
+import threading
+import time
+
+# 添加 backend 目录到 Python 路径
+backend_path = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'backend')
+sys.path.insert(0, backend_path)
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+
+def _prepare_database(path):
+    """复制主数据库（使用备份API以包含WAL中的内容）并写入基准测试所需的用户、报告和任务"""
+    from app import database, models_user_profile, models_user_report
+    from app.migrations import run_migrations
+
+    if os.path.exists(database.DATABASE_FILE):
+        src = sqlite3.connect(database.DATABASE_FILE)
+        dst = sqlite3.connect(path)
+        src.backup(dst)
+        src.close()
+        dst.close()
+    engine = create_engine(f"sqlite:///{path}", connect_args={"check_same_thread": False})
+    database.Base.metadata.create_all(bind=engine)
+    run_migrations(engine)
+    db = sessionmaker(bind=engine)()
+    user_id = "bench_user"
+    if not db.query(models_user_profile.UserProfile).filter_by(user_id=user_id).first():
+        db.add(models_user_profile.UserProfile(user_id=user_id, nickname="bench"))
+        db.flush()
+    db.add_all([
+        models_user_report.UserReport(id="report_bench", user_id=user_id, title="基准报告",
+                                      report_type="FULL_REPORT"),
+        models_user_report.GenerationTask(id="task_bench", user_id=user_id, report_id="report_bench",
+                                          report_type="FULL_REPORT", status="generating"),
+    ])
+    db.flush()
+    db.add_all([
+        models_user_report.ReportChapter(id=f"ch_bench_{i}", report_id="report_bench",
+                                         chapter_code=str(i), title=f"章节{i}", order_num=i)
+        for i in range(20)
+    ])
+    db.commit()
+    db.close()
+    engine.dispose()
+    return user_id
+
+
+def _run_profile(profile, path, duration, readers, write_rate):
+    """在指定配置下运行读写负载，返回统计结果"""
+    from app import crud, crud_user_profile, crud_user_report, models, schemas_user_profile
+    from app.database import apply_sqlite_pragmas, get_sqlite_pragmas
+
+    engine = create_engine(f"sqlite:///{path}", connect_args={"check_same_thread": False})
+    apply_sqlite_pragmas(engine, get_sqlite_pragmas(profile, overrides=""))
+    Session = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+    with Session() as db:
+        major_ids = [m.id for m in db.query(models.Major.id)] or [1]
+        category_ids = [c.id for c in db.query(models.MajorCategory.id)] or [None]
+
+    deadline = time.perf_counter() + duration
+    lock = threading.Lock()
+    stats = {"reads": 0, "writes": 0, "errors": 0, "latencies": []}
+
+    def pace(started, count):
+        """按 write_rate 限速"""
+        if write_rate > 0:
+            delay = started + count / write_rate - time.perf_counter()
+            if delay > 0:
+                time.sleep(delay)
+
+    def record(key, latency=None):
+        with lock:
+            stats[key] += 1
+            if latency is not None:
+                stats["latencies"].append(latency)
+
+    def reader():
+        rng = random.Random()
+        while time.perf_counter() < deadline:
+            start = time.perf_counter()
+            try:
+                with Session() as db:
+                    crud.get_majors(db, category_id=rng.choice(category_ids), limit=20)
+                    crud.get_major(db, rng.choice(major_ids))
+                record("reads", time.perf_counter() - start)
+            except Exception:
+                record("errors")
+
+    def chat_writer():
+        turn, started = 0, time.perf_counter()
+        while time.perf_counter() < deadline:
+            pace(started, turn)
+            try:
+                with Session() as db:
+                    crud_user_profile.create_conversation(db, "bench_user", "bench", "user", f"问题{turn}")
+                    crud_user_profile.create_conversation(db, "bench_user", "bench", "assistant", "回答" * 200)
+                    crud_user_profile.update_user_profile(
+                        db, "bench_user", schemas_user_profile.UserProfileUpdate(career_confusion_level=turn % 10)
+                    )
+                record("writes")
+            except Exception:
+                record("errors")
+            turn += 1
+
+    def report_writer():
+        step, started = 0, time.perf_counter()
+        html = "<p>" + "报告内容" * 2000 + "</p>"
+        while time.perf_counter() < deadline:
+            pace(started, step)
+            chapter_id = f"ch_bench_{step % 20}"
+            try:
+                with Session() as db:
+                    crud_user_report.update_chapter_content(db, chapter_id, content_html=html, word_count=8000)
+                    crud_user_report.create_generation_log(db, "task_bench", f"章节{step}完成", chapter_id=chapter_id)
+                    crud_user_report.update_generation_task(db, "task_bench", progress=step % 100)
+                record("writes")
+            except Exception:
+                record("errors")
+            step += 1
+
+    threads = [threading.Thread(target=reader) for _ in range(readers)]
+    threads += [threading.Thread(target=chat_writer), threading.Thread(target=report_writer)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    engine.dispose()
+
+    latencies = sorted(stats["latencies"]) or [0.0]
+    return {
+        "reads_per_sec": stats["reads"] / duration,
+        "writes_per_sec": stats["writes"] / duration,
+        "p50_ms": latencies[len(latencies) // 2] * 1000,
+        "p95_ms": latencies[int(len(latencies) * 0.95)] * 1000,
+        "errors": stats["errors"],
+    }
+
+
+def main():
+    """主函数"""
+    duration = float(sys.argv[1]) if len(sys.argv) > 1 else 5.0
+    readers = int(sys.argv[2]) if len(sys.argv) > 2 else 4
+    write_rate = float(sys.argv[3]) if len(sys.argv) > 3 else 20.0
+
+    workdir = tempfile.mkdtemp(prefix="bench_sqlite_")
+    results = {}
+    try:
+        for profile in ("default", "production"):
+            path = os.path.join(workdir, f"{profile}.db")
+            _prepare_database(path)
+            print(f"\n[Bench] profile={profile}, {readers} readers + 2 writers, {duration:.0f}s ...")
+            results[profile] = _run_profile(profile, path, duration, readers, write_rate)
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+
+    print("\n" + "=" * 72)
+    print(f"{'profile':<12}{'reads/s':>10}{'p50 ms':>10}{'p95 ms':>10}{'writes/s':>11}{'errors':>9}")
+    for profile, r in results.items():
+        print(f"{profile:<12}{r['reads_per_sec']:>10.0f}{r['p50_ms']:>10.2f}{r['p95_ms']:>10.2f}"
+              f"{r['writes_per_sec']:>11.1f}{r['errors']:>9}")
+    base, prod = results["default"]["reads_per_sec"], results["production"]["reads_per_sec"]
+    if base:
+        print(f"\n读取吞吐量提升: {prod / base:.1f}x")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
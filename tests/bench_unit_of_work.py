@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+工作单元基准测试
+按 /api/user-profiles/{user_id}/chat 的写入顺序模拟一轮对话：
+写入用户消息 -> 更新画像（含更新日志） -> 写入助手回复 -> 重新读取画像，
+对比逐个CRUD提交（per_helper）与 database.unit_of_work 合并提交两种方式
+每轮的提交次数（SQLite 上每次提交都要 fsync）和延迟。
+每种连接配置使用 data/career_guidance.db 的独立副本，原数据库不会被修改。
+
+    python tests/bench_unit_of_work.py [每种方式的对话轮数=200]
+"""
+
+import sys
+import os
+import shutil
+import sqlite3
+import tempfile
+import time
+
+# 添加 backend 目录到 Python 路径
+backend_path = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'backend')
+sys.path.insert(0, backend_path)
+
+from contextlib import nullcontext
+
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker
+
+
+def _prepare_database(path):
+    """复制主数据库并建表"""
+    from app import database
+    from app.migrations import run_migrations
+
+    if os.path.exists(database.DATABASE_FILE):
+        src = sqlite3.connect(database.DATABASE_FILE)
+        dst = sqlite3.connect(path)
+        src.backup(dst)
+        src.close()
+        dst.close()
+    engine = create_engine(f"sqlite:///{path}", connect_args={"check_same_thread": False})
+    database.Base.metadata.create_all(bind=engine)
+    run_migrations(engine)
+    engine.dispose()
+
+
+def _chat_turn(db, user_id, turn, use_unit_of_work):
+    """与 chat_with_profile 相同的写入顺序"""
+    from app import crud_user_profile as crud, schemas_user_profile as schemas
+    from app.database import unit_of_work
+
+    with unit_of_work(db) if use_unit_of_work else nullcontext():
+        conversation = crud.create_conversation(db, user_id, "bench", "user", f"我喜欢数据分析{turn}")
+        crud.update_user_profile(
+            db, user_id,
+            schemas.UserProfileUpdate(holland_code="IRA", resilience_score=turn % 10 + 1),
+            update_type="conversation_extract",
+            source_message_id=conversation.id
+        )
+        crud.create_conversation(db, user_id, "bench", "assistant", "回答" * 200)
+    return crud.get_user_profile(db, user_id).completeness_score
+
+
+def _run_mode(profile, path, turns, use_unit_of_work):
+    """运行指定轮数，返回每轮提交次数和延迟统计"""
+    from app import crud_user_profile
+    from app.database import apply_sqlite_pragmas, get_sqlite_pragmas
+
+    engine = create_engine(f"sqlite:///{path}", connect_args={"check_same_thread": False})
+    apply_sqlite_pragmas(engine, get_sqlite_pragmas(profile, overrides=""))
+    commits = [0]
+    event.listen(engine, "commit", lambda conn: commits.__setitem__(0, commits[0] + 1))
+    Session = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+    user_id = f"bench_uow_{int(use_unit_of_work)}"
+    with Session() as db:
+        crud_user_profile.get_or_create_user_profile(db, user_id)
+    commits[0] = 0
+
+    latencies = []
+    for turn in range(turns):
+        start = time.perf_counter()
+        with Session() as db:
+            _chat_turn(db, user_id, turn, use_unit_of_work)
+        latencies.append(time.perf_counter() - start)
+    engine.dispose()
+
+    latencies.sort()
+    return {
+        "commits_per_turn": commits[0] / turns,
+        "p50_ms": latencies[len(latencies) // 2] * 1000,
+        "p95_ms": latencies[int(len(latencies) * 0.95)] * 1000,
+    }
+
+
+def main():
+    """主函数"""
+    turns = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+
+    workdir = tempfile.mkdtemp(prefix="bench_uow_")
+    results = {}
+    try:
+        for profile in ("default", "production"):
+            path = os.path.join(workdir, f"{profile}.db")
+            _prepare_database(path)
+            for mode, use_unit_of_work in (("per_helper", False), ("unit_of_work", True)):
+                print(f"\n[Bench] profile={profile}, mode={mode}, {turns} turns ...")
+                results[(profile, mode)] = _run_mode(profile, path, turns, use_unit_of_work)
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+
+    print("\n" + "=" * 60)
+    print(f"{'profile':<12}{'mode':<15}{'commits/turn':>13}{'p50 ms':>10}{'p95 ms':>10}")
+    for (profile, mode), r in results.items():
+        print(f"{profile:<12}{mode:<15}{r['commits_per_turn']:>13.1f}{r['p50_ms']:>10.2f}{r['p95_ms']:>10.2f}")
+    for profile in ("default", "production"):
+        base, uow = results[(profile, "per_helper")]["p95_ms"], results[(profile, "unit_of_work")]["p95_ms"]
+        if uow:
+            print(f"{profile}: p95 延迟降低 {base / uow:.1f}x")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+单写线程基准测试
+多个线程同时执行与 /api/user-profiles/{user_id}/chat 相同的写入（用户消息、画像更新、助手回复），
+对比每个线程用自己的连接直接提交（direct）与经 app.write_queue 写线程合并提交（queued）
+的吞吐量、提交次数、p95 延迟和 "database is locked" 错误数。
+使用 data/career_guidance.db 的副本，原数据库不会被修改。
+
+    python tests/bench_write_queue.py [线程数=16] [每线程轮数=50] [busy_timeout毫秒=200]
+"""
+
+import sys
+import os
+import shutil
+import tempfile
+import threading
+import time
+
+# 添加 backend 目录到 Python 路径
+backend_path = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'backend')
+sys.path.insert(0, backend_path)
+
+from sqlalchemy import create_engine, event
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.orm import sessionmaker
+
+from bench_unit_of_work import _prepare_database
+
+
+def _chat_turn(db, user_id, turn):
+    """与 chat_with_profile 相同的写入顺序"""
+    from app import crud_user_profile as crud, schemas_user_profile as schemas
+
+    conversation = crud.create_conversation(db, user_id, "bench", "user", f"我喜欢数据分析{turn}")
+    crud.update_user_profile(
+        db, user_id,
+        schemas.UserProfileUpdate(holland_code="IRA", resilience_score=turn % 10 + 1),
+        update_type="conversation_extract",
+        source_message_id=conversation.id
+    )
+    crud.create_conversation(db, user_id, "bench", "assistant", "回答" * 200)
+
+
+def _run_mode(path, threads, turns, busy_timeout, queued):
+    """并发运行，返回吞吐量、提交次数、延迟和错误统计"""
+    from app import crud_user_profile, database, write_queue
+    from app.database import apply_sqlite_pragmas, get_sqlite_pragmas
+
+    pragmas = dict(get_sqlite_pragmas("production", overrides=""), busy_timeout=busy_timeout)
+    engine = create_engine(f"sqlite:///{path}", connect_args={"check_same_thread": False},
+                           pool_size=threads, max_overflow=0)
+    apply_sqlite_pragmas(engine, dict(pragmas, query_only=1) if queued else pragmas)
+    Session = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+    database.WRITE_QUEUE_ENABLED = queued
+    commits = [0]
+    if queued:
+        writer = write_queue.get_write_queue(engine)
+        event.listen(writer.engine, "commit", lambda conn: commits.__setitem__(0, commits[0] + 1))
+    else:
+        event.listen(engine, "commit", lambda conn: commits.__setitem__(0, commits[0] + 1))
+
+    user_ids = [f"bench_wq_{int(queued)}_{i}" for i in range(threads)]
+    with Session() as db:
+        for user_id in user_ids:
+            crud_user_profile.get_or_create_user_profile(db, user_id)
+    commits[0] = 0
+
+    latencies, errors = [], [0]
+    lock = threading.Lock()
+
+    def worker(user_id):
+        for turn in range(turns):
+            start = time.perf_counter()
+            try:
+                with Session() as db:
+                    write_queue.run_write(db, _chat_turn, user_id, turn)
+            except OperationalError as e:
+                if "locked" not in str(e):
+                    raise
+                with lock:
+                    errors[0] += 1
+                continue
+            with lock:
+                latencies.append(time.perf_counter() - start)
+
+    start = time.perf_counter()
+    workers = [threading.Thread(target=worker, args=(user_id,)) for user_id in user_ids]
+    for t in workers:
+        t.start()
+    for t in workers:
+        t.join()
+    elapsed = time.perf_counter() - start
+
+    stats = write_queue.get_write_queue(engine).stats() if queued else {}
+    write_queue.close_write_queues()
+    database.WRITE_QUEUE_ENABLED = False
+    engine.dispose()
+
+    latencies.sort()
+    return {
+        "turns_per_s": len(latencies) / elapsed,
+        "commits": commits[0],
+        "avg_batch": stats.get("avg_batch", 1.0),
+        "p95_ms": latencies[int(len(latencies) * 0.95)] * 1000 if latencies else 0.0,
+        "locked": errors[0],
+    }
+
+
+def main():
+    """主函数"""
+    threads = int(sys.argv[1]) if len(sys.argv) > 1 else 16
+    turns = int(sys.argv[2]) if len(sys.argv) > 2 else 50
+    busy_timeout = int(sys.argv[3]) if len(sys.argv) > 3 else 200
+
+    workdir = tempfile.mkdtemp(prefix="bench_wq_")
+    results = {}
+    try:
+        path = os.path.join(workdir, "bench.db")
+        _prepare_database(path)
+        for mode, queued in (("direct", False), ("queued", True)):
+            print(f"\n[Bench] mode={mode}, {threads} threads x {turns} turns, busy_timeout={busy_timeout}ms ...")
+            results[mode] = _run_mode(path, threads, turns, busy_timeout, queued)
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+
+    print("\n" + "=" * 64)
+    print(f"{'mode':<10}{'turns/s':>10}{'commits':>10}{'avg batch':>11}{'p95 ms':>10}{'locked':>9}")
+    for mode, r in results.items():
+        print(f"{mode:<10}{r['turns_per_s']:>10.1f}{r['commits']:>10}{r['avg_batch']:>11.1f}"
+              f"{r['p95_ms']:>10.2f}{r['locked']:>9}")
+    if results["direct"]["turns_per_s"]:
+        print(f"吞吐量提升 {results['queued']['turns_per_s'] / results['direct']['turns_per_s']:.1f}x")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
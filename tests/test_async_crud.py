@@ -0,0 +1,158 @@
+# -*- coding: utf-8 -*-
+"""
+异步CRUD测试
+在临时 aiosqlite 数据库上验证 crud_user_report_async / crud_user_profile_async
+与同步版本的查询语义一致，并确认查询期间事件循环不被阻塞
+（报告生成流程的同步会话操作在线程池中执行）。
+"""
+
+import asyncio
+from datetime import datetime, timedelta
+
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+
+async def _make_session_factory(path):
+    from app.database import Base
+    from app import models, models_user_profile, models_user_report  # noqa: F401 注册所有表
+
+    engine = create_async_engine(f"sqlite+aiosqlite:///{path}")
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    return engine, async_sessionmaker(engine, autoflush=False, expire_on_commit=False)
+
+
+def test_async_database_url():
+    """测试同步URL到异步驱动的映射"""
+    from app.database import async_database_url
+
+    assert async_database_url("sqlite:///data/x.db").drivername == "sqlite+aiosqlite"
+    assert async_database_url("postgresql+psycopg2://u:p@h/db").drivername == "postgresql+asyncpg"
+    assert async_database_url("postgresql://u:p@h/db").database == "db"
+
+
+def test_async_report_crud(tmp_path):
+    """测试异步报告/任务CRUD"""
+    from app import crud_user_report_async as crud
+    from app import crud_user_profile_async
+    from app.models_user_report import UserReport, GenerationTask
+    from app.schemas_user_report import UserReportUpdate, TaskStatus
+
+    async def run(path):
+        engine, Session = await _make_session_factory(path)
+        async with Session() as db:
+            await crud_user_profile_async.get_or_create_user_profile(db, "async_user")
+            now = datetime.utcnow()
+            for i in range(3):
+                db.add(UserReport(
+                    id=f"report_{i}", user_id="async_user", title=f"报告{i}",
+                    report_type="SUB_REPORT_A", status="completed",
+                    created_at=now + timedelta(minutes=i)
+                ))
+            db.add(GenerationTask(
+                id="task_1", user_id="async_user", report_type="SUB_REPORT_A",
+                status=TaskStatus.GENERATING.value, created_at=now
+            ))
+            await db.commit()
+
+            reports, total = await crud.get_user_reports(db, "async_user", limit=2)
+            assert total == 3 and [r.id for r in reports] == ["report_2", "report_1"]
+
+            updated = await crud.update_user_report(db, "report_0", UserReportUpdate(title="新标题"))
+            assert updated.title == "新标题"
+            assert await crud.delete_user_report(db, "report_1")
+            assert await crud.get_user_report(db, "report_1") is None
+            assert (await crud.get_user_reports(db, "async_user"))[1] == 2
+
+            active = await crud.get_active_generation_task(db, "async_user")
+            assert active.id == "task_1"
+            await crud.update_generation_task(db, "task_1", status=TaskStatus.COMPLETED.value, progress=None)
+            assert await crud.get_active_generation_task(db, "async_user") is None
+            history, count = await crud.get_generation_history(db, "async_user", status="completed")
+            assert count == 1 and history[0].status == "completed"
+        await engine.dispose()
+
+    asyncio.run(run(tmp_path / "async.db"))
+
+
+def test_async_profile_crud(tmp_path):
+    """测试异步画像CRUD，并确认查询期间事件循环可以调度其他协程"""
+    from app import crud_user_profile_async as crud
+    from app.models_user_profile import UserProfileLog
+
+    async def run(path):
+        engine, Session = await _make_session_factory(path)
+        async with Session() as db:
+            profile = await crud.get_or_create_user_profile(db, "profile_user")
+            again = await crud.get_or_create_user_profile(db, "profile_user")
+            assert profile.id == again.id and profile.nickname == "用户profile_"
+
+            for i, update_type in enumerate(["form_input", "conversation_extract", "form_input"]):
+                db.add(UserProfileLog(
+                    user_id="profile_user", update_type=update_type,
+                    timestamp=datetime.utcnow() + timedelta(seconds=i)
+                ))
+            await db.commit()
+            logs = await crud.get_user_profile_logs(db, "profile_user", update_type="form_input")
+            assert len(logs) == 2
+
+            await crud.create_conversation(db, "profile_user", "s1", "user", "你好")
+            history = await crud.get_conversation_history(db, "profile_user", session_id="s1")
+            assert [c.message_content for c in history] == ["你好"]
+
+        # 并发执行查询时，心跳协程应持续运行
+        ticks = 0
+
+        async def heartbeat():
+            nonlocal ticks
+            while True:
+                ticks += 1
+                await asyncio.sleep(0)
+
+        async def query():
+            async with Session() as db:
+                return await crud.get_user_profile_logs(db, "profile_user")
+
+        beat = asyncio.create_task(heartbeat())
+        results = await asyncio.gather(*(query() for _ in range(20)))
+        beat.cancel()
+        assert all(len(r) == 3 for r in results)
+        assert ticks > 20
+        await engine.dispose()
+
+    asyncio.run(run(tmp_path / "async.db"))
+
+
+def test_report_workflow_off_event_loop(make_engine):
+    """测试报告生成流程的同步数据库操作都在线程池中执行，不占用事件循环线程"""
+    import threading
+    from sqlalchemy import event
+    from sqlalchemy.orm import sessionmaker
+    from app import crud_user_profile
+    from app.models_user_report import GenerationTask
+    from app.report_generation_service import ReportGenerationService
+    from app.schemas_user_report import ReportType, TaskStatus
+
+    async def run(engine, Session):
+        loop_thread = threading.current_thread()
+        threads = []
+        event.listen(engine, "before_cursor_execute",
+                     lambda *args: threads.append(threading.current_thread()))
+
+        async def quick_chapter(chapter, user_data, config):
+            return f"# {chapter.title}"
+        service = ReportGenerationService(Session(), owns_session=True)
+        service._mock_generate_chapter = quick_chapter
+        task_id = await service.generate_report("report_user", ReportType.SUB_REPORT_A)
+        await asyncio.gather(*(t for t in asyncio.all_tasks() if t is not asyncio.current_task()))
+        assert threads and loop_thread not in threads
+        return task_id
+
+    engine = make_engine("report.db")
+    Session = sessionmaker(bind=engine, autoflush=False)
+    with Session() as db:
+        crud_user_profile.get_or_create_user_profile(db, "report_user")
+    task_id = asyncio.run(run(engine, Session))
+    with Session() as db:
+        task = db.get(GenerationTask, task_id)
+        assert task.status == TaskStatus.COMPLETED.value and task.progress == 100
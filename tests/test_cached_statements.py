@@ -0,0 +1,29 @@
+# -*- coding: utf-8 -*-
+"""
+缓存语句测试
+lambda_stmt 按代码位置缓存语句结构，验证重复调用时绑定参数（用户、会话、条数）按本次调用取值，
+以及对话历史返回行元组。
+"""
+
+from sqlalchemy import Row
+
+
+def test_cached_statement_parameters(db):
+    """测试缓存语句的参数绑定"""
+    from app import crud_user_profile as crud
+
+    for user_id in ("a", "b"):
+        crud.get_or_create_user_profile(db, user_id)
+        for i in range(3):
+            crud.create_conversation(db, user_id, f"s{i % 2}", "user", f"{user_id}{i}")
+
+    for user_id in ("a", "b"):
+        db.expunge_all()
+        assert crud.get_user_profile(db, user_id).user_id == user_id
+        history = crud.get_conversation_history(db, user_id)
+        assert [r.message_content for r in history] == [f"{user_id}2", f"{user_id}1", f"{user_id}0"]
+        assert isinstance(history[0], Row)
+        assert [r.message_content for r in crud.get_conversation_history(db, user_id, session_id="s0", limit=1)] \
+            == [f"{user_id}2"]
+        assert len(crud.get_conversation_history(db, user_id, limit=2)) == 2
+    assert crud.get_user_profile(db, "missing") is None
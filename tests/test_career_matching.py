@@ -0,0 +1,140 @@
+# -*- coding: utf-8 -*-
+"""
+职业匹配引擎测试
+使用内存数据库验证画像编码、职业排序、推荐记录写入和批量重新打分
+"""
+
+import os
+import time
+
+import pytest
+
+PROJECT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+@pytest.fixture
+def profiles(db, major, matrix_file):
+    """3个职业、2个用户画像"""
+    from app import models, models_user_profile
+
+    db.add_all([
+        models.Occupation(id=1, name="软件开发工程师", industry="IT互联网",
+                          description="负责软件系统的设计、开发和维护",
+                          requirements=["编程能力", "算法基础", "团队协作"], salary_min=8000, salary_max=30000),
+        models.Occupation(id=2, name="平面设计师", industry="文化传媒",
+                          description="负责品牌视觉和平面设计的创意工作",
+                          requirements=["设计软件", "艺术审美", "创意能力"], salary_min=5000, salary_max=15000),
+        models.Occupation(id=3, name="中学教师", industry="教育",
+                          description="从事中学教育教学和学生培养",
+                          requirements=["沟通表达", "教育心理学"], salary_min=5000, salary_max=12000),
+        models.MajorOccupation(major_id=major.id, occupation_id=3, match_score=90),
+        models_user_profile.UserProfile(
+            user_id="u-tech", holland_code="IRC", mbti_type="INTJ",
+            ability_assessment={"logic": 9, "analysis": 8, "creativity": 4}, value_priorities=["创新空间", "收入"],
+            career_path_preference="technical"
+        ),
+        models_user_profile.UserProfile(
+            user_id="u-teacher", holland_code="SAE", ability_assessment={"communication": 9, "teamwork": 8},
+            value_priorities=["社会贡献"], preferred_majors=[major.id]
+        ),
+    ])
+    db.commit()
+    return db
+
+
+def test_match_profile(profiles):
+    """测试单个画像的职业排序"""
+    from app import models_user_profile
+    from app.services.career_matching import SKILL_KEYWORDS, _ability_vector, match_profile
+
+    # 前端能力自评的英文键和对话提取的中文能力名都映射到能力维度
+    dims = list(SKILL_KEYWORDS)
+    vector = _ability_vector({"logic": 8, "creativity": 6, "leadership": 7, "沟通能力": 9})
+    assert vector[dims.index("分析推理")] == 0.8 and vector[dims.index("创造创新")] == 0.6
+    assert vector[dims.index("组织协作")] == 0.7 and vector[dims.index("沟通表达")] == 0.9
+
+    db = profiles
+    tech = db.query(models_user_profile.UserProfile).filter_by(user_id="u-tech").one()
+    matches = match_profile(db, tech, limit=3)
+    assert matches[0].occupation_name == "软件开发工程师"
+    assert 0 < matches[0].match_score <= 100
+    assert matches[0].match_score >= matches[-1].match_score
+    assert matches[0].key_requirements == ["编程能力", "算法基础", "团队协作"]
+    assert matches[0].salary_range == "8000-30000"
+
+    teacher = db.query(models_user_profile.UserProfile).filter_by(user_id="u-teacher").one()
+    top = match_profile(db, teacher, limit=1)[0]
+    assert top.occupation_name == "中学教师"
+    assert "意向专业" in top.match_reason
+
+
+def test_form_options_mapped():
+    """测试画像表单的每个价值观选项和能力自评项都映射到至少一个维度"""
+    import re
+    from app.services.career_matching import _ability_vector, _value_vector
+
+    form_path = os.path.join(PROJECT_DIR, "profile-form.js")
+    with open(form_path, encoding="utf-8") as f:
+        form = f.read()
+    values_block = form[form.index("value_priorities: {"):form.index("ability_assessment: {")]
+    abilities_block = form[form.index("ability_assessment: {"):form.index("universal_skills: {")]
+    values = re.findall(r"\{ value: '([^']+)'", values_block)
+    abilities = re.findall(r"\{ key: '([^']+)'", abilities_block)
+    assert len(values) == 9 and len(abilities) == 6
+
+    unmapped = [v for v in values if not _value_vector([v]).any()]
+    unmapped += [a for a in abilities if not _ability_vector({a: 8}).any()]
+    assert unmapped == [], unmapped
+
+
+def test_recommendations_saved_and_rescored(profiles):
+    """测试推荐记录写入、反馈保留和批量重新打分"""
+    from app import models_user_profile
+    from app.services.career_matching import recommend_for_user, rescore_all_users
+
+    Recommendation = models_user_profile.UserCareerPathRecommendation
+    db = profiles
+    tech = db.query(models_user_profile.UserProfile).filter_by(user_id="u-tech").one()
+    recommend_for_user(db, tech, limit=2)
+    rows = db.query(Recommendation).filter_by(user_id="u-tech").order_by(Recommendation.recommendation_rank).all()
+    assert [r.recommendation_rank for r in rows] == [1, 2]
+    assert rows[0].occupation_id == 1
+    rows[0].user_feedback = "like"
+    db.commit()
+
+    assert rescore_all_users(db, limit=3) == 2
+    rows = db.query(Recommendation).filter_by(user_id="u-tech").order_by(Recommendation.recommendation_rank).all()
+    assert len(rows) == 3
+    assert rows[0].user_feedback == "like"
+    assert db.query(Recommendation).filter_by(user_id="u-teacher").count() == 3
+
+    # 画像分析只计算不写入，已保存的推荐和反馈不变
+    from app.api_user_profile import analyze_user_profile
+    saved_ids = [r.id for r in rows]
+    analysis = analyze_user_profile("u-tech", db)
+    assert len(analysis.career_paths) == 3
+    rows = db.query(Recommendation).filter_by(user_id="u-tech").order_by(Recommendation.recommendation_rank).all()
+    assert [r.id for r in rows] == saved_ids and rows[0].user_feedback == "like"
+
+
+def test_scoring_speed():
+    """测试1万个职业的打分耗时"""
+    import numpy as np
+    from app import models_user_profile
+    from app.services import career_matching
+
+    rng = np.random.default_rng(0)
+    features = career_matching._normalize_blocks(
+        rng.random((10000, career_matching.FEATURE_DIM), dtype=np.float32)
+    )
+    profile = models_user_profile.UserProfile(
+        user_id="bench", holland_code="IAS", mbti_type="ENFP",
+        ability_assessment={"logic": 7, "communication": 8}, value_priorities=["成就感"],
+        career_path_preference="professional"
+    )
+    start = time.perf_counter()
+    vector = career_matching.encode_profile(profile)
+    top = career_matching._top_k(features @ vector, 20)
+    elapsed = (time.perf_counter() - start) * 1000
+    assert len(top) == 20
+    assert elapsed < 500, f"top-20 of 10k took {elapsed:.2f} ms"
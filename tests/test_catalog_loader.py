@@ -0,0 +1,88 @@
+# -*- coding: utf-8 -*-
+"""
+专业目录导入测试
+在临时数据库上验证 catalog_loader：空库全量导入、重复导入无变化、
+修改数据文件后只更新变化的行、dry-run 不写入，以及代码重复时报错。
+"""
+
+import os
+import json
+import shutil
+
+import pytest
+from sqlalchemy import event
+from sqlalchemy.orm import sessionmaker
+
+# 导入会把数据库的全文索引标记为就绪
+pytestmark = pytest.mark.usefixtures("fresh_search_index")
+
+
+def test_full_load_and_idempotent(engine):
+    """测试空库导入与重复导入"""
+    from app import catalog_loader, models, search_index
+
+    commits = [0]
+    event.listen(engine, "commit", lambda conn: commits.__setitem__(0, commits[0] + 1))
+
+    report = catalog_loader.load_catalog(engine)
+    disciplines, categories, majors = catalog_loader.read_catalog()
+    assert report["disciplines"]["inserted"] == len(disciplines) == 10
+    assert report["major_categories"]["inserted"] == len(categories)
+    assert report["majors"]["inserted"] == len(majors) > 400
+    assert commits[0] == 1
+
+    again = catalog_loader.load_catalog(engine)
+    assert all(stats["inserted"] == stats["updated"] == 0 for stats in again.values())
+    assert again["majors"]["unchanged"] == len(majors)
+
+    db = sessionmaker(bind=engine)()
+    major = db.query(models.Major).filter(models.Major.code == "080901").first()
+    assert major.name == "计算机科学与技术" and major.category.code == "0809"
+    assert isinstance(major.main_courses, list) and major.main_courses
+    if search_index.is_fts_available(db):
+        assert search_index.rebuild_search_index(db, "majors_fts") == len(majors)
+    db.close()
+
+
+def test_incremental_update(engine, tmp_path):
+    """测试修改数据文件后只更新变化的行，dry-run 不写入"""
+    from app import catalog_loader, models
+
+    catalog_loader.load_catalog(engine)
+
+    data_dir = str(tmp_path / "catalog_data")
+    shutil.copytree(catalog_loader.CATALOG_DIR, data_dir)
+    path = os.path.join(data_dir, "09_agriculture.json")
+    with open(path, encoding="utf-8") as f:
+        document = json.load(f)
+    document["categories"][0]["majors"][0]["main_courses"].append("智慧农业")
+    document["categories"][0]["majors"].append({
+        "code": "090199T", "name": "测试专业", "description": "测试", "main_courses": ["测试课程"]
+    })
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(document, f, ensure_ascii=False)
+
+    preview = catalog_loader.load_catalog(engine, directory=data_dir, dry_run=True)
+    assert preview["majors"]["inserted"] == 1 and preview["majors"]["updated"] == 1
+    db = sessionmaker(bind=engine)()
+    assert db.query(models.Major).filter(models.Major.code == "090199T").count() == 0
+
+    report = catalog_loader.load_catalog(engine, directory=data_dir)
+    assert report["majors"] == {"inserted": 1, "updated": 1, "unchanged": preview["majors"]["unchanged"]}
+    assert report["disciplines"]["updated"] == 0
+    major = db.query(models.Major).filter(models.Major.code == "090101").first()
+    assert major.main_courses[-1] == "智慧农业"
+    assert db.query(models.Major).filter(models.Major.code == "090199T").first().duration == 4
+    db.close()
+
+
+def test_duplicate_codes_rejected(tmp_path):
+    """测试数据文件之间代码重复时报错"""
+    from app import catalog_loader
+
+    for name in ("a.json", "b.json"):
+        with open(tmp_path / name, "w", encoding="utf-8") as f:
+            json.dump({"code": "99", "name": "重复", "categories": []}, f, ensure_ascii=False)
+    with pytest.raises(ValueError) as excinfo:
+        catalog_loader.read_catalog(str(tmp_path))
+    assert "a.json" in str(excinfo.value) and "b.json" in str(excinfo.value)
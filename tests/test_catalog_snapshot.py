@@ -0,0 +1,47 @@
+# -*- coding: utf-8 -*-
+"""
+学科专业目录快照测试
+使用内存数据库验证快照构建、分页和失效逻辑
+"""
+
+
+def _seed(db):
+    from app import crud, schemas
+    d = crud.create_discipline(db, schemas.DisciplineCreate(name="工学", code="08"))
+    c = crud.create_major_category(db, schemas.MajorCategoryCreate(
+        name="计算机类", code="0809", discipline_id=d.id
+    ))
+    crud.create_major(db, schemas.MajorCreate(
+        name="软件工程", code="080902", category_id=c.id,
+        description="培养软件开发人才", duration=4, main_courses=["数据结构", "操作系统"]
+    ))
+    return d
+
+
+def test_snapshot_tree(db):
+    """测试快照树结构与原接口字段一致"""
+    from app.catalog_snapshot import build_catalog_snapshot
+
+    d = _seed(db)
+    snapshot = build_catalog_snapshot(db, version=7)
+
+    assert snapshot.version == 7
+    tree = snapshot.get_discipline(d.id).to_dict()
+    assert tree['name'] == "工学"
+    category = tree['majorCategories'][0]
+    assert category['disciplineId'] == d.id
+    major = category['majors'][0]
+    assert major['mainCourses'] == ["数据结构", "操作系统"]
+    assert set(major) == {'id', 'name', 'code', 'categoryId', 'description',
+                          'duration', 'mainCourses', 'createdAt'}
+    assert snapshot.get_discipline(9999) is None
+    assert snapshot.list_disciplines(skip=1, limit=10) == ()
+
+
+def test_snapshot_invalidation(db):
+    """测试目录写入后版本号递增"""
+    from app import catalog_snapshot, crud, schemas
+
+    before = catalog_snapshot.get_catalog_version()
+    crud.create_discipline(db, schemas.DisciplineCreate(name="理学", code="07"))
+    assert catalog_snapshot.get_catalog_version() == before + 1
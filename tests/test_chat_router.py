@@ -0,0 +1,82 @@
+# -*- coding: utf-8 -*-
+"""
+对话模式路由测试
+验证按消息长度、对话阶段和延迟预算选择快速模式/完整管线（超预算时的探测和样本过期），
+以及按模式统计延迟和提取质量。
+"""
+
+from app.services.chat_router import ChatModeRouter, RouteDecision
+
+
+def _result(fields=0, confidence=0.8):
+    return {
+        'extracted_info': [{'field': f'f{i}', 'value': i, 'confidence': confidence} for i in range(fields)],
+        'profile_updates': {},
+    }
+
+
+def test_routing_rules():
+    """测试路由规则"""
+    router = ChatModeRouter(mode="auto", fast_max_chars=10, latency_budget_ms=5000)
+
+    assert router.choose("你好", "initial") == RouteDecision("fast", "short_message")
+    assert router.choose("我喜欢编程", "deepening") == RouteDecision("full", "detailed")
+    assert router.choose("我大学学的是计算机，但更喜欢做设计", "exploring") == RouteDecision("full", "detailed")
+
+    # 完整管线样本不足时不按预算路由
+    for _ in range(4):
+        router.record(RouteDecision("full", "detailed"), 9000, _result())
+    assert router.choose("我大学学的是计算机，但更喜欢做设计", "exploring").mode == "full"
+    router.record(RouteDecision("full", "detailed"), 9000, _result())
+    assert router.choose("我大学学的是计算机，但更喜欢做设计", "exploring") == RouteDecision("fast", "over_budget")
+
+    assert ChatModeRouter(mode="full").choose("你好", "initial") == RouteDecision("full", "forced")
+    assert ChatModeRouter(mode="fast").choose("很长的消息" * 50, "deepening") == RouteDecision("fast", "forced")
+
+
+def test_budget_recovery():
+    """测试超出预算后通过探测和样本过期恢复完整管线"""
+    now = [0.0]
+    router = ChatModeRouter(mode="auto", fast_max_chars=10, latency_budget_ms=5000,
+                            window_seconds=60, probe_every=3, clock=lambda: now[0])
+    message = "我大学学的是计算机，但更喜欢做设计"
+    for _ in range(5):
+        router.record(RouteDecision("full", "detailed"), 9000, _result())
+
+    # 每3次超预算路由中有1次探测完整管线
+    decisions = [router.choose(message, "exploring") for _ in range(6)]
+    assert [d.reason for d in decisions] == ["over_budget", "over_budget", "budget_probe"] * 2
+    assert decisions[2] == RouteDecision("full", "budget_probe")
+
+    # 探测样本恢复到预算内后重新走完整管线
+    for _ in range(6):
+        router.record(RouteDecision("full", "budget_probe"), 1000, _result())
+    assert router.choose(message, "exploring") == RouteDecision("full", "detailed")
+
+    # 旧样本超出时间窗口后不再按预算路由
+    router.reset()
+    for _ in range(5):
+        router.record(RouteDecision("full", "detailed"), 9000, _result())
+    assert router.choose(message, "exploring").reason == "over_budget"
+    now[0] = 61.0
+    assert router.estimate_ms("full") is None
+    assert router.choose(message, "exploring") == RouteDecision("full", "detailed")
+
+
+def test_mode_stats():
+    """测试按模式统计延迟和提取质量"""
+    router = ChatModeRouter(mode="auto")
+    for latency in (100, 200, 300):
+        router.record(RouteDecision("fast", "short_message"), latency, _result(fields=1, confidence=0.6))
+    router.record(RouteDecision("full", "detailed"), 4000, _result(fields=3, confidence=0.9))
+
+    stats = router.stats()["modes"]
+    assert stats["fast"]["requests"] == 3
+    assert stats["fast"]["p50_ms"] == 200
+    assert stats["fast"]["avg_fields"] == 1
+    assert stats["fast"]["avg_confidence"] == 0.6
+    assert stats["fast"]["reasons"] == {"short_message": 3}
+    assert stats["full"]["avg_fields"] == 3
+
+    router.reset()
+    assert router.stats()["modes"]["fast"]["requests"] == 0
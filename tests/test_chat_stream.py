@@ -0,0 +1,133 @@
+# -*- coding: utf-8 -*-
+"""
+流式对话接口测试
+用逐段产生回复的假RAG服务验证 POST /api/user-profiles/{user_id}/chat/stream：
+事件顺序（token -> profile_updates -> suggested_questions -> done）、首个片段在分析完成前到达，
+响应结束后才写入对话记录和画像更新，以及出错时发送 error 事件且不写入。
+"""
+
+import asyncio
+import json
+import time
+
+import pytest
+from fastapi import FastAPI
+from sqlalchemy.orm import sessionmaker
+
+
+class _FakeStreamService:
+    """第一个片段立即产生，随后的分析（提取、追问）耗时 0.5 秒"""
+
+    def __init__(self, fail=False):
+        self.fail = fail
+
+    async def astream_message(self, user_message, user_profile, conversation_history=None, preprocessed=None):
+        if self.fail:
+            raise RuntimeError("LLM unavailable")
+        for text in ("你好，", "喜欢数据分析", "很不错！"):
+            yield "token", text
+            await asyncio.sleep(0.05)
+        await asyncio.sleep(0.35)
+        yield "result", {
+            "reply": "你好，喜欢数据分析很不错！",
+            "intent": "share_interest",
+            "extracted_info": [{"field": "value_priorities", "value": ["成就感"], "confidence": 0.8}],
+            "profile_updates": {},
+            "suggested_questions": ["你用过哪些分析工具？"],
+            "conversation_stage": "initial",
+        }
+
+
+@pytest.fixture
+def make_app(engine):
+    """make_app(service) 创建使用 engine 和假RAG服务的应用，返回 (app, Session)；测试结束时恢复服务注册"""
+    from app import api_user_profile
+    from app.services import registry
+
+    Session = sessionmaker(autoflush=False, bind=engine)
+
+    def get_db():
+        db = Session()
+        try:
+            yield db
+        finally:
+            db.close()
+
+    def factory(service):
+        registry.register_service("dspy_rag", lambda: service)
+        app = FastAPI()
+        app.include_router(api_user_profile.router)
+        app.dependency_overrides[api_user_profile.get_db] = get_db
+        return app, Session
+
+    yield factory
+    registry.register_service("dspy_rag", registry._dspy_rag_service)
+
+
+async def _post_stream(app, path, payload):
+    """直接调用ASGI应用，返回 (各响应体片段到达时间, 解析后的事件, 发送完成时间)"""
+    body = json.dumps(payload).encode()
+    received = {"sent": False}
+    chunks, start = [], time.perf_counter()
+
+    async def receive():
+        if not received["sent"]:
+            received["sent"] = True
+            return {"type": "http.request", "body": body, "more_body": False}
+        await asyncio.sleep(3600)
+
+    async def send(message):
+        if message["type"] == "http.response.body" and message.get("body"):
+            chunks.append((time.perf_counter() - start, message["body"].decode()))
+
+    scope = {
+        "type": "http", "asgi": {"version": "3.0"}, "http_version": "1.1", "method": "POST",
+        "scheme": "http", "path": path, "raw_path": path.encode(), "query_string": b"", "root_path": "",
+        "headers": [(b"content-type", b"application/json")], "client": ("test", 1), "server": ("test", 80),
+    }
+    await app(scope, receive, send)
+    events = []
+    for block in "".join(text for _, text in chunks).strip().split("\n\n"):
+        event, data = block.split("\n")
+        events.append((event[len("event: "):], json.loads(data[len("data: "):])))
+    return chunks, events, time.perf_counter() - start
+
+
+def test_stream_events_and_deferred_save(make_app):
+    """测试事件顺序、首个片段延迟和响应结束后写入"""
+    from app import crud_user_profile as crud
+
+    app, Session = make_app(_FakeStreamService())
+    chunks, events, total = asyncio.run(
+        _post_stream(app, "/api/user-profiles/u_stream/chat/stream", {"message": "我喜欢数据分析"})
+    )
+
+    names = [name for name, _ in events]
+    assert names == ["token", "token", "token", "profile_updates", "suggested_questions", "done"], names
+    assert "".join(data["text"] for name, data in events if name == "token") == "你好，喜欢数据分析很不错！"
+    updates = dict(events)["profile_updates"]
+    assert updates["updated_fields"] == ["value_priorities"]
+    assert dict(events)["suggested_questions"]["questions"] == ["你用过哪些分析工具？"]
+
+    first_chunk = chunks[0][0]
+    assert first_chunk < 0.2 and total >= 0.5, (first_chunk, total)
+
+    # 后台任务在响应发送完成后写入
+    with Session() as db:
+        history = crud.get_conversation_history(db, "u_stream")
+        assert [r.message_role for r in history] == ["assistant", "user"]
+        assert crud.get_user_profile(db, "u_stream").value_priorities == ["成就感"]
+
+
+def test_stream_error(make_app):
+    """测试出错时发送 error 事件且不写入"""
+    from app import crud_user_profile as crud
+
+    app, Session = make_app(_FakeStreamService(fail=True))
+    _, events, _ = asyncio.run(
+        _post_stream(app, "/api/user-profiles/u_fail/chat/stream", {"message": "你好"})
+    )
+
+    assert events == [("error", {"message": "LLM unavailable"})]
+    with Session() as db:
+        assert crud.get_conversation_history(db, "u_fail") == []
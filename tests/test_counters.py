@@ -0,0 +1,76 @@
+# -*- coding: utf-8 -*-
+"""
+写回式计数器测试
+验证并发点赞不丢增量、读取叠加未写回增量以及批量写回
+"""
+
+import threading
+
+import pytest
+from sqlalchemy import text
+
+
+@pytest.fixture
+def shares(engine, db, major):
+    """两条经验分享，点赞数分别为5和NULL"""
+    from app import models
+
+    experience = models.PersonalExperience(
+        nickname="u", major_id=major.id, education="本科", school_name="某大学", experience="经历"
+    )
+    db.add(experience)
+    db.commit()
+    with engine.begin() as conn:
+        conn.execute(text(
+            "INSERT INTO experience_shares (id, experience_id, title, content, likes) VALUES "
+            "(1, :experience_id, '分享1', '内容', 5), (2, :experience_id, '分享2', '内容', NULL)"
+        ), {"experience_id": experience.id})
+    return engine
+
+
+def _stored_likes(engine, share_id):
+    with engine.connect() as conn:
+        return conn.execute(text("SELECT likes FROM experience_shares WHERE id = :id"), {"id": share_id}).scalar()
+
+
+def test_concurrent_increments(shares):
+    """测试并发累加与批量写回"""
+    from app.counters import WriteBehindCounter
+
+    engine = shares
+    counter = WriteBehindCounter("experience_shares", "likes", interval=60, bind=engine)
+
+    def click():
+        for _ in range(500):
+            counter.increment(1)
+        counter.increment(2)
+
+    threads = [threading.Thread(target=click) for _ in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert _stored_likes(engine, 1) == 5
+    assert counter.current(1, 5) == 4005
+    rows = [{"id": 1, "likes": 5}, {"id": 2, "likes": None}]
+    counter.overlay(rows)
+    assert [r["likes"] for r in rows] == [4005, 8]
+
+    assert counter.flush() == 2
+    assert _stored_likes(engine, 1) == 4005
+    assert _stored_likes(engine, 2) == 8
+    assert counter.pending(1) == 0
+    assert counter.flush() == 0
+    counter.close()
+
+
+def test_failed_flush_retries(shares):
+    """测试写回失败后增量保留"""
+    from app.counters import WriteBehindCounter
+
+    engine = shares
+    counter = WriteBehindCounter("missing_table", "likes", interval=60, bind=engine)
+    counter.increment(1, 3)
+    assert counter.flush() == 0
+    assert counter.pending(1) == 3
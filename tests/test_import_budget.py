@@ -0,0 +1,46 @@
+# -*- coding: utf-8 -*-
+"""
+启动导入测试
+验证导入 app.main 不导入LLM框架、不初始化数据库，且累计导入耗时在预算内；
+以及服务注册表按需创建服务、dspy 不可用时对话回退到 LazyLLM 版RAG服务。
+"""
+
+
+def test_startup_imports():
+    """测试 app.main 的导入耗时与导入内容"""
+    from app import import_budget
+
+    # 测试环境负载不稳定，使用宽松预算
+    result = import_budget.check_budget(budget_ms=10000, top=5)
+    assert not result["forbidden"], result["forbidden"]
+    assert "[API] Database initialized" not in result["stdout"]
+    assert result["ok"]
+
+
+def test_registry_lazy_services():
+    """测试服务按需创建与回退"""
+    from app.services import registry
+
+    calls = []
+    registry.register_service("probe", lambda: calls.append(1) or object())
+    try:
+        assert calls == [] and "probe" not in registry.loaded_services()
+        first = registry.get_service("probe")
+        assert registry.get_service("probe") is first and calls == [1]
+
+        def missing():
+            raise ImportError("No module named 'probe_framework'")
+
+        registry.register_service("missing", missing)
+        assert registry.try_get_service("missing") is None
+
+        try:
+            import dspy  # noqa: F401
+        except ImportError:
+            service = registry.get_chat_service()
+            assert service is registry.get_service("rag")
+            assert "dspy_rag" not in registry.loaded_services()
+    finally:
+        registry._factories.pop("probe", None)
+        registry._factories.pop("missing", None)
+        registry.reset_services()
@@ -0,0 +1,77 @@
+# -*- coding: utf-8 -*-
+"""
+JSONText 列类型与数据迁移测试
+验证列表自动编解码、旧脚本预编码字符串兼容、脏数据回退及历史数据规范化
+"""
+
+import json
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.exc import StatementError
+from sqlalchemy.orm import sessionmaker
+
+
+@pytest.fixture
+def engine(make_engine):
+    """尚未执行迁移的SQLite数据库（JSONText 列以文本存储）"""
+    return make_engine("json.db")
+
+
+@pytest.fixture
+def category(engine):
+    """专业所属的学科门类和专业类"""
+    with engine.begin() as conn:
+        conn.execute(text("INSERT INTO disciplines (id, name, code) VALUES (1, '工学', '08')"))
+        conn.execute(text("INSERT INTO major_categories (id, name, code, discipline_id) VALUES (1, '计算机类', '0809', 1)"))
+    return 1
+
+
+def test_round_trip(category, db):
+    """测试列表写入与读取"""
+    from app import models
+
+    db.add(models.Major(name="软件工程", code="080902", category_id=category, main_courses=["软件测试", "项目管理"]))
+    # 旧初始化脚本传入的预编码字符串原样写入
+    db.add(models.Major(name="网络工程", code="080903", category_id=category,
+                        main_courses=json.dumps(["计算机网络"], ensure_ascii=False)))
+    db.commit()
+    db.expunge_all()
+
+    majors = db.query(models.Major).order_by(models.Major.id).all()
+    assert majors[0].main_courses == ["软件测试", "项目管理"]
+    assert majors[1].main_courses == ["计算机网络"]
+    raw = db.execute(text("SELECT main_courses FROM majors WHERE id = :id"), {"id": majors[0].id}).scalar()
+    assert raw == '["软件测试", "项目管理"]'
+
+    # 非JSON字符串写入时报错，而不是读取时静默变为空列表
+    db.add(models.Major(name="物联网工程", code="080905", category_id=category, main_courses="传感器、嵌入式"))
+    with pytest.raises(StatementError) as excinfo:
+        db.commit()
+    assert isinstance(excinfo.value.orig, ValueError)
+    db.rollback()
+
+
+def test_migration_normalizes_legacy_rows(category, engine):
+    """测试迁移规范化历史数据"""
+    from app import models
+    from app.migrations import run_migrations
+
+    with engine.begin() as conn:
+        conn.execute(text(
+            "INSERT INTO majors (id, name, code, category_id, main_courses) VALUES "
+            "(1, 'A', 'a', 1, '数据结构、操作系统'), (2, 'B', 'b', 1, ''), (3, 'C', 'c', 1, '[\"编译原理\"]')"
+        ))
+
+    Session = sessionmaker(bind=engine)
+    with Session() as db:
+        # 迁移前脏数据回退为空列表
+        assert db.get(models.Major, 1).main_courses == []
+
+    assert "0001_normalize_json_text_columns" in run_migrations(engine)
+    assert run_migrations(engine) == []
+
+    with Session() as db:
+        assert db.get(models.Major, 1).main_courses == ["数据结构", "操作系统"]
+        assert db.get(models.Major, 2).main_courses is None
+        assert db.get(models.Major, 3).main_courses == ["编译原理"]
@@ -0,0 +1,70 @@
+# -*- coding: utf-8 -*-
+"""
+游标分页测试
+验证游标编解码、(created_at, id) 键集翻页不重不漏以及计数缓存失效
+"""
+
+from datetime import datetime
+
+import pytest
+
+
+@pytest.fixture(autouse=True)
+def _reset_counts():
+    """每个测试使用新的数据库，清空计数缓存"""
+    from app.pagination import invalidate_counts
+    invalidate_counts()
+
+
+def test_cursor_codec():
+    """测试游标编解码"""
+    from app.pagination import encode_cursor, decode_time_cursor, decode_id_cursor
+
+    ts = datetime(2024, 5, 1, 12, 30, 0, 123456)
+    assert decode_time_cursor(encode_cursor(ts, 42)) == (ts, 42)
+    assert decode_id_cursor(encode_cursor(7)) == 7
+    for bad in ["not-a-cursor", encode_cursor(1, 2, 3), encode_cursor("x", 1)]:
+        with pytest.raises(ValueError):
+            decode_time_cursor(bad)
+
+
+def test_keyset_pages(db, major):
+    """测试键集翻页（created_at 相同时按id区分）"""
+    from app import crud, models
+
+    same_time = datetime(2024, 1, 1)
+    for i in range(7):
+        db.add(models.PersonalExperience(
+            nickname=f"u{i}", major_id=major.id, education="本科", school_name="某大学",
+            experience="经历", created_at=same_time if i < 4 else datetime(2024, 1, 2 + i)
+        ))
+    db.commit()
+
+    seen, cursor = [], None
+    while True:
+        page = crud.get_personal_experiences(db, limit=3, cursor=cursor)
+        assert page["total"] == 7
+        seen.extend(item.id for item in page["items"])
+        cursor = page["next_cursor"]
+        if not cursor:
+            break
+    assert sorted(seen) == list(range(1, 8))
+    assert len(seen) == len(set(seen))
+    assert seen[:3] == [7, 6, 5]
+
+
+def test_count_cache_invalidation(db, major):
+    """测试写入后计数缓存失效"""
+    from app import crud, schemas
+
+    data = dict(nickname="u", major_id=major.id, education="本科", school_name="某大学", experience="经历")
+    crud.create_personal_experience(db, schemas.PersonalExperienceCreate(**data))
+    assert crud.get_personal_experiences(db)["total"] == 1
+    crud.create_personal_experience(db, schemas.PersonalExperienceCreate(**data))
+    assert crud.get_personal_experiences(db)["total"] == 2
+
+    # 任意学校名不会让缓存无限增长
+    from app import pagination
+    for i in range(pagination.COUNT_CACHE_MAX_ENTRIES + 50):
+        crud.get_personal_experiences(db, school_name=f"学校{i}")
+    assert len(pagination._counts) == pagination.COUNT_CACHE_MAX_ENTRIES
@@ -0,0 +1,31 @@
+# -*- coding: utf-8 -*-
+"""
+查询计划审计测试
+验证高频CRUD路径没有未确认的全表扫描或临时B树排序，且所有查询函数都有审计场景
+"""
+
+
+def test_plan_findings():
+    """测试计划行的问题识别"""
+    from app.query_audit import _plan_findings
+
+    plan = [
+        (2, 0, 0, "SCAN career_paths"),
+        (3, 0, 0, "SEARCH report_chapters USING INDEX ix_report_chapters_report_order (report_id=?)"),
+        (4, 0, 0, "SCAN majors_fts VIRTUAL TABLE INDEX 0:M1"),
+        (5, 0, 0, "SCAN anon_1"),
+        (6, 0, 0, "USE TEMP B-TREE FOR ORDER BY"),
+        (7, 0, 0, "SCAN majors USING COVERING INDEX ix_majors_category_id_id"),
+    ]
+    tables = {"career_paths", "report_chapters", "majors"}
+    assert _plan_findings(plan, tables) == ["SCAN career_paths", "USE TEMP B-TREE FOR ORDER BY"]
+
+
+def test_hot_paths_use_indexes():
+    """测试所有审计场景没有未确认的问题"""
+    from app.query_audit import run_audit
+
+    findings, uncovered = run_audit(source=None)
+    unexpected = [f"{f.function}: {f.detail}" for f in findings if not f.expected]
+    assert not unexpected, unexpected
+    assert not uncovered, uncovered
@@ -0,0 +1,139 @@
+# -*- coding: utf-8 -*-
+"""
+请求级查询统计测试
+验证SQL规范化、N+1 标记、响应头、按路由汇总与诊断接口，raise 模式下的查询预算，
+以及后台任务和写线程任务的归属
+"""
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import text
+
+
+@pytest.fixture
+def items_client(make_engine, monkeypatch):
+    """返回 (TestClient, engine)：单条查询和逐行查询（N+1）两个路由；统计与预算在测试后恢复"""
+    from app import query_stats
+    from app.api_diagnostics import router as diagnostics_router
+
+    query_stats.reset_query_stats()
+    monkeypatch.setattr(query_stats, "QUERY_BUDGET_MODE", "log")
+    monkeypatch.setattr(query_stats, "ROUTE_BUDGETS", dict(query_stats.ROUTE_BUDGETS))
+    engine = make_engine("items.db")
+    with engine.begin() as conn:
+        conn.execute(text("CREATE TABLE items (id INTEGER PRIMARY KEY, name TEXT)"))
+        conn.execute(text("INSERT INTO items (name) VALUES ('a'), ('b'), ('c'), ('d'), ('e'), ('f')"))
+
+    app = FastAPI()
+    app.add_middleware(query_stats.QueryStatsMiddleware)
+    app.include_router(diagnostics_router)
+
+    @app.get("/items/{item_id}")
+    def read_item(item_id: int):
+        with engine.connect() as conn:
+            return {"name": conn.execute(text("SELECT name FROM items WHERE id = :id"), {"id": item_id}).scalar()}
+
+    @app.get("/items")
+    def read_items():
+        # 逐行查询（N+1）
+        with engine.connect() as conn:
+            ids = conn.execute(text("SELECT id FROM items")).scalars().all()
+            return [conn.execute(text("SELECT name FROM items WHERE id = :id"), {"id": i}).scalar() for i in ids]
+
+    yield TestClient(app), engine
+    query_stats.reset_query_stats()
+
+
+def test_normalize_sql():
+    """测试SQL规范化"""
+    from app.query_stats import normalize_sql
+
+    assert normalize_sql("SELECT * FROM t_1 WHERE id IN (?, ?,  ?) AND name = 'x'  LIMIT 10") == \
+        "SELECT * FROM t_1 WHERE id IN (...) AND name = ? LIMIT ?"
+    assert normalize_sql("SELECT a FROM t WHERE b = %(b_1)s AND c IN (%(c_1)s, %(c_2)s)") == \
+        "SELECT a FROM t WHERE b = %(b_1)s AND c IN (...)"
+
+
+def test_request_stats_and_diagnostics(items_client):
+    """测试响应头、N+1 标记与诊断接口"""
+    client, _ = items_client
+
+    response = client.get("/items/2")
+    assert response.json() == {"name": "b"}
+    assert response.headers["x-db-queries"] == "1"
+
+    response = client.get("/items")
+    assert response.headers["x-db-queries"] == "7"
+
+    stats = client.get("/api/diagnostics/queries").json()
+    routes = {route["route"]: route for route in stats["routes"]}
+    listing = routes["GET /items"]
+    assert listing["queries_max"] == 7 and listing["n_plus_one"] == 1
+    assert listing["top_statements"][0] == {"sql": "SELECT name FROM items WHERE id = ?", "count": 6}
+    assert routes["GET /items/{item_id}"]["requests"] == 1
+    assert stats["recent"][-1]["n_plus_one"][0]["count"] == 6
+
+    client.delete("/api/diagnostics/queries")
+    assert client.get("/api/diagnostics/queries").json()["routes"] == []
+
+
+def test_budget_raise_mode(items_client):
+    """测试 raise 模式下超出路由预算"""
+    from app import query_stats
+
+    client, _ = items_client
+    query_stats.ROUTE_BUDGETS["GET /items"] = 3
+    query_stats.QUERY_BUDGET_MODE = "raise"
+    assert client.get("/items/1").status_code == 200
+    with pytest.raises(query_stats.QueryBudgetExceeded, match="query #4 exceeds budget 3"):
+        client.get("/items")
+
+
+def test_background_tasks_and_writer_thread(items_client, make_engine):
+    """测试请求启动的后台任务不计入请求统计，写线程中的任务计入提交它的请求"""
+    import asyncio
+    import time
+    from app import query_stats
+    from app.write_queue import WriteQueue
+
+    client, engine = items_client
+    seen = []
+
+    async def background(delay):
+        await asyncio.sleep(delay)
+        with engine.connect() as conn:
+            for i in range(1, 6):
+                conn.execute(text("SELECT name FROM items WHERE id = :id"), {"id": i})
+        seen.append(query_stats.current_query_stats())
+
+    @client.app.post("/spawn")
+    async def spawn(detached: bool = False):
+        if detached:
+            query_stats.run_detached(asyncio.create_task, background(0))
+        else:
+            asyncio.create_task(background(0.05))
+        return {}
+
+    query_stats.ROUTE_BUDGETS["POST /spawn"] = 2
+    query_stats.QUERY_BUDGET_MODE = "raise"
+    with client:
+        response = client.post("/spawn", params={"detached": True})
+        assert response.headers["x-db-queries"] == "0"
+        response = client.post("/spawn")
+        for _ in range(100):
+            if len(seen) == 2:
+                break
+            time.sleep(0.01)
+    # 脱离请求上下文启动的任务不带统计；复制了请求上下文的任务在请求结束后不再计入（也不触发预算）
+    assert seen[0] is None
+    assert seen[1].closed and seen[1].count == 0
+    assert "POST /spawn" not in {route["route"] for route in query_stats.get_query_stats()["routes"]}
+
+    write_queue = WriteQueue(make_engine("queue.db").url)
+    try:
+        with query_stats.track_queries("job") as stats:
+            write_queue.submit(lambda db: db.execute(text("SELECT 1")).all()).result(timeout=5)
+        assert stats.statements == {"SELECT ?": [1, stats.statements["SELECT ?"][1]]}
+    finally:
+        write_queue.close()
@@ -0,0 +1,93 @@
+# -*- coding: utf-8 -*-
+"""
+专业-职业推荐测试
+使用内存数据库验证批量专业详情（窗口函数截取前N个相关职业）、
+稀疏推荐矩阵的双向前K查询、增量更新和文件持久化
+"""
+
+import os
+
+import pytest
+
+
+@pytest.fixture
+def catalog(db, major_category):
+    """3个专业、4个职业，专业1关联全部职业，专业3无关联"""
+    from app import models
+
+    for i in range(1, 4):
+        db.add(models.Major(id=i, name=f"专业{i}", code=f"M{i}", category_id=major_category.id, main_courses=["课程"]))
+    for i in range(1, 5):
+        db.add(models.Occupation(id=i, name=f"职业{i}", requirements=["能力"]))
+    for occupation_id, score in [(1, 60), (2, 95), (3, 80), (4, 70)]:
+        db.add(models.MajorOccupation(major_id=1, occupation_id=occupation_id, match_score=score))
+    db.add(models.MajorOccupation(major_id=2, occupation_id=4, match_score=90))
+    db.commit()
+    return db
+
+
+def test_majors_batch(catalog):
+    """测试批量专业详情"""
+    from app import crud
+
+    db = catalog
+    details = crud.get_majors_batch(db, [3, 1, 99, 2], top_n=2)
+    assert [d["major"].id for d in details] == [3, 1, 2]
+    assert details[0]["related_occupations"] == []
+    assert [(r["occupation"].id, r["match_score"]) for r in details[1]["related_occupations"]] == [(2, 95), (3, 80)]
+    assert [r["occupation"].id for r in details[2]["related_occupations"]] == [4]
+    assert crud.get_majors_batch(db, []) == []
+
+
+def test_matrix_lookup_and_update():
+    """测试推荐矩阵双向查询与增量更新"""
+    from app.recommendation_matrix import RecommendationMatrix
+
+    matrix = RecommendationMatrix.from_rows(
+        [(1, 1, 60), (1, 2, 95), (1, 3, 80), (2, 2, 70), (1, 1, 65)], top_k=2
+    )
+    assert matrix.occupations_for_major(1) == ((2, 95), (3, 80))
+    assert matrix.majors_for_occupation(2) == ((1, 95), (2, 70))
+    assert matrix.occupations_for_major(99) == ()
+
+    matrix.update(1, 1, 99)
+    matrix.update(3, 2, 100)
+    assert matrix.occupations_for_major(1) == ((1, 99), (2, 95))
+    assert matrix.majors_for_occupation(2) == ((3, 100), (1, 95))
+    # 得分下降后由未进入前K的条目补位
+    matrix.update(1, 1, 10)
+    assert matrix.occupations_for_major(1) == ((2, 95), (3, 80))
+    matrix.compact()
+    assert matrix.occupations_for_major(1) == ((2, 95), (3, 80))
+
+
+def test_matrix_persistence(catalog, matrix_file):
+    """测试推荐矩阵文件热启动与增量写入"""
+    from app import crud, recommendation_matrix
+
+    db = catalog
+    first = crud.get_recommended_occupations(db, 1, limit=2)
+    assert [(r["occupation"].id, r["match_score"]) for r in first] == [(2, 95), (3, 80)]
+    assert os.path.exists(matrix_file)
+
+    loaded = recommendation_matrix.RecommendationMatrix.load()
+    assert loaded.fingerprint[:2] == (5, 5)
+    assert loaded.fingerprint == recommendation_matrix._db_fingerprint(db)
+    assert loaded.majors_for_occupation(4) == ((2, 90), (1, 70))
+    assert os.listdir(os.path.dirname(matrix_file)) == ["matrix.bin"]
+
+    crud.create_major_occupation(db, major_id=3, occupation_id=4, match_score=99)
+    majors = crud.get_recommended_majors(db, 4)
+    assert [(r["major"].id, r["match_score"]) for r in majors] == [(3, 99), (2, 90), (1, 70)]
+    # 增量更新后的指纹与数据库一致
+    matrix = recommendation_matrix.get_recommendation_matrix(db)
+    assert matrix.fingerprint == recommendation_matrix._db_fingerprint(db)
+    matrix.save()
+
+    # 原地修改匹配度（行数和最大ID不变）后，文件指纹不再匹配，重新构建
+    from app import models
+    db.query(models.MajorOccupation).filter_by(major_id=2, occupation_id=4).update({"match_score": 50})
+    db.commit()
+    recommendation_matrix.reset_recommendation_matrix()
+    majors = crud.get_recommended_majors(db, 4)
+    assert [(r["major"].id, r["match_score"]) for r in majors] == [(3, 99), (1, 70), (2, 50)]
@@ -0,0 +1,75 @@
+# -*- coding: utf-8 -*-
+"""
+对话回复缓存测试
+验证消息规范化、按画像摘要+对话阶段分区的近似匹配（含否定词检查）、
+提取信息只在完全相同时复用，以及 LRU/TTL 淘汰和命中率指标。
+"""
+
+import time
+
+from app.services.reply_cache import ReplyCache, normalize_message
+
+NEW_USER = "（新用户）"
+
+
+def _result(reply, field="practice_experiences"):
+    return {
+        'reply': reply,
+        'suggested_questions': ["能具体说说吗？"],
+        'intent': 'express_confusion',
+        'extracted_info': [{'field': field, 'value': reply, 'confidence': 0.8}],
+        'profile_updates': {'career_path_preference': 'technical'},
+        'pipeline': {'wall_ms': 3000.0},
+    }
+
+
+def test_near_duplicate_lookup():
+    """测试规范化与近似匹配"""
+    assert normalize_message("我不知道想做什么啊！！") == "我不知道想做什么"
+    assert normalize_message("ＡＩ 方向？") == "ai方向"
+
+    cache = ReplyCache(threshold=0.8)
+    cache.put("我不知道想做什么", NEW_USER, "initial", _result("迷茫很正常"))
+
+    hit = cache.get("我不知道想做什么呀。", NEW_USER, "initial")
+    assert hit.exact and hit.similarity == 1.0
+    assert hit.result['extracted_info'] and hit.result['profile_updates']
+    assert 'pipeline' not in hit.result
+
+    hit = cache.get("我不知道我想做什么", NEW_USER, "initial")
+    assert hit is not None and not hit.exact and hit.similarity >= 0.8
+    assert hit.result['reply'] == "迷茫很正常"
+    assert hit.result['extracted_info'] == [] and hit.result['profile_updates'] == {}
+
+    # 否定词不同、分区不同、相似度不足时不命中
+    assert cache.get("我知道想做什么", NEW_USER, "initial") is None
+    assert cache.get("我不知道想做什么", NEW_USER, "exploring") is None
+    assert cache.get("我不知道想做什么", "霍兰德代码: RIA", "initial") is None
+    assert cache.get("我喜欢打篮球", NEW_USER, "initial") is None
+
+    # 返回的是副本
+    hit.result['suggested_questions'].append("x")
+    assert cache.get("我不知道想做什么", NEW_USER, "initial").result['suggested_questions'] == ["能具体说说吗？"]
+
+
+def test_eviction_and_stats():
+    """测试 LRU/TTL 淘汰和指标"""
+    cache = ReplyCache(max_entries=2, ttl=60, threshold=0.8)
+    cache.put("我喜欢打篮球", NEW_USER, "initial", _result("a"))
+    cache.put("我想当医生", NEW_USER, "initial", _result("b"))
+    assert cache.get("我喜欢打篮球", NEW_USER, "initial") is not None   # 篮球变为最近使用
+    cache.put("我对未来很迷茫", NEW_USER, "initial", _result("c"))
+    assert cache.get("我想当医生", NEW_USER, "initial") is None
+    assert cache.get("我喜欢打篮球", NEW_USER, "initial") is not None
+
+    cache.ttl = 0.05
+    time.sleep(0.1)
+    assert cache.get("我对未来很迷茫", NEW_USER, "initial") is None
+
+    stats = cache.stats()
+    assert stats['exact_hits'] == 2 and stats['misses'] == 2 and stats['hit_rate'] == 0.5
+    # 查找时只清理候选中的过期条目；其余过期条目在下次淘汰时清理
+    assert stats['evicted'] == 1 and stats['expired'] == 1 and stats['puts'] == 3
+    assert stats['entries'] == 1
+    cache.clear()
+    assert cache.stats()['entries'] == 0
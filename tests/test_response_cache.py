@@ -0,0 +1,94 @@
+# -*- coding: utf-8 -*-
+"""
+目录接口响应缓存测试
+验证编码字节缓存、ETag条件请求、按目录版本失效，以及按 Accept-Encoding 选择编码
+"""
+
+import pytest
+from fastapi import FastAPI, Request
+from fastapi.testclient import TestClient
+
+
+@pytest.fixture
+def catalog_client():
+    """返回 (TestClient, 构建次数)；测试前后清空响应缓存"""
+    from app.response_cache import cached_catalog_response, get_catalog_response_cache
+
+    get_catalog_response_cache().clear()
+    calls = {"count": 0}
+    app = FastAPI()
+
+    @app.get("/items")
+    def read_items(request: Request):
+        def build():
+            calls["count"] += 1
+            return {"code": 200, "message": "success", "data": {"items": ["专业"] * 500}}
+        return cached_catalog_response(request, build)
+
+    yield TestClient(app), calls
+    get_catalog_response_cache().clear()
+
+
+def test_etag_and_304(catalog_client):
+    """测试ETag与304响应"""
+    client, calls = catalog_client
+
+    first = client.get("/items")
+    assert first.status_code == 200
+    assert first.json()["data"]["items"][0] == "专业"
+    etag = first.headers["etag"]
+
+    second = client.get("/items", headers={"If-None-Match": etag})
+    assert second.status_code == 304
+    assert second.content == b""
+    assert calls["count"] == 1
+
+
+def test_version_invalidation(catalog_client):
+    """测试目录版本变化后重新构建"""
+    from app.catalog_snapshot import invalidate_catalog_snapshot
+
+    client, calls = catalog_client
+    etag = client.get("/items").headers["etag"]
+    invalidate_catalog_snapshot()
+    response = client.get("/items", headers={"If-None-Match": etag})
+    # 内容未变，ETag相同，但响应体需要重新构建
+    assert response.status_code == 304
+    assert calls["count"] == 2
+
+
+def test_gzip_body(catalog_client):
+    """测试gzip压缩版本"""
+    client, _ = catalog_client
+    response = client.get("/items", headers={"Accept-Encoding": "gzip"})
+    assert response.headers.get("content-encoding") == "gzip"
+    assert response.json()["code"] == 200
+
+
+def test_encoding_negotiation(catalog_client):
+    """测试按 Accept-Encoding 的q值选择编码，以及每种编码各自的ETag"""
+    from app.response_cache import CachedResponse, _choose_encoding, parse_accept_encoding
+
+    assert parse_accept_encoding("br;q=0, GZIP ;q=0.5,identity") == {"br": 0.0, "gzip": 0.5, "identity": 1.0}
+    entry = CachedResponse(1, '"abc"', b"{}", b"gz", b"br")
+    assert _choose_encoding("br;q=0, gzip", entry) == "gzip"
+    assert _choose_encoding("gzip;q=0", entry) is None
+    assert _choose_encoding("gzip, br", entry) == "br"
+    assert _choose_encoding("gzip;q=1, br;q=0.5", entry) == "gzip"
+    assert _choose_encoding("*", entry) == "br"
+    assert _choose_encoding("br", entry._replace(br_body=None)) is None
+
+    client, _ = catalog_client
+    plain = client.get("/items", headers={"Accept-Encoding": "identity"})
+    gzipped = client.get("/items", headers={"Accept-Encoding": "gzip"})
+    unwanted = client.get("/items", headers={"Accept-Encoding": "gzip;q=0"})
+    assert "content-encoding" not in plain.headers and "content-encoding" not in unwanted.headers
+    assert gzipped.headers["etag"] == plain.headers["etag"][:-1] + '-gz"'
+
+    # 条件请求只与所选编码的ETag匹配
+    assert client.get("/items", headers={"Accept-Encoding": "gzip",
+                                         "If-None-Match": gzipped.headers["etag"]}).status_code == 304
+    assert client.get("/items", headers={"Accept-Encoding": "gzip",
+                                         "If-None-Match": plain.headers["etag"]}).status_code == 200
+    assert client.get("/items", headers={"Accept-Encoding": "identity",
+                                         "If-None-Match": plain.headers["etag"]}).status_code == 304
@@ -0,0 +1,108 @@
+# -*- coding: utf-8 -*-
+"""
+日志保留测试
+在临时数据库上验证 app.retention：过期行分批删除并归档到 jsonl.gz、未过期行保留、
+清理对话时置空画像日志的引用、dry-run 只统计、启用写队列时经写线程删除，
+以及 incremental_vacuum 归还空闲页。
+"""
+
+import os
+import gzip
+import json
+from datetime import datetime, timedelta
+
+from sqlalchemy import func, select
+
+
+def _seed(engine, old_rows, new_rows, content="消息"):
+    """写入 old_rows 行过期数据和 new_rows 行未过期数据，返回过期对话ID集合"""
+    from app.database import Base
+    tables = Base.metadata.tables
+    old, new = datetime.utcnow() - timedelta(days=400), datetime.utcnow()
+    with engine.begin() as conn:
+        conn.execute(tables["user_profiles"].insert(), {"user_id": "u1", "nickname": "t"})
+        conn.execute(tables["generation_tasks"].insert(),
+                     {"id": "t1", "user_id": "u1", "report_type": "SUB_REPORT_A", "status": "completed"})
+        rows = [{"user_id": "u1", "message_role": "user", "message_content": content,
+                 "extracted_entities": {"i": i}, "timestamp": old if i < old_rows else new}
+                for i in range(old_rows + new_rows)]
+        conn.execute(tables["user_conversations"].insert(), rows)
+        old_ids = set(conn.execute(select(tables["user_conversations"].c.id)
+                                   .where(tables["user_conversations"].c.timestamp == old)).scalars())
+        # 未过期的画像日志引用过期对话
+        conn.execute(tables["user_profile_logs"].insert(), [
+            {"user_id": "u1", "field_name": "f", "source_message_id": i, "timestamp": new} for i in old_ids
+        ])
+        conn.execute(tables["generation_logs"].insert(), [
+            {"task_id": "t1", "message": "log", "created_at": old if i < old_rows else new}
+            for i in range(old_rows + new_rows)
+        ])
+    return old_ids
+
+
+def test_purge_and_archive(engine, tmp_path):
+    """测试分批删除、归档与引用置空"""
+    from app import retention
+    from app.database import Base
+    tables = Base.metadata.tables
+
+    old_ids = _seed(engine, old_rows=1200, new_rows=10)
+
+    preview = retention.run_retention(engine, dry_run=True)
+    assert preview["tables"]["user_conversations"] == {"expired": 1200}
+
+    report = retention.run_retention(engine, archive_dir=str(tmp_path / "archive"), batch_size=500, pause=0)
+    stats = report["tables"]["user_conversations"]
+    assert stats["deleted"] == 1200 and stats["batches"] == 3
+    assert report["tables"]["generation_logs"]["deleted"] == 1200
+    assert report["tables"]["user_profile_logs"] == {"deleted": 0, "batches": 0, "archive": None}
+
+    with gzip.open(stats["archive"], "rt", encoding="utf-8") as f:
+        archived = [json.loads(line) for line in f]
+    assert {row["id"] for row in archived} == old_ids
+    assert archived[0]["extracted_entities"] == {"i": 0} and archived[0]["timestamp"]
+
+    with engine.connect() as conn:
+        assert conn.execute(select(func.count()).select_from(tables["user_conversations"])).scalar() == 10
+        assert conn.execute(select(func.count()).select_from(tables["user_profile_logs"])
+                            .where(tables["user_profile_logs"].c.source_message_id.isnot(None))).scalar() == 0
+    again = retention.run_retention(engine, archive_dir=str(tmp_path / "archive"))
+    assert all(s["deleted"] == 0 and s["archive"] is None for s in again["tables"].values())
+
+
+def test_purge_through_write_queue(make_engine, tmp_path, monkeypatch):
+    """测试启用写队列时每批删除经写线程执行"""
+    from app import database, retention, write_queue
+
+    engine = make_engine("queued.db", pragmas={"journal_mode": "WAL"}, migrate=True)
+    _seed(engine, old_rows=300, new_rows=5)
+    monkeypatch.setattr(database, "WRITE_QUEUE_ENABLED", True)
+    try:
+        stats = retention.purge_table(retention.POLICIES["user_conversations"], engine,
+                                      archive_dir=str(tmp_path / "archive"), batch_size=100, pause=0)
+        assert stats["deleted"] == 300 and stats["batches"] == 3
+        # 3批删除 + 1次确认没有剩余过期行
+        assert [s["jobs"] for s in write_queue.write_queue_stats() if s["database"] == engine.url.database] == [4]
+        assert retention.count_expired(retention.POLICIES["user_conversations"], engine) == 0
+    finally:
+        write_queue.close_write_queues()
+
+
+def test_incremental_vacuum(make_engine, tmp_path):
+    """测试清理后归还空闲页"""
+    from app import retention
+
+    engine = make_engine("vacuum.db", migrate=True)
+    path = engine.url.database
+    assert retention.auto_vacuum_mode(engine) == 0
+    assert retention.enable_incremental_vacuum(engine)
+    assert retention.auto_vacuum_mode(engine) == 2
+
+    _seed(engine, old_rows=2000, new_rows=10, content="长消息" * 400)
+    size_before = os.path.getsize(path)
+    report = retention.run_retention(engine, archive_dir=str(tmp_path / "archive"), pause=0)
+    assert report["vacuumed_pages"] > 0
+    with engine.connect() as conn:
+        assert conn.exec_driver_sql("PRAGMA freelist_count").scalar() == 0
+    size_after = os.path.getsize(path)
+    assert size_after < size_before / 2
@@ -0,0 +1,58 @@
+# -*- coding: utf-8 -*-
+"""
+专业/职业全文检索测试
+在SQLite数据库上验证二元分词、BM25排序、高亮摘要和创建路径同步
+"""
+
+import pytest
+
+
+pytestmark = pytest.mark.usefixtures("fresh_search_index")
+
+
+def test_bigram_tokens():
+    """测试中文二元分词"""
+    from app.search_index import bigram_tokens
+
+    assert bigram_tokens("计算机") == ["计算", "算机"]
+    assert bigram_tokens("法") == ["法"]
+    assert bigram_tokens("UI/UX设计") == ["ui", "ux", "设计"]
+
+
+@pytest.mark.sqlite_only  # BM25排序和高亮摘要依赖FTS5
+def test_search_majors(db):
+    """测试专业检索排序与高亮"""
+    from app import crud, schemas
+
+    d = crud.create_discipline(db, schemas.DisciplineCreate(name="工学", code="08"))
+    c = crud.create_major_category(db, schemas.MajorCategoryCreate(
+        name="计算机类", code="0809", discipline_id=d.id
+    ))
+    crud.create_major(db, schemas.MajorCreate(
+        name="软件工程", code="080902", category_id=c.id,
+        description="培养软件开发和项目管理的工程人才", duration=4, main_courses=["软件测试"]
+    ))
+    crud.create_major(db, schemas.MajorCreate(
+        name="计算机科学与技术", code="080901", category_id=c.id,
+        description="培养掌握计算机科学理论和技术的专业人才", duration=4, main_courses=["软件工程导论"]
+    ))
+
+    results = crud.search_majors(db, "软件工程")
+    assert [r["major"].name for r in results] == ["软件工程", "计算机科学与技术"]
+    assert results[0]["highlight"]["name"] == "<mark>软件工程</mark>"
+    assert "<mark>软件工程</mark>" in results[1]["highlight"]["snippet"]
+    assert crud.search_majors(db, "医学") == []
+
+
+@pytest.mark.sqlite_only
+def test_search_occupations(db):
+    """测试职业检索"""
+    from app import crud, schemas
+
+    crud.create_occupation(db, schemas.OccupationCreate(
+        name="数据分析师", industry="IT互联网",
+        description="负责数据收集、处理、分析和可视化", requirements=["统计学", "编程能力"]
+    ))
+    results = crud.search_occupations(db, "统计")
+    assert len(results) == 1
+    assert results[0]["occupation"].name == "数据分析师"
@@ -0,0 +1,131 @@
+# -*- coding: utf-8 -*-
+"""
+职业规划知识库检索测试
+验证 Markdown 按标题分节切块、BM25 检索前K个相关段落、参考资料格式化，
+索引持久化后按指纹加载（源文件变化时重建，并发保存互不覆盖），以及单次检索耗时。
+"""
+
+import os
+import threading
+import time
+
+import pytest
+
+from app.services import skill_index
+from app.services.skill_index import SkillIndex, chunk_markdown, format_passages, load_chunks, source_fingerprint
+
+SAMPLE = """---
+name: sample
+---
+# 职业规划
+
+## 道路选择
+
+### 考研还是就业
+
+**考研**适合希望从事科研、需要更高学历门槛的方向。
+
+| 选择 | 适合人群 |
+|------|----------|
+| 就业 | 希望尽早积累实践经验 |
+
+### 转行
+
+转行前先做技能迁移分析，评估可迁移技能和需要补充的能力。
+
+## 行业趋势
+
+人工智能、新能源等行业需求增长较快。
+"""
+
+
+def test_chunk_markdown():
+    """测试按标题分节切块"""
+    chunks = chunk_markdown(SAMPLE, "样例", max_chars=400)
+    titles = [c.title for c in chunks]
+    assert titles == [
+        "职业规划 > 道路选择 > 考研还是就业",
+        "职业规划 > 道路选择 > 转行",
+        "职业规划 > 行业趋势",
+    ], titles
+    assert chunks[0].text == "考研适合希望从事科研、需要更高学历门槛的方向。\n选择 | 适合人群\n就业 | 希望尽早积累实践经验"
+    assert all(c.source == "样例" for c in chunks)
+
+    # 超长节按段落合并后切开
+    long_section = "# 标题\n\n" + "\n\n".join("段落内容" * 10 for _ in range(6))
+    parts = chunk_markdown(long_section, "样例", max_chars=100)
+    assert len(parts) == 3 and all(len(c.text) <= 100 for c in parts)
+
+
+def test_search_and_format():
+    """测试检索相关段落和格式化"""
+    index = SkillIndex.build(load_chunks(), source_fingerprint())
+    assert len(index.chunks) > 50
+
+    cases = {
+        "什么时候适合职业转换": "转换",
+        "如何制定大一的行动计划": "大一",
+        "人工智能行业前景怎么样": "趋势",
+    }
+    for query, keyword in cases.items():
+        passages = index.search(query, k=3)
+        assert len(passages) == 3 and passages[0].score >= passages[-1].score > 0
+        assert keyword in passages[0].title, (query, passages[0].title)
+    assert index.search("我喜欢打篮球") == []
+
+    text = format_passages(index.search("如何制定大一的行动计划", k=3), max_chars=300)
+    assert text.startswith("[1] ") and "[2] " in text
+    assert format_passages([]) == ""
+
+    queries = list(cases) * 200
+    start = time.perf_counter()
+    for query in queries:
+        index.search(query)
+    avg_ms = (time.perf_counter() - start) * 1000 / len(queries)
+    assert avg_ms < 1.0, avg_ms
+
+
+@pytest.fixture
+def index_file(tmp_path, monkeypatch):
+    """索引文件放在临时目录，测试前后丢弃内存中的索引"""
+    path = str(tmp_path / "skill_index.json")
+    monkeypatch.setattr(skill_index, "SKILL_INDEX_FILE", path)
+    skill_index.reset_skill_index()
+    yield path
+    skill_index.reset_skill_index()
+
+
+def test_persistence(index_file, tmp_path):
+    """测试索引持久化和按指纹重建"""
+    built = skill_index.get_skill_index()
+    # 临时文件已替换为正式文件
+    assert os.listdir(tmp_path) == ["skill_index.json"]
+
+    skill_index.reset_skill_index()
+    loaded = skill_index.get_skill_index()
+    assert loaded is not built
+    assert loaded.chunks == built.chunks
+    assert [p[:3] for p in loaded.search("考研还是工作")] == [p[:3] for p in built.search("考研还是工作")]
+
+    # 多个进程同时保存：各自写临时文件，不互相覆盖
+    errors = []
+
+    def save():
+        try:
+            built.save()
+        except OSError as e:
+            errors.append(e)
+    threads = [threading.Thread(target=save) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert errors == [] and os.listdir(tmp_path) == ["skill_index.json"]
+    assert SkillIndex.load().chunks == built.chunks
+
+    # 指纹不一致时重建
+    stale = SkillIndex(built.chunks[:1], {}, ["stale"])
+    stale.save()
+    skill_index.reset_skill_index()
+    assert len(skill_index.get_skill_index().chunks) == len(built.chunks)
+    assert SkillIndex.load(str(tmp_path / "missing.json")) is None
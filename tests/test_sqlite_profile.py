@@ -0,0 +1,47 @@
+# -*- coding: utf-8 -*-
+"""
+SQLite连接配置测试
+验证配置档解析、连接事件设置的PRAGMA以及周期性维护
+（读写并发吞吐量对比见 tests/bench_sqlite_profile.py）
+"""
+
+import os
+
+import pytest
+from sqlalchemy import text
+
+
+def test_profile_overrides():
+    """测试配置档与单项覆盖"""
+    from app.database import get_sqlite_pragmas
+
+    pragmas = get_sqlite_pragmas("production", overrides="cache_size=-1024, mmap_size=0")
+    assert pragmas["journal_mode"] == "WAL"
+    assert pragmas["cache_size"] == "-1024"
+    assert pragmas["mmap_size"] == "0"
+    assert get_sqlite_pragmas("none", overrides="") == {}
+    assert get_sqlite_pragmas(" Production ", overrides="")["journal_mode"] == "WAL"
+    # 拼写错误的配置档名报错，而不是回退到 default 静默关闭WAL
+    with pytest.raises(ValueError, match="prodcution"):
+        get_sqlite_pragmas("prodcution", overrides="")
+
+
+def test_connect_event_and_maintenance(make_engine):
+    """测试新连接上的PRAGMA与WAL检查点"""
+    from app.database import get_sqlite_pragmas, run_sqlite_maintenance
+
+    engine = make_engine("profile.db", pragmas=get_sqlite_pragmas("production", overrides="busy_timeout=1234"))
+    path = engine.url.database
+    with engine.begin() as conn:
+        conn.execute(text("CREATE TABLE t (id INTEGER PRIMARY KEY, v TEXT)"))
+        conn.execute(text("INSERT INTO t (v) VALUES ('a'), ('b')"))
+    with engine.connect() as conn:
+        assert conn.execute(text("PRAGMA journal_mode")).scalar() == "wal"
+        assert conn.execute(text("PRAGMA synchronous")).scalar() == 1
+        assert conn.execute(text("PRAGMA temp_store")).scalar() == 2
+        assert conn.execute(text("PRAGMA busy_timeout")).scalar() == 1234
+        assert conn.execute(text("PRAGMA cache_size")).scalar() == -65536
+    assert os.path.exists(path + "-wal")
+
+    busy, log_frames, checkpointed = run_sqlite_maintenance(engine)
+    assert busy == 0 and checkpointed == log_frames
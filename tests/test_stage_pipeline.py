@@ -0,0 +1,75 @@
+# -*- coding: utf-8 -*-
+"""
+阶段图执行器测试
+用 sleep 模拟对话管线各阶段（与 DSPyCareerRAGService._chat_stages 相同的依赖图），
+验证互不依赖的阶段并发执行、总耗时接近关键路径、超时降级、无降级阶段失败和依赖环检查。
+"""
+
+import time
+
+import pytest
+
+from app.services.pipeline import PipelineError, Stage, parse_timeouts, run_stages_sync, summarize_timings
+
+
+def _sleeper(seconds, value):
+    def func(ctx):
+        time.sleep(seconds)
+        return value(ctx) if callable(value) else value
+    return func
+
+
+def _chat_graph(llm_seconds=0.3):
+    """对话管线形状的阶段图：关键路径 intent -> merged -> extracted -> prompt -> llm -> optimization"""
+    return [
+        Stage('intent', _sleeper(0.1, {'intent_type': 'career_exploration'})),
+        Stage('merged_intent', _sleeper(0.0, lambda ctx: ctx['intent']), ('intent',)),
+        Stage('context_analysis', _sleeper(0.2, {'topic': 'career'})),
+        Stage('extracted_info', _sleeper(0.1, lambda ctx: {'intent': ctx['merged_intent']['intent_type']}),
+              ('merged_intent',)),
+        Stage('prompt_config', _sleeper(0.05, {}), ('merged_intent', 'extracted_info')),
+        Stage('raw_response', _sleeper(llm_seconds, lambda ctx: f"回复:{ctx['message']}"), ('prompt_config',)),
+        Stage('optimization', _sleeper(0.1, lambda ctx: {'optimized_response': ctx['raw_response'] + '!'}),
+              ('raw_response', 'extracted_info'),
+              fallback=lambda ctx: {'optimized_response': ctx['raw_response']}),
+        Stage('suggested_questions', _sleeper(0.2, ['你喜欢什么?']), ('extracted_info', 'prompt_config'),
+              fallback=lambda ctx: []),
+    ]
+
+
+def test_parallel_critical_path():
+    """测试并发执行：总耗时接近关键路径"""
+    start = time.perf_counter()
+    results, timings = run_stages_sync(_chat_graph(), {'message': '你好'})
+    wall = time.perf_counter() - start
+
+    assert results['optimization']['optimized_response'] == '回复:你好!'
+    assert results['extracted_info'] == {'intent': 'career_exploration'}
+    assert results['suggested_questions'] == ['你喜欢什么?']
+    summary = summarize_timings(timings)
+    assert all(s['status'] == 'ok' for s in summary['stages'].values())
+    # 关键路径 0.65s，各阶段之和 1.05s
+    assert wall < 0.9, wall
+    assert summary['stages_ms'] > 1000
+
+
+def test_timeout_fallback():
+    """测试阶段超时使用降级结果"""
+    timeouts = parse_timeouts("suggested_questions=0.05, optimization=0.05")
+    assert timeouts == {'suggested_questions': 0.05, 'optimization': 0.05}
+    results, timings = run_stages_sync(_chat_graph(), {'message': '你好'}, timeouts)
+
+    assert results['suggested_questions'] == []
+    assert results['optimization'] == {'optimized_response': '回复:你好'}
+    stages = summarize_timings(timings)['stages']
+    assert stages['suggested_questions']['status'] == 'timeout'
+    assert stages['raw_response']['status'] == 'ok'
+
+
+def test_failure_without_fallback():
+    """测试无降级阶段失败时抛出 PipelineError"""
+    with pytest.raises(PipelineError, match='raw_response'):
+        run_stages_sync(_chat_graph(), {'message': '你好'}, {'raw_response': 0.05})
+
+    with pytest.raises(ValueError, match='cycle'):
+        run_stages_sync([Stage('a', _sleeper(0, 1), ('b',)), Stage('b', _sleeper(0, 1), ('a',))], {})
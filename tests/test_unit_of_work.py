@@ -0,0 +1,104 @@
+# -*- coding: utf-8 -*-
+"""
+工作单元测试
+验证 database.unit_of_work 内的CRUD写操作只 flush、在边界统一提交一次，
+异常时整体回滚，immediate_commits 恢复逐次提交，以及目录缓存在提交后才失效。
+"""
+
+import pytest
+from sqlalchemy import event
+
+
+@pytest.fixture
+def commits(engine):
+    """engine 上的提交计数器"""
+    counter = [0]
+    event.listen(engine, "commit", lambda conn: counter.__setitem__(0, counter[0] + 1))
+    return counter
+
+
+def test_chat_turn_single_commit(db, commits):
+    """测试一轮对话的写入合并为一次提交"""
+    from app import crud_user_profile as crud, schemas_user_profile as schemas
+    from app.database import unit_of_work, in_unit_of_work
+
+    crud.get_or_create_user_profile(db, "uow_user")
+    commits[0] = 0
+
+    with unit_of_work(db):
+        conversation = crud.create_conversation(db, "uow_user", "s1", "user", "我想做数据分析")
+        assert conversation.id is not None
+        crud.update_user_profile(
+            db, "uow_user", schemas.UserProfileUpdate(holland_code="IRA", mbti_type="INTJ"),
+            update_type="conversation_extract", source_message_id=conversation.id
+        )
+        crud.create_conversation(db, "uow_user", "s1", "assistant", "好的")
+        assert commits[0] == 0
+    assert commits[0] == 1 and not in_unit_of_work(db)
+
+    logs = crud.get_user_profile_logs(db, "uow_user")
+    assert {log.field_name for log in logs} == {"holland_code", "mbti_type"}
+    assert all(log.source_message_id == conversation.id for log in logs)
+    assert crud.get_user_profile(db, "uow_user").completeness_score == 20
+
+
+def test_batch_update_single_commit(db, commits):
+    """测试批量更新（含逐字段日志）只提交一次"""
+    from app import crud_user_profile as crud, schemas_user_profile as schemas
+
+    crud.get_or_create_user_profile(db, "batch_user")
+    commits[0] = 0
+    items = [
+        schemas.ProfileBatchUpdateItem(field="holland_code", value="SEC"),
+        schemas.ProfileBatchUpdateItem(field="mbti_type", value="ENFJ"),
+        schemas.ProfileBatchUpdateItem(field="value_priorities", value='["成长", "稳定"]'),
+    ]
+    profile = crud.batch_update_profile(db, "batch_user", items)
+    assert commits[0] == 1
+    assert profile.value_priorities == ["成长", "稳定"]
+    assert len(crud.get_user_profile_logs(db, "batch_user")) == 3
+
+
+def test_rollback_and_opt_out(db, commits):
+    """测试异常时整体回滚，以及 immediate_commits 逐次提交"""
+    from app import crud_user_profile as crud
+    from app.database import immediate_commits, unit_of_work
+
+    crud.get_or_create_user_profile(db, "rb_user")
+    with pytest.raises(RuntimeError):
+        with unit_of_work(db):
+            crud.create_conversation(db, "rb_user", "s1", "user", "不会被保存")
+            raise RuntimeError("boom")
+    assert crud.get_conversation_history(db, "rb_user") == []
+
+    commits[0] = 0
+    with unit_of_work(db):
+        crud.create_conversation(db, "rb_user", "s1", "user", "工作单元")
+        with immediate_commits(db):
+            crud.create_conversation(db, "rb_user", "s1", "assistant", "进度1")
+            crud.create_conversation(db, "rb_user", "s1", "assistant", "进度2")
+        crud.create_conversation(db, "rb_user", "s1", "user", "结束")
+    # 进入时提交1次 + 逐次提交2次 + 边界提交1次
+    assert commits[0] == 4
+    assert len(crud.get_conversation_history(db, "rb_user")) == 4
+
+
+def test_cache_invalidated_after_commit(db):
+    """测试目录缓存在工作单元提交后才失效，回滚时不失效"""
+    from app import crud, schemas
+    from app.catalog_snapshot import get_catalog_version
+    from app.database import unit_of_work
+
+    version = get_catalog_version()
+    with pytest.raises(RuntimeError):
+        with unit_of_work(db):
+            crud.create_discipline(db, schemas.DisciplineCreate(code="98", name="回滚学科"))
+            raise RuntimeError("boom")
+    assert get_catalog_version() == version
+
+    with unit_of_work(db):
+        crud.create_discipline(db, schemas.DisciplineCreate(code="99", name="测试学科"))
+        assert get_catalog_version() == version
+    assert get_catalog_version() == version + 1
+    crud.create_discipline(db, schemas.DisciplineCreate(code="97", name="直接提交"))
+    assert get_catalog_version() == version + 2
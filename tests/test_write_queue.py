@@ -0,0 +1,129 @@
+# -*- coding: utf-8 -*-
+"""
+SQLite 单写线程测试
+在临时数据库上验证 app.write_queue：排队的任务合并为一次提交、失败任务只回滚自己的保存点、
+启用写队列时 CRUD 写函数经写线程执行，而只读连接上的直接写入被拒绝，
+以及提交后回调只在批次提交后执行。
+"""
+
+import threading
+
+import pytest
+from sqlalchemy import func, select, text
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.orm import Session
+
+WAL = {"journal_mode": "WAL"}
+
+
+def _insert_conversation(db, content):
+    from app.models_user_profile import UserConversation
+    conversation = UserConversation(user_id="u1", message_role="user", message_content=content)
+    db.add(conversation)
+    db.flush()
+    return conversation.id
+
+
+def _count_conversations(engine):
+    from app.models_user_profile import UserConversation
+    with engine.connect() as conn:
+        return conn.execute(select(func.count()).select_from(UserConversation.__table__)).scalar()
+
+
+def test_batched_commit(make_engine):
+    """测试排队任务合并提交与失败任务隔离"""
+    from app.write_queue import WriteQueue
+
+    engine = make_engine("queue.db", pragmas=WAL)
+    write_queue = WriteQueue(engine.url)
+    try:
+        # 第一个任务阻塞写线程，期间提交的任务在下一批中一起执行
+        started, release = threading.Event(), threading.Event()
+
+        def block(db):
+            started.set()
+            release.wait(5)
+            return _insert_conversation(db, "first")
+        first = write_queue.submit(block)
+        assert started.wait(5)
+        futures = [write_queue.submit(_insert_conversation, f"m{i}") for i in range(20)]
+
+        def fail(db):
+            _insert_conversation(db, "rolled back")
+            raise ValueError("boom")
+        failed = write_queue.submit(fail)
+        release.set()
+
+        ids = [f.result(timeout=5) for f in futures]
+        assert first.result(timeout=5) and len(set(ids)) == 20
+        with pytest.raises(ValueError):
+            failed.result(timeout=5)
+
+        stats = write_queue.stats()
+        assert stats["jobs"] == 22 and stats["batches"] == 2 and stats["max_batch"] == 21
+        assert _count_conversations(engine) == 21
+    finally:
+        write_queue.close()
+
+
+def test_queued_crud_on_read_only_session(make_engine, monkeypatch):
+    """测试启用写队列时CRUD写函数经写线程执行、只读连接拒绝直接写入"""
+    from app import database, write_queue
+    from app import crud_user_profile
+
+    engine = make_engine("app.db", pragmas=WAL)
+    read_engine = make_engine("app.db", pragmas={**WAL, "query_only": 1})
+    monkeypatch.setattr(database, "WRITE_QUEUE_ENABLED", True)
+    try:
+        with Session(bind=read_engine) as db:
+            with pytest.raises(OperationalError, match="readonly"):
+                db.execute(text("INSERT INTO user_conversations (user_id, message_role, message_content) "
+                                "VALUES ('u1', 'user', 'direct')"))
+            db.rollback()
+
+            profile = crud_user_profile.get_or_create_user_profile(db, "u1")
+            conversation = crud_user_profile.create_conversation(db, "u1", "s1", "user", "你好")
+            assert profile.id and conversation.id and conversation.message_content == "你好"
+            assert crud_user_profile.get_user_profile(db, "u1").nickname == profile.nickname
+
+        stats = write_queue.write_queue_stats()
+        assert [s["jobs"] for s in stats if s["database"] == engine.url.database] == [2]
+        assert _count_conversations(engine) == 1
+    finally:
+        write_queue.close_write_queues()
+
+
+def test_after_commit_callbacks(make_engine):
+    """测试提交后回调在批次提交后执行，失败任务的回调被丢弃"""
+    from app.database import call_after_commit
+    from app.write_queue import WriteQueue
+
+    engine = make_engine("queue.db", pragmas=WAL)
+    write_queue = WriteQueue(engine.url)
+    seen = []
+    try:
+        started, release = threading.Event(), threading.Event()
+
+        def block(db):
+            started.set()
+            release.wait(5)
+        write_queue.submit(block)
+        assert started.wait(5)
+
+        def write(db, name):
+            _insert_conversation(db, name)
+            # 回调执行时数据已对其他连接可见
+            call_after_commit(db, lambda: seen.append((name, _count_conversations(engine))))
+
+        def fail(db):
+            write(db, "rolled back")
+            raise ValueError("boom")
+        futures = [write_queue.submit(write, "a"), write_queue.submit(fail), write_queue.submit(write, "b")]
+        assert seen == []
+        release.set()
+        for future in futures:
+            future.exception(timeout=5)
+        assert write_queue.stats()["batches"] == 2
+        assert seen == [("a", 2), ("b", 2)]
+    finally:
+        write_queue.close()